@@ -1,10 +1,10 @@
 import os
 import json
+import asyncio
 import logging
 import concurrent.futures
+from django.conf import settings
 from json_repair import repair_json
-import google.generativeai as genai
-from groq import Groq
 
 logger = logging.getLogger(__name__)
 
@@ -15,11 +15,28 @@ class AIOrchestrator:
     - Quiz generation -> OpenAI (or Gemini Flash fallback)
     - Lab generation -> Groq (Llama-3 fast code generation, or Gemini Fallback)
     - Theory generation -> Gemini
+
+    `pacing_seconds` overrides LLM_MODULE_PACING_SECONDS for this orchestrator, and
+    `call_spacer` (anything with a blocking `wait()`, such as prewarm_courses' CallSpacer)
+    is waited on before each sync provider call that has a configured client.
     """
-    def __init__(self):
+    def __init__(self, pacing_seconds=None, call_spacer=None):
+        self.pacing_seconds = settings.LLM_MODULE_PACING_SECONDS if pacing_seconds is None else pacing_seconds
+        self.call_spacer = call_spacer
+        if settings.LLM_PROVIDER_BACKEND == "fake":
+            self._use_fake_providers()
+        elif settings.LLM_PROVIDER_BACKEND == "replay":
+            self._use_cassette_providers()
+        else:
+            self._use_live_providers()
+        if settings.LLM_CASSETTE_RECORD:
+            self._record_providers()
+
+    def _use_live_providers(self):
         # Gemini Init
         self.gemini_key = os.getenv("GEMINI_API_KEY")
         if self.gemini_key:
+            import google.generativeai as genai  # deferred: pulls in grpc/protobuf
             genai.configure(api_key=self.gemini_key)
             self.gemini_model = genai.GenerativeModel('gemini-2.0-flash')
         else:
@@ -28,17 +45,69 @@ class AIOrchestrator:
         # Groq Init
         self.groq_key = os.getenv("GROQ_API_KEY")
         if self.groq_key:
+            from groq import AsyncGroq, Groq
             self.groq_client = Groq(api_key=self.groq_key)
+            self.groq_async_client = AsyncGroq(api_key=self.groq_key)
         else:
             self.groq_client = None
+            self.groq_async_client = None
 
         # OpenAI Init (Optional)
         self.openai_key = os.getenv("OPENAI_API_KEY")
         if self.openai_key:
-            from openai import OpenAI
+            from openai import AsyncOpenAI, OpenAI
             self.openai_client = OpenAI(api_key=self.openai_key)
+            self.openai_async_client = AsyncOpenAI(api_key=self.openai_key)
         else:
             self.openai_client = None
+            self.openai_async_client = None
+
+    def _use_fake_providers(self):
+        """Offline providers from fake_llm, behind the same client attributes the callers use."""
+        from .fake_llm import FakeChatClient, FakeGenerativeModel, get_fake_llm
+
+        llm = get_fake_llm()
+        self.gemini_key = self.groq_key = self.openai_key = "fake"
+        self.gemini_model = FakeGenerativeModel(llm)
+        self.groq_client = FakeChatClient(llm)
+        self.groq_async_client = FakeChatClient(llm, is_async=True)
+        self.openai_client = FakeChatClient(llm)
+        self.openai_async_client = FakeChatClient(llm, is_async=True)
+
+    def _use_cassette_providers(self):
+        """Replay recorded provider responses (llm_cassette); providers absent from the cassette stay disabled."""
+        from .fake_llm import FakeChatClient, FakeGenerativeModel
+        from .llm_cassette import get_cassette
+
+        cassette = get_cassette()
+        scale = settings.LLM_CASSETTE_LATENCY_SCALE
+        self.gemini_key = self.groq_key = self.openai_key = None
+        self.gemini_model = self.groq_client = self.groq_async_client = None
+        self.openai_client = self.openai_async_client = None
+        if "gemini" in cassette.providers:
+            self.gemini_key = "replay"
+            self.gemini_model = FakeGenerativeModel(cassette.player("gemini", scale))
+        for provider in ("groq", "openai"):
+            if provider in cassette.providers:
+                player = cassette.player(provider, scale)
+                setattr(self, f"{provider}_key", "replay")
+                setattr(self, f"{provider}_client", FakeChatClient(player))
+                setattr(self, f"{provider}_async_client", FakeChatClient(player, is_async=True))
+
+    def _record_providers(self):
+        """Wrap whichever clients are configured so every call is appended to the cassette."""
+        from .llm_cassette import get_recorder
+
+        recorder = get_recorder()
+        if self.gemini_model:
+            self.gemini_model = recorder.wrap_model("gemini", self.gemini_model)
+        for provider in ("groq", "openai"):
+            client = getattr(self, f"{provider}_client")
+            async_client = getattr(self, f"{provider}_async_client")
+            if client:
+                setattr(self, f"{provider}_client", recorder.wrap_chat_client(provider, client))
+            if async_client:
+                setattr(self, f"{provider}_async_client", recorder.wrap_chat_client(provider, async_client, is_async=True))
 
     def _safe_parse_json(self, raw_text, default_val=None):
         if not raw_text:
@@ -51,9 +120,10 @@ class AIOrchestrator:
             logger.error(f"Failed to parse repaired JSON: {str(e)}\nRaw: {raw_text}")
             return default_val
 
-    def generate_course_structure(self, topic, language, level="Beginner"):
-        """Structure Phase matches Gemini."""
-        prompt = f"""
+    # -- Prompts (shared by the sync and async pipelines) --
+
+    def _structure_prompt(self, topic, language, level):
+        return f"""
         Create a comprehensive 10-module course on "{topic}" using {language}.
         Target Audience: {level}
         
@@ -73,13 +143,9 @@ class AIOrchestrator:
         }}
         Ensure there are exactly 10 modules. Do not include the phrase 'Master this concept.' Return ONLY raw JSON.
         """
-        raw_output = self._call_gemini(prompt)
-        if not raw_output:
-            raw_output = self._call_groq(prompt)
-        return self._safe_parse_json(raw_output, {})
 
-    def generate_theory(self, topic, language, module_title, module_number):
-        prompt = f"""
+    def _theory_prompt(self, topic, language, module_title, module_number):
+        return f"""
         Generate detailed theoretical content for Module {module_number}: "{module_title}" of the course "{topic}" ({language}).
         Return ONLY a JSON object:
         {{
@@ -94,13 +160,9 @@ class AIOrchestrator:
             ]
         }}
         """
-        raw_output = self._call_gemini(prompt)
-        if not raw_output:
-            raw_output = self._call_groq(prompt)
-        return self._safe_parse_json(raw_output, {"theory": f"Theory for {module_title}", "real_world_examples": []})
 
-    def generate_quizzes(self, topic, language, module_title, module_number):
-        prompt = f"""
+    def _quiz_prompt(self, topic, language, module_title, module_number):
+        return f"""
         Generate exactly 10 quiz questions for Module {module_number}: "{module_title}" of "{topic}" ({language}).
         Return ONLY a JSON object containing an array field "quizzes":
         {{
@@ -117,19 +179,9 @@ class AIOrchestrator:
         }}
         Focus on deep reasoning.
         """
-        raw_output = None
-        if self.openai_client:
-            raw_output = self._call_openai(prompt)
-        if not raw_output:
-            raw_output = self._call_gemini(prompt)
-        if not raw_output:
-            raw_output = self._call_groq(prompt)
-            
-        print(f"[DEBUG] generate_quizzes final raw_output: {repr(raw_output)[:100]}")
-        return self._safe_parse_json(raw_output, {"quizzes": []})
 
-    def generate_labs(self, topic, language, module_title, module_number):
-        prompt = f"""
+    def _labs_prompt(self, topic, language, module_title, module_number):
+        return f"""
         Generate coding labs and examples for Module {module_number}: "{module_title}" of "{topic}" ({language}).
         Return ONLY a JSON object:
         {{
@@ -147,12 +199,48 @@ class AIOrchestrator:
                     "description": "Instructions...",
                     "tasks": ["Task 1", "Task 2"],
                     "expected_outcome": "Outcome",
-                    "preloaded_code": "starter code..."
+                    "preloaded_code": "starter code...",
+                    "test_cases": [
+                        {{"stdin": "input for one run", "expected_output": "exact stdout of a correct solution"}}
+                    ]
                  }}
             ]
         }}
-        Ensure high quality compilable {language} code.
+        Ensure high quality compilable {language} code. test_cases are optional hidden grading cases.
         """
+
+    # -- Phases --
+
+    def generate_course_structure(self, topic, language, level="Beginner"):
+        """Structure Phase matches Gemini."""
+        prompt = self._structure_prompt(topic, language, level)
+        raw_output = self._call_gemini(prompt)
+        if not raw_output:
+            raw_output = self._call_groq(prompt)
+        return self._safe_parse_json(raw_output, {})
+
+    def generate_theory(self, topic, language, module_title, module_number):
+        prompt = self._theory_prompt(topic, language, module_title, module_number)
+        raw_output = self._call_gemini(prompt)
+        if not raw_output:
+            raw_output = self._call_groq(prompt)
+        return self._safe_parse_json(raw_output, {"theory": f"Theory for {module_title}", "real_world_examples": []})
+
+    def generate_quizzes(self, topic, language, module_title, module_number):
+        prompt = self._quiz_prompt(topic, language, module_title, module_number)
+        raw_output = None
+        if self.openai_client:
+            raw_output = self._call_openai(prompt)
+        if not raw_output:
+            raw_output = self._call_gemini(prompt)
+        if not raw_output:
+            raw_output = self._call_groq(prompt)
+            
+        print(f"[DEBUG] generate_quizzes final raw_output: {repr(raw_output)[:100]}")
+        return self._safe_parse_json(raw_output, {"quizzes": []})
+
+    def generate_labs(self, topic, language, module_title, module_number):
+        prompt = self._labs_prompt(topic, language, module_title, module_number)
         raw_output = None
         if self.groq_client:
             raw_output = self._call_groq(prompt)
@@ -166,11 +254,57 @@ class AIOrchestrator:
         import time
         
         theory_data = self.generate_theory(topic, language, module_title, module_number)
-        time.sleep(0.5)
+        time.sleep(self.pacing_seconds)
         quizzes_data = self.generate_quizzes(topic, language, module_title, module_number)
-        time.sleep(0.5)
+        time.sleep(self.pacing_seconds)
         labs_data = self.generate_labs(topic, language, module_title, module_number)
-        
+        return self._merge_module_parts(theory_data, quizzes_data, labs_data)
+
+    # -- Async phases (ASGI views); same prompts and fallbacks, awaiting the providers' async clients --
+
+    async def agenerate_course_structure(self, topic, language, level="Beginner"):
+        prompt = self._structure_prompt(topic, language, level)
+        raw_output = await self._acall_gemini(prompt)
+        if not raw_output:
+            raw_output = await self._acall_groq(prompt)
+        return self._safe_parse_json(raw_output, {})
+
+    async def agenerate_theory(self, topic, language, module_title, module_number):
+        prompt = self._theory_prompt(topic, language, module_title, module_number)
+        raw_output = await self._acall_gemini(prompt)
+        if not raw_output:
+            raw_output = await self._acall_groq(prompt)
+        return self._safe_parse_json(raw_output, {"theory": f"Theory for {module_title}", "real_world_examples": []})
+
+    async def agenerate_quizzes(self, topic, language, module_title, module_number):
+        prompt = self._quiz_prompt(topic, language, module_title, module_number)
+        raw_output = None
+        if self.openai_async_client:
+            raw_output = await self._acall_openai(prompt)
+        if not raw_output:
+            raw_output = await self._acall_gemini(prompt)
+        if not raw_output:
+            raw_output = await self._acall_groq(prompt)
+        return self._safe_parse_json(raw_output, {"quizzes": []})
+
+    async def agenerate_labs(self, topic, language, module_title, module_number):
+        prompt = self._labs_prompt(topic, language, module_title, module_number)
+        raw_output = None
+        if self.groq_async_client:
+            raw_output = await self._acall_groq(prompt)
+        if not raw_output:
+            raw_output = await self._acall_gemini(prompt)
+        return self._safe_parse_json(raw_output, {"code_examples": [], "mini_labs": []})
+
+    async def agenerate_complete_module(self, topic, language, module_title, module_number):
+        theory_data = await self.agenerate_theory(topic, language, module_title, module_number)
+        await asyncio.sleep(self.pacing_seconds)
+        quizzes_data = await self.agenerate_quizzes(topic, language, module_title, module_number)
+        await asyncio.sleep(self.pacing_seconds)
+        labs_data = await self.agenerate_labs(topic, language, module_title, module_number)
+        return self._merge_module_parts(theory_data, quizzes_data, labs_data)
+
+    def _merge_module_parts(self, theory_data, quizzes_data, labs_data):
         print(f"[DEBUG] theory_data keys: {theory_data.keys() if isinstance(theory_data, dict) else 'not a dict'}")
         print(f"[DEBUG] quizzes_data keys: {quizzes_data.keys() if isinstance(quizzes_data, dict) else 'not a dict'}")
         print(f"[DEBUG] labs_data keys: {labs_data.keys() if isinstance(labs_data, dict) else 'not a dict'}")
@@ -196,9 +330,14 @@ class AIOrchestrator:
 
     # -- Internal Callers with Retry/Failover --
 
+    def _space_call(self):
+        if self.call_spacer:
+            self.call_spacer.wait()
+
     def _call_gemini(self, prompt, retries=2):
         if not self.gemini_model:
             return None
+        self._space_call()
         import time
         for attempt in range(retries):
             try:
@@ -212,6 +351,7 @@ class AIOrchestrator:
     def _call_groq(self, prompt, retries=2):
         if not self.groq_client:
             return None
+        self._space_call()
         import time
         for attempt in range(retries):
             try:
@@ -232,6 +372,7 @@ class AIOrchestrator:
     def _call_openai(self, prompt, retries=2):
         if not self.openai_client:
             return None
+        self._space_call()
         import time
         for attempt in range(retries):
             try:
@@ -248,3 +389,53 @@ class AIOrchestrator:
                 logger.warning(f"OpenAI attempt {attempt+1} failed: {e}")
                 time.sleep(1)
         return None
+
+    async def _acall_gemini(self, prompt, retries=2):
+        if not self.gemini_model:
+            return None
+        for attempt in range(retries):
+            try:
+                response = await self.gemini_model.generate_content_async(prompt)
+                return response.text
+            except Exception as e:
+                logger.warning(f"Gemini async attempt {attempt+1} failed: {e}")
+                await asyncio.sleep(1)
+        return None
+
+    async def _acall_groq(self, prompt, retries=2):
+        if not self.groq_async_client:
+            return None
+        for attempt in range(retries):
+            try:
+                chat_completion = await self.groq_async_client.chat.completions.create(
+                    messages=[
+                        {"role": "system", "content": "You output only valid raw JSON. No markdown wrappers. No chat preamble."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    model="llama-3.3-70b-versatile",
+                    temperature=0.2,
+                )
+                return chat_completion.choices[0].message.content
+            except Exception as e:
+                logger.warning(f"Groq async attempt {attempt+1} failed: {e}")
+                await asyncio.sleep(1)
+        return None
+
+    async def _acall_openai(self, prompt, retries=2):
+        if not self.openai_async_client:
+            return None
+        for attempt in range(retries):
+            try:
+                response = await self.openai_async_client.chat.completions.create(
+                    model="gpt-4o-mini",
+                    response_format={ "type": "json_object" },
+                    messages=[
+                        {"role": "system", "content": "You are a JSON generating system. Output JSON only."},
+                        {"role": "user", "content": prompt}
+                    ]
+                )
+                return response.choices[0].message.content
+            except Exception as e:
+                logger.warning(f"OpenAI async attempt {attempt+1} failed: {e}")
+                await asyncio.sleep(1)
+        return None
@@ -1,6 +1,6 @@
-import google.generativeai as genai
 import os
 import json
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,6 +14,7 @@ class GeminiService:
             self.model = None
         else:
             try:
+                import google.generativeai as genai
                 genai.configure(api_key=self.api_key)
                 self.model = genai.GenerativeModel('gemini-flash-latest')
                 self.client = True # Flag to indicate success
@@ -30,6 +31,16 @@ class GeminiService:
                 self.client = None
                 self.model = None
 
+    def _mentai_prompt(self, query):
+        return f"""
+        You are MentAI, an expert AI learning assistant.
+        The user is asking: "{query}"
+        
+        Provide a concise, helpful, and encouraging response.
+        If the user asks for code, provide clean, well-commented code snippets.
+        Focus on being a 'learning buddy' rather than just a search engine.
+        """
+
     def ask_mentai(self, query):
         """
         Custom chat assistant method for MentAI with retry logic.
@@ -38,15 +49,7 @@ class GeminiService:
         if not self.model:
             return None
 
-        prompt = f"""
-        You are MentAI, an expert AI learning assistant.
-        The user is asking: "{query}"
-        
-        Provide a concise, helpful, and encouraging response.
-        If the user asks for code, provide clean, well-commented code snippets.
-        Focus on being a 'learning buddy' rather than just a search engine.
-        """
-        
+        prompt = self._mentai_prompt(query)
         max_retries = 2
         import time
 
@@ -62,6 +65,26 @@ class GeminiService:
                     logger.error(f"MentAI chat error after {max_retries + 1} attempts: {str(e)}")
                     return f"DEBUG_ERROR: {str(e)}"
 
+    async def aask_mentai(self, query):
+        """Async `ask_mentai` for the ASGI views; same retries, without blocking the event loop."""
+        if not self.model:
+            return None
+
+        prompt = self._mentai_prompt(query)
+        max_retries = 2
+
+        for attempt in range(max_retries + 1):
+            try:
+                response = await self.model.generate_content_async(prompt)
+                return response.text if response else None
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                if attempt < max_retries:
+                    await asyncio.sleep(0.5)
+                else:
+                    logger.error(f"MentAI chat error after {max_retries + 1} attempts: {str(e)}")
+                    return f"DEBUG_ERROR: {str(e)}"
+
     def generate_course_structure(self, topic, language, level="Beginner"):
         """
         Generates a structured course outline with 10 modules using Gemini.
@@ -8,6 +8,11 @@ class ApiConfig(AppConfig):
     def ready(self):
         import os
         import logging
+        from django.db.backends.signals import connection_created
+        from .sqlite_profile import configure_sqlite_connection
+
+        connection_created.connect(configure_sqlite_connection, dispatch_uid="api.sqlite_profile")
+
         logger = logging.getLogger('api')
         if os.getenv("GEMINI_API_KEY"):
             logger.info("MentAI Startup: GEMINI_API_KEY is loaded and configured.")
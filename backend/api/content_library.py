@@ -0,0 +1,151 @@
+"""
+Offline curriculum, loaded from data files on first use.
+
+The prebuilt theory, quizzes and labs live in CONTENT_LIBRARY_DIR/<language>/<section>.json
+(api/content by default) rather than in Python literals, so a worker only parses and holds
+the languages and sections it actually serves. Loaded sections are cached as read-only
+mappings. Once a section is older than CONTENT_LIBRARY_RELOAD_SECONDS, its file's mtime is
+checked again and a changed file is reloaded, so curriculum edits go live without a deploy.
+A file that fails to parse keeps the previously loaded version.
+
+Sections:
+  theory.json    {module_number: markdown}
+  quizzes.json   {module_number: [question, ...]}
+  labs.json      {"snippets": {module_number: [code, ...]},
+                  "contexts": {lab_index: {title, desc, tasks}},
+                  "test_cases": {module_number: {lab_index: [case, ...]}}}
+  concepts.json  {module_type: [[question, options, answer, explanation], ...]}
+"""
+import itertools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from types import MappingProxyType
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+logger = logging.getLogger('api')
+
+EMPTY = MappingProxyType({})
+SECTIONS = ("theory", "quizzes", "labs", "concepts")
+LANGUAGE_KEY = re.compile(r"[a-z0-9]+")
+_versions = itertools.count(1)
+
+
+def freeze(value):
+    """Read-only copy of loaded content: dicts become mappingproxies and lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """Fresh mutable copy of a frozen entry, which callers are free to modify."""
+    if isinstance(value, MappingProxyType):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+def _int_keys(pairs):
+    # JSON object keys are strings; module numbers and lab indexes are ints everywhere else
+    return {int(key) if key.isdigit() else key: value for key, value in pairs}
+
+
+class ContentLibrary:
+    def __init__(self, root, reload_seconds=0):
+        self.root = str(root)
+        self.reload_seconds = reload_seconds
+        self._cache = {}  # (language, section) -> (data, mtime_ns, checked_at)
+        self._lock = threading.Lock()
+        # Changes whenever a loaded section changes, so anything derived from the library can key on it
+        self.version = next(_versions)
+
+    def path(self, language, section):
+        return os.path.join(self.root, language, f"{section}.json")
+
+    def section(self, language, section):
+        """The frozen contents of <language>/<section>.json, or an empty mapping if there is none."""
+        key = (language, section)
+        entry = self._cache.get(key)
+        if entry is not None and not self._stale(entry):
+            return entry[0]
+        if not LANGUAGE_KEY.fullmatch(language or "") or section not in SECTIONS:
+            return EMPTY
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or self._stale(entry):
+                loaded = self._cache[key] = self._load(key, entry)
+                if entry is not None and loaded[0] is not entry[0]:
+                    self.version = next(_versions)
+                entry = loaded
+            return entry[0]
+
+    def _stale(self, entry):
+        return bool(self.reload_seconds) and time.monotonic() - entry[2] >= self.reload_seconds
+
+    def _load(self, key, entry):
+        path = self.path(*key)
+        now = time.monotonic()
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            return EMPTY, None, now
+        if entry is not None and entry[1] == mtime:
+            return entry[0], mtime, now
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = freeze(json.load(f, object_pairs_hook=_int_keys))
+        except (OSError, ValueError) as e:
+            logger.error(f"Content library: could not load {path}: {e}")
+            return (entry[0] if entry else EMPTY), mtime, now
+        logger.info(f"Content library: loaded {path}")
+        return data, mtime, now
+
+    def languages(self):
+        return sorted(
+            name for name in os.listdir(self.root)
+            if LANGUAGE_KEY.fullmatch(name) and os.path.isdir(os.path.join(self.root, name))
+        )
+
+    def loaded(self):
+        return sorted(key for key, entry in self._cache.items() if entry[0] is not EMPTY)
+
+    def reload(self):
+        """Forget everything loaded so far; the next lookups read the files again."""
+        with self._lock:
+            self._cache.clear()
+            self.version = next(_versions)
+
+
+_library = None
+_library_lock = threading.Lock()
+
+
+def get_library():
+    global _library
+    if _library is None:
+        with _library_lock:
+            if _library is None:
+                _library = ContentLibrary(settings.CONTENT_LIBRARY_DIR, settings.CONTENT_LIBRARY_RELOAD_SECONDS)
+    return _library
+
+
+@receiver(setting_changed)
+def _reset_library(setting, **kwargs):
+    # override_settings in tests and benches points the library somewhere else
+    global _library
+    if setting in ("CONTENT_LIBRARY_DIR", "CONTENT_LIBRARY_RELOAD_SECONDS"):
+        _library = None
+
+
+def section(language, name):
+    return get_library().section(language, name)
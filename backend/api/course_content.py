@@ -1,7 +1,27 @@
 import random
+from functools import lru_cache
+
+from . import content_library
+from .content_library import freeze, thaw
 
 MIN_QUIZ_QUESTIONS = 10
 
+_AUGMENT_TEMPLATES = (
+    ("What is a key benefit of {topic} in the context of {module}?", ["Efficiency", "Complexity", "Latency", "Cost"], "Efficiency", "Core advantage."),
+    ("In {topic}, how does {module} affect performance?", ["Optimizes it", "Degrades it", "No effect", "Random"], "Optimizes it", "Performance impact."),
+    ("Which keyword is most associated with {module} in {topic}?", ["import", "class", "function", "var"], "import", "Key syntax."),
+    ("True or False: {module} is essential for {topic} applications.", ["True", "False", "Maybe", "Deprecated"], "True", "Importance."),
+    ("What is the primary use case for {module}?", ["Data Processing", "UI Rendering", "Network", "Security"], "Data Processing", "Usage."),
+    ("Debug: If {module} fails in {topic}, check:", ["Logs", "Power", "Internet", "Hardware"], "Logs", "Troubleshooting."),
+    ("Advanced: {module} relies on?", ["Abstraction", "Magic", "Luck", "None"], "Abstraction", "Concept."),
+    ("When to avoid using {module}?", ["Never", "Small scripts", "Always", "Production"], "Small scripts", "Overhead."),
+    ("Best practice for {module}?", ["Consistency", "Speed", "Short code", "Comments"], "Consistency", "Maintainability."),
+    ("{module} is strictly typed in {topic}?", ["Depends on lang", "Yes", "No", "Always"], "Depends on lang", "Type system."),
+    ("Legacy alternative to {module}?", ["Manual code", "AI", "Cloud", "None"], "Manual code", "Historical."),
+    ("Security implication of {module}?", ["Input validation", "None", "Speed", "Color"], "Input validation", "Safety.")
+)
+
+
 def _augment_quiz_questions(questions, topic, module_title, target_count):
     """
     Augment the list of questions to reach target_count using algorithmic templates.
@@ -13,21 +33,7 @@ def _augment_quiz_questions(questions, topic, module_title, target_count):
 
     needed = target_count - current_count
     
-    templates = [
-        ("What is a key benefit of {topic} in the context of {module}?", ["Efficiency", "Complexity", "Latency", "Cost"], "Efficiency", "Core advantage."),
-        ("In {topic}, how does {module} affect performance?", ["Optimizes it", "Degrades it", "No effect", "Random"], "Optimizes it", "Performance impact."),
-        ("Which keyword is most associated with {module} in {topic}?", ["import", "class", "function", "var"], "import", "Key syntax."),
-        ("True or False: {module} is essential for {topic} applications.", ["True", "False", "Maybe", "Deprecated"], "True", "Importance."),
-        ("What is the primary use case for {module}?", ["Data Processing", "UI Rendering", "Network", "Security"], "Data Processing", "Usage."),
-        ("Debug: If {module} fails in {topic}, check:", ["Logs", "Power", "Internet", "Hardware"], "Logs", "Troubleshooting."),
-        ("Advanced: {module} relies on?", ["Abstraction", "Magic", "Luck", "None"], "Abstraction", "Concept."),
-        ("When to avoid using {module}?", ["Never", "Small scripts", "Always", "Production"], "Small scripts", "Overhead."),
-        ("Best practice for {module}?", ["Consistency", "Speed", "Short code", "Comments"], "Consistency", "Maintainability."),
-        ("{module} is strictly typed in {topic}?", ["Depends on lang", "Yes", "No", "Always"], "Depends on lang", "Type system."),
-        ("Legacy alternative to {module}?", ["Manual code", "AI", "Cloud", "None"], "Manual code", "Historical."),
-        ("Security implication of {module}?", ["Input validation", "None", "Speed", "Color"], "Input validation", "Safety.")
-    ]
-    
+    templates = list(_AUGMENT_TEMPLATES)
     random.shuffle(templates)
     
     safe_topic = topic if topic else "Programming"
@@ -44,7 +50,7 @@ def _augment_quiz_questions(questions, topic, module_title, target_count):
             
         questions.append({
             "question": q_text,
-            "options": t_opts,
+            "options": list(t_opts),
             "answer": t_ans,
             "explanation": t_expl,
             "difficulty": "medium",
@@ -198,47 +204,32 @@ def get_module_objectives(language, module_title, module_number):
         f"Debug and troubleshoot issues related to {module_title}"
     ]
 
-from .theory_content import (
-    python_theory, java_theory, js_theory, react_theory, cpp_theory,
-    html_theory, css_theory, c_theory, go_theory, ts_theory, solidity_theory,
-    sql_theory, mongodb_theory
-)
+# Language aliases -> content library language, for module theory
+_THEORY_LANGUAGES = {
+    **dict.fromkeys(["python", "py", "python3"], "python"),
+    **dict.fromkeys(["javascript", "js", "node", "nodejs"], "javascript"),
+    **dict.fromkeys(["html", "html5"], "html"),
+    **dict.fromkeys(["css", "css3"], "css"),
+    **dict.fromkeys(["react", "reactjs", "nextjs", "next.js", "jsx"], "react"),
+    "java": "java",
+    **dict.fromkeys(["cpp", "c++", "cplusplus"], "cpp"),
+    "c": "c",
+    **dict.fromkeys(["go", "golang"], "go"),
+    **dict.fromkeys(["typescript", "ts"], "typescript"),
+    **dict.fromkeys(["solidity", "sol"], "solidity"),
+    **dict.fromkeys(["sql", "sqlite", "postgresql", "mysql"], "sql"),
+    **dict.fromkeys(["mongodb", "mongo", "nosql"], "mongodb"),
+}
+
 
 def get_module_theory(language, module_title, module_number):
     """
     Generates detailed, university-level theory content for a given module.
     Enforces 100% uniqueness and strict topic boundaries.
     """
-    lang_key = language.lower()
-    content = ""
-
     # Strict matching to avoid bleed
-    if lang_key in ["python", "py", "python3"]:
-        content = python_theory.get(module_number)
-    elif lang_key in ["javascript", "js", "node", "nodejs"]:
-        content = js_theory.get(module_number)
-    elif lang_key in ["html", "html5"]:
-        content = html_theory.get(module_number)
-    elif lang_key in ["css", "css3"]:
-        content = css_theory.get(module_number)
-    elif lang_key in ["react", "reactjs", "nextjs", "next.js", "jsx"]:
-        content = react_theory.get(module_number)
-    elif lang_key in ["java"]:
-        content = java_theory.get(module_number)
-    elif lang_key in ["cpp", "c++", "cplusplus"]:
-        content = cpp_theory.get(module_number)
-    elif lang_key in ["c"]:
-        content = c_theory.get(module_number)
-    elif lang_key in ["go", "golang"]:
-        content = go_theory.get(module_number)
-    elif lang_key in ["typescript", "ts"]:
-        content = ts_theory.get(module_number)
-    elif lang_key in ["solidity", "sol"]:
-        content = solidity_theory.get(module_number)
-    elif lang_key in ["sql", "sqlite", "postgresql", "mysql"]:
-        content = sql_theory.get(module_number)
-    elif lang_key in ["mongodb", "mongo", "nosql"]:
-        content = mongodb_theory.get(module_number)
+    theory_language = _THEORY_LANGUAGES.get(language.lower())
+    content = content_library.section(theory_language, "theory").get(module_number) if theory_language else ""
 
     # General Fallback (Minimal, No Fake "Advanced Analysis")
     if not content:
@@ -445,14 +436,44 @@ def get_mini_project(language, module_title, module_number):
         "tasks": tasks
     }
 
-def get_prebuilt_code_snippet(topic, topic_type, module_index, lab_index=0, module_title=""):
-    """
-    Return a runnable, pre-loaded code snippet based on topic, module, and specific lab index.
-    Ensures difficulty progression and NO placeholders.
-    """
+# Shown when a language has no prebuilt code for a module or lab; {lab} and {module} count from 1
+_SNIPPET_FALLBACKS = {
+    "go": "// Go Advanced Lab {lab}\npackage main\nimport \"fmt\"\nfunc main() {{ fmt.Println(\"Complexity level strict\") }}",
+    "typescript": "// TS Advanced Lab {lab}\nconsole.log('TS Complexity');",
+    "c": "// C Advanced Lab {lab}\n#include <stdio.h>\nint main() {{ printf(\"Advanced C\"); return 0; }}",
+    "javascript": "// JS Advanced Lab {lab}\nconsole.log('Running complex JS...');",
+    "react": "// React Advanced Component\nexport default function App() {{ return <div>Advanced React</div> }}",
+    "html": "<!-- HTML Advanced Structure -->\n<div class='container'>Content</div>",
+    "css": "/* Advanced CSS */\n.expert {{\n  display: grid;\n}}",
+    "python": "# Python Advanced Lab {lab}",
+    "java": "public class Main {{ public static void main(String[] a) {{ System.out.println(\"Advanced Java\"); }} }}",
+    "cpp": "#include <iostream>\nusing namespace std;\nint main() {{\n    cout << \"Running C++ Lab...\" << endl;\n    return 0;\n}}",
+    "sql": "-- SQL Module {module} Practice Query\nSELECT * FROM Users WHERE id = 1;",
+    "mongodb": "// MongoDB Module {module} Query\ndb.users.find({{}});",
+}
+
+
+def _runnable_snippet(language, snippet):
+    """Wrap Java and C++ statement snippets in a main() so they compile on their own."""
+    if language == "java":
+        if "class " in snippet or "interface " in snippet:
+            code = f"// Lab Code\n{snippet}"
+            if "public static void main" not in code:
+                code += "\n\npublic class Main { public static void main(String[] a) { System.out.println(\"Run specific logic inside classes\"); } }"
+            return code
+        return f"public class Main {{\n    public static void main(String[] args) {{\n        {snippet}\n    }}\n}}"
+    if language == "cpp":
+        if "int main" in snippet:
+            return f"#include <iostream>\nusing namespace std;\n{snippet}"
+        return f"#include <iostream>\nusing namespace std;\nint main() {{ {snippet} return 0; }}"
+    return snippet
+
+
+
+@lru_cache(maxsize=1024)
+def _snippet_language(topic):
+    """The content library language for a free-form topic or language name (python when nothing matches)."""
     topic_lower = topic.lower()
-    
-    # DETERMINE LANGUAGE STRICTLY
     language = "python" # fallback
     if "python" in topic_lower: language = "python"
     elif "java" in topic_lower and "script" not in topic_lower: language = "java"
@@ -467,244 +488,50 @@ def get_prebuilt_code_snippet(topic, topic_type, module_index, lab_index=0, modu
     elif "c" == topic_lower or "c " in topic_lower or " c" in topic_lower: language = "c"
     elif "sql" in topic_lower: language = "sql"
     elif "mongodb" in topic_lower or "mongo" in topic_lower: language = "mongodb"
+    return language
 
-    # 7. GO (EXECUTABLE)
-    if language == "go":
-        go_snippets = {
-            1: ["// Lab 1: Hello World\npackage main\nimport \"fmt\"\nfunc main() {\n    fmt.Println(\"Hello, Go!\")\n}", "// Lab 2: Variables\npackage main\nimport \"fmt\"\nfunc main() {\n    var i int = 10\n    fmt.Println(i)\n}", "// Lab 3: Math\npackage main\nimport \"fmt\"\nfunc main() {\n    fmt.Println(5 + 5)\n}"],
-            2: ["// Lab 1: Types\npackage main\nimport \"fmt\"\nfunc main() {\n    var f float64 = 3.14\n    fmt.Printf(\"Type: %T\n\", f)\n}", "// Lab 2: Constants\npackage main\nimport \"fmt\"\nfunc main() {\n    const pi = 3.14159\n    fmt.Println(pi)\n}", "// Lab 3: Conversion\npackage main\nimport \"fmt\"\nfunc main() {\n    var i int = 42\n    var f float64 = float64(i)\n    fmt.Println(f)\n}"],
-            3: ["// Lab 1: For Loop\npackage main\nimport \"fmt\"\nfunc main() {\n    for i := 0; i < 5; i++ {\n        fmt.Println(i)\n    }\n}", "// Lab 2: If-Else\npackage main\nimport \"fmt\"\nfunc main() {\n    if 7%2 == 0 {\n        fmt.Println(\"Even\")\n    } else {\n        fmt.Println(\"Odd\")\n    }\n}", "// Lab 3: Switch\npackage main\nimport \"fmt\"\nfunc main() {\n    i := 2\n    switch i {\n    case 1: fmt.Println(\"One\")\n    case 2: fmt.Println(\"Two\")\n    }\n}"],
-            4: ["// Lab 1: Function\npackage main\nimport \"fmt\"\nfunc add(a int, b int) int {\n    return a + b\n}\nfunc main() {\n    fmt.Println(add(3, 4))\n}", "// Lab 2: Multiple Return\npackage main\nimport \"fmt\"\nfunc swap(x, y string) (string, string) {\n    return y, x\n}\nfunc main() {\n    a, b := swap(\"hello\", \"world\")\n    fmt.Println(a, b)\n}", "// Lab 3: Variadic\npackage main\nimport \"fmt\"\nfunc sum(nums ...int) {\n    total := 0\n    for _, num := range nums {\n        total += num\n    }\n    fmt.Println(total)\n}\nfunc main() {\n    sum(1, 2, 3)\n}"],
-            5: ["// Lab 1: Array\npackage main\nimport \"fmt\"\nfunc main() {\n    var a [2]string\n    a[0] = \"Hello\"\n    a[1] = \"World\"\n    fmt.Println(a)\n}", "// Lab 2: Slice\npackage main\nimport \"fmt\"\nfunc main() {\n    p := []int{2, 3, 5, 7, 11}\n    fmt.Println(p[1:4])\n}", "// Lab 3: Map\npackage main\nimport \"fmt\"\nfunc main() {\n    m := make(map[string]int)\n    m[\"k1\"] = 7\n    fmt.Println(m)\n}"],
-            6: ["// Lab 1: Pointer\npackage main\nimport \"fmt\"\nfunc main() {\n    i, j := 42, 2701\n    p := &i\n    fmt.Println(*p)\n    *p = 21\n    fmt.Println(i)\n}", "// Lab 2: Struct\npackage main\nimport \"fmt\"\ntype Vertex struct {\n    X int\n    Y int\n}\nfunc main() {\n    v := Vertex{1, 2}\n    v.X = 4\n    fmt.Println(v.X)\n}", "// Lab 3: Method\npackage main\nimport \"fmt\"\nimport \"math\"\ntype Vertex struct {\n    X, Y float64\n}\nfunc (v Vertex) Abs() float64 {\n    return math.Sqrt(v.X*v.X + v.Y*v.Y)\n}\nfunc main() {\n    v := Vertex{3, 4}\n    fmt.Println(v.Abs())\n}"],
-            7: ["// Lab 1: Interface\npackage main\nimport \"fmt\"\nimport \"math\"\ntype Abser interface {\n    Abs() float64\n}\nfunc main() {\n    // Implement interface example\n}", "// Lab 2: Error\npackage main\nimport \"fmt\"\nimport \"time\"\ntype MyError struct {\n    When time.Time\n    What string\n}\nfunc (e *MyError) Error() string {\n    return fmt.Sprintf(\"at %v, %s\", e.When, e.What)\n}\nfunc main() {\n    // Run error logic\n}", "// Lab 3: Reader\npackage main\nimport \"fmt\"\nimport \"io\"\nimport \"strings\"\nfunc main() {\n    r := strings.NewReader(\"Hello, Reader!\")\n    b := make([]byte, 8)\n    for {\n        n, err := r.Read(b)\n        fmt.Printf(\"n = %v err = %v b = %v\n\", n, err, b)\n        fmt.Printf(\"b[:n] = %q\n\", b[:n])\n        if err == io.EOF {\n            break\n        }\n    }\n}"],
-            8: ["// Lab 1: Goroutine\npackage main\nimport \"fmt\"\nimport \"time\"\nfunc say(s string) {\n    for i := 0; i < 5; i++ {\n        time.Sleep(100 * time.Millisecond)\n        fmt.Println(s)\n    }\n}\nfunc main() {\n    go say(\"world\")\n    say(\"hello\")\n}", "// Lab 2: Channel\npackage main\nimport \"fmt\"\nfunc sum(s []int, c chan int) {\n    sum := 0\n    for _, v := range s {\n        sum += v\n    }\n    c <- sum\n}\nfunc main() {\n    s := []int{7, 2, 8, -9, 4, 0}\n    c := make(chan int)\n    go sum(s[:len(s)/2], c)\n    go sum(s[len(s)/2:], c)\n    x, y := <-c, <-c\n    fmt.Println(x, y, x+y)\n}", "// Lab 3: Select\npackage main\nimport \"fmt\"\nfunc main() {\n    // Use select for channels\n}"],
-            9: ["// Lab 1: Mutex\npackage main\nimport \"fmt\"\nimport \"sync\"\nimport \"time\"\ntype SafeCounter struct {\n    v   map[string]int\n    mux sync.Mutex\n}\nfunc (c *SafeCounter) Inc(key string) {\n    c.mux.Lock()\n    c.v[key]++\n    c.mux.Unlock()\n}\nfunc main() {\n    c := SafeCounter{v: make(map[string]int)}\n    for i := 0; i < 1000; i++ {\n        go c.Inc(\"somekey\")\n    }\n    time.Sleep(time.Second)\n    fmt.Println(c.v[\"somekey\"])\n}", "// Lab 2: WaitGroup\npackage main\nimport \"fmt\"\nimport \"sync\"\nimport \"time\"\nfunc worker(id int, wg *sync.WaitGroup) {\n    defer wg.Done()\n    fmt.Printf(\"Worker %d starting\n\", id)\n    time.Sleep(time.Second)\n    fmt.Printf(\"Worker %d done\n\", id)\n}\nfunc main() {\n    var wg sync.WaitGroup\n    for i := 1; i <= 5; i++ {\n        wg.Add(1)\n        go worker(i, &wg)\n    }\n    wg.Wait()\n}", "// Lab 3: Context\npackage main\nimport \"fmt\"\nimport \"context\"\nimport \"time\"\nfunc main() {\n    // Context example\n}"],
-            10: ["// Lab 1: Testing\npackage main\nimport \"testing\"\nfunc TestAbs(t *testing.T) {\n    got := 1\n    if got != 1 {\n        t.Errorf(\"Abs(-1) = %d; want 1\", got)\n    }\n}", "// Lab 2: JSON\npackage main\nimport \"encoding/json\"\nimport \"fmt\"\nimport \"os\"\nfunc main() {\n    type ColorGroup struct {\n        ID     int\n        Name   string\n        Colors []string\n    }\n    group := ColorGroup{1, \"Reds\", []string{\"Crimson\", \"Red\", \"Ruby\", \"Maroon\"}}\n    b, err := json.Marshal(group)\n    if err != nil {\n        fmt.Println(\"error:\", err)\n    }\n    os.Stdout.Write(b)\n}", "// Lab 3: HTTP Server\npackage main\nimport \"fmt\"\nimport \"net/http\"\nfunc handler(w http.ResponseWriter, r *http.Request) {\n    fmt.Fprintf(w, \"Hi there, I love %s!\", r.URL.Path[1:])\n}\nfunc main() {\n    http.HandleFunc(\"/\", handler)\n    // http.ListenAndServe(\":8080\", nil)\n}"]
-        }
-        mod_labs = go_snippets.get(module_index + 1, [])
-        return mod_labs[lab_index] if lab_index < len(mod_labs) else f"// Go Advanced Lab {lab_index+1}\npackage main\nimport \"fmt\"\nfunc main() {{ fmt.Println(\"Complexity level strict\") }}"
 
-    # 8. TYPESCRIPT (EXECUTABLE)
-    elif language == "typescript":
-        ts_snippets = {
-            1: ["// Lab 1: Intro\nconst message: string = 'Hello World';\nconsole.log(message);", "// Lab 2: Types\nlet isDone: boolean = false;\nlet decimal: number = 6;\nconsole.log(isDone, decimal);", "// Lab 3: Array\nlet list: number[] = [1, 2, 3];\nconsole.log(list);"],
-            2: ["// Lab 1: Interface\ninterface User {\n  name: string;\n  id: number;\n}\nconst user: User = { name: 'Hayes', id: 0 };\nconsole.log(user);", "// Lab 2: Class\nclass Animal {\n  name: string;\n  constructor(theName: string) { this.name = theName; }\n  move(distanceInMeters: number = 0) {\n    console.log(`${this.name} moved ${distanceInMeters}m.`);\n  }\n}\nnew Animal('Cat').move(10);", "// Lab 3: Inheritance\nclass Snake extends Animal {\n  move(distanceInMeters = 5) {\n    super.move(distanceInMeters);\n  }\n}"],
-            3: ["// Lab 1: Function\nfunction add(x: number, y: number): number {\n  return x + y;\n}\nconsole.log(add(5, 5));", "// Lab 2: Optional\nfunction buildName(firstName: string, lastName?: string) {\n    return firstName + ' ' + lastName;\n}\nconsole.log(buildName('Bob'));", "// Lab 3: Rest\nfunction buildName(firstName: string, ...restOfName: string[]) {\n  return firstName + ' ' + restOfName.join(' ');\n}"],
-            4: ["// Lab 1: Generic\nfunction identity<T>(arg: T): T {\n  return arg;\n}\nconsole.log(identity<string>('myString'));", "// Lab 2: Generic Class\nclass GenericNumber<T> {\n  zeroValue: T;\n  add: (x: T, y: T) => T;\n}\nlet myGenericNumber = new GenericNumber<number>();", "// Lab 3: Constraints\ninterface Lengthwise {\n  length: number;\n}\nfunction loggingIdentity<T extends Lengthwise>(arg: T): T {\n  console.log(arg.length);\n  return arg;\n}"],
-            5: ["// Lab 1: Enum\nenum Color {Red, Green, Blue}\nlet c: Color = Color.Green;\nconsole.log(c);", "// Lab 2: Literal\ntype Easing = 'ease-in' | 'ease-out' | 'ease-in-out';\nlet x: Easing = 'ease-in';\nconsole.log(x);", "// Lab 3: Union\nfunction padLeft(value: string, padding: string | number) {\n  // ...\n}"],
-            6: ["// Lab 1: Intersection\ninterface ErrorHandling { success: boolean; error?: { message: string }; }\ninterface ArtworksData { artworks: { title: string }[]; }\ntype ArtworksResponse = ArtworksData & ErrorHandling;", "// Lab 2: Type Guard\nfunction isNumber(x: any): x is number {\n  return typeof x === 'number';\n}", "// Lab 3: Instanceof\n// if (x instanceof String) ..."],
-            7: ["// Lab 1: Symbols\nlet sym2 = Symbol('key');\nlet sym3 = Symbol('key');\nconsole.log(sym2 === sym3);", "// Lab 2: Iterator\nlet someArray = [1, 'string', false];\nfor (let entry of someArray) { console.log(entry); }", "// Lab 3: Generator\nfunction* generator() { yield 1; }"],
-            8: ["// Lab 1: Module Export\n// export const numberRegexp = /^[0-9]+$/;", "// Lab 2: Valid\n// import { numberRegexp } from './ZipCodeValidator';", "// Lab 3: Default\n// export default function (s: string) { ... }"],
-            9: ["// Lab 1: Namespace\nnamespace Validation { export interface StringValidator { isAcceptable(s: string): boolean; } }", "// Lab 2: Alias\nimport pol = Validation.StringValidator;", "// Lab 3: Ambient\n// declare var myLibrary;"],
-            10: ["// Lab 1: Decorator\nfunction sealed(constructor: Function) { Object.seal(constructor); Object.seal(constructor.prototype); }", "// Lab 2: Mixin\n// Mixin pattern example", "// Lab 3: JSX\n// let x = <div />;"]
-        }
-        mod_labs = ts_snippets.get(module_index + 1, [])
-        return mod_labs[lab_index] if lab_index < len(mod_labs) else f"// TS Advanced Lab {lab_index+1}\nconsole.log('TS Complexity');"
-
-    # 9. C (EXECUTABLE)
-    elif language == "c":
-        c_snippets = {
-            1: ["// Lab 1: Hello World\n#include <stdio.h>\nint main() {\n    printf(\"Hello, C!\\n\");\n    return 0;\n}", "// Lab 2: Variables\n#include <stdio.h>\nint main() {\n    int id = 5;\n    printf(\"%d\\n\", id);\n    return 0;\n}", "// Lab 3: Math\n#include <stdio.h>\nint main() {\n    int sum = 10 + 20;\n    printf(\"Sum: %d\\n\", sum);\n    return 0;\n}"],
-            2: ["// Lab 1: Types\n#include <stdio.h>\nint main() {\n    float f = 3.14;\n    char c = 'A';\n    printf(\"%f %c\\n\", f, c);\n    return 0;\n}", "// Lab 2: Input\n#include <stdio.h>\nint main() {\n    int i;\n    // scanf is tricky in web env, using preset\n    i = 10;\n    printf(\"Value: %d\\n\", i);\n    return 0;\n}", "// Lab 3: Constants\n#include <stdio.h>\n#define PI 3.14\nint main() {\n    printf(\"%f\\n\", PI);\n    return 0;\n}"],
-            3: ["// Lab 1: If-Else\n#include <stdio.h>\nint main() {\n    int num = 10;\n    if (num > 0) printf(\"Positive\\n\");\n    return 0;\n}", "// Lab 2: For Loop\n#include <stdio.h>\nint main() {\n    for(int i=0; i<5; i++) printf(\"%d\\n\", i);\n    return 0;\n}", "// Lab 3: While\n#include <stdio.h>\nint main() {\n    int i = 0;\n    while(i < 3) { printf(\"%d\\n\", i++); }\n    return 0;\n}"],
-            4: ["// Lab 1: Function\n#include <stdio.h>\nint add(int a, int b) { return a+b; }\nint main() {\n    printf(\"%d\\n\", add(5, 7));\n    return 0;\n}", "// Lab 2: Pointer\n#include <stdio.h>\nint main() {\n    int i = 5;\n    int *p = &i;\n    printf(\"%d\\n\", *p);\n    return 0;\n}", "// Lab 3: Ref\n#include <stdio.h>\nvoid inc(int *n) { (*n)++; }\nint main() {\n    int a = 10;\n    inc(&a);\n    printf(\"%d\\n\", a);\n    return 0;\n}"],
-            5: ["// Lab 1: Array\n#include <stdio.h>\nint main() {\n    int arr[5] = {1, 2, 3, 4, 5};\n    printf(\"%d\\n\", arr[0]);\n    return 0;\n}", "// Lab 2: String\n#include <stdio.h>\n#include <string.h>\nint main() {\n    char str[] = \"Hello\";\n    printf(\"%lu\\n\", strlen(str));\n    return 0;\n}", "// Lab 3: Multi-dim\n#include <stdio.h>\nint main() {\n    int mat[2][2] = {{1, 2}, {3, 4}};\n    printf(\"%d\\n\", mat[1][1]);\n    return 0;\n}"],
-            6: ["// Lab 1: Struct\n#include <stdio.h>\nstruct Point { int x, y; };\nint main() {\n    struct Point p = {1, 2};\n    printf(\"%d %d\\n\", p.x, p.y);\n    return 0;\n}", "// Lab 2: Union\n#include <stdio.h>\nunion Data { int i; float f; };\nint main() {\n    union Data d; d.i = 10;\n    printf(\"%d\\n\", d.i);\n    return 0;\n}", "// Lab 3: Enumeration\n#include <stdio.h>\nenum Level {LOW, MEDIUM, HIGH};\nint main() {\n    enum Level var = MEDIUM;\n    printf(\"%d\\n\", var);\n    return 0;\n}"],
-            7: ["// Lab 1: Malloc\n#include <stdio.h>\n#include <stdlib.h>\nint main() {\n    int *ptr = (int*)malloc(sizeof(int));\n    *ptr = 5;\n    printf(\"%d\\n\", *ptr);\n    free(ptr);\n    return 0;\n}", "// Lab 2: Calloc\n#include <stdio.h>\n#include <stdlib.h>\nint main() {\n    int *ptr = (int*)calloc(5, sizeof(int));\n    printf(\"%d\\n\", ptr[0]);\n    free(ptr);\n    return 0;\n}", "// Lab 3: Realloc\n#include <stdio.h>\n#include <stdlib.h>\nint main() {\n    int *ptr = malloc(sizeof(int));\n    ptr = realloc(ptr, 2*sizeof(int));\n    free(ptr);\n    return 0;\n}"],
-            8: ["// Lab 1: File Write\n#include <stdio.h>\nint main() {\n    FILE *fp = fopen(\"test.txt\", \"w\");\n    fprintf(fp, \"Hello\");\n    fclose(fp);\n    return 0;\n}", "// Lab 2: File Read\n#include <stdio.h>\nint main() {\n    // Read logic needed on server with file\n    printf(\"File IO simulation\\n\");\n    return 0;\n}", "// Lab 3: Binary\n#include <stdio.h>\nint main() {\n    // Binary IO\n    return 0;\n}"],
-            9: ["// Lab 1: Preprocessor\n#include <stdio.h>\n#define MAX(a,b) ((a)>(b)?(a):(b))\nint main() {\n    printf(\"%d\\n\", MAX(10, 20));\n    return 0;\n}", "// Lab 2: Macro\n#include <stdio.h>\n#define LOG(x) printf(\"Log: %s\\n\", x)\nint main() {\n    LOG(\"Error\");\n    return 0;\n}", "// Lab 3: Include guard\n// #ifndef HEADER_H ..."],
-            10: ["// Lab 1: Error Handling\n#include <stdio.h>\n#include <errno.h>\n#include <string.h>\nint main() {\n    FILE *fp = fopen(\"no.txt\", \"r\");\n    if(fp == NULL) printf(\"Error: %s\\n\", strerror(errno));\n    return 0;\n}", "// Lab 2: Command Line\n#include <stdio.h>\nint main(int argc, char *argv[]) {\n    printf(\"%d args\\n\", argc);\n    return 0;\n}", "// Lab 3: Bitwise\n#include <stdio.h>\nint main() {\n    printf(\"%d\\n\", 5 & 1);\n    return 0;\n}"]
-        }
-        mod_labs = c_snippets.get(module_index + 1, [])
-        return mod_labs[lab_index] if lab_index < len(mod_labs) else f"// C Advanced Lab {lab_index+1}\n#include <stdio.h>\nint main() {{ printf(\"Advanced C\"); return 0; }}"
-
-    # 1. JAVASCRIPT (EXECUTABLE)
-    if language == "javascript":
-        js_snippets = {
-            1: ["// Lab 1: Variables\nconst name = 'Coder';\nconsole.log(`Hello ${name}`);", "// Lab 2: Math\nconsole.log(10 + 5);\nconsole.log(Math.random());", "// Lab 3: Types\nconsole.log(typeof 'text');\nconsole.log(typeof 123);"],
-            2: ["// Lab 1: Equality\nconsole.log(5 === '5');\nconsole.log(5 == '5');", "// Lab 2: Arithmetic\nlet x = 10;\nx += 5;\nconsole.log(x);", "// Lab 3: Strings\nconsole.log('JS'.repeat(3));"],
-            3: ["// Lab 1: If-Else\nconst age = 20;\nif (age >= 18) console.log('Adult');", "// Lab 2: For Loop\nfor(let i=0; i<3; i++) console.log(i);", "// Lab 3: While\nlet k=0;\nwhile(k<3) console.log(k++);"],
-            4: ["// Lab 1: Function\nfunction add(a,b) { return a+b; }\nconsole.log(add(2,3));", "// Lab 2: Arrow\nconst sq = x => x*x;\nconsole.log(sq(5));", "// Lab 3: Scope\n{ let block = 'visible'; }\n// console.log(block); // Error"],
-            5: ["// Lab 1: Array\nconst a = [1,2];\na.push(3);\nconsole.log(a);", "// Lab 2: Map\nconsole.log([1,2].map(x => x*2));", "// Lab 3: JSON\nconst o = {id:1};\nconsole.log(JSON.stringify(o));"],
-            6: ["// Lab 1: Object\nconst user = {name: 'Ali', age: 25};\nconsole.log(user.name);", "// Lab 2: Keys\nconsole.log(Object.keys({a:1, b:2}));", "// Lab 3: Method\nconst o = {f: () => 'Hi'};\nconsole.log(o.f());"],
-            7: ["// Lab 1: Promise\nPromise.resolve('Done').then(console.log);", "// Lab 2: Async\nasync function f() { return 'Fast'; }\nf().then(console.log);", "// Lab 3: Timeout\nsetTimeout(() => console.log('Waited'), 100);"],
-            8: ["// Lab 1: DOM (Sim)\n// document.body.innerHTML = 'Hi';", "// Lab 2: Event\n// btn.addEventListener('click', () => {});", "// Lab 3: Select\n// document.querySelector('#id');"],
-            9: ["// Lab 1: Node\nconsole.log('Running in Node env');", "// Lab 2: Process\nconsole.log(process.version);", "// Lab 3: Module\n// const fs = require('fs');"],
-            10: ["// Lab 1: Try-Catch\ntry { throw new Error('Oops'); } catch(e) { console.log(e.message); }", "// Lab 2: Class\nclass A { constructor() { console.log('Init'); } }\nnew A();", "// Lab 3: RegEx\nconsole.log(/a/.test('apple'));"]
-        }
-        mod_labs = js_snippets.get(module_index + 1, [])
-        return mod_labs[lab_index] if lab_index < len(mod_labs) else f"// JS Advanced Lab {lab_index+1}\nconsole.log('Running complex JS...');"
-
-    # 2. REACT (FRAMEWORK)
-    elif language == "react":
-        react_snippets = {
-            1: ["// Lab 1: Component\nexport default function Hello() {\n  return <h1>Hello React</h1>;\n}", "// Lab 2: JSX Expressions\nconst name = 'User';\nreturn <div>Welcome {name}</div>;", "// Lab 3: Styling\nreturn <div style={{color: 'red'}}>Red Text</div>;"],
-            2: ["// Lab 1: Props\nfunction Card({title}) {\n  return <h2>{title}</h2>;\n}", "// Lab 2: Children\nfunction Layout({children}) {\n  return <main>{children}</main>;\n}", "// Lab 3: Default Props\n// function Button({color='blue'})"],
-            3: ["// Lab 1: State\nconst [count, setCount] = useState(0);\n<button onClick={() => setCount(c => c+1)}>+</button>", "// Lab 2: Toggle\nconst [show, setShow] = useState(true);\n{show && <Modal />}", "// Lab 3: Input\nconst [val, setVal] = useState('');\n<input value={val} onChange={e => setVal(e.target.value)} />"],
-            4: ["// Lab 1: Effect\nuseEffect(() => { console.log('Mounted'); }, []);", "// Lab 2: Dependency\nuseEffect(() => { console.log(count); }, [count]);", "// Lab 3: Cleanup\nuseEffect(() => { return () => console.log('Clean'); }, []);"],
-            5: ["// Lab 1: Ternary\nreturn isLogged ? <Admin /> : <Login />;", "// Lab 2: Logical AND\nreturn {errors.length > 0 && <Alert />};", "// Lab 3: Map\n{items.map(item => <li key={item.id}>{item.name}</li>)}"],
-            6: ["// Lab 1: Form\n<form onSubmit={handleSubmit}>...</form>", "// Lab 2: Controlled\n<input value={email} onChange={handleChange} />", "// Lab 3: Textarea\n<textarea value={desc} />"],
-            7: ["// Lab 1: Link\n<Link to='/about'>About</Link>", "// Lab 2: Route\n<Route path='/user/:id' component={User} />", "// Lab 3: Nav\n<NavLink activeClassName='active'>Home</NavLink>"],
-            8: ["// Lab 1: Context\nconst Theme = createContext('light');", "// Lab 2: Provider\n<Theme.Provider value='dark'><App /></Theme.Provider>", "// Lab 3: Consumer\nconst theme = useContext(Theme);"],
-            9: ["// Lab 1: Custom Hook\nfunction useWindowWidth() { ... }", "// Lab 2: useReducer\nconst [state, dispatch] = useReducer(reducer, init);", "// Lab 3: Ref\nconst inputRef = useRef(null);"],
-            10: ["// Lab 1: Memo\nconst MemoComp = React.memo(MyComp);", "// Lab 2: Lazy\nconst LazyComp = React.lazy(() => import('./Comp'));", "// Lab 3: Portal\nReactDOM.createPortal(child, container);"]
-        }
-        mod_labs = react_snippets.get(module_index + 1, [])
-        return mod_labs[lab_index] if lab_index < len(mod_labs) else f"// React Advanced Component\nexport default function App() {{ return <div>Advanced React</div> }}"
-
-    # 3. HTML (MARKUP)
-    elif language == "html":
-        html_snippets = {
-            1: ["<!-- Lab 1: Boilerplate -->\n<!DOCTYPE html>\n<html>\n<body>Hello</body>\n</html>", "<!-- Lab 2: Headings -->\n<h1>Main</h1>\n<h2>Sub</h2>", "<!-- Lab 3: Paragraphs -->\n<p>First p</p>\n<p>Second p</p>"],
-            2: ["<!-- Lab 1: Form -->\n<form>\n  <input type='text' required />\n</form>", "<!-- Lab 2: Checkbox -->\n<input type='checkbox'> Agree", "<!-- Lab 3: Button -->\n<button>Submit</button>"],
-            3: ["<!-- Lab 1: Image -->\n<img src='logo.png' alt='Logo' />", "<!-- Lab 2: Link -->\n<a href='https://example.com'>Go</a>", "<!-- Lab 3: List -->\n<ul><li>Item 1</li></ul>"],
-            4: ["<!-- Lab 1: Video -->\n<video controls src='movie.mp4'></video>", "<!-- Lab 2: Audio -->\n<audio controls src='song.mp3'></audio>", "<!-- Lab 3: Embed -->\n<iframe src='...'></iframe>"],
-            5: ["<!-- Lab 1: Table -->\n<table><tr><td>Data</td></tr></table>", "<!-- Lab 2: Table Head -->\n<thead><tr><th>ID</th></tr></thead>", "<!-- Lab 3: Merge -->\n<td colspan='2'>Wide</td>"],
-            6: ["<!-- Lab 1: Meta -->\n<meta name='description' content='Site'>", "<!-- Lab 2: Title -->\n<title>My Page</title>", "<!-- Lab 3: Charset -->\n<meta charset='UTF-8'>"],
-            7: ["<!-- Lab 1: New Tab -->\n<a target='_blank' href='...'>Link</a>", "<!-- Lab 2: Relative -->\n<img src='./img/pic.jpg'>", "<!-- Lab 3: Anchor -->\n<a href='#section1'>Jump</a>"],
-            8: ["<!-- Lab 1: Script -->\n<script src='app.js'></script>", "<!-- Lab 2: Style -->\n<link rel='stylesheet' href='style.css'>", "<!-- Lab 3: Favicon -->\n<link rel='icon' href='icon.png'>"],
-            9: ["<!-- Lab 1: Semantics -->\n<article>Content</article>", "<!-- Lab 2: Footer -->\n<footer>Copyright</footer>", "<!-- Lab 3: Nav -->\n<nav>Links</nav>"],
-            10: ["<!-- Lab 1: Data Attr -->\n<div data-id='123'>User</div>", "<!-- Lab 2: Accessible -->\n<button aria-label='Close'>X</button>", "<!-- Lab 3: Canvas -->\n<canvas id='game'></canvas>"]
-        }
-        mod_labs = html_snippets.get(module_index + 1, [])
-        return mod_labs[lab_index] if lab_index < len(mod_labs) else "<!-- HTML Advanced Structure -->\n<div class='container'>Content</div>"
 
-    # 4. CSS (STYLE)
-    elif language == "css":
-        css_snippets = {
-            1: ["/* Lab 1: Selectors */\np {\n  color: red;\n}", "/* Lab 2: ID */\n#main {\n  background: #eee;\n}", "/* Lab 3: Class */\n.card {\n  border: 1px solid black;\n}"],
-            2: ["/* Lab 1: Box Model */\ndiv {\n  padding: 20px;\n  margin: 10px;\n}", "/* Lab 2: Border */\n.box {\n  border-radius: 5px;\n}", "/* Lab 3: Size */\nimg {\n  width: 100%;\n}"],
-            3: ["/* Lab 1: Font */\nbody {\n  font-family: sans-serif;\n}", "/* Lab 2: Weight */\nh1 {\n  font-weight: bold;\n}", "/* Lab 3: Align */\np {\n  text-align: center;\n}"],
-            4: ["/* Lab 1: Flex */\n.row {\n  display: flex;\n}", "/* Lab 2: Justify */\n.row {\n  justify-content: center;\n}", "/* Lab 3: Align Items */\n.row {\n  align-items: center;\n}"],
-            5: ["/* Lab 1: Grid */\n.grid {\n  display: grid;\n}", "/* Lab 2: Columns */\n.grid {\n  grid-template-columns: 1fr 1fr;\n}", "/* Lab 3: Gap */\n.grid {\n  gap: 20px;\n}"],
-            6: ["/* Lab 1: Mobile */\n@media (max-width: 600px) {\n  .nav { display: none; }\n}", "/* Lab 2: Desktop */\n@media (min-width: 1024px) {\n  .container { width: 960px; }\n}", "/* Lab 3: Print */\n@media print {\n  .ad { display: none; }\n}"],
-            7: ["/* Lab 1: Transition */\nbutton {\n  transition: all 0.3s;\n}", "/* Lab 2: Transform */\n.card:hover {\n  transform: scale(1.05);\n}", "/* Lab 3: Keyframes */\n@keyframes spin {\n  to { transform: rotate(360deg); }\n}"],
-            8: ["/* Lab 1: Variable */\n:root {\n  --main-color: blue;\n}", "/* Lab 2: Use Var */\na {\n  color: var(--main-color);\n}", "/* Lab 3: Calc */\n.sidebar {\n  width: calc(100% - 200px);\n}"],
-            9: ["/* Lab 1: Hover */\na:hover {\n  text-decoration: underline;\n}", "/* Lab 2: Focus */\ninput:focus {\n  outline: 2px solid blue;\n}", "/* Lab 3: First Child */\nli:first-child {\n  font-weight: bold;\n}"],
-            10: ["/* Lab 1: Shadow */\n.card {\n  box-shadow: 0 2px 4px rgba(0,0,0,0.1);\n}", "/* Lab 2: Gradient */\n.hero {\n  background: linear-gradient(to right, red, blue);\n}", "/* Lab 3: Z-Index */\n.modal {\n  z-index: 1000;\n}"]
-        }
-        mod_labs = css_snippets.get(module_index + 1, [])
-        return mod_labs[lab_index] if lab_index < len(mod_labs) else "/* Advanced CSS */\n.expert {\n  display: grid;\n}"
-
-    # 5. PYTHON
-    elif language == "python":
-        py_snippets = {
-            1: [ # Intro
-                "# Lab 1: Hello World & Vars\nname = 'Student'\nprint(f'Hello {name}, Welcome to Python 3.10+')",
-                "# Lab 2: Math\na, b = 10, 5\nprint(f'{a} + {b} = {a+b}')\nprint(f'{a} ** {b} = {a**b}')",
-                "# Lab 3: Input\n# Note: Input is simulated in some envs\nuser = 'Guest' # input('Enter name: ')\nprint(f'{user} is learning code!')"
-            ],
-            2: [ # Variables & Memory
-                "# Lab 1: Types\nx = 10\ny = 3.14\nz = 'Text'\nprint(type(x), type(y), type(z))",
-                "# Lab 2: ID Check\na = [1, 2]\nb = a\nprint(f'Same object? {id(a) == id(b)}')",
-                "# Lab 3: Swap\na, b = 5, 10\na, b = b, a\nprint(f'a={a}, b={b}')"
-            ],
-            3: [ # Control Flow
-                "# Lab 1: Simple If\nx = 10\nif x > 0: print('Positive')",
-                "# Lab 2: If-Else\nx = 10\nmsg = 'Even' if x%2==0 else 'Odd'\nprint(msg)",
-                "# Lab 3: Match Case\ncmd = 'start'\nmatch cmd:\n    case 'start': print('Go')\n    case 'stop': print('Halt')"
-            ],
-            4: [ # Functions
-                "# Lab 1: Def\ndef greet(n):\n    return f'Hi {n}'\nprint(greet('Eve'))",
-                "# Lab 2: Args\ndef add(a, b=1):\n    return a + b\nprint(add(5))",
-                "# Lab 3: Lambda\nsq = lambda x: x*x\nprint(list(map(sq, [1,2,3])))"
-            ],
-            5: [ # Lists/Tuples
-                "# Lab 1: List Ops\nl = [1, 2, 3]\nl.append(4)\nprint(l)",
-                "# Lab 2: Tuple\nt = (10, 20)\n# t[0] = 5 # Error\nprint(t)",
-                "# Lab 3: Slicing\ntxt = 'Python'\nprint(txt[::-1])"
-            ],
-            6: [ # Dicts
-                "# Lab 1: Dict Basics\nd = {'a': 1}\nprint(d['a'])",
-                "# Lab 2: Keys\nd = {'x': 10, 'y': 20}\nprint(list(d.keys()))",
-                "# Lab 3: Get\nd = {}\nprint(d.get('miss', 'default'))"
-            ],
-            7: [ # OOP Basics
-                "# Lab 1: Class\nclass Cat:\n  def meow(self): print('Meow')\nc = Cat()\nc.meow()",
-                "# Lab 2: Init\nclass User:\n  def __init__(self, name):\n    self.name = name\nprint(User('Ali').name)",
-                "# Lab 3: Methods\nclass Calc:\n  def add(self, a, b): return a+b\nprint(Calc().add(1,2))"
-            ],
-            8: [ # OOP Advanced
-                "# Lab 1: Inheritance\nclass A: pass\nclass B(A): pass\nprint(issubclass(B, A))",
-                "# Lab 2: Super\nclass Base:\n  def hi(self): print('Base')\nclass Sub(Base):\n  def hi(self): super().hi(); print('Sub')\nSub().hi()",
-                "# Lab 3: Decorator\ndef log(f):\n  def w(): print('Run'); f()\n  return w\n@log\ndef hi(): print('Hi')\nhi()"
-            ],
-            9: [ # Error Handling
-                "# Lab 1: Try/Except\ntry:\n  print(1/0)\nexcept ZeroDivisionError:\n  print('No divide by zero')",
-                "# Lab 2: Finally\ntry: 1/1\nfinally: print('Done')",
-                "# Lab 3: Raise\ndef check(x):\n  if x < 0: raise ValueError('Neg')\ntry: check(-1)\nexcept ValueError as e: print(e)"
-            ],
-            10: [ # Advanced Libs
-                "# Lab 1: OS\nimport os\nprint(os.name)",
-                "# Lab 2: Math\nimport math\nprint(math.pi)",
-                "# Lab 3: JSON\nimport json\nd = {'k': 'v'}\nprint(json.dumps(d))"
-            ]
-        }
-        mod_labs = py_snippets.get(module_index + 1, [])
-        return mod_labs[lab_index] if lab_index < len(mod_labs) else f"# Python Advanced Lab {lab_index+1}"
-
-    # 6. JAVA
-    elif language == "java":
-        java_snippets = {
-            1: ["System.out.println(\"Hello JVM\");", "int x=10; System.out.println(x);", "String s=\"Java\"; System.out.println(s);"],
-            2: ["int a=5, b=10; System.out.println(Math.max(a,b));", "char c='A'; System.out.println((int)c);", "boolean f=true; System.out.println(!f);"],
-            3: ["int x=10; if(x>5) System.out.println(\"High\");", "for(int i=0;i<3;i++) System.out.print(i);", "int k=0; while(k<3) {System.out.print(k++);}"],
-            4: ["static void hi(){System.out.println(\"Hi\");} public static void main(String[] a){hi();}", "static int add(int a){return a+1;} public static void main(String[] x){System.out.println(add(5));}", "System.out.println(\"Scope Test\");"],
-            5: ["int[] a={1,2}; System.out.println(a[0]);", "String s=\"Text\"; System.out.println(s.length());", "String[] arr={\"A\",\"B\"}; System.out.println(arr[1]);"],
-            6: ["class Dog{void bark(){System.out.println(\"Woof\");}} public static void main(String[] a){new Dog().bark();}", "class P{int x=10;} System.out.println(new P().x);", "class T{T(){System.out.println(\"Init\");}} new T();"],
-            7: ["class A{void f(){System.out.println(\"A\");}} class B extends A{} new B().f();", "class A{int x=1;} class B extends A{int x=2;} System.out.println(new B().x);", "interface I{void m();} class C implements I{public void m(){System.out.println(\"I\");}} new C().m();"],
-            8: ["interface I{default void d(){System.out.println(\"Def\");}}", "abstract class A{abstract void m();} class B extends A{void m(){System.out.println(\"B\");}}", "Object o = \"S\"; if(o instanceof String) System.out.println(\"Is String\");"],
-            9: ["try{int x=1/0;}catch(Exception e){System.out.println(\"Zero\");}", "throw new RuntimeException(\"Test\");", "try{throw new Exception();}catch(Exception e){e.printStackTrace();}"],
-            10: ["import java.util.*; List<String> l=new ArrayList<>(); l.add(\"A\"); System.out.println(l);", "import java.util.*; Map<String,Integer> m=new HashMap<>(); m.put(\"K\",1); System.out.println(m);", "import java.util.stream.*; Stream.of(1,2,3).forEach(System.out::print);"]
-        }
-        mod_labs = java_snippets.get(module_index + 1, [])
-        if lab_index < len(mod_labs):
-            class_wrapper = f"public class Main {{\n    public static void main(String[] args) {{\n        {mod_labs[lab_index]}\n    }}\n}}"
-            if "class " in mod_labs[lab_index] or "interface " in mod_labs[lab_index]:
-                 class_wrapper = f"// Lab Code\n{mod_labs[lab_index]}"
-                 if "public static void main" not in class_wrapper:
-                     class_wrapper += "\n\npublic class Main { public static void main(String[] a) { System.out.println(\"Run specific logic inside classes\"); } }"
-            return class_wrapper
-        return "public class Main { public static void main(String[] a) { System.out.println(\"Advanced Java\"); } }"
-
-    # 7. C++
-    elif language == "cpp":
-        cpp_snippets = {
-             1: ["cout << \"Hello C++\" << endl;", "int x=10; cout << x << endl;", "cout << \"Size: \" << sizeof(int) << endl;"],
-             2: ["int x=10; int &y=x; y=20; cout << x;", "const int C=100; cout << C;", "auto x=5; cout << x;"],
-             3: ["if(true) cout << \"Yes\";", "for(int i=0;i<3;i++) cout << i;", "int i=0; while(i<3) cout << i++;"],
-             4: ["void f() { cout << \"F\"; } int main() { f(); return 0; }", "int add(int a, int b) { return a+b; } int main() { cout << add(1,2); return 0; }", "void swap(int &a, int &b) { int t=a; a=b; b=t; }"],
-             6: ["class Box { public: int w; }; int main() { Box b; b.w=10; cout << b.w; return 0; }", "class T { public: T() { cout << \"Ctor\"; } }; int main() { T t; return 0; }", "class P { private: int x; public: void s(int v) { x=v; } };"],
-        }
-        mod_labs = cpp_snippets.get(module_index + 1, [])
-        if lab_index < len(mod_labs):
-             snippet = mod_labs[lab_index]
-             if "int main" in snippet: return f"#include <iostream>\nusing namespace std;\n{snippet}"
-             return f"#include <iostream>\nusing namespace std;\nint main() {{ {snippet} return 0; }}"
-
-        return f"#include <iostream>\nusing namespace std;\nint main() {{\n    cout << \"Running C++ Lab...\" << endl;\n    return 0;\n}}"
-
-    # 10. SQL (Non-Executable / Walkthrough Display)
-    elif language == "sql":
-        sql_snippets = {
-            1: ["-- SQL Lab 1: Relational Schema Creation\nCREATE TABLE Users (\n    id INT PRIMARY KEY,\n    name VARCHAR(50) NOT NULL,\n    email VARCHAR(100) UNIQUE\n);", "-- SQL Lab 2: Primary & Foreign Keys\nCREATE TABLE Orders (\n    order_id INT PRIMARY KEY,\n    user_id INT,\n    amount DECIMAL(10,2),\n    FOREIGN KEY (user_id) REFERENCES Users(id)\n);", "-- SQL Lab 3: Basic Constraints\nCREATE TABLE Products (\n    prod_id INT PRIMARY KEY,\n    name VARCHAR(100),\n    price DECIMAL(10,2) CHECK (price > 0)\n);"],
-            2: ["-- SQL DDL Altering structures\nALTER TABLE Users ADD phone VARCHAR(20);", "-- SQL DDL Dropping elements\nDROP TABLE TempUsers;", "-- SQL DDL Truncating tables\nTRUNCATE TABLE TempLogs;"]
-        }
-        mod_labs = sql_snippets.get(module_index + 1, [])
-        return mod_labs[lab_index] if lab_index < len(mod_labs) else f"-- SQL Module {module_index + 1} Practice Query\nSELECT * FROM Users WHERE id = 1;"
-
-    # 11. MONGODB (Non-Executable / Walkthrough Display)
-    elif language == "mongodb":
-        mongo_snippets = {
-            1: ["// MongoDB Lab 1: Insert documents\ndb.users.insertOne({\n  name: 'Alice',\n  email: 'alice@domain.com',\n  age: 25\n});", "// MongoDB Lab 2: Query filters ($gte, $in)\ndb.users.find({\n  age: { $gte: 21 },\n  status: { $in: ['active', 'pending'] }\n});", "// MongoDB Lab 3: Projections\ndb.users.find(\n  { age: { $gte: 21 } },\n  { name: 1, email: 1, _id: 0 }\n);"],
-            2: ["// MongoDB Lab 1: Field modifier ($set)\ndb.users.updateOne(\n  { email: 'alice@domain.com' },\n  { $set: { status: 'verified' } }\n);", "// MongoDB Lab 2: Increment numeric values ($inc)\ndb.users.updateMany(\n  { status: 'active' },\n  { $inc: { login_count: 1 } }\n);", "// MongoDB Lab 3: Push elements to arrays ($push)\ndb.users.updateOne(\n  { name: 'Alice' },\n  { $push: { roles: 'admin' } }\n);"]
-        }
-        mod_labs = mongo_snippets.get(module_index + 1, [])
-        return mod_labs[lab_index] if lab_index < len(mod_labs) else f"// MongoDB Module {module_index + 1} Query\ndb.users.find({{}});"
-
-    # Default
-    return f"// Code for {module_title}"
+def get_prebuilt_code_snippet(topic, topic_type, module_index, lab_index=0, module_title=""):
+    """
+    Return a runnable, pre-loaded code snippet based on topic, module, and specific lab index.
+    Ensures difficulty progression and NO placeholders.
+    """
+    language = _snippet_language(topic)
+    labs = content_library.section(language, "labs").get("snippets", {}).get(module_index + 1, ())
+    if 0 <= lab_index < len(labs):
+        return _runnable_snippet(language, labs[lab_index])
+    fallback = _SNIPPET_FALLBACKS.get(language)
+    if fallback is None:
+        return f"// Code for {module_title}"
+    return fallback.format(lab=lab_index + 1, module=module_index + 1)
+
+
+def get_lab_test_cases(language, module_number, lab_index):
+    """Hidden grading cases for a prebuilt lab: [{"stdin", "expected_output"}, ...], or None."""
+    cases = content_library.section(language, "labs").get("test_cases", {}).get(module_number, {}).get(lab_index)
+    return thaw(cases) if cases else None
+
+
+# Lab titles and descriptions for languages whose labs.json has no "contexts"
+DEFAULT_MINI_LAB_CONTEXT = freeze({
+    0: {"title": "Fundamentals & Basics", "desc": "Start with the core concepts."},
+    1: {"title": "Logic & Application", "desc": "Apply what you've learned."},
+    2: {"title": "Advanced Challenge", "desc": "Solve a complex problem."}
+})
+
+
+@lru_cache(maxsize=1024)
+def _mini_lab_language(lang_lower):
+    if "html" in lang_lower: return "html"
+    elif "css" in lang_lower: return "css"
+    elif "react" in lang_lower: return "react"
+    elif "go" in lang_lower: return "go"
+    elif "typescript" in lang_lower: return "typescript"
+    elif "c " in f" {lang_lower} " or lang_lower == "c": return "c"
+    elif "sql" in lang_lower: return "sql"
+    elif "mongodb" in lang_lower or "mongo" in lang_lower: return "mongodb"
+    return None
 
 
 def get_mini_labs(language, module_title, module_number, topic_type="EXECUTABLE"):
@@ -714,65 +541,9 @@ def get_mini_labs(language, module_title, module_number, topic_type="EXECUTABLE"
     """
     module_index = module_number - 1
     lang_lower = language.lower()
+    lab_context = content_library.section(_mini_lab_language(lang_lower), "labs").get("contexts") or DEFAULT_MINI_LAB_CONTEXT
 
     labs = []
-    
-    # Lab Titles/Descriptions Map
-    lab_context = {
-        0: {"title": "Fundamentals & Basics", "desc": "Start with the core concepts."},
-        1: {"title": "Logic & Application", "desc": "Apply what you've learned."},
-        2: {"title": "Advanced Challenge", "desc": "Solve a complex problem."}
-    }
-    
-    if "html" in lang_lower:
-        lab_context = {
-            0: {"title": "Structure & Semantics", "desc": "Build the HTML skeleton."},
-            1: {"title": "Content & Attributes", "desc": "Add meaningful attributes and content."},
-            2: {"title": "Forms & Interaction", "desc": "Create interactive elements."}
-        }
-    elif "css" in lang_lower:
-        lab_context = {
-            0: {"title": "Selectors & Colors", "desc": "Apply basic styling."},
-            1: {"title": "Box Model & Layout", "desc": "Control spacing and positioning."},
-            2: {"title": "Responsive Design", "desc": "Make it look good on all screens."}
-        }
-    elif "react" in lang_lower:
-        lab_context = {
-            0: {"title": "Component Logic", "desc": "Define the component structure."},
-            1: {"title": "State & Props", "desc": "Manage data flow."},
-            2: {"title": "Interactivity", "desc": "Handle user events and effects."}
-        }
-    elif "go" in lang_lower:
-        lab_context = {
-            0: {"title": "Go Basics", "desc": "Understand packages and main function.", "tasks": ["Create a Hello World program", "Declare variables with types", "Print formatted output"]},
-            1: {"title": "Control Structures", "desc": "Implement flow control logic.", "tasks": ["Write a for loop", "Use if-else conditions", "Implement a switch statement"]},
-            2: {"title": "Concurrency", "desc": "Use Goroutines and Channels.", "tasks": ["Start a Goroutine", "Send data to a Channel", "Receive from a Channel"]}
-        }
-    elif "typescript" in lang_lower:
-        lab_context = {
-            0: {"title": "Type Safety", "desc": "Define interfaces and types.", "tasks": ["Define an Interface", "Use strict types", "Compile to JavaScript"]},
-            1: {"title": "Functions & Classes", "desc": "Use OOP with strong typing.", "tasks": ["Create a Class", "Implement a Method", "Use Arrow Functions"]},
-            2: {"title": "Advanced Features", "desc": "Generics and Decorators.", "tasks": ["Use a Generic function", "Apply a Decorator", "Use Union types"]}
-        }
-    elif "c " in f" {lang_lower} " or lang_lower == "c":
-        lab_context = {
-            0: {"title": "Memory & Pointers", "desc": "Direct memory manipulation.", "tasks": ["Declare a pointer", "Use address-of operator", "Dereference a pointer"]},
-            1: {"title": "Structs & Unions", "desc": "Custom data types.", "tasks": ["Define a Struct", "Access struct members", "Use a Union"]},
-            2: {"title": "System Calls", "desc": "Interact with the OS.", "tasks": ["Use malloc/free", "Read a file", "Handle errors"]}
-        }
-    elif "sql" in lang_lower:
-        lab_context = {
-            0: {"title": "Database Schema DDL", "desc": "Write CREATE and ALTER TABLE statements to define your relational schema.", "tasks": ["Create a Users table", "Define primary and foreign keys", "Add check constraints"]},
-            1: {"title": "Data Querying with JOINs", "desc": "Formulate SELECT queries combining data from multiple tables using INNER and LEFT JOINs.", "tasks": ["Perform an INNER JOIN", "Write a LEFT JOIN showing empty relations", "Apply aggregates on the joined datasets"]},
-            2: {"title": "Grouping and Filtering", "desc": "Use aggregates, GROUP BY, and HAVING to segment and filter records.", "tasks": ["Calculate total counts", "Filter groups using HAVING", "Write nested subqueries"]}
-        }
-    elif "mongodb" in lang_lower or "mongo" in lang_lower:
-        lab_context = {
-            0: {"title": "Document CRUD Operations", "desc": "Practice insertOne, insertMany, find, and update queries.", "tasks": ["Insert complex nested documents", "Filter using query operators like $gte", "Use array update operators like $push"]},
-            1: {"title": "Data Modeling & References", "desc": "Explore embedded documents vs referenced document collections.", "tasks": ["Design a denormalized embedded schema", "Model 1:Many relationships using ObjectId references", "Perform aggregate $lookup queries"]},
-            2: {"title": "Aggregation Pipelines", "desc": "Build aggregation stages to transform and compute stats on collection documents.", "tasks": ["Match and filter input documents", "Group by specific fields and sum values", "Unwind arrays and project fields"]}
-        }
-
     for i in range(3):
         # We pass the detected or provided topic_type to snippet generator
         # Note: snippet generator mostly relies on language string now, but good practice
@@ -782,319 +553,68 @@ def get_mini_labs(language, module_title, module_number, topic_type="EXECUTABLE"
         lab_title = f"Lab {i+1}: {ctx['title']}"
         description = ctx['desc']
         
-        tasks = ctx.get("tasks", [])
+        tasks = list(ctx.get("tasks", ()))
         if not tasks:
             tasks = [f"Task {i+1}.1: Analyze the code", f"Task {i+1}.2: Modify and Run"]
 
-        labs.append({
+        lab = {
             "title": lab_title,
             "description": description,
             "preloaded_code": code, 
             "tasks": tasks 
-        })
+        }
+        test_cases = get_lab_test_cases(lang_lower, module_number, i)
+        if test_cases:
+            lab["test_cases"] = test_cases
+        labs.append(lab)
     
     return labs
 
+
+# For languages or modules without prebuilt questions; {module_title} is filled in per call
+GENERIC_MODULE_QUIZ = freeze([
+    {"question": "Key concept of {module_title}?", "options": ["Core Logic", "UI", "DB", "Net"], "answer": "Core Logic", "explanation": "Central to {module_title}.", "difficulty": "easy", "type": "theory"},
+    {"question": "Why use this?", "options": ["Efficiency", "Fun", "Required", "Hard"], "answer": "Efficiency", "explanation": "Solves problems.", "difficulty": "easy", "type": "theory"},
+    {"question": "Best practice?", "options": ["Clean Code", "Chaos", "Fast", "Short"], "answer": "Clean Code", "explanation": "Readable.", "difficulty": "medium", "type": "theory"},
+    {"question": "Debug how?", "options": ["Logs", "Guess", "Delete", "Rewrite"], "answer": "Logs", "explanation": "Trace execution.", "difficulty": "medium", "type": "code"},
+    {"question": "Type?", "options": ["Concept", "Tool", "Lang", "Game"], "answer": "Concept", "explanation": "Learning unit.", "difficulty": "easy", "type": "theory"},
+    {"question": "Performance factor?", "options": ["Algorithm", "Color", "Name", "Comments"], "answer": "Algorithm", "explanation": "Complexity.", "difficulty": "medium", "type": "theory"},
+    {"question": "Common error?", "options": ["Syntax", "Hardware", "User", "Network"], "answer": "Syntax", "explanation": "Typo.", "difficulty": "easy", "type": "code"},
+    {"question": "Optimization?", "options": ["Refactor", "Ignore", "Delete", "Hide"], "answer": "Refactor", "explanation": "Improve.", "difficulty": "hard", "type": "code"},
+    {"question": "Security risk?", "options": ["Injection", "Speed", "Space", "Time"], "answer": "Injection", "explanation": "Input.", "difficulty": "hard", "type": "theory"},
+    {"question": "Future trend?", "options": ["AI", "Fax", "Tape", "CD"], "answer": "AI", "explanation": "Automation.", "difficulty": "medium", "type": "theory"}
+])
+
+
+@lru_cache(maxsize=1024)
+def _quiz_language(lang_lower):
+    if "python" in lang_lower: return "python"
+    elif "javascript" in lang_lower or "node" in lang_lower: return "javascript"
+    elif "react" in lang_lower: return "react"
+    elif "html" in lang_lower: return "html"
+    elif "css" in lang_lower: return "css"
+    elif "java" in lang_lower: return "java"
+    elif "go" in lang_lower: return "go"
+    elif "typescript" in lang_lower or "ts" in lang_lower: return "typescript"
+    elif "c " in f" {lang_lower} " or lang_lower == "c": return "c"
+    elif "sql" in lang_lower: return "sql"
+    elif "mongodb" in lang_lower or "mongo" in lang_lower: return "mongodb"
+    return None
+
+
 def get_module_quiz(language, topic_type, module_title, module_number):
     """
     Generate a quiz for the module with ~3 questions each.
     """
-    lang_lower = language.lower()
-    
-    # 1. PYTHON QUIZZES
-    python_quizzes = {
-        1: [
-            {"question": "Who created Python?", "options": ["Guido van Rossum", "Gosling", "Stroustrup", "Ritchie"], "answer": "Guido van Rossum", "explanation": "1991.", "difficulty": "easy", "type": "theory"}, 
-            {"question": "Extension?", "options": [".py", ".python", ".p", ".txt"], "answer": ".py", "explanation": "Standard.", "difficulty": "easy", "type": "theory"}, 
-            {"question": "Print?", "options": ["print()", "echo", "cout", "log"], "answer": "print()", "explanation": "Function.", "difficulty": "easy", "type": "code"},
-            {"question": "Output: print(2**3)?", "options": ["8", "6", "9", "Error"], "answer": "8", "explanation": "Exponentiation.", "difficulty": "medium", "type": "code"},
-            {"question": "Which is NOT a valid variable name?", "options": ["2myVar", "my_var", "_myVar", "myVar2"], "answer": "2myVar", "explanation": "Cannot start with digit.", "difficulty": "medium", "type": "syntax"},
-            {"question": "What is Python?", "options": ["Interpreted", "Compiled", "Assembly", "Hardware"], "answer": "Interpreted", "explanation": "Line by line.", "difficulty": "easy", "type": "theory"},
-            {"question": "Comments start with?", "options": ["#", "//", "/*", "<!--"], "answer": "#", "explanation": "Hash symbol.", "difficulty": "easy", "type": "syntax"},
-            {"question": "Output: print('a'+'b')?", "options": ["ab", "a+b", "Error", "ba"], "answer": "ab", "explanation": "Concatenation.", "difficulty": "medium", "type": "code"},
-            {"question": "Multiline string?", "options": ["'''...'''", "//...", "#...", "/*...*/"], "answer": "'''...'''", "explanation": "Triple quotes.", "difficulty": "medium", "type": "syntax"},
-            {"question": "Type of 5.0?", "options": ["float", "int", "str", "double"], "answer": "float", "explanation": "Decimal.", "difficulty": "medium", "type": "theory"}
-        ],
-        2: [{"question": "Mutable?", "options": ["List", "Tuple", "Int", "Str"], "answer": "List", "explanation": "Changeable."}, {"question": "Immutable?", "options": ["Tuple", "List", "Set", "Dict"], "answer": "Tuple", "explanation": "Fixed."}, {"question": "Type check?", "options": ["type()", "check()", "typeof", "is"], "answer": "type()", "explanation": "Builtin."}],
-        3: [{"question": "Loop keyword?", "options": ["for", "loop", "repeat", "cycle"], "answer": "for", "explanation": "Standard."}, {"question": "Range(3)?", "options": ["0, 1, 2", "1, 2, 3", "0, 1", "1, 2"], "answer": "0, 1, 2", "explanation": "Start 0."}, {"question": "Stop loop?", "options": ["break", "stop", "exit", "end"], "answer": "break", "explanation": "Exit."}],
-        4: [{"question": "Define func?", "options": ["def", "func", "function", "void"], "answer": "def", "explanation": "Keyword."}, {"question": "Return?", "options": ["return", "back", "out", "exit"], "answer": "return", "explanation": "Value."}, {"question": "Lambda?", "options": ["Anonymous", "Named", "Class", "Loop"], "answer": "Anonymous", "explanation": "One line."}],
-        5: [{"question": "Append?", "options": [".append()", ".push()", ".add()", ".insert()"], "answer": ".append()", "explanation": "End."}, {"question": "Remove?", "options": [".remove()", ".delete()", ".pop()", ".kill()"], "answer": ".remove()", "explanation": "Item."}, {"question": "Length?", "options": ["len()", "size()", "count()", "length"], "answer": "len()", "explanation": "Size."}],
-        6: [{"question": "Dict definition?", "options": ["{}", "[]", "()", "<>"], "answer": "{}", "explanation": "Braces."}, {"question": "Get value?", "options": [".get()", "[]", "fetch", "find"], "answer": ".get()", "explanation": "Safe."}, {"question": "Key type?", "options": ["Immutable", "Any", "Int", "Str"], "answer": "Immutable", "explanation": "Hashable."}],
-        7: [{"question": "Class keyword?", "options": ["class", "struct", "object", "def"], "answer": "class", "explanation": "Blueprint."}, {"question": "Init method?", "options": ["__init__", "init", "start", "new"], "answer": "__init__", "explanation": "Constructor."}, {"question": "Self?", "options": ["Current instance", "Static", "Global", "Parent"], "answer": "Current instance", "explanation": "Context."}],
-        8: [{"question": "Inheritance?", "options": ["Parent-Child", "Sibling", "Friend", "Enemy"], "answer": "Parent-Child", "explanation": "Reuse."}, {"question": "Super?", "options": ["Parent access", "Global", "Root", "Admin"], "answer": "Parent access", "explanation": "Delegation."}, {"question": "Decorator?", "options": ["@wrapper", "#comment", "$var", "&ref"], "answer": "@wrapper", "explanation": "Modify behavior."}],
-        9: [{"question": "Try block?", "options": ["Code that might crash", "Safe code", "Loop", "Test"], "answer": "Code that might crash", "explanation": "Risk."}, {"question": "Catch error?", "options": ["except", "catch", "error", "handle"], "answer": "except", "explanation": "Handle."}, {"question": "Always run?", "options": ["finally", "done", "always", "end"], "answer": "finally", "explanation": "Cleanup."}],
-        10: [{"question": "OS module?", "options": ["System ops", "Math", "Web", "Graphics"], "answer": "System ops", "explanation": "Files/Process."}, {"question": "JSON?", "options": ["Data format", "Code", "Database", "Game"], "answer": "Data format", "explanation": "Interchange."}, {"question": "Pip?", "options": ["Installer", "Game", "Editor", "Env"], "answer": "Installer", "explanation": "Packages."}]
-    }
-
-    # 2. JAVASCRIPT QUIZZES
-    js_quizzes = {
-        1: [
-            {"question": "JS Engine?", "options": ["V8", "Motor", "Engine.js", "Sprint"], "answer": "V8", "explanation": "Chrome.", "difficulty": "easy", "type": "theory"},
-            {"question": "Console?", "options": ["console.log", "print", "echo", "out"], "answer": "console.log", "explanation": "Output.", "difficulty": "easy", "type": "code"},
-            {"question": "Variable?", "options": ["let", "int", "str", "bool"], "answer": "let", "explanation": "Block scoped.", "difficulty": "easy", "type": "syntax"},
-            {"question": "Strict Equal?", "options": ["===", "==", "=", "eq"], "answer": "===", "explanation": "Values & Types.", "difficulty": "medium", "type": "code"},
-            {"question": "Typeof?", "options": ["Operator", "Function", "Method", "Prop"], "answer": "Operator", "explanation": "Returns string.", "difficulty": "medium", "type": "theory"},
-            {"question": "NaN?", "options": ["Not a Number", "Null", "New", "None"], "answer": "Not a Number", "explanation": "Numeric.", "difficulty": "medium", "type": "theory"},
-            {"question": "Event?", "options": ["click", "tap", "hit", "punch"], "answer": "click", "explanation": "Interaction.", "difficulty": "easy", "type": "code"},
-            {"question": "DOM?", "options": ["Document Object Model", "Data", "Disk", "Done"], "answer": "Document Object Model", "explanation": "Tree.", "difficulty": "hard", "type": "theory"},
-            {"question": "Async?", "options": ["Promise", "Wait", "Block", "Stop"], "answer": "Promise", "explanation": "Future.", "difficulty": "hard", "type": "code"},
-            {"question": "JSON parses?", "options": ["JSON.parse()", "JSON.read()", "JSON.to()", "parse()"], "answer": "JSON.parse()", "explanation": "String to Obj.", "difficulty": "medium", "type": "syntax"}
-        ],
-        2: [{"question": "Strict Equal?", "options": ["===", "==", "=", "eq"], "answer": "===", "explanation": "Values & Types."}, {"question": "Typeof?", "options": ["Operator", "Function", "Method", "Prop"], "answer": "Operator", "explanation": "Returns string."}, {"question": "NaN?", "options": ["Not a Number", "Null", "New", "None"], "answer": "Not a Number", "explanation": "Invalid math."}],
-        3: [{"question": "For loop?", "options": ["Iterate", "Define", "Import", "Export"], "answer": "Iterate", "explanation": "Repeat."}, {"question": "While?", "options": ["Cond loop", "Once", "Never", "Always"], "answer": "Cond loop", "explanation": "Until false."}, {"question": "Switch?", "options": ["Multi-branch", "Toggle", "Button", "Light"], "answer": "Multi-branch", "explanation": "Cases."}],
-        4: [{"question": "Arrow Func?", "options": ["=>", "->", "<-", "=="], "answer": "=>", "explanation": "Short syntax."}, {"question": "Scope?", "options": ["Global/Local", "Up/Down", "Left/Right", "None"], "answer": "Global/Local", "explanation": "Visibility."}, {"question": "Hoisting?", "options": ["Moved to top", "Deleted", "Hidden", "Error"], "answer": "Moved to top", "explanation": "Declaration."}],
-        5: [{"question": "Push?", "options": ["Add end", "Add start", "Remove", "Sort"], "answer": "Add end", "explanation": "Grow array."}, {"question": "Map?", "options": ["Transform", "Filter", "Find", "Sort"], "answer": "Transform", "explanation": "New array."}, {"question": "Filter?", "options": ["Select subset", "Change", "Add", "Sort"], "answer": "Select subset", "explanation": "Condition."}],
-        6: [{"question": "Object key?", "options": ["String", "Int", "Bool", "Float"], "answer": "String", "explanation": "Or Symbol."}, {"question": "Dot notation?", "options": ["Access prop", "End sentence", "Math", "Regex"], "answer": "Access prop", "explanation": "obj.prop."}, {"question": "JSON?", "options": ["String format", "Object", "Array", "Function"], "answer": "String format", "explanation": "Data."}],
-        7: [{"question": "Promise?", "options": ["Async result", "Guarantee", "Contract", "Loop"], "answer": "Async result", "explanation": "Future value."}, {"question": "Async/Await?", "options": ["Sugar for Promises", "New thread", "Fast mode", "Error"], "answer": "Sugar for Promises", "explanation": "Readable."}, {"question": "Fetch?", "options": ["Network request", "Dog", "Retrieve", "Find"], "answer": "Network request", "explanation": "HTTP."}],
-        8: [{"question": "DOM?", "options": ["Doc Object Model", "Disk Mode", "Data Mod", "Div"], "answer": "Doc Object Model", "explanation": "HTML tree."}, {"question": "Selector?", "options": ["querySelector", "find", "search", "pick"], "answer": "querySelector", "explanation": "CSS style."}, {"question": "Event?", "options": ["Click", "Loop", "Var", "Func"], "answer": "Click", "explanation": "Interaction."}],
-        9: [{"question": "Node.js?", "options": ["Runtime", "Library", "Framework", "Language"], "answer": "Runtime", "explanation": "Server JS."}, {"question": "Require?", "options": ["Import", "Need", "Want", "Ask"], "answer": "Import", "explanation": "CommonJS."}, {"question": "NPM?", "options": ["Pkg Manager", "No Problem", "Node Master", "Net"], "answer": "Pkg Manager", "explanation": "Modules."}],
-        10: [{"question": "Error?", "options": ["Throw", "Cast", "Spin", "Jump"], "answer": "Throw", "explanation": "Raise exception."}, {"question": "Debug?", "options": ["Fix bugs", "Create bugs", "Ignore", "Delete"], "answer": "Fix bugs", "explanation": "Troubleshoot."}, {"question": "Strict mode?", "options": ["Safer JS", "Fast JS", "Slow JS", "Old JS"], "answer": "Safer JS", "explanation": "No bad syntax."}]
-    }
-
-    # 3. REACT QUIZZES
-    react_quizzes = {
-        1: [
-            {"question": "JSX?", "options": ["HTML in JS", "Java", "Python", "XML"], "answer": "HTML in JS", "explanation": "Syntax ext.", "difficulty": "easy", "type": "theory"},
-            {"question": "Component?", "options": ["Reusable UI", "Database", "Server", "Loop"], "answer": "Reusable UI", "explanation": "Building block.", "difficulty": "easy", "type": "theory"},
-            {"question": "Import React?", "options": ["Yes", "No", "Maybe", "Never"], "answer": "Yes", "explanation": "Usually required.", "difficulty": "easy", "type": "code"},
-            {"question": "Props?", "options": ["Arguments", "Variables", "Loops", "Errors"], "answer": "Arguments", "explanation": "Passed data.", "difficulty": "easy", "type": "theory"},
-            {"question": "State?", "options": ["Memory", "Disk", "Network", "None"], "answer": "Memory", "explanation": "Persist.", "difficulty": "medium", "type": "theory"},
-            {"question": "Virtual DOM?", "options": ["Memory rep", "Real DOM", "Browser", "Server"], "answer": "Memory rep", "explanation": "Diffing.", "difficulty": "hard", "type": "theory"},
-            {"question": "Hook?", "options": ["Function", "Class", "Var", "Loop"], "answer": "Function", "explanation": "Logic.", "difficulty": "medium", "type": "code"},
-            {"question": "Effect?", "options": ["Side effect", "Visual", "Sound", "Taste"], "answer": "Side effect", "explanation": "API.", "difficulty": "medium", "type": "code"},
-            {"question": "Key?", "options": ["Unique ID", "Password", "Access", "Name"], "answer": "Unique ID", "explanation": "List.", "difficulty": "hard", "type": "theory"},
-            {"question": "Build?", "options": ["Optimize", "Delete", "Format", "Lint"], "answer": "Optimize", "explanation": "Prod.", "difficulty": "medium", "type": "theory"}
-        ],
-        2: [{"question": "Props?", "options": ["Arguments", "Variables", "Loops", "Errors"], "answer": "Arguments", "explanation": "Passed data."}, {"question": "Props mutable?", "options": ["No", "Yes", "Sometimes", "Always"], "answer": "No", "explanation": "Read-only."}, {"question": "Children prop?", "options": ["Nested content", "Child process", "Kid", "Heir"], "answer": "Nested content", "explanation": "Wrapper."}],
-        3: [{"question": "State?", "options": ["Memory", "Disk", "Network", "None"], "answer": "Memory", "explanation": "Persist between renders."}, {"question": "useState?", "options": ["Hook", "Class", "Func", "Var"], "answer": "Hook", "explanation": "Func component."}, {"question": "Set state?", "options": ["Re-renders", "Reloads page", "Crashes", "Nothing"], "answer": "Re-renders", "explanation": "Updates UI."}],
-        4: [{"question": "Effect?", "options": ["Side effect", "Visual", "Sound", "Taste"], "answer": "Side effect", "explanation": "API calls, DOM."}, {"question": "Dependency array?", "options": ["When to run", "Data storage", "List", "Queue"], "answer": "When to run", "explanation": "Triggers."}, {"question": "Cleanup?", "options": ["Return func", "Delete", "Clear", "Erase"], "answer": "Return func", "explanation": "Unmount."}],
-        5: [{"question": "Condition?", "options": ["Ternary", "If loop", "While", "Switch"], "answer": "Ternary", "explanation": "Inline."}, {"question": "Map list?", "options": ["Display items", "Find", "Sort", "Filter"], "answer": "Display items", "explanation": "Render list."}, {"question": "Key prop?", "options": ["Unique ID", "Password", "Access", "Name"], "answer": "Unique ID", "explanation": "Reconciliation."}],
-        6: [{"question": "Controlled?", "options": ["React handles value", "DOM handles", "User", "Server"], "answer": "React handles value", "explanation": "State bound."}, {"question": "OnSubmit?", "options": ["Form event", "Button", "Div", "Span"], "answer": "Form event", "explanation": "Handler."}, {"question": "Prevent Default?", "options": ["Stop reload", "Stop code", "Stop user", "Error"], "answer": "Stop reload", "explanation": "SPA behavior."}],
-        7: [{"question": "Router?", "options": ["Navigation", "Wifi", "Server", "Database"], "answer": "Navigation", "explanation": "URL handling."}, {"question": "Link?", "options": ["Change URL", "Save", "Load", "Delete"], "answer": "Change URL", "explanation": "No reload."}, {"question": "Route param?", "options": ["Dynamic path", "Static", "Fixed", "None"], "answer": "Dynamic path", "explanation": ":id."}],
-        8: [{"question": "Context?", "options": ["Global state", "Local", "DB", "File"], "answer": "Global state", "explanation": "Avoid drilling."}, {"question": "Provider?", "options": ["Supplies value", "Consumes", "Hides", "Deletes"], "answer": "Supplies value", "explanation": "Wrap app."}, {"question": "Consumer?", "options": ["Uses value", "Creates", "Saves", "Updates"], "answer": "Uses value", "explanation": "Access context."}],
-        9: [{"question": "Custom Hook?", "options": ["Reuse logic", "New UI", "CSS", "HTML"], "answer": "Reuse logic", "explanation": "useMyHook."}, {"question": "Rules of Hooks?", "options": ["Top level only", "Anywhere", "In loops", "In class"], "answer": "Top level only", "explanation": "Order matters."}, {"question": "Naming?", "options": ["usePrefix", "getPrefix", "setPrefix", "doPrefix"], "answer": "usePrefix", "explanation": "Convention."}],
-        10: [{"question": "Build?", "options": ["Optimize", "Delete", "Format", "Lint"], "answer": "Optimize", "explanation": "Production."}, {"question": "Virtual DOM?", "options": ["Memory rep", "Real DOM", "Browser", "Server"], "answer": "Memory rep", "explanation": "Diffing."}, {"question": "SPA?", "options": ["Single Page App", "Spa day", "Special", "Super"], "answer": "Single Page App", "explanation": "No reloads."}]
-    }
-
-    # 4. HTML QUIZZES
-    html_quizzes = {
-        1: [
-            {"question": "HTML stands for?", "options": ["HyperText Markup Lang", "High Tech", "Home Tool", "Hyper Link"], "answer": "HyperText Markup Lang", "explanation": "Structure.", "difficulty": "easy", "type": "theory"}, 
-            {"question": "Paragraph?", "options": ["<p>", "<b>", "<i>", "<div>"], "answer": "<p>", "explanation": "Text block.", "difficulty": "easy", "type": "code"}, 
-            {"question": "Heading?", "options": ["<h1>", "<head>", "<top>", "<title>"], "answer": "<h1>", "explanation": "Main title.", "difficulty": "easy", "type": "code"},
-            {"question": "Image?", "options": ["<img>", "<pic>", "<image>", "<src>"], "answer": "<img>", "explanation": "Visual.", "difficulty": "easy", "type": "code"},
-            {"question": "Link?", "options": ["<a>", "<link>", "<go>", "<href>"], "answer": "<a>", "explanation": "Anchor.", "difficulty": "easy", "type": "code"},
-            {"question": "List unordered?", "options": ["<ul>", "<ol>", "<li list>", "<list>"], "answer": "<ul>", "explanation": "Bullet.", "difficulty": "medium", "type": "code"},
-            {"question": "Table?", "options": ["<table>", "<grid>", "<tab>", "<sheet>"], "answer": "<table>", "explanation": "Data.", "difficulty": "medium", "type": "theory"},
-            {"question": "Comment?", "options": ["<!-- -->", "//", "#", "/* */"], "answer": "<!-- -->", "explanation": "Hidden.", "difficulty": "easy", "type": "syntax"},
-            {"question": "SEO tag?", "options": ["<meta>", "<seo>", "<search>", "<find>"], "answer": "<meta>", "explanation": "Info.", "difficulty": "hard", "type": "theory"},
-            {"question": "Doc type?", "options": ["<!DOCTYPE html>", "<html type>", "<ver>", "<mode>"], "answer": "<!DOCTYPE html>", "explanation": "Standard.", "difficulty": "medium", "type": "syntax"}
-        ],
-        2: [{"question": "Form tag?", "options": ["<form>", "<input>", "<submit>", "<data>"], "answer": "<form>", "explanation": "Container."}, {"question": "Input type?", "options": ["text", "paragraph", "word", "letter"], "answer": "text", "explanation": "Simple text."}, {"question": "Submit?", "options": ["<button>", "<send>", "<go>", "<do>"], "answer": "<button>", "explanation": "Trigger."}],
-        3: [{"question": "Img src?", "options": ["Source file", "Link", "Name", "ID"], "answer": "Source file", "explanation": "Path."}, {"question": "Alt text?", "options": ["Description", "Title", "Name", "Link"], "answer": "Description", "explanation": "Access."}, {"question": "Link tag?", "options": ["<a>", "<link>", "<go>", "<href>"], "answer": "<a>", "explanation": "Anchor."}],
-        4: [{"question": "Video?", "options": ["<video>", "<movie>", "<film>", "<mp4>"], "answer": "<video>", "explanation": "Wait 5."}, {"question": "Audio?", "options": ["<audio>", "<sound>", "<mp3>", "<music>"], "answer": "<audio>", "explanation": "Wait 5."}, {"question": "Controls?", "options": ["Play/Pause", "Color", "Size", "Font"], "answer": "Play/Pause", "explanation": "UI."}],
-        5: [{"question": "Table?", "options": ["<table>", "<grid>", "<tab>", "<sheet>"], "answer": "<table>", "explanation": "Data grid."}, {"question": "Row?", "options": ["<tr>", "<row>", "<line>", "<r>"], "answer": "<tr>", "explanation": "Table row."}, {"question": "Cell?", "options": ["<td>", "<cell>", "<data>", "<small>"], "answer": "<td>", "explanation": "Data cell."}],
-        6: [{"question": "Meta?", "options": ["Info about page", "Content", "Link", "Style"], "answer": "Info about page", "explanation": "Head."}, {"question": "Title?", "options": ["Browser tab", "Page body", "Header", "Footer"], "answer": "Browser tab", "explanation": "Window title."}, {"question": "Charset?", "options": ["UTF-8", "ASCII", "ANSI", "ISO"], "answer": "UTF-8", "explanation": "Encoding."}],
-        7: [{"question": "Target _blank?", "options": ["New tab", "Same tab", "New Window", "Download"], "answer": "New tab", "explanation": "Context."}, {"question": "Absolute path?", "options": ["Full URL", "Relative", "Local", "Short"], "answer": "Full URL", "explanation": "https://..."}, {"question": "Relative?", "options": ["From current", "Full", "Global", "Root"], "answer": "From current", "explanation": "./..."}],
-        8: [{"question": "Local Storage?", "options": ["Browser DB", "Server", "Cloud", "File"], "answer": "Browser DB", "explanation": "Persist."}, {"question": "Session?", "options": ["Until close", "Forever", "1 day", "1 hour"], "answer": "Until close", "explanation": "Temp."}, {"question": "Cookies?", "options": ["Small data", "Cakes", "Files", "Code"], "answer": "Small data", "explanation": "Sent to server."}],
-        9: [{"question": "Responsive?", "options": ["Adapts to screen", "Fast", "Slow", "Static"], "answer": "Adapts to screen", "explanation": "Mobile friendly."}, {"question": "Viewport?", "options": ["Visible area", "Screen", "Window", "Phone"], "answer": "Visible area", "explanation": "Meta tag."}, {"question": "Media?", "options": ["Images/Video", "News", "Social", "Paper"], "answer": "Images/Video", "explanation": "HTML5."}],
-        10: [{"question": "Validation?", "options": ["Check errors", "Run code", "Compile", "Save"], "answer": "Check errors", "explanation": "Standards."}, {"question": "Semantic?", "options": ["Meaningful tags", "Short tags", "Long tags", "Fast tags"], "answer": "Meaningful tags", "explanation": "Accessibility."}, {"question": "Access?", "options": ["Screen readers", "Fast net", "Good screen", "Mouse"], "answer": "Screen readers", "explanation": "ARIA."}]
-    }
-
-    # 5. CSS QUIZZES
-    css_quizzes = {
-        1: [{"question": "CSS?", "options": ["Cascading Style Sheets", "Code Style", "Computer Sheet", "Creative Style"], "answer": "Cascading Style Sheets", "explanation": "Styling."}, {"question": "Color?", "options": ["Text color", "Bg color", "Border", "Shadow"], "answer": "Text color", "explanation": "Property."}, {"question": "Selector?", "options": ["Target element", "Choose color", "Pick font", "Save"], "answer": "Target element", "explanation": "Rule."}],
-        2: [{"question": "Box Model?", "options": ["M-B-P-C", "Size", "Shape", "Color"], "answer": "M-B-P-C", "explanation": "Margin, Border, Padding, Content."}, {"question": "Margin?", "options": ["Outside", "Inside", "Border", "Text"], "answer": "Outside", "explanation": "Space."}, {"question": "Padding?", "options": ["Inside", "Outside", "Border", "Color"], "answer": "Inside", "explanation": "Space."}],
-        3: [{"question": "Font-size?", "options": ["Text size", "Box size", "Img size", "File size"], "answer": "Text size", "explanation": "Px, rem."}, {"question": "Bold?", "options": ["font-weight", "font-style", "text-dec", "bold"], "answer": "font-weight", "explanation": "Thickness."}, {"question": "Italic?", "options": ["font-style", "font-weight", "text-mode", "slant"], "answer": "font-style", "explanation": "Style."}],
-        4: [{"question": "Flex?", "options": ["Layout 1D", "Layout 2D", "Color", "Anim"], "answer": "Layout 1D", "explanation": "Row/Col."}, {"question": "Justify?", "options": ["Main axis", "Cross axis", "Center", "Side"], "answer": "Main axis", "explanation": "Align."}, {"question": "Align?", "options": ["Cross axis", "Main axis", "Center", "Side"], "answer": "Cross axis", "explanation": "Vertical."}],
-        5: [{"question": "Grid?", "options": ["Layout 2D", "Layout 1D", "Table", "List"], "answer": "Layout 2D", "explanation": "Rows & Cols."}, {"question": "Gap?", "options": ["Space between", "Margin", "Padding", "Border"], "answer": "Space between", "explanation": "Track gap."}, {"question": "Fr?", "options": ["Fraction", "Frame", "Free", "For"], "answer": "Fraction", "explanation": "Unit."}],
-        6: [{"question": "Media Query?", "options": ["Responsive rule", "Print", "Audio", "Video"], "answer": "Responsive rule", "explanation": "@media."}, {"question": "Breakpoint?", "options": ["Width trigger", "Error", "Stop", "Pause"], "answer": "Width trigger", "explanation": "Change layout."}, {"question": "Mobile first?", "options": ["Small to large", "Large to small", "Desktop", "Tablet"], "answer": "Small to large", "explanation": "Strategy."}],
-        7: [{"question": "Transition?", "options": ["Smooth change", "Jump", "Flash", "Hide"], "answer": "Smooth change", "explanation": "Time based."}, {"question": "Duration?", "options": ["Time", "Speed", "Distance", "Size"], "answer": "Time", "explanation": "Seconds."}, {"question": "Easing?", "options": ["Speed curve", "Soft", "Hard", "Fast"], "answer": "Speed curve", "explanation": "Accel."}],
-        8: [{"question": "Variable?", "options": ["--name", "$name", "@name", "name"], "answer": "--name", "explanation": "CSS Custom Prop."}, {"question": "Use var?", "options": ["var(--n)", "use(--n)", "$n", "@n"], "answer": "var(--n)", "explanation": "Function."}, {"question": "Scope?", "options": ["Cascade", "Global", "Local", "None"], "answer": "Cascade", "explanation": "Inheritance."}],
-        9: [{"question": "Hover?", "options": ["Mouse over", "Click", "Focus", "Active"], "answer": "Mouse over", "explanation": "Pseudo."}, {"question": "Pseudo-class?", "options": [":state", "::part", ".class", "#id"], "answer": ":state", "explanation": "State."}, {"question": "Focus?", "options": ["Selected", "Hovered", "Active", "Visited"], "answer": "Selected", "explanation": "Input."}],
-        10: [{"question": "BEM?", "options": ["Block Elem Mod", "Big Eat Man", "Box Edge M", "None"], "answer": "Block Elem Mod", "explanation": "Methodology."}, {"question": "Specificity?", "options": ["Ranking", "Size", "Speed", "Color"], "answer": "Ranking", "explanation": "Conflict resolution."}, {"question": "!important?", "options": ["Override", "Note", "Comment", "Error"], "answer": "Override", "explanation": "Force."}]
-    }
-
-    # 6. JAVA QUIZZES
-    java_quizzes = {
-        1: [
-             {"question": "JVM?", "options": ["Virtual Machine", "Java Version", "Visual", "Model"], "answer": "Virtual Machine", "explanation": "Run anywhere.", "difficulty": "easy", "type": "theory"},
-             {"question": "Entry point?", "options": ["public static void main", "start()", "init()", "run()"], "answer": "public static void main", "explanation": "Signature.", "difficulty": "easy", "type": "code"},
-             {"question": "Bytecode?", "options": [".class", ".java", ".exe", ".code"], "answer": ".class", "explanation": "Compiled.", "difficulty": "medium", "type": "theory"},
-             {"question": "Inheritance?", "options": ["extends", "implements", "inherits", "using"], "answer": "extends", "explanation": "Keyword.", "difficulty": "medium", "type": "syntax"},
-             {"question": "Interface?", "options": ["implements", "extends", "uses", "copies"], "answer": "implements", "explanation": "Contract.", "difficulty": "medium", "type": "syntax"},
-             {"question": "GC?", "options": ["Garbage Collection", "Game Center", "Graph", "Great"], "answer": "Garbage Collection", "explanation": "Memory.", "difficulty": "hard", "type": "theory"},
-             {"question": "String immutable?", "options": ["Yes", "No", "Sometimes", "Maybe"], "answer": "Yes", "explanation": "Pool.", "difficulty": "medium", "type": "theory"},
-             {"question": "ArrayList vs Array?", "options": ["Dynamic", "Static", "Same", "Slower"], "answer": "Dynamic", "explanation": "Resizing.", "difficulty": "easy", "type": "theory"},
-             {"question": "Exception base?", "options": ["Throwable", "Error", "Problem", "Base"], "answer": "Throwable", "explanation": "Hierarchy.", "difficulty": "hard", "type": "theory"},
-             {"question": "Thread?", "options": ["run()", "start()", "go()", "play()"], "answer": "start()", "explanation": "Execution.", "difficulty": "hard", "type": "code"}
-        ],
-        2: [{"question": "int?", "options": ["Integer", "Decimal", "Text", "Bool"], "answer": "Integer", "explanation": "Whole num."}, {"question": "double?", "options": ["Decimal", "Int", "Char", "Bool"], "answer": "Decimal", "explanation": "Floating point."}, {"question": "boolean?", "options": ["True/False", "Yes/No", "1/0", "On/Off"], "answer": "True/False", "explanation": "Logic."}],
-        3: [{"question": "Loop?", "options": ["Repeat code", "Stop code", "Skip", "Jump"], "answer": "Repeat code", "explanation": "Automate."}, {"question": "While?", "options": ["Condition", "Count", "Forever", "Once"], "answer": "Condition", "explanation": "Check first."}, {"question": "Do-While?", "options": ["Run once", "Run never", "Run always", "None"], "answer": "Run once", "explanation": "Check last."}],
-        4: [{"question": "Method?", "options": ["Function", "Var", "Class", "Loop"], "answer": "Function", "explanation": "Behavior."}, {"question": "Void?", "options": ["No return", "Return 0", "Null", "Empty"], "answer": "No return", "explanation": "Type."}, {"question": "Param?", "options": ["Input", "Output", "Error", "Name"], "answer": "Input", "explanation": "Arg."}],
-        5: [{"question": "Array?", "options": ["Fixed size", "Dynamic", "Map", "Set"], "answer": "Fixed size", "explanation": "Collection."}, {"question": "Index?", "options": ["0-based", "1-based", "Key", "Name"], "answer": "0-based", "explanation": "Position."}, {"question": "Length?", "options": [".length", ".size()", "count", "len"], "answer": ".length", "explanation": "Prop."}],
-        6: [{"question": "Object?", "options": ["Instance", "Class", "Method", "Var"], "answer": "Instance", "explanation": "Real."}, {"question": "Class?", "options": ["Template", "Object", "Func", "Var"], "answer": "Template", "explanation": "Blueprint."}, {"question": "New?", "options": ["Create", "Old", "Delete", "Update"], "answer": "Create", "explanation": "Instantiate."}],
-        7: [{"question": "Extend?", "options": ["Inherit", "Copy", "Paste", "Cut"], "answer": "Inherit", "explanation": "Parent."}, {"question": "Override?", "options": ["Replace method", "New method", "Delete", "Hide"], "answer": "Replace method", "explanation": "Polymorphism."}, {"question": "Super?", "options": ["Parent", "Child", "Self", "Global"], "answer": "Parent", "explanation": "Base class."}],
-        8: [{"question": "Interface?", "options": ["Abstract", "Concrete", "Final", "Static"], "answer": "Abstract", "explanation": "Contract."}, {"question": "Implement?", "options": ["Fulfill", "Extend", "Use", "Import"], "answer": "Fulfill", "explanation": "Code body."}, {"question": "Multiple?", "options": ["Interfaces", "Classes", "Abstracts", "None"], "answer": "Interfaces", "explanation": "Allowed."}],
-        9: [{"question": "Exception?", "options": ["Error", "Success", "Log", "Print"], "answer": "Error", "explanation": "Event."}, {"question": "Try?", "options": ["Attempt", "Test", "Loop", "If"], "answer": "Attempt", "explanation": "Block."}, {"question": "Catch?", "options": ["Handle", "Throw", "Ignore", "Pass"], "answer": "Handle", "explanation": "Block."}],
-        10: [{"question": "List?", "options": ["Collection", "Array", "String", "Int"], "answer": "Collection", "explanation": "Ordered."}, {"question": "Map?", "options": ["Key-Value", "List", "Set", "Queue"], "answer": "Key-Value", "explanation": "Dict."}, {"question": "Set?", "options": ["Unique", "Sorted", "List", "Map"], "answer": "Unique", "explanation": "No dupes."}]
-    }
-
-    # 3. GO QUIZZES
-    go_quizzes = {
-        1: [
-            {"question": "Who created Go?", "options": ["Google", "Facebook", "Microsoft", "Apple"], "answer": "Google", "explanation": "2009.", "difficulty": "easy", "type": "theory"}, 
-            {"question": "Compilated?", "options": ["Yes", "No", "JIT", "Vm"], "answer": "Yes", "explanation": "Native.", "difficulty": "easy", "type": "theory"}, 
-            {"question": "Which main function?", "options": ["main()", "start()", "init()", "run()"], "answer": "main()", "explanation": "Entry point.", "difficulty": "easy", "type": "code"},
-            {"question": "Variable decl?", "options": ["var x int", "int x", "let x", "x int"], "answer": "var x int", "explanation": "Syntax.", "difficulty": "medium", "type": "code"},
-            {"question": "Short assign?", "options": [":=", "=", "<-", "->"], "answer": ":=", "explanation": "Inference.", "difficulty": "easy", "type": "code"},
-            {"question": "Zero value int?", "options": ["0", "null", "undefined", "-1"], "answer": "0", "explanation": "Default.", "difficulty": "medium", "type": "theory"},
-            {"question": "Loop?", "options": ["for", "while", "do", "repeat"], "answer": "for", "explanation": "Only loop.", "difficulty": "medium", "type": "theory"},
-            {"question": "Public func?", "options": ["Capitalized", "Lowercase", "Export", "Public"], "answer": "Capitalized", "explanation": "Visibility.", "difficulty": "easy", "type": "code"},
-            {"question": "Unused var?", "options": ["Error", "Warning", "Ignore", "Allowed"], "answer": "Error", "explanation": "Strict.", "difficulty": "hard", "type": "theory"},
-            {"question": "Nil slice?", "options": ["Len 0", "Null", "Error", "Panic"], "answer": "Len 0", "explanation": "Safe.", "difficulty": "hard", "type": "theory"}
-        ],
-        2: [{"question": "Variable decl?", "options": ["var x int", "int x", "x = int", "declare x"], "answer": "var x int", "explanation": "Syntax.", "difficulty": "medium", "type": "code"}, {"question": "Short assign?", "options": [":=", "=", "<-", "->"], "answer": ":=", "explanation": "Inference.", "difficulty": "easy", "type": "code"}, {"question": "Zero value int?", "options": ["0", "null", "undefined", "-1"], "answer": "0", "explanation": "Default.", "difficulty": "medium", "type": "theory"}],
-        3: [{"question": "Loop keyword?", "options": ["for", "while", "do", "repeat"], "answer": "for", "explanation": "Only for.", "difficulty": "medium", "type": "theory"}, {"question": "Range loop?", "options": ["index, value", "key, val", "i, v", "All"], "answer": "All", "explanation": "Convenient.", "difficulty": "medium", "type": "code"}, {"question": "Condition loop?", "options": ["for x < 10", "while x < 10", "loop x < 10", "if x < 10"], "answer": "for x < 10", "explanation": "Like while.", "difficulty": "hard", "type": "code"}],
-        4: [{"question": "Return multiple?", "options": ["Yes", "No", "Only tuples", "Objects"], "answer": "Yes", "explanation": "Feature.", "difficulty": "easy", "type": "theory"}, {"question": "Export func?", "options": ["Capitalize", "Lowercase", "Export keyword", "Public"], "answer": "Capitalize", "explanation": "Visibility.", "difficulty": "medium", "type": "code"}, {"question": "Variadic?", "options": ["...", "args", "var", "rest"], "answer": "...", "explanation": "Syntax.", "difficulty": "hard", "type": "code"}],
-        5: [{"question": "Array size?", "options": ["Fixed", "Dynamic", "Mutable", "None"], "answer": "Fixed", "explanation": "Type part.", "difficulty": "medium", "type": "theory"}, {"question": "Slice?", "options": ["Dynamic", "Fixed", "Static", "Copy"], "answer": "Dynamic", "explanation": "View.", "difficulty": "easy", "type": "theory"}, {"question": "Make slice?", "options": ["make()", "new()", "create()", "alloc()"], "answer": "make()", "explanation": "Alloc.", "difficulty": "medium", "type": "code"}],
-        6: [{"question": "Pointer?", "options": ["*", "&", "@", "#"], "answer": "*", "explanation": "Type.", "difficulty": "medium", "type": "code"}, {"question": "Address?", "options": ["&", "*", "address()", "ptr"], "answer": "&", "explanation": "Get addr.", "difficulty": "easy", "type": "code"}, {"question": "Struct?", "options": ["type X struct", "class X", "struct X", "def X"], "answer": "type X struct", "explanation": "Def.", "difficulty": "medium", "type": "code"}],
-        7: [{"question": "Interface?", "options": ["Method set", "Class", "Abstract", "Inherit"], "answer": "Method set", "explanation": "Behavior.", "difficulty": "hard", "type": "theory"}, {"question": "Implement?", "options": ["Implicit", "Explicit", "Implements keyword", "Inherit"], "answer": "Implicit", "explanation": "Duck typing.", "difficulty": "hard", "type": "theory"}, {"question": "Empty interface?", "options": ["Any type", "Void", "Null", "None"], "answer": "Any type", "explanation": "Generic.", "difficulty": "hard", "type": "code"}],
-        8: [{"question": "Goroutine?", "options": ["go func", "thread", "async", "process"], "answer": "go func", "explanation": "Lightweight.", "difficulty": "medium", "type": "code"}, {"question": "Channel?", "options": ["Communication", "TV", "Stream", "File"], "answer": "Communication", "explanation": "Sync.", "difficulty": "hard", "type": "theory"}, {"question": "Select?", "options": ["Wait on channels", "If else", "Switch", "Choose"], "answer": "Wait on channels", "explanation": "Comm.", "difficulty": "hard", "type": "code"}],
-        9: [{"question": "Defer?", "options": ["End of function", "Immediate", "Async", "Start"], "answer": "End of function", "explanation": "Cleanup.", "difficulty": "medium", "type": "code"}, {"question": "Panic?", "options": ["Crash", "Warning", "Error", "Stop"], "answer": "Crash", "explanation": "Critical.", "difficulty": "medium", "type": "theory"}, {"question": "Recover?", "options": ["Stop panic", "Restart", "Save", "Log"], "answer": "Stop panic", "explanation": "Handle.", "difficulty": "hard", "type": "code"}],
-        10: [{"question": "Test file?", "options": ["_test.go", ".test", ".spec", "test_"], "answer": "_test.go", "explanation": "Convention.", "difficulty": "easy", "type": "theory"}, {"question": "Test func?", "options": ["TestXxx", "test()", "check()", "spec()"], "answer": "TestXxx", "explanation": "Sign.", "difficulty": "medium", "type": "code"}, {"question": "go.mod?", "options": ["Modules", "make", "compile", "run"], "answer": "Modules", "explanation": "Deps.", "difficulty": "easy", "type": "theory"}]
-    }
-
-    # 4. TYPESCRIPT QUIZZES
-    ts_quizzes = {
-        1: [
-            {"question": "Superset of?", "options": ["JS", "Java", "C#", "Python"], "answer": "JS", "explanation": "Base.", "difficulty": "easy", "type": "theory"}, 
-            {"question": "Extension?", "options": [".ts", ".js", ".tsx", ".type"], "answer": ".ts", "explanation": "File.", "difficulty": "easy", "type": "theory"}, 
-            {"question": "Compile to?", "options": ["JS", "Binary", "Bytecode", "C"], "answer": "JS", "explanation": "Target.", "difficulty": "easy", "type": "theory"},
-            {"question": "Type annotation?", "options": [": type", "as type", "-> type", "type"], "answer": ": type", "explanation": "Syntax.", "difficulty": "easy", "type": "code"},
-            {"question": "Interface?", "options": ["Structure", "Class", "Object", "Func"], "answer": "Structure", "explanation": "Shape.", "difficulty": "medium", "type": "theory"},
-            {"question": "Any type?", "options": ["Disable check", "All", "Object", "Void"], "answer": "Disable check", "explanation": "Escape.", "difficulty": "medium", "type": "theory"},
-            {"question": "Arrow func?", "options": ["=>", "->", "function", "def"], "answer": "=>", "explanation": "Short.", "difficulty": "easy", "type": "code"},
-            {"question": "Optional prop?", "options": ["?", "!", "*", "&"], "answer": "?", "explanation": "Maybe.", "difficulty": "medium", "type": "syntax"},
-            {"question": "Readonly?", "options": ["Immutable", "Private", "Global", "Static"], "answer": "Immutable", "explanation": "Const.", "difficulty": "medium", "type": "theory"},
-            {"question": "Generics?", "options": ["<T>", "[T]", "(T)", "{T}"], "answer": "<T>", "explanation": "Reuse.", "difficulty": "hard", "type": "code"}
-        ],
-        2: [{"question": "Type annotation?", "options": [": type", "as type", "-> type", "type"], "answer": ": type", "explanation": "Syntax.", "difficulty": "easy", "type": "code"}, {"question": "Interface?", "options": ["Structure", "Class", "Object", "Func"], "answer": "Structure", "explanation": "Shape.", "difficulty": "medium", "type": "theory"}, {"question": "Any type?", "options": ["Disable check", "All", "Object", "Void"], "answer": "Disable check", "explanation": "Escape.", "difficulty": "medium", "type": "theory"}],
-        3: [{"question": "Arrow func return?", "options": ["Implicit", "Explicit", "Return keyword", "None"], "answer": "Implicit", "explanation": "Shorthand.", "difficulty": "medium", "type": "code"}, {"question": "Optional param?", "options": ["?", "!", "*", "&"], "answer": "?", "explanation": "Syntax.", "difficulty": "easy", "type": "code"}, {"question": "Default param?", "options": ["= val", ": val", "-> val", "is val"], "answer": "= val", "explanation": "Value.", "difficulty": "easy", "type": "code"}],
-        4: [{"question": "Generics?", "options": ["<T>", "[T]", "(T)", "{T}"], "answer": "<T>", "explanation": "Syntax.", "difficulty": "medium", "type": "code"}, {"question": "Reuse?", "options": ["Yes", "No", "Complex", "Slow"], "answer": "Yes", "explanation": "Purpose.", "difficulty": "easy", "type": "theory"}, {"question": "Constraint?", "options": ["extends", "implements", "is", "as"], "answer": "extends", "explanation": "Limit.", "difficulty": "hard", "type": "code"}],
-        5: [{"question": "Enum?", "options": ["Named constants", "List", "Array", "Map"], "answer": "Named constants", "explanation": "Feature.", "difficulty": "easy", "type": "theory"}, {"question": "Union?", "options": ["|", "&", "!", "?"], "answer": "|", "explanation": "Or.", "difficulty": "medium", "type": "code"}, {"question": "Alias?", "options": ["type", "alias", "def", "var"], "answer": "type", "explanation": "Rename.", "difficulty": "medium", "type": "code"}],
-        6: [{"question": "Intersection?", "options": ["&", "|", "+", "*"], "answer": "&", "explanation": "Combine.", "difficulty": "hard", "type": "code"}, {"question": "Type guard?", "options": ["is", "as", "check", "if"], "answer": "is", "explanation": "Narrow.", "difficulty": "hard", "type": "code"}, {"question": "Unknown type?", "options": ["Safe any", "Void", "Never", "Null"], "answer": "Safe any", "explanation": "Check.", "difficulty": "medium", "type": "theory"}],
-        7: [{"question": "Symbol?", "options": ["Unique", "String", "Int", "Obj"], "answer": "Unique", "explanation": "Prim.", "difficulty": "hard", "type": "theory"}, {"question": "Iterator?", "options": ["next()", "loop()", "run()", "go()"], "answer": "next()", "explanation": "Func.", "difficulty": "hard", "type": "code"}, {"question": "For..of?", "options": ["Values", "Keys", "Index", "Prop"], "answer": "Values", "explanation": "Iter.", "difficulty": "medium", "type": "code"}],
-        8: [{"question": "Module?", "options": ["File", "Folder", "Class", "Func"], "answer": "File", "explanation": "Unit.", "difficulty": "easy", "type": "theory"}, {"question": "Export?", "options": ["Public", "global", "extern", "share"], "answer": "Public", "explanation": "Expose.", "difficulty": "easy", "type": "code"}, {"question": "Import?", "options": ["Require", "Include", "Use", "Get"], "answer": "Use", "explanation": "ES6.", "difficulty": "easy", "type": "code"}],
-        9: [{"question": "Namespace?", "options": ["Grouping", "Class", "File", "Url"], "answer": "Grouping", "explanation": "Org.", "difficulty": "medium", "type": "theory"}, {"question": "Internal?", "options": ["Yes", "No", "Maybe", "External"], "answer": "Yes", "explanation": "Scope.", "difficulty": "medium", "type": "theory"}, {"question": "Ambient?", "options": ["declare", "def", "var", "let"], "answer": "declare", "explanation": "Exist.", "difficulty": "hard", "type": "code"}],
-        10: [{"question": "Decorator?", "options": ["@exp", "#exp", "$exp", "&exp"], "answer": "@exp", "explanation": "Meta.", "difficulty": "hard", "type": "code"}, {"question": "Experimental?", "options": ["Yes", "No", "Standard", "Legacy"], "answer": "Yes", "explanation": "Config.", "difficulty": "medium", "type": "theory"}, {"question": "Uses?", "options": ["Classes", "Funcs", "Vars", "All"], "answer": "Classes", "explanation": "Meta.", "difficulty": "medium", "type": "theory"}]
-    }
-
-    # 5. C QUIZZES
-    c_quizzes = {
-        1: [
-            {"question": "Creator?", "options": ["Ritchie", "Thompson", "Kernighan", "Stroustrup"], "answer": "Ritchie", "explanation": "Bell Labs.", "difficulty": "easy", "type": "theory"}, 
-            {"question": "Year?", "options": ["1972", "1980", "1990", "1960"], "answer": "1972", "explanation": "Approx.", "difficulty": "easy", "type": "theory"}, 
-            {"question": "Extension?", "options": [".c", ".cpp", ".cs", ".h"], "answer": ".c", "explanation": "Source.", "difficulty": "easy", "type": "theory"},
-            {"question": "Entry?", "options": ["main", "start", "init", "begin"], "answer": "main", "explanation": "Required.", "difficulty": "easy", "type": "code"},
-            {"question": "Header file?", "options": [".h", ".c", ".lib", ".obj"], "answer": ".h", "explanation": "Defs.", "difficulty": "easy", "type": "theory"},
-            {"question": "Printf?", "options": ["stdio.h", "stdlib.h", "string.h", "math.h"], "answer": "stdio.h", "explanation": "IO.", "difficulty": "medium", "type": "code"},
-            {"question": "Comment?", "options": ["//", "#", ";", "--"], "answer": "//", "explanation": "C99.", "difficulty": "easy", "type": "syntax"},
-            {"question": "Sizeof char?", "options": ["1", "2", "4", "8"], "answer": "1", "explanation": "Byte.", "difficulty": "medium", "type": "theory"},
-            {"question": "NULL value?", "options": ["0", "-1", "1", "Unknown"], "answer": "0", "explanation": "Address.", "difficulty": "medium", "type": "theory"},
-            {"question": "Pointer operator?", "options": ["*", "&", "->", "."], "answer": "*", "explanation": "Value at.", "difficulty": "medium", "type": "code"}
-        ],
-        2: [{"question": "Entry?", "options": ["main", "start", "init", "begin"], "answer": "main", "explanation": "Required.", "difficulty": "easy", "type": "code"}, {"question": "Printf?", "options": ["stdio.h", "conio.h", "stdlib.h", "math.h"], "answer": "stdio.h", "explanation": "Header.", "difficulty": "medium", "type": "code"}, {"question": "Comment?", "options": ["//", "#", ";", "--"], "answer": "//", "explanation": "Style.", "difficulty": "easy", "type": "code"}],
-        3: [{"question": "If syntax?", "options": ["if()", "if then", "case", "when"], "answer": "if()", "explanation": "Parens.", "difficulty": "easy", "type": "code"}, {"question": "Switch param?", "options": ["Int/Char", "Float", "String", "Array"], "answer": "Int/Char", "explanation": "Discrete.", "difficulty": "medium", "type": "theory"}, {"question": "Break?", "options": ["Exit switch", "Stop prog", "Skip", "Return"], "answer": "Exit switch", "explanation": "Control.", "difficulty": "medium", "type": "code"}],
-        4: [{"question": "Pointer?", "options": ["Var address", "Value", "Ref", "Class"], "answer": "Var address", "explanation": "Mem.", "difficulty": "medium", "type": "theory"}, {"question": "Dereference?", "options": ["*", "&", "->", "."], "answer": "*", "explanation": "Value.", "difficulty": "hard", "type": "code"}, {"question": "Null ptr?", "options": ["NULL", "0", "None", "Nil"], "answer": "NULL", "explanation": "Empty.", "difficulty": "medium", "type": "code"}],
-        5: [{"question": "Array index?", "options": ["0-based", "1-based", "Any", "Neg"], "answer": "0-based", "explanation": "Offset.", "difficulty": "easy", "type": "theory"}, {"question": "String end?", "options": ["\\0", "\\n", "EOF", "None"], "answer": "\\0", "explanation": "Null term.", "difficulty": "medium", "type": "code"}, {"question": "Bounds check?", "options": ["No", "Yes", "Auto", "Strict"], "answer": "No", "explanation": "Unsafe.", "difficulty": "hard", "type": "theory"}],
-        6: [{"question": "Struct?", "options": ["Composite", "Class", "Func", "Array"], "answer": "Composite", "explanation": "Group.", "difficulty": "medium", "type": "theory"}, {"question": "Sizeof?", "options": ["Operator", "Func", "Macro", "Key"], "answer": "Operator", "explanation": "Bytes.", "difficulty": "medium", "type": "code"}, {"question": "Union?", "options": ["Shared mem", "Struct", "Class", "Enum"], "answer": "Shared mem", "explanation": "Overlap.", "difficulty": "hard", "type": "theory"}],
-        7: [{"question": "Malloc?", "options": ["Heap", "Stack", "Global", "Code"], "answer": "Heap", "explanation": "Dynamic.", "difficulty": "hard", "type": "code"}, {"question": "Free?", "options": ["Dealloc", "Delete", "Remove", "Clean"], "answer": "Dealloc", "explanation": "Leak.", "difficulty": "medium", "type": "code"}, {"question": "Header?", "options": ["stdlib.h", "stdio.h", "mem.h", "alloc.h"], "answer": "stdlib.h", "explanation": "Lib.", "difficulty": "medium", "type": "code"}],
-        8: [{"question": "File ptr?", "options": ["FILE*", "file", "fd", "stream"], "answer": "FILE*", "explanation": "Handle.", "difficulty": "medium", "type": "code"}, {"question": "Open mode?", "options": ["r/w/a", "get/put", "in/out", "1/2"], "answer": "r/w/a", "explanation": "Flags.", "difficulty": "easy", "type": "theory"}, {"question": "EOF?", "options": ["End of File", "Error", "Empty", "Exit"], "answer": "End of File", "explanation": "Const.", "difficulty": "easy", "type": "theory"}],
-        9: [{"question": "Macro?", "options": ["#define", "const", "var", "let"], "answer": "#define", "explanation": "Sub.", "difficulty": "medium", "type": "code"}, {"question": "Include?", "options": ["#include", "import", "use", "require"], "answer": "#include", "explanation": "File.", "difficulty": "easy", "type": "code"}, {"question": "Guard?", "options": ["#ifndef", "#limit", "#guard", "#check"], "answer": "#ifndef", "explanation": "Once.", "difficulty": "hard", "type": "code"}],
-        10: [{"question": "Errno?", "options": ["Error code", "Msg", "Func", "Flag"], "answer": "Error code", "explanation": "Global.", "difficulty": "hard", "type": "theory"}, {"question": "Argc?", "options": ["Count", "Values", "Env", "Name"], "answer": "Count", "explanation": "Args.", "difficulty": "medium", "type": "code"}, {"question": "Bitwise AND?", "options": ["&", "&&", "and", "+"], "answer": "&", "explanation": "Bits.", "difficulty": "medium", "type": "code"}]
-    }
-
-    # 6. SQL QUIZZES
-    sql_quizzes = {
-        1: [
-            {"question": "What does SQL stand for?", "options": ["Structured Query Language", "Simple Query Language", "Sequential Query Language", "Standard Query Language"], "answer": "Structured Query Language", "explanation": "SQL is the industry standard structured querying language.", "difficulty": "easy", "type": "theory"},
-            {"question": "Which SQL sublanguage is used to define database structures like tables?", "options": ["DDL", "DML", "DQL", "DCL"], "answer": "DDL", "explanation": "Data Definition Language (DDL) includes CREATE, ALTER, and DROP.", "difficulty": "easy", "type": "theory"},
-            {"question": "Which of the following is a DML statement?", "options": ["INSERT", "CREATE", "DROP", "ALTER"], "answer": "INSERT", "explanation": "INSERT modifies data rows, making it part of Data Manipulation Language (DML).", "difficulty": "easy", "type": "code"},
-            {"question": "In the relational model, what represents an attribute?", "options": ["A column", "A row", "A table", "A primary key"], "answer": "A column", "explanation": "Columns represent attributes, while rows represent individual tuples.", "difficulty": "easy", "type": "theory"},
-            {"question": "Which key uniquely identifies a row in a table and cannot contain NULL values?", "options": ["Primary Key", "Foreign Key", "Unique Key", "Super Key"], "answer": "Primary Key", "explanation": "Primary keys strictly enforce uniqueness and non-nullability.", "difficulty": "easy", "type": "theory"},
-            {"question": "Which sublanguage controls transaction boundaries via COMMIT and ROLLBACK?", "options": ["TCL", "DML", "DDL", "DQL"], "answer": "TCL", "explanation": "Transaction Control Language (TCL) manages database changes.", "difficulty": "medium", "type": "theory"},
-            {"question": "What SQL statement is used to retrieve data from a database?", "options": ["SELECT", "GET", "FETCH", "OPEN"], "answer": "SELECT", "explanation": "SELECT is the primary DQL command used for projection and selection.", "difficulty": "easy", "type": "code"},
-            {"question": "What is the purpose of a Foreign Key constraint?", "options": ["Enforce referential integrity", "Ensure unique values", "Accelerate query performance", "Prevent NULL values"], "answer": "Enforce referential integrity", "explanation": "Foreign keys link rows across tables, building relational integrity.", "difficulty": "medium", "type": "theory"},
-            {"question": "Which command is used to delete an entire table schema along with all its data?", "options": ["DROP TABLE", "DELETE TABLE", "TRUNCATE TABLE", "REMOVE TABLE"], "answer": "DROP TABLE", "explanation": "DROP TABLE is a DDL command that deletes both structure and content.", "difficulty": "medium", "type": "code"},
-            {"question": "Which sublanguage manages access control permissions (GRANT, REVOKE)?", "options": ["DCL", "TCL", "DDL", "DQL"], "answer": "DCL", "explanation": "Data Control Language (DCL) handles permissions.", "difficulty": "medium", "type": "theory"}
-        ],
-        2: [{"question": "Which data type is best suited for high-precision currency values?", "options": ["DECIMAL", "FLOAT", "VARCHAR", "DOUBLE"], "answer": "DECIMAL", "explanation": "DECIMAL prevents floating-point rounding errors.", "difficulty": "easy"}, {"question": "What constraint ensures a column cannot have duplicate values across rows?", "options": ["UNIQUE", "NOT NULL", "CHECK", "FOREIGN KEY"], "answer": "UNIQUE", "explanation": "UNIQUE prevents duplicates while allowing NULLs.", "difficulty": "medium"}, {"question": "Which constraint checks values against a specific range?", "options": ["CHECK", "NOT NULL", "PRIMARY KEY", "FOREIGN KEY"], "answer": "CHECK", "explanation": "CHECK evaluates boolean expressions for each row.", "difficulty": "medium"}],
-        3: [{"question": "How do you filter records in SQL?", "options": ["WHERE", "GROUP BY", "SELECT", "ORDER BY"], "answer": "WHERE", "explanation": "WHERE filters raw rows.", "difficulty": "easy"}, {"question": "Which keyword sorts the result set?", "options": ["ORDER BY", "SORT BY", "GROUP BY", "WHERE"], "answer": "ORDER BY", "explanation": "ORDER BY orders output.", "difficulty": "easy"}, {"question": "What does SELECT DISTINCT do?", "options": ["Removes duplicates", "Returns all rows", "Groups rows", "Counts rows"], "answer": "Removes duplicates", "explanation": "DISTINCT retains only unique value patterns.", "difficulty": "medium"}],
-        4: [{"question": "Which JOIN returns only matching records from both tables?", "options": ["INNER JOIN", "LEFT JOIN", "FULL JOIN", "CROSS JOIN"], "answer": "INNER JOIN", "explanation": "INNER JOIN requires a key match in both datasets.", "difficulty": "easy"}, {"question": "Which JOIN returns unmatched rows from the first table with NULL columns for the second table?", "options": ["LEFT JOIN", "RIGHT JOIN", "INNER JOIN", "CROSS JOIN"], "answer": "LEFT JOIN", "explanation": "LEFT OUTER JOIN preserves unmatched left rows.", "difficulty": "medium"}, {"question": "What is a CROSS JOIN?", "options": ["Cartesian product", "Key union", "Intersection", "None"], "answer": "Cartesian product", "explanation": "CROSS JOIN pairs every left row with every right row.", "difficulty": "hard"}],
-        5: [{"question": "Which function calculates the average of a column?", "options": ["AVG()", "MEAN()", "SUM()", "COUNT()"], "answer": "AVG()", "explanation": "AVG calculates numerical averages.", "difficulty": "easy"}, {"question": "Which clause groups duplicate rows into summary rows?", "options": ["GROUP BY", "HAVING", "ORDER BY", "WHERE"], "answer": "GROUP BY", "explanation": "GROUP BY aggregates common rows.", "difficulty": "easy"}, {"question": "Why use HAVING instead of WHERE?", "options": ["Filters aggregates", "Faster", "Allows NULLs", "Groups rows"], "answer": "Filters aggregates", "explanation": "HAVING evaluates aggregated expressions after GROUP BY.", "difficulty": "hard"}],
-        6: [{"question": "What is a correlated subquery?", "options": ["References outer query", "Independent query", "Speeds up lookups", "View query"], "answer": "References outer query", "explanation": "Runs once per outer row, accessing its values.", "difficulty": "hard"}, {"question": "Which operator returns true if a subquery returns any rows?", "options": ["EXISTS", "IN", "ANY", "ALL"], "answer": "EXISTS", "explanation": "EXISTS checks row presence.", "difficulty": "medium"}, {"question": "What is a nested query?", "options": ["Query inside query", "Joined query", "Indexed query", "Recursive query"], "answer": "Query inside query", "explanation": "Query inside another query's SELECT/WHERE/FROM.", "difficulty": "easy"}],
-        7: [{"question": "Which DML command changes existing records?", "options": ["UPDATE", "INSERT", "ALTER", "CHANGE"], "answer": "UPDATE", "explanation": "UPDATE modifies row values.", "difficulty": "easy"}, {"question": "How is TRUNCATE different from DELETE?", "options": ["TRUNCATE is DDL", "DELETE is DDL", "TRUNCATE fires triggers", "None"], "answer": "TRUNCATE is DDL", "explanation": "TRUNCATE drops table storage space.", "difficulty": "hard"}, {"question": "Which DML statement deletes rows conditionally?", "options": ["DELETE", "TRUNCATE", "DROP", "REMOVE"], "answer": "DELETE", "explanation": "DELETE filters rows using WHERE.", "difficulty": "easy"}],
-        8: [{"question": "What is an Index?", "options": ["Search acceleration structure", "Data copy", "Temporary view", "Trigger"], "answer": "Search acceleration structure", "explanation": "B-Trees speed up row lookups.", "difficulty": "medium"}, {"question": "What is a View?", "options": ["Virtual table", "Index copy", "Stored function", "Trigger"], "answer": "Virtual table", "explanation": "Views represent stored queries.", "difficulty": "easy"}, {"question": "Explain SELECT analysis command?", "options": ["EXPLAIN", "SHOW", "DESCRIBE", "DEBUG"], "answer": "EXPLAIN", "explanation": "EXPLAIN shows query plans.", "difficulty": "medium"}],
-        9: [{"question": "What does Atomicity in ACID mean?", "options": ["All or nothing", "State consistency", "Locks transactions", "Durability"], "answer": "All or nothing", "explanation": "Atomicity treats all steps as one unit.", "difficulty": "easy"}, {"question": "Which Isolation anomaly is prevented by preventing uncommitted reads?", "options": ["Dirty Read", "Phantom Read", "Non-repeatable Read", "None"], "answer": "Dirty Read", "explanation": "Dirty Reads read uncommitted changes.", "difficulty": "medium"}, {"question": "Which isolation level is most restrictive?", "options": ["SERIALIZABLE", "REPEATABLE READ", "READ COMMITTED", "READ UNCOMMITTED"], "answer": "SERIALIZABLE", "explanation": "SERIALIZABLE serializes all transactions.", "difficulty": "hard"}],
-        10: [{"question": "What is a CTE in SQL?", "options": ["Common Table Expression", "Create Table Expression", "Context Table Element", "None"], "answer": "Common Table Expression", "explanation": "WITH cte AS definitions.", "difficulty": "medium"}, {"question": "Which is a valid ranking window function?", "options": ["ROW_NUMBER()", "SUM()", "COUNT()", "AVG()"], "answer": "ROW_NUMBER()", "explanation": "ROW_NUMBER assigns serial numbers.", "difficulty": "medium"}, {"question": "What keyword defines window function boundaries?", "options": ["OVER", "PARTITION", "ORDER", "WINDOW"], "answer": "OVER", "explanation": "OVER specifies the window partition.", "difficulty": "easy"}]
-    }
-
-    # 7. MONGODB QUIZZES
-    mongodb_quizzes = {
-        1: [
-            {"question": "What type of database is MongoDB?", "options": ["Document-oriented", "Relational", "Key-Value", "Graph"], "answer": "Document-oriented", "explanation": "MongoDB stores data in flexible document structures.", "difficulty": "easy", "type": "theory"},
-            {"question": "What binary JSON-like format does MongoDB use to store documents?", "options": ["BSON", "JSON", "XML", "YAML"], "answer": "BSON", "explanation": "BSON represents Binary JSON, adding indexing and types.", "difficulty": "easy", "type": "theory"},
-            {"question": "Which relational concept corresponds to a MongoDB collection?", "options": ["A table", "A database", "A row", "A column"], "answer": "A table", "explanation": "Collections group documents, analogous to SQL tables.", "difficulty": "easy", "type": "theory"},
-            {"question": "What is the size limit for a single BSON document in MongoDB?", "options": ["16MB", "4MB", "8MB", "32MB"], "answer": "16MB", "explanation": "MongoDB enforces a hard 16MB document size limit.", "difficulty": "medium", "type": "theory"},
-            {"question": "What field is automatically generated as a primary key in MongoDB documents?", "options": ["_id", "id", "uuid", "key"], "answer": "_id", "explanation": "_id serves as the unique primary key.", "difficulty": "easy", "type": "theory"},
-            {"question": "What data type represents Date values in MongoDB BSON?", "options": ["UTC Date Time", "String", "Numeric", "Epoch seconds"], "answer": "UTC Date Time", "explanation": "BSON date represents Epoch milliseconds.", "difficulty": "medium", "type": "theory"},
-            {"question": "What is horizontal scalability in MongoDB called?", "options": ["Sharding", "Replication", "Indexing", "Normalization"], "answer": "Sharding", "explanation": "Sharding distributes data horizontally across shards.", "difficulty": "easy", "type": "theory"},
-            {"question": "What architecture construct manages consensus and high availability?", "options": ["Replica Sets", "Shards", "Routers", "Config Servers"], "answer": "Replica Sets", "explanation": "Replica sets copy data to prevent data loss.", "difficulty": "medium", "type": "theory"},
-            {"question": "Which of the following is true about MongoDB schemas?", "options": ["They are dynamic", "They are strictly typed", "They must be defined in advance", "They do not support nesting"], "answer": "They are dynamic", "explanation": "MongoDB allows documents in the same collection to vary in fields.", "difficulty": "easy", "type": "theory"},
-            {"question": "How many bytes compose a standard MongoDB ObjectId?", "options": ["12", "16", "8", "24"], "answer": "12", "explanation": "ObjectId is a 12-byte binary representation.", "difficulty": "medium", "type": "theory"}
-        ],
-        2: [{"question": "What BSON type is unique and includes timestamps?", "options": ["ObjectId", "Decimal128", "Date", "Binary"], "answer": "ObjectId", "explanation": "Includes Timestamp, Machine, PID, Counter.", "difficulty": "medium"}, {"question": "Embedding documents improves which aspect of performance?", "options": ["Read latency", "Write latency", "Storage efficiency", "None"], "answer": "Read latency", "explanation": "Avoids joining data.", "difficulty": "medium"}, {"question": "What is referencing in MongoDB?", "options": ["Linking ObjectIds", "Nesting documents", "Indexes", "Sharding"], "answer": "Linking ObjectIds", "explanation": "Similar to foreign keys.", "difficulty": "easy"}],
-        3: [{"question": "Which command inserts a single document?", "options": ["insertOne", "insert", "insertMany", "push"], "answer": "insertOne", "explanation": "insertOne is the standard CRUD command.", "difficulty": "easy"}, {"question": "What query operator filters values greater than a threshold?", "options": ["$gt", "$gte", "$lt", "$in"], "answer": "$gt", "explanation": "$gt is Greater Than.", "difficulty": "easy"}, {"question": "What query operator checks if an element is in an array?", "options": ["$in", "$all", "$exists", "$type"], "answer": "$in", "explanation": "$in maps matching values.", "difficulty": "medium"}],
-        4: [{"question": "Which operator updates or creates a field value?", "options": ["$set", "$inc", "$unset", "$push"], "answer": "$set", "explanation": "$set modifies field values.", "difficulty": "easy"}, {"question": "What does $inc do?", "options": ["Increments numeric field", "Adds array item", "Removes field", "Renames field"], "answer": "$inc", "explanation": "$inc increments numbers.", "difficulty": "easy"}, {"question": "Which operator appends items to arrays uniquely?", "options": ["$addToSet", "$push", "$pull", "$pop"], "answer": "$addToSet", "explanation": "$addToSet avoids duplicate insertions.", "difficulty": "medium"}],
-        5: [{"question": "Which index covers array fields?", "options": ["Multikey Index", "Compound Index", "Single Field Index", "Text Index"], "answer": "Multikey Index", "explanation": "Multikey indexes map array elements.", "difficulty": "medium"}, {"question": "How do you create an index in MongoDB?", "options": ["createIndex", "addIndex", "buildIndex", "Index"], "answer": "createIndex", "explanation": "createIndex builds indexes.", "difficulty": "easy"}, {"question": "Compound indexes index how many fields?", "options": ["Multiple fields", "Single field", "All fields", "Array elements"], "answer": "Multiple fields", "explanation": "Compound indexes store ordered combinations.", "difficulty": "medium"}],
-        6: [{"question": "What pipeline stage filters documents?", "options": ["$match", "$group", "$sort", "$project"], "answer": "$match", "explanation": "$match acts as WHERE filters.", "difficulty": "easy"}, {"question": "What stage aggregates grouped documents?", "options": ["$group", "$match", "$unwind", "$lookup"], "answer": "$group", "explanation": "$group aggregates documents.", "difficulty": "easy"}, {"question": "How do you order documents in pipelines?", "options": ["$sort", "$order", "$group", "$match"], "answer": "$sort", "explanation": "$sort orders outputs.", "difficulty": "easy"}],
-        7: [{"question": "Which pipeline stage joins collection documents?", "options": ["$lookup", "$unwind", "$project", "$match"], "answer": "$lookup", "explanation": "$lookup performs joins.", "difficulty": "medium"}, {"question": "What stage flattens arrays into document streams?", "options": ["$unwind", "$lookup", "$project", "$group"], "answer": "$unwind", "explanation": "$unwind outputs a document per array item.", "difficulty": "medium"}, {"question": "What does $project do?", "options": ["Reshapes outputs", "Filters rows", "Groups rows", "Joins tables"], "answer": "$project", "explanation": "$project maps properties.", "difficulty": "easy"}],
-        8: [{"question": "What modeling style matches 1:Few relations?", "options": ["Embedding", "Referencing", "Sharding", "None"], "answer": "Embedding", "explanation": "Embedding avoids reference overhead.", "difficulty": "easy"}, {"question": "What modeling style prevents unbounded document growth?", "options": ["Referencing", "Embedding", "Indexing", "None"], "answer": "Referencing", "explanation": "Referencing scales past 16MB limits.", "difficulty": "medium"}, {"question": "Why denormalize NoSQL databases?", "options": ["Read performance", "Write speed", "Integrity", "None"], "answer": "Read performance", "explanation": "Reduces collection hops.", "difficulty": "medium"}],
-        9: [{"question": "Which node handles all write operations in a Replica Set?", "options": ["Primary", "Secondary", "Arbiter", "Config"], "answer": "Primary", "explanation": "Only primary accepts writes.", "difficulty": "easy"}, {"question": "What consensus process elects a new Primary node?", "options": ["Consensus Election", "Consensus Heartbeat", "Replication", "Router"], "answer": "Consensus Election", "explanation": "Replica sets elect automatically.", "difficulty": "medium"}, {"question": "Does MongoDB support multi-document transactions?", "options": ["Yes, since 4.0", "No", "Only single documents", "Yes, since 1.0"], "answer": "Yes, since 4.0", "explanation": "Enables multi-collection sessions.", "difficulty": "hard"}],
-        10: [{"question": "What scaling mechanism splits collections horizontally?", "options": ["Sharding", "Replication", "Indexing", "Transactions"], "answer": "Sharding", "explanation": "Sharding partitions data space.", "difficulty": "easy"}, {"question": "Which component routes queries to correct shards?", "options": ["mongos query router", "Config Servers", "Primary node", "Arbiter"], "answer": "mongos query router", "explanation": "mongos handles chunk routing.", "difficulty": "medium"}, {"question": "What config servers store?", "options": ["Cluster metadata", "Oplogs", "Database views", "Triggers"], "answer": "Cluster metadata", "explanation": "Stores cluster routing states.", "difficulty": "hard"}]
-    }
-
-    # SELECTION logic
-    quizzes = {}
-    if "python" in lang_lower: quizzes = python_quizzes
-    elif "javascript" in lang_lower or "node" in lang_lower: quizzes = js_quizzes
-    elif "react" in lang_lower: quizzes = react_quizzes
-    elif "html" in lang_lower: quizzes = html_quizzes
-    elif "css" in lang_lower: quizzes = css_quizzes
-    elif "java" in lang_lower: quizzes = java_quizzes
-    elif "go" in lang_lower: quizzes = go_quizzes
-    elif "typescript" in lang_lower or "ts" in lang_lower: quizzes = ts_quizzes
-    elif "c " in f" {lang_lower} " or lang_lower == "c": quizzes = c_quizzes
-    elif "sql" in lang_lower: quizzes = sql_quizzes
-    elif "mongodb" in lang_lower or "mongo" in lang_lower: quizzes = mongodb_quizzes
-    
-    qs = quizzes.get(module_number, [])
+    quizzes = content_library.section(_quiz_language(language.lower()), "quizzes")
+    qs = thaw(quizzes.get(module_number, ()))
     
     # GENERIC FALLBACK
     if not qs:
-        qs = [
-            {"question": f"Key concept of {module_title}?", "options": ["Core Logic", "UI", "DB", "Net"], "answer": "Core Logic", "explanation": f"Central to {module_title}.", "difficulty": "easy", "type": "theory"},
-            {"question": "Why use this?", "options": ["Efficiency", "Fun", "Required", "Hard"], "answer": "Efficiency", "explanation": "Solves problems.", "difficulty": "easy", "type": "theory"},
-            {"question": "Best practice?", "options": ["Clean Code", "Chaos", "Fast", "Short"], "answer": "Clean Code", "explanation": "Readable.", "difficulty": "medium", "type": "theory"},
-            {"question": "Debug how?", "options": ["Logs", "Guess", "Delete", "Rewrite"], "answer": "Logs", "explanation": "Trace execution.", "difficulty": "medium", "type": "code"},
-            {"question": "Type?", "options": ["Concept", "Tool", "Lang", "Game"], "answer": "Concept", "explanation": "Learning unit.", "difficulty": "easy", "type": "theory"},
-            {"question": "Performance factor?", "options": ["Algorithm", "Color", "Name", "Comments"], "answer": "Algorithm", "explanation": "Complexity.", "difficulty": "medium", "type": "theory"},
-            {"question": "Common error?", "options": ["Syntax", "Hardware", "User", "Network"], "answer": "Syntax", "explanation": "Typo.", "difficulty": "easy", "type": "code"},
-            {"question": "Optimization?", "options": ["Refactor", "Ignore", "Delete", "Hide"], "answer": "Refactor", "explanation": "Improve.", "difficulty": "hard", "type": "code"},
-            {"question": "Security risk?", "options": ["Injection", "Speed", "Space", "Time"], "answer": "Injection", "explanation": "Input.", "difficulty": "hard", "type": "theory"},
-            {"question": "Future trend?", "options": ["AI", "Fax", "Tape", "CD"], "answer": "AI", "explanation": "Automation.", "difficulty": "medium", "type": "theory"}
-        ]
+        qs = thaw(GENERIC_MODULE_QUIZ)
+        for q in qs:
+            q["question"] = q["question"].format(module_title=module_title)
+            q["explanation"] = q["explanation"].format(module_title=module_title)
         random.shuffle(qs)
     
     # FINAL ENFORCEMENT: Ensure 10 questions
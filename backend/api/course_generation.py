@@ -0,0 +1,530 @@
+"""
+Course generation shared by the sync and async views and the warming commands.
+
+`claim_course_generation` resolves a generate-course request up to the provider
+calls (answering it from the database, or marking a course row "generating" under
+the topic's generation lease), `create_course_full` builds the course, and
+`ensure_module_content` fills in one outline-only module. Each module is
+checkpointed as soon as it is generated, so an interrupted build resumes from
+the modules it already saved.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import prefetch_related_objects
+from rest_framework import status
+
+from . import generation_lease, topic_stats
+from .course_content import get_mini_labs, get_module_quiz, get_module_theory, get_module_titles, get_prebuilt_code_examples
+from .db import refresh_stale_connections
+from .models import Course, Module, Quiz
+from .persistence import normalize_quiz_list, save_course_outline, save_module_content, save_modules_content
+from .serializers import (
+    CourseSerializer, ModuleSerializer, CompactCourseSerializer, CompactModuleSerializer,
+    projection_from_request, is_compact_schema, prefetch_lookups,
+)
+from .topic_classifier import TopicClassifier
+
+
+def get_course_by_topic(topic: str):
+    return Course.objects.filter(topic__iexact=topic).first()
+
+
+MIN_MODULE_CONTENT_LEN = 100
+GENERATION_MODES = ("full", "lazy")
+
+
+def _module_title_from_name(name: str) -> str:
+    if ": " in name:
+        return name.split(": ", 1)[1]
+    return name
+
+
+def course_modules_lack_content(course) -> bool:
+    modules = list(course.modules.all())
+    if not modules:
+        return True
+    return any(
+        not mod.content or len(mod.content.strip()) < MIN_MODULE_CONTENT_LEN
+        for mod in modules
+    )
+
+
+def _hydrate_course_modules(course, language, topic_type, topic_display):
+    """Backfill module theory/labs/quizzes when DB has outline-only rows (common on Render cache hits)."""
+    print(f"Hydrating empty module content for course id={course.id} topic={course.topic!r}")
+    with_quizzes = set(Quiz.objects.filter(module__course=course).values_list("module_id", flat=True))
+    results = []
+    for mod in course.modules.all():
+        if mod.content and len(mod.content.strip()) >= MIN_MODULE_CONTENT_LEN:
+            continue
+        title = _module_title_from_name(mod.name)
+        mod_num = mod.order or 1
+        results.append((mod, {
+            "theory": get_module_theory(language, title, mod_num),
+            "mini_labs": get_mini_labs(language, title, mod_num, topic_type=topic_type),
+            "code_examples": get_prebuilt_code_examples(language, title, mod_num),
+            "quizzes": [] if mod.id in with_quizzes else get_module_quiz(language, topic_type, title, mod_num),
+            "fallback": True,
+        }))
+    save_modules_content(results)
+
+
+def _resolve_generation_mode(data):
+    """Per-request `generation_mode` wins over the deployment default."""
+    mode = data.get("generation_mode") or settings.COURSE_GENERATION_MODE
+    mode = str(mode).strip().lower()
+    return mode if mode in GENERATION_MODES else "full"
+
+
+def complete_module_payload(module_content, language, topic_type, module_title, module_number):
+    """Validate a provider payload and fill empty quizzes/labs/examples from the offline library."""
+    # Validate generated content. If it lacks theory, quizzes, or labs, use fallback
+    if not module_content or not module_content.get("theory") or len(module_content.get("theory")) < 100:
+        print(f"[Offline Fallback] AI theory too short or missing for module: {module_title}")
+        raise ValueError("Invalid theory content")
+
+    # Field-by-field robust fallback for other parts if AI returned empty collections due to rate limits
+    if not normalize_quiz_list(module_content.get("quizzes", [])):
+        print(f"[Offline Fallback] AI quizzes empty/missing for module: {module_title}. Using prebuilt fallback quizzes.")
+        module_content["quizzes"] = get_module_quiz(language, topic_type, module_title, module_number)
+
+    if not module_content.get("mini_labs"):
+        print(f"[Offline Fallback] AI mini_labs empty/missing for module: {module_title}. Using prebuilt fallback mini labs.")
+        module_content["mini_labs"] = get_mini_labs(language, module_title, module_number, topic_type=topic_type)
+
+    if not module_content.get("code_examples"):
+        print(f"[Offline Fallback] AI code_examples empty/missing for module: {module_title}. Using prebuilt fallback code examples.")
+        module_content["code_examples"] = get_prebuilt_code_examples(language, module_title, module_number)
+
+    print(f"Generated content keys: {module_content.keys()}")
+    print(f"Theory length: {len(module_content.get('theory', ''))}")
+    print(f"Quiz count: {len(module_content.get('quizzes', []))}")
+    return module_content
+
+
+def fallback_module_payload(language, topic_type, module_title, module_number):
+    print(f"[Offline Fallback] Populating offline fallback for module: {module_title}")
+
+    # Generate fallback content from our prebuilt course_content library
+    fallback_quiz = get_module_quiz(language, topic_type, module_title, module_number)
+    print(f"[Offline Fallback] Completed fallback population. Quiz count: {len(fallback_quiz)}")
+    return {
+        "theory": get_module_theory(language, module_title, module_number),
+        "mini_labs": get_mini_labs(language, module_title, module_number, topic_type=topic_type),
+        "code_examples": get_prebuilt_code_examples(language, module_title, module_number),
+        "quizzes": fallback_quiz,
+        "fallback": True,
+    }
+
+
+def generate_module_payload(orchestrator, topic, language, topic_type, module_title, module_number):
+    """Generate theory, labs and quizzes for one module, filling gaps from the offline library."""
+    print(f"START generating module: {module_title}")
+    try:
+        # Generate theory, labs, quizzes
+        module_content = orchestrator.generate_complete_module(
+            topic=topic,
+            language=language,
+            module_title=module_title,
+            module_number=module_number
+        )
+        return complete_module_payload(module_content, language, topic_type, module_title, module_number)
+    except Exception as e:
+        print(f"Module generation failed or was empty: {e}")
+        return fallback_module_payload(language, topic_type, module_title, module_number)
+
+
+def module_generation_args(module):
+    """(topic, language, topic_type, module_title, module_number) for generating `module`'s content."""
+    course = module.course
+    classification = TopicClassifier.classify(course.topic or course.title or "general")
+    return (
+        course.topic or course.title,
+        classification["language"],
+        classification["type"],
+        _module_title_from_name(module.name),
+        module.order or 1,
+    )
+
+
+def _save_hydrated_module(module, module_content):
+    save_module_content(module, module_content)
+    course = module.course
+    if course.status == "outline" and not course_modules_lack_content(course):
+        course.status = "generated"
+        course.save(update_fields=["status"])
+
+
+def store_module_content(module_id, module_content):
+    """Persist content generated outside a row lock; the first writer wins if another worker got there first."""
+    with transaction.atomic():
+        module = Module.objects.select_for_update().select_related("course").get(id=module_id)
+        if not module.content:
+            _save_hydrated_module(module, module_content)
+    return module
+
+
+def _hydrate_module(module_id, orchestrator=None):
+    """Generate content for an outline-only module outside any transaction and store it."""
+    module = Module.objects.select_related("course").get(id=module_id)
+    if module.content:
+        return module
+
+    from .ai_orchestrator import AIOrchestrator
+    print(f"Generating content for Module ID {module_id}: {module.name}")
+    module_content = generate_module_payload(orchestrator or AIOrchestrator(), *module_generation_args(module))
+    return store_module_content(module_id, module_content)
+
+
+def ensure_module_content(module_id, orchestrator=None):
+    """
+    Generate and persist content for an outline-only module. Returns the hydrated module.
+
+    No transaction is open during the provider call (with SQLite's IMMEDIATE mode it
+    would hold the database write lock for the whole call): the prefetch cache key
+    doubles as the generation lock and the save re-checks the row, as in the async path.
+    """
+    lock_key = f"module-prefetch:{module_id}"
+    if cache.add(lock_key, True, timeout=settings.LAZY_PREFETCH_LOCK_TIMEOUT):
+        try:
+            return _hydrate_module(module_id, orchestrator)
+        finally:
+            cache.delete(lock_key)
+
+    wait_for_prefetch(module_id)
+    # Lock expired without a result; generate without it, the save still keeps the first writer
+    return _hydrate_module(module_id, orchestrator)
+
+
+def prefetch_next_module(module):
+    """Speculatively hydrate the module after `module` on a background thread."""
+    if not settings.LAZY_PREFETCH_NEXT_MODULE:
+        return
+    next_module = (
+        Module.objects.filter(course_id=module.course_id, order__gt=module.order, content="")
+        .order_by("order")
+        .only("id")
+        .first()
+    )
+    if not next_module:
+        return
+    lock_key = f"module-prefetch:{next_module.id}"
+    if not cache.add(lock_key, True, timeout=settings.LAZY_PREFETCH_LOCK_TIMEOUT):
+        return
+
+    def run():
+        try:
+            _hydrate_module(next_module.id)
+            print(f"[Lazy Generation] Prefetched module id={next_module.id}")
+        except Exception as e:
+            print(f"[Lazy Generation] Prefetch failed for module id={next_module.id}: {e}")
+        finally:
+            cache.delete(lock_key)
+            connections.close_all()
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def wait_for_prefetch(module_id):
+    """Block while a background prefetch of this module is in flight instead of generating it twice."""
+    deadline = time.monotonic() + settings.LAZY_PREFETCH_LOCK_TIMEOUT
+    while cache.get(f"module-prefetch:{module_id}") and time.monotonic() < deadline:
+        time.sleep(0.25)
+
+
+def serialize_course(course, request=None):
+    """Serialize a course honouring `?schema=v2`, `?fields=` and `?include=`."""
+    serializer_class = CompactCourseSerializer if is_compact_schema(request) else CourseSerializer
+    serializer = serializer_class(course, **projection_from_request(request))
+    prefetch_related_objects([course], *prefetch_lookups(serializer))
+    return serializer.data
+
+
+def serialize_module(module, request=None):
+    serializer_class = CompactModuleSerializer if is_compact_schema(request) else ModuleSerializer
+    serializer = serializer_class(module, **projection_from_request(request))
+    prefetch_related_objects([module], *prefetch_lookups(serializer))
+    return serializer.data
+
+
+def _build_course_response(course, metadata, request=None):
+    if course.status != "outline" and course_modules_lack_content(course):
+        _hydrate_course_modules(
+            course,
+            metadata["language"],
+            metadata["topic_type"],
+            course.title or course.topic,
+        )
+        course.status = "generated"
+        course.save(update_fields=["status"])
+    response_data = serialize_course(course, request)
+    response_data["metadata"] = metadata
+    return response_data
+
+
+def _course_metadata(classification):
+    return {
+        "language": classification["language"],
+        "execution_enabled": classification["execution_enabled"],
+        "topic_type": classification["type"],
+    }
+
+
+GENERATING_RESPONSE = (
+    {"message": "Course is currently being generated. Please wait.", "status": "generating"},
+    status.HTTP_202_ACCEPTED,
+)
+
+
+def _existing_course_response(existing_course, data, metadata, request, lease=None):
+    """
+    (body, status) for a topic that already has a course row, or None when generation
+    should start or resume from the module checkpoints (no usable course, `force`, or
+    the request generating it died). `lease` is the generation lease this request holds, if any.
+    """
+    if existing_course.status == "generating" and generation_lease.is_held(existing_course.topic, lease):
+        return GENERATING_RESPONSE
+    if data.get("force"):
+        # Modules that fell back to offline content are generated again; done ones are kept
+        print(f"Force generation requested. Retrying fallback and unfinished modules of course: {existing_course.id}")
+        existing_course.modules.filter(generation_status="fallback").update(generation_status="pending")
+        return None
+    if existing_course.status == "generating":
+        # Nobody holds the lease: the worker generating it was killed or restarted
+        print(f"Resuming stalled generation for course id={existing_course.id}")
+        return None
+    if existing_course.status in ("generated", "outline"):
+        print(f"Course {existing_course.topic} found in DB. Returning existing structure.")
+        return _build_course_response(existing_course, metadata, request), status.HTTP_200_OK
+    return None
+
+
+def claim_course_generation(raw_topic, data, request, record_request=True, wait_seconds=None):
+    """
+    Resolve a generate-course request up to the provider calls.
+
+    Returns ((body, status), None) when the request is answered from the database,
+    or (None, job) after marking a course row "generating" for this request to fill.
+    job["lease"] is the topic's generation lease (api/generation_lease.py); release it
+    once the course is saved. While another request holds the lease this waits up to
+    `wait_seconds` (default GENERATION_WAIT_SECONDS) for that course, then answers 202.
+    `record_request` counts the request towards demand-driven warming (api/topic_stats.py).
+    """
+    classification = TopicClassifier.classify(raw_topic)
+    metadata = _course_metadata(classification)
+
+    display_title = classification.get("display_title", raw_topic.title())
+    classifier_normalized = display_title.strip().lower()
+    if record_request:
+        topic_stats.record(classifier_normalized, raw_topic.strip())
+    if wait_seconds is None:
+        wait_seconds = settings.GENERATION_WAIT_SECONDS
+    deadline = time.monotonic() + wait_seconds
+    while True:
+        answered, job, held_topic = _try_claim_course_generation(
+            raw_topic, display_title, classifier_normalized, data, metadata, request
+        )
+        remaining = deadline - time.monotonic()
+        if not held_topic or remaining <= 0:
+            return answered, job
+        print(f"Waiting up to {remaining:.0f}s for the course generation of {held_topic!r} in progress")
+        generation_lease.wait_for_release(held_topic, remaining)
+        # `force` applied to the course that was in progress, not to the one it produced
+        data = {key: value for key, value in data.items() if key != "force"}
+
+
+def _try_claim_course_generation(raw_topic, display_title, classifier_normalized, data, metadata, request, lease=None):
+    """One attempt of claim_course_generation: (answered, job, topic whose lease to wait for)."""
+    # 1. Fast normalized DB check, then double check with the classifier's display_title
+    # in case it maps to an existing course
+    for normalized_topic in dict.fromkeys((raw_topic.strip().lower(), classifier_normalized)):
+        existing_course = get_course_by_topic(normalized_topic)
+        if existing_course:
+            answered = _existing_course_response(existing_course, data, metadata, request, lease)
+            if answered:
+                waiting = answered is GENERATING_RESPONSE
+                return answered, None, existing_course.topic if waiting else None
+
+    # 2. Take the topic's generation lease so only one request in any worker generates it
+    if lease is None:
+        lease = generation_lease.acquire(classifier_normalized)
+        if lease is None:
+            return GENERATING_RESPONSE, None, classifier_normalized
+        try:
+            # Check again under the lease: the previous holder may have just saved the course
+            answered, job, held_topic = _try_claim_course_generation(
+                raw_topic, display_title, classifier_normalized, data, metadata, request, lease
+            )
+        except Exception:
+            lease.release()
+            raise
+        if answered:
+            lease.release()
+        return answered, job, held_topic
+
+    print(f"Generating new course for: {display_title} (Lang: {metadata['language']}, Exec: {metadata['execution_enabled']})")
+    course_obj, _ = Course.objects.get_or_create(
+        topic=classifier_normalized,
+        defaults={
+            "title": display_title,
+            "status": "generating"
+        }
+    )
+    course_obj.status = "generating"
+    course_obj.save()
+    return None, {
+        "course": course_obj,
+        "topic": display_title,
+        "metadata": {**metadata, "generation_mode": _resolve_generation_mode(data)},
+        "lease": lease,
+    }, None
+
+
+DEFAULT_MODULE_TITLES = [
+    "Introduction and Development Environment",
+    "Language Fundamentals: Variables and Data Types",
+    "Control Flow: Conditionals and Loops",
+    "Functions and Scope",
+    "Data Structures and Collections",
+    "Object-Oriented Programming and Core Concepts",
+    "Advanced Language Features",
+    "Exception Handling and File I/O",
+    "Testing and Debugging",
+    "Projects and Best Practices"
+]
+
+
+def is_valid_outline(course_outline):
+    return bool(course_outline and "modules" in course_outline and len(course_outline["modules"]) > 0)
+
+
+def fallback_course_outline(topic, language):
+    print(f"[Offline Fallback] Generating prebuilt curriculum outline for {topic} ({language})")
+    # If we don't have a syllabus for this language, use generic titles
+    titles = get_module_titles(language) or DEFAULT_MODULE_TITLES
+    return {
+        "course_title": f"Complete {topic} Programming",
+        "course_description": f"A comprehensive course covering {topic} from fundamentals to advanced applications with hands-on labs and interactive quizzes.",
+        "modules": [
+            {
+                "module_number": idx + 1,
+                "title": title,
+                "description": f"Master the concepts of {title.lower()} with detailed theory, exercises, and assessments.",
+                "learning_objectives": [f"Understand {title.lower()}", f"Apply {title.lower()} in real-world scenarios"],
+                "difficulty": "Beginner" if idx < 3 else "Intermediate" if idx < 7 else "Advanced"
+            }
+            for idx, title in enumerate(titles)
+        ]
+    }
+
+
+def persist_course_outline(course_obj, course_outline, topic):
+    """Save the course details and outline modules. Returns [(module, module_title, module_number)]."""
+    refresh_stale_connections()
+    course_obj.title = course_outline.get("course_title", f"Course on {topic}")
+    course_obj.content = course_outline.get("course_description", f"A comprehensive course covering {topic}.")
+    return [
+        (module, mod["title"], mod.get("module_number", 0))
+        for module, mod in zip(save_course_outline(course_obj, course_outline), course_outline["modules"])
+    ]
+
+
+def checkpointed_modules(course_obj):
+    """
+    [(module, module_title, module_number)] for a course whose outline an earlier,
+    interrupted generation already saved, or [] for a new course.
+    """
+    return [
+        (module, _module_title_from_name(module.name), module.order)
+        for module in course_obj.modules.order_by("order")
+    ]
+
+
+def mark_module_generating(module):
+    refresh_stale_connections()
+    module.generation_status = "generating"
+    Module.objects.filter(pk=module.pk).update(generation_status="generating")
+
+
+def save_module_checkpoint(module, module_content):
+    """Commit one module's content as soon as it is generated, so a killed worker loses at most that module."""
+    refresh_stale_connections()
+    save_module_content(module, module_content)
+
+
+def mark_course_outline_only(course_obj, module_count, topic):
+    # Outline-first: ModuleContentView generates each module the first time it is opened
+    print(f"[Lazy Generation] Persisted outline with {module_count} modules for {topic}")
+    course_obj.status = "outline"
+    course_obj.save()
+
+
+def save_generated_course(course_obj):
+    """Flip the course to "generated" once every module has its checkpoint saved."""
+    print("Paced generation complete. Marking course as generated...")
+    refresh_stale_connections()
+    course_obj.status = "generated"
+    course_obj.save()
+
+
+def mark_course_failed(course_obj):
+    refresh_stale_connections()
+    course_obj.status = "failed"
+    course_obj.save()
+
+
+def create_course_full(course_obj, topic, language, topic_type="EXECUTABLE", generation_mode="full", orchestrator=None, request=None):
+    """
+    Build `course_obj` with the Multi-LLM orchestrator and return it serialized.
+
+    In "lazy" mode only the outline is persisted; module content is hydrated on demand.
+    Raises ValueError, after marking the course "failed", when generation fails.
+    """
+    try:
+        from .ai_orchestrator import AIOrchestrator
+        orchestrator = orchestrator or AIOrchestrator()
+
+        # Resume from the outline an interrupted generation of this course already saved
+        modules_to_create = checkpointed_modules(course_obj)
+        if modules_to_create:
+            print(f"Resuming generation of {topic} from its saved outline")
+        else:
+            course_outline = None
+            try:
+                print(f"Attempting valid Multi-LLM AI structure generation for: {topic}")
+                course_outline = orchestrator.generate_course_structure(topic, language)
+            except Exception as ex_struct:
+                print(f"[Offline Fallback] AI structure generation failed: {ex_struct}")
+
+            # If AI structure generation failed, was empty, or had 0 modules, use offline fallback curriculum
+            if not is_valid_outline(course_outline):
+                course_outline = fallback_course_outline(topic, language)
+            if not is_valid_outline(course_outline):
+                raise ValueError("Failed to generate course structure. AI returned empty or invalid response.")
+
+            # Update Course details and save the Modules structure immediately
+            modules_to_create = persist_course_outline(course_obj, course_outline, topic)
+
+        if generation_mode == "lazy":
+            mark_course_outline_only(course_obj, len(modules_to_create), topic)
+            return serialize_course(course_obj, request)
+
+        pending = [entry for entry in modules_to_create if entry[0].generation_status in ("pending", "generating")]
+        print(f"Starting paced content generation for {len(pending)} of {len(modules_to_create)} modules...")
+        for module, title, num in pending:
+            mark_module_generating(module)
+            save_module_checkpoint(
+                module, generate_module_payload(orchestrator, topic, language, topic_type, title, num)
+            )
+        save_generated_course(course_obj)
+        return serialize_course(course_obj, request)
+    except Exception as e:
+        import traceback
+        tb = traceback.format_exc()
+        print(f"[Backend Error] Exception in create_course_full: {tb}")
+        mark_course_failed(course_obj)
+        raise ValueError(f"AI Content Generation Failed: {e}")
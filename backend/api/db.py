@@ -0,0 +1,18 @@
+"""Central database-connection housekeeping for long-running requests."""
+from django.db import connections
+
+
+def refresh_stale_connections():
+    """
+    Re-validate persistent connections after long provider I/O.
+
+    Django health-checks a reused connection once, at the start of a request.
+    Course generation then spends minutes waiting on LLM providers, long enough
+    for Postgres or a proxy to drop the idle SSL connection. Calling this before
+    touching the database again closes obsolete connections and re-arms the
+    health check, so the next query transparently reconnects if needed.
+    Connections inside an atomic block are left alone.
+    """
+    for conn in connections.all(initialized_only=True):
+        if not conn.in_atomic_block:
+            conn.close_if_unusable_or_obsolete()
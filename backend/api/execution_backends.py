@@ -0,0 +1,279 @@
+"""
+Execution backends for the execute-code endpoint.
+
+`Judge0Backend` submits runs to Judge0 (RapidAPI). `LocalSubprocessBackend` runs
+languages whose LanguageRegistry entry declares a `local_runtime` in a subprocess
+on this host, isolated by `sandbox` and capped on CPU, memory, processes, output
+size and wall time, which
+answers a beginner Python lab in tens of milliseconds instead of a network round
+trip. `InterpreterPoolBackend` runs Python on pre-started warm interpreters
+(`interpreter_pool`). CODE_EXECUTION_BACKEND picks the backend; languages it
+cannot run (or whose toolchain is missing) always fall back to Judge0.
+
+Every backend answers `(body, status_code)` with a Judge0-shaped body, so clients
+cannot tell which one ran their code.
+"""
+import logging
+import os
+import resource
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from functools import lru_cache
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.urls import reverse
+
+from . import judge0, sandbox
+from .languages import LanguageRegistry
+
+logger = logging.getLogger('api')
+
+# Judge0 status IDs, reused so local results look like Judge0 ones
+STATUS_ACCEPTED = {"id": 3, "description": "Accepted"}
+STATUS_TIME_LIMIT = {"id": 5, "description": "Time Limit Exceeded"}
+STATUS_COMPILE_ERROR = {"id": 6, "description": "Compilation Error"}
+STATUS_SIGSEGV = {"id": 7, "description": "Runtime Error (SIGSEGV)"}
+STATUS_SIGXFSZ = {"id": 8, "description": "Runtime Error (SIGXFSZ)"}
+STATUS_SIGFPE = {"id": 9, "description": "Runtime Error (SIGFPE)"}
+STATUS_SIGABRT = {"id": 10, "description": "Runtime Error (SIGABRT)"}
+STATUS_NZEC = {"id": 11, "description": "Runtime Error (NZEC)"}
+STATUS_OTHER = {"id": 12, "description": "Runtime Error (Other)"}
+
+SIGNAL_STATUSES = {
+    signal.SIGSEGV: STATUS_SIGSEGV,
+    signal.SIGXFSZ: STATUS_SIGXFSZ,
+    signal.SIGFPE: STATUS_SIGFPE,
+    signal.SIGABRT: STATUS_SIGABRT,
+    signal.SIGXCPU: STATUS_TIME_LIMIT,
+}
+
+COMPILE_CPU_SECONDS = 10
+COMPILE_WALL_SECONDS = 15
+COMPILE_FILE_LIMIT = 64 * 1024 * 1024
+
+
+class ExecutionBackend:
+    """Runs one submission. `local` backends answer synchronously even in async execution mode."""
+    name = None
+    local = False
+
+    def supports(self, language_id):
+        return True
+
+    def execute(self, payload, wait=True):
+        """(body, status_code) for a Judge0-shaped payload: language_id, source_code, stdin."""
+        raise NotImplementedError
+
+    async def aexecute(self, payload, wait=True):
+        return await sync_to_async(self.execute, thread_sensitive=False)(payload, wait)
+
+
+class Judge0Backend(ExecutionBackend):
+    name = "judge0"
+
+    def execute(self, payload, wait=True):
+        return judge0_response(judge0.submit(payload, wait=wait), wait)
+
+    async def aexecute(self, payload, wait=True):
+        return judge0_response(await judge0.asubmit(payload, wait=wait), wait)
+
+
+def judge0_response(judge0_res, wait=True):
+    """(body, status) for a Judge0 submission; a queued run (`wait=False`) answers 202 with its token."""
+    print(f"[CodeExecutionView] Judge0 status: {judge0_res.status_code}, response: {judge0_res.text}")
+    if judge0_res.status_code not in ((200,) if wait else (200, 201)):
+        return {"error": "Judge0 error", "details": judge0_res.text}, judge0_res.status_code
+    if wait:
+        return judge0.judge0_output(judge0_res.json()), 200
+    token = judge0_res.json()["token"]
+    return {
+        "token": token,
+        "status": {"id": 1, "description": "In Queue"},
+        "result_url": reverse("execute-code-result", args=[token]),
+    }, 202
+
+
+def _resolve_tool(name):
+    return sys.executable if name == "{python}" else shutil.which(name)
+
+
+@lru_cache(maxsize=None)
+def local_runtime(language_id):
+    """The registry's `local_runtime` for a Judge0 language ID, or None if it is not declared or not installed."""
+    _, metadata = LanguageRegistry.get_by_judge0_id(language_id)
+    runtime = (metadata or {}).get("local_runtime")
+    if not runtime:
+        return None
+    for command in (runtime.get("compile"), runtime["run"]):
+        if command and command[0] != "{binary}" and not _resolve_tool(command[0]):
+            return None
+    return {**runtime, "extension": metadata["extension"]}
+
+
+def _apply_limits(cpu_seconds, memory_bytes, limit_address_space, max_processes, file_bytes):
+    """preexec_fn: runs in the child between fork and exec."""
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+    if memory_bytes:
+        limit = resource.RLIMIT_AS if limit_address_space else resource.RLIMIT_DATA
+        resource.setrlimit(limit, (memory_bytes, memory_bytes))
+    if max_processes:
+        resource.setrlimit(resource.RLIMIT_NPROC, (max_processes, max_processes))
+    resource.setrlimit(resource.RLIMIT_FSIZE, (file_bytes, file_bytes))
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+
+
+def _kill_group(pid, timed_out):
+    timed_out.set()
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+class LocalSubprocessBackend(ExecutionBackend):
+    name = "local"
+    local = True
+
+    def supports(self, language_id):
+        return local_runtime(language_id) is not None and sandbox.available()
+
+    def execute(self, payload, wait=True):
+        runtime = local_runtime(payload["language_id"])
+        if runtime is None:
+            return {"error": f"No local runtime for language {payload['language_id']}"}, 400
+
+        with tempfile.TemporaryDirectory(prefix="mentai-run-") as workdir:
+            paths = {
+                "{source}": os.path.join(workdir, f"main.{runtime['extension']}"),
+                "{binary}": os.path.join(workdir, "main"),
+                "{python}": sys.executable,
+            }
+            with open(paths["{source}"], "w", encoding="utf-8") as f:
+                f.write(payload["source_code"])
+            with open(os.path.join(workdir, "stdin"), "w", encoding="utf-8") as f:
+                f.write(payload.get("stdin") or "")
+
+            if runtime.get("compile"):
+                compiled = self._run(
+                    self._argv(runtime["compile"], paths), workdir,
+                    cpu_seconds=COMPILE_CPU_SECONDS, wall_seconds=COMPILE_WALL_SECONDS,
+                    memory_bytes=None, limit_address_space=False, file_bytes=COMPILE_FILE_LIMIT,
+                )
+                if compiled["timed_out"] or compiled["returncode"] != 0:
+                    return self._output(compiled, STATUS_COMPILE_ERROR, compile_output=compiled["stderr"] or compiled["stdout"]), 200
+
+            run = self._run(
+                self._argv(runtime["run"], paths), workdir,
+                cpu_seconds=settings.LOCAL_EXECUTION_CPU_SECONDS,
+                wall_seconds=settings.LOCAL_EXECUTION_WALL_SECONDS,
+                memory_bytes=settings.LOCAL_EXECUTION_MEMORY_MB * 1024 * 1024,
+                limit_address_space=runtime.get("address_space_limit", True),
+                file_bytes=settings.LOCAL_EXECUTION_OUTPUT_LIMIT_KB * 1024,
+            )
+            return self._output(run, self._status(run)), 200
+
+    def _argv(self, command, paths):
+        return [paths.get(arg, arg) if arg.startswith("{") else arg for arg in command]
+
+    def _run(self, argv, workdir, cpu_seconds, wall_seconds, memory_bytes, limit_address_space, file_bytes):
+        """
+        Run argv with rlimits in its own process group and the execution sandbox.
+        stdout/stderr go to files whose size RLIMIT_FSIZE caps, so a runaway print loop
+        is stopped instead of buffered.
+        """
+        argv[0] = _resolve_tool(argv[0]) or argv[0]
+        program = os.path.basename(argv[0])
+        argv = sandbox.wrap(argv, workdir)
+        env = {"PATH": os.environ.get("PATH", "/usr/bin:/bin"), "LANG": "C.UTF-8", "HOME": workdir}
+        out_path, err_path = os.path.join(workdir, "stdout"), os.path.join(workdir, "stderr")
+        timed_out = threading.Event()
+        started = time.perf_counter()
+        with open(os.path.join(workdir, "stdin"), "rb") as stdin, open(out_path, "wb") as stdout, open(err_path, "wb") as stderr:
+            proc = subprocess.Popen(
+                argv, cwd=workdir, stdin=stdin, stdout=stdout, stderr=stderr, env=env,
+                start_new_session=True, close_fds=True,
+                preexec_fn=lambda: _apply_limits(
+                    cpu_seconds, memory_bytes, limit_address_space, settings.LOCAL_EXECUTION_MAX_PROCESSES, file_bytes
+                ),
+            )
+            timer = threading.Timer(wall_seconds, _kill_group, args=(proc.pid, timed_out))
+            timer.start()
+            try:
+                # wait4 instead of proc.wait() to get the child's own CPU time
+                _, wait_status, usage = os.wait4(proc.pid, 0)
+            finally:
+                timer.cancel()
+            proc.returncode = os.waitstatus_to_exitcode(wait_status)
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)  # reap anything the program left running
+            except ProcessLookupError:
+                pass
+
+        logger.info(f"Local run {program} -> {proc.returncode} in {(time.perf_counter() - started) * 1000:.0f}ms")
+        return {
+            "returncode": proc.returncode,
+            "timed_out": timed_out.is_set(),
+            "stdout": self._read_capped(out_path),
+            "stderr": self._read_capped(err_path),
+            "time": f"{usage.ru_utime + usage.ru_stime:.3f}",
+        }
+
+    def _read_capped(self, path):
+        with open(path, "rb") as f:
+            return f.read(settings.LOCAL_EXECUTION_OUTPUT_LIMIT_KB * 1024).decode("utf-8", errors="replace")
+
+    def _status(self, run):
+        if run["timed_out"]:
+            return STATUS_TIME_LIMIT
+        if run["returncode"] == 0:
+            return STATUS_ACCEPTED
+        if run["returncode"] < 0:
+            return SIGNAL_STATUSES.get(-run["returncode"], STATUS_OTHER)
+        return STATUS_NZEC
+
+    def _output(self, run, status, compile_output=None):
+        return judge0.judge0_output({
+            "stdout": None if compile_output is not None else run["stdout"] or None,
+            "stderr": None if compile_output is not None else run["stderr"] or None,
+            "compile_output": compile_output,
+            "status": status,
+            "time": run["time"],
+            # ru_maxrss survives exec, so it would report this worker's size; left unset
+            "memory": None,
+        })
+
+
+class InterpreterPoolBackend(ExecutionBackend):
+    """Python runs on the warm interpreters of `interpreter_pool`, skipping interpreter startup."""
+    name = "pool"
+    local = True
+
+    def supports(self, language_id):
+        return language_id == LanguageRegistry.get_language_id("python") and sandbox.available()
+
+    def execute(self, payload, wait=True):
+        from .interpreter_pool import get_pool
+
+        result = get_pool().run(payload)
+        return judge0.judge0_output({**result, "compile_output": None, "memory": None}), 200
+
+
+BACKENDS = {
+    "judge0": Judge0Backend(),
+    "local": LocalSubprocessBackend(),
+    "pool": InterpreterPoolBackend(),
+}
+
+
+def get_backend(language_id):
+    """The configured backend if it can run this language, otherwise Judge0."""
+    backend = BACKENDS.get(settings.CODE_EXECUTION_BACKEND)
+    if backend is not None and backend.supports(language_id):
+        return backend
+    return BACKENDS["judge0"]
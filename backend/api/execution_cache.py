@@ -0,0 +1,104 @@
+"""
+Result cache for unmodified prebuilt lab snippets.
+
+Most runs are students pressing "Run" on a lab's untouched `preloaded_code`. When
+the submitted code is one of the prebuilt snippets from `get_prebuilt_code_snippet`
+and contains nothing that makes its output vary between runs (clocks, randomness,
+threads, addresses, hash ordering, files), its Judge0 result is stored under
+(language_id, sha256(code), sha256(stdin)) and later runs are answered without
+a Judge0 call. `manage.py prewarm_execution_cache` fills the cache ahead of time.
+"""
+import hashlib
+import re
+from functools import lru_cache
+
+from django.core.cache import cache
+
+from . import content_library
+from .course_content import get_prebuilt_code_snippet
+from .languages import LanguageRegistry
+from .models import ExecutionResult
+
+# Identifiers that are also English words or common substrings ("update", "settings") must stand alone
+NONDETERMINISTIC_PATTERN = re.compile(
+    r"random|uuid|thread|getpid|environ|argv|frozenset|settimeout|setinterval|nanotime|currenttimemillis"
+    r"|\b(?:rand|srand|time|localtime|clock|date|datetime|getenv|fopen)\b"
+    r"|\b(?:open|id|hash|set)\s*\(|\.now\s*\(|\bgo\s+\w|\bsync\.|%p",
+    re.IGNORECASE,
+)
+CACHEABLE_STATUS_IDS = (3, 6)  # Accepted, Compilation Error
+MODULES_PER_COURSE = 10
+LABS_PER_MODULE = 3
+
+
+def sha256(text):
+    return hashlib.sha256((text or "").encode("utf-8")).hexdigest()
+
+
+def prebuilt_snippets(languages=None):
+    """(language, language_id, module_number, lab_index, code) for every executable prebuilt lab snippet."""
+    for language, meta in LanguageRegistry.SUPPORTED_LANGUAGES.items():
+        if (languages and language not in languages) or not meta.get("judge0_id"):
+            continue
+        for module_index in range(MODULES_PER_COURSE):
+            for lab_index in range(LABS_PER_MODULE):
+                code = get_prebuilt_code_snippet(language, "EXECUTABLE", module_index, lab_index)
+                if code.startswith("// Code for"):
+                    break  # no prebuilt library for this language
+                yield language, meta["judge0_id"], module_index + 1, lab_index, code
+
+
+def is_deterministic(code):
+    return not NONDETERMINISTIC_PATTERN.search(code)
+
+
+def cacheable_snippets():
+    """(language_id, code hash) of the deterministic prebuilt snippets, rebuilt when the content library changes."""
+    return _cacheable_snippets(content_library.get_library().version)
+
+
+@lru_cache(maxsize=1)
+def _cacheable_snippets(library_version):
+    return frozenset(
+        (language_id, sha256(code))
+        for _, language_id, _, _, code in prebuilt_snippets()
+        if is_deterministic(code)
+    )
+
+
+def is_cacheable(payload):
+    return (payload["language_id"], sha256(payload["source_code"])) in cacheable_snippets()
+
+
+def _cache_key(language_id, code_hash, stdin_hash):
+    return f"execution-result:{language_id}:{code_hash}:{stdin_hash}"
+
+
+def lookup(payload):
+    """Stored output for a Judge0 payload, or None when it is not a cached prebuilt snippet run."""
+    if not is_cacheable(payload):
+        return None
+    key = (payload["language_id"], sha256(payload["source_code"]), sha256(payload.get("stdin")))
+    result = cache.get(_cache_key(*key))
+    if result is None:
+        result = (
+            ExecutionResult.objects
+            .filter(language_id=key[0], code_sha256=key[1], stdin_sha256=key[2])
+            .values_list("result", flat=True)
+            .first()
+        )
+        if result is not None:
+            cache.set(_cache_key(*key), result, timeout=None)
+    return result
+
+
+def store(payload, output):
+    """Remember `output` when the payload is a cacheable snippet and the run finished deterministically."""
+    if not is_cacheable(payload) or (output.get("status") or {}).get("id") not in CACHEABLE_STATUS_IDS:
+        return False
+    key = (payload["language_id"], sha256(payload["source_code"]), sha256(payload.get("stdin")))
+    ExecutionResult.objects.update_or_create(
+        language_id=key[0], code_sha256=key[1], stdin_sha256=key[2], defaults={"result": output}
+    )
+    cache.set(_cache_key(*key), output, timeout=None)
+    return True
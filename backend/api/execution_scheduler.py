@@ -0,0 +1,244 @@
+"""
+Fair admission control for code runs sent to Judge0.
+
+At most EXECUTION_MAX_IN_FLIGHT runs per worker process talk to Judge0 at once
+(size it to the RapidAPI plan divided by the number of worker processes), and each
+user has at most EXECUTION_PER_USER_IN_FLIGHT of them. A "user" is a login or the
+signed client id the backend hands each browser (see `client_key`). The caps are per process, so
+they only engage when a process serves requests concurrently: gthread workers (the
+start commands use `--worker-class gthread --threads 8`) or ASGI. A sync worker runs
+one request at a time and never queues. Waiting runs are admitted
+round-robin across users, so one student re-clicking "Run" cannot starve the class.
+When the queue is full, or a user already has EXECUTION_PER_USER_QUEUE runs waiting,
+the request is rejected at once with a Retry-After estimate instead of piling up
+behind Judge0's own 429s.
+"""
+import asyncio
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+
+CLIENT_ID_SALT = "api.execution_scheduler.client_id"
+
+
+class QueueFull(Exception):
+    def __init__(self, retry_after, reason):
+        super().__init__(reason)
+        self.retry_after = retry_after
+
+
+def client_ip(request):
+    """
+    The X-Forwarded-For entry the outermost of EXECUTION_TRUSTED_PROXIES proxies appended,
+    or the socket peer when there are none. Leading entries are set by the client.
+    """
+    hops = [hop.strip() for hop in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",") if hop.strip()]
+    trusted = settings.EXECUTION_TRUSTED_PROXIES
+    if trusted and len(hops) >= trusted:
+        return hops[-trusted]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def client_id(request):
+    """The id in the request's X-Client-Id header if the backend signed it, else None."""
+    token = request.headers.get("X-Client-Id", "").strip()
+    if not token:
+        return None
+    try:
+        return signing.Signer(salt=CLIENT_ID_SALT).unsign(token)
+    except signing.BadSignature:
+        return None
+
+
+def issue_client_id(request):
+    """
+    A new signed client id for a request that has none. None once the client's IP got
+    EXECUTION_CLIENT_IDS_PER_IP this hour, so a client cannot mint ids to dodge its caps.
+    """
+    key = f"client-ids:{client_ip(request)}"
+    cache.add(key, 0, timeout=3600)
+    try:
+        issued = cache.incr(key)
+    except ValueError:  # expired in between
+        cache.add(key, 1, timeout=3600)
+        issued = 1
+    if issued > settings.EXECUTION_CLIENT_IDS_PER_IP:
+        return None
+    return signing.Signer(salt=CLIENT_ID_SALT).sign(uuid.uuid4().hex)
+
+
+def client_key(request):
+    """
+    Who a run is charged to: the logged-in user, the signed client id the backend issued
+    to this browser (ClientIdMiddleware), or else the client IP. IP-keyed clients may be
+    a whole classroom behind one NAT, so they get the larger EXECUTION_PER_IP_* caps.
+    """
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return f"user:{user.pk}"
+    signed_id = client_id(request)
+    if signed_id:
+        return f"client:{signed_id}"
+    return f"ip:{client_ip(request)}"
+
+
+class ExecutionScheduler:
+    def __init__(self, max_in_flight, per_user, max_queue, per_user_queue, queue_timeout, per_ip=None, per_ip_queue=None):
+        self.max_in_flight = max_in_flight
+        self.per_user = per_user
+        self.max_queue = max_queue
+        self.per_user_queue = per_user_queue
+        # Caps for "ip:" keys from client_key; default to the per-user ones
+        self.per_ip = per_user if per_ip is None else per_ip
+        self.per_ip_queue = per_user_queue if per_ip_queue is None else per_ip_queue
+        self.queue_timeout = queue_timeout
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._user_in_flight = {}
+        self._waiting = OrderedDict()  # user -> deque of tickets; order is the round-robin ring
+        self._queued = 0
+        self._avg_run_seconds = 1.0
+        self._rejected = 0
+
+    def _retry_after(self):
+        waves = (self._queued + self.max_in_flight) / self.max_in_flight
+        return max(1, math.ceil(waves * self._avg_run_seconds))
+
+    def _reject(self, reason):
+        self._rejected += 1
+        raise QueueFull(self._retry_after(), reason)
+
+    def acquire(self, user):
+        """Block until `user` may start a run; raises QueueFull instead of waiting when over capacity."""
+        with self._cond:
+            if not self._queued and self._can_run(user):
+                self._start(user)
+                return
+            if self._queued >= self.max_queue:
+                self._reject("Execution queue is full")
+            if len(self._waiting.get(user, ())) >= self._caps(user)[1]:
+                self._reject("Too many runs queued for this user")
+
+            ticket = {"granted": False}
+            self._waiting.setdefault(user, deque()).append(ticket)
+            self._queued += 1
+            self._dispatch()  # a free slot may be usable by this user even if others are waiting
+            deadline = time.monotonic() + self.queue_timeout
+            while not ticket["granted"]:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._drop(user, ticket)
+                    self._reject("Timed out waiting for an execution slot")
+                self._cond.wait(remaining)
+
+    def release(self, user, elapsed=None):
+        with self._cond:
+            self._in_flight -= 1
+            self._user_in_flight[user] -= 1
+            if not self._user_in_flight[user]:
+                del self._user_in_flight[user]
+            if elapsed is not None:
+                self._avg_run_seconds = 0.8 * self._avg_run_seconds + 0.2 * elapsed
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, user):
+        self.acquire(user)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(user, time.monotonic() - started)
+
+    @asynccontextmanager
+    async def aslot(self, user):
+        """`slot` for the async views; the wait for a slot happens off the event loop."""
+        acquiring = asyncio.ensure_future(sync_to_async(self.acquire, thread_sensitive=False)(user))
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # Client went away while waiting: hand the slot back once the thread gets it
+            acquiring.add_done_callback(lambda f: f.exception() is None and self.release(user))
+            raise
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(user, time.monotonic() - started)
+
+    def _caps(self, user):
+        """(in flight, queued) allowed for `user`."""
+        if user.startswith("ip:"):
+            return self.per_ip, self.per_ip_queue
+        return self.per_user, self.per_user_queue
+
+    def _can_run(self, user):
+        return self._in_flight < self.max_in_flight and self._user_in_flight.get(user, 0) < self._caps(user)[0]
+
+    def _start(self, user):
+        self._in_flight += 1
+        self._user_in_flight[user] = self._user_in_flight.get(user, 0) + 1
+
+    def _drop(self, user, ticket):
+        self._waiting[user].remove(ticket)
+        self._queued -= 1
+        if not self._waiting[user]:
+            del self._waiting[user]
+
+    def _dispatch(self):
+        """Grant waiting tickets one user at a time, moving each served user to the back of the ring."""
+        granted = False
+        while self._in_flight < self.max_in_flight:
+            user = next((u for u in self._waiting if self._can_run(u)), None)
+            if user is None:
+                break
+            ticket = self._waiting[user].popleft()
+            self._queued -= 1
+            if self._waiting[user]:
+                self._waiting.move_to_end(user)
+            else:
+                del self._waiting[user]
+            ticket["granted"] = granted = True
+            self._start(user)
+        if granted:
+            self._cond.notify_all()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "in_flight": self._in_flight,
+                "max_in_flight": self.max_in_flight,
+                "queued": self._queued,
+                "users_waiting": len(self._waiting),
+                "rejected": self._rejected,
+                "avg_run_seconds": round(self._avg_run_seconds, 3),
+            }
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = ExecutionScheduler(
+                    settings.EXECUTION_MAX_IN_FLIGHT,
+                    settings.EXECUTION_PER_USER_IN_FLIGHT,
+                    settings.EXECUTION_MAX_QUEUE,
+                    settings.EXECUTION_PER_USER_QUEUE,
+                    settings.EXECUTION_QUEUE_TIMEOUT,
+                    per_ip=settings.EXECUTION_PER_IP_IN_FLIGHT,
+                    per_ip_queue=settings.EXECUTION_PER_IP_QUEUE,
+                )
+    return _scheduler
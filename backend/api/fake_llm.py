@@ -0,0 +1,232 @@
+"""
+Deterministic stand-in for the Gemini, Groq and OpenAI clients used by AIOrchestrator.
+
+With LLM_PROVIDER_BACKEND="fake" the orchestrator gets these objects instead of the
+SDK clients, so the whole pipeline (retries, failover, JSON repair, validation,
+fallback and persistence) runs offline. Each call sleeps for a latency drawn
+from a log-normal distribution around the configured median for its phase.
+It then fails, returns malformed JSON, or returns schema-valid structure,
+theory, quiz or lab JSON for the prompt. Content depends only on the prompt and
+the random draws on FAKE_LLM_SEED, so runs are repeatable.
+"""
+import asyncio
+import json
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+from django.conf import settings
+
+PHASE_MARKERS = (
+    ("structure", "-module course on"),
+    ("theory", "Generate detailed theoretical content"),
+    ("quiz", "quiz questions"),
+    ("labs", "Generate coding labs"),
+)
+
+
+class FakeProviderError(Exception):
+    pass
+
+
+def parse_latencies(value):
+    """'1500' or 'structure=800,theory=2500,quiz=1200,labs=1800' -> {phase: median seconds}"""
+    latencies = {}
+    for part in str(value).split(","):
+        phase, _, ms = part.rpartition("=")
+        latencies[phase.strip() or "default"] = float(ms) / 1000
+    return latencies
+
+
+def prompt_phase(prompt):
+    return next((phase for phase, marker in PHASE_MARKERS if marker in prompt), "default")
+
+
+class FakeLLM:
+    def __init__(self, latencies, sigma=0.35, failure_rate=0.0, malformed_rate=0.0, seed=0):
+        self.latencies = latencies
+        self.sigma = sigma
+        self.failure_rate = failure_rate
+        self.malformed_rate = malformed_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "failures": 0, "malformed": 0, "latency": 0.0}
+
+    @classmethod
+    def from_settings(cls):
+        return cls(
+            parse_latencies(settings.FAKE_LLM_LATENCY_MS),
+            sigma=settings.FAKE_LLM_LATENCY_SIGMA,
+            failure_rate=settings.FAKE_LLM_FAILURE_RATE,
+            malformed_rate=settings.FAKE_LLM_MALFORMED_RATE,
+            seed=settings.FAKE_LLM_SEED,
+        )
+
+    def _draw(self, prompt):
+        """(latency, outcome) for one call; outcome is 'fail', 'malformed' or 'ok'."""
+        phase = prompt_phase(prompt)
+        median = self.latencies.get(phase, self.latencies.get("default", 1.0))
+        with self._lock:
+            latency = median * self._random.lognormvariate(0, self.sigma) if self.sigma else median
+            roll = self._random.random()
+            outcome = "fail" if roll < self.failure_rate else "malformed" if roll < self.failure_rate + self.malformed_rate else "ok"
+            self.stats["calls"] += 1
+            self.stats["latency"] += latency
+            if outcome == "fail":
+                self.stats["failures"] += 1
+            elif outcome == "malformed":
+                self.stats["malformed"] += 1
+        return latency, outcome
+
+    def _text(self, prompt, outcome):
+        if outcome == "fail":
+            raise FakeProviderError("fake provider: simulated 503 / rate limit")
+        text = json.dumps(fake_payload(prompt))
+        if outcome == "malformed":
+            # Cut the JSON off mid-document, like a response that hit max tokens
+            return text[:max(1, len(text) // 3)]
+        return text
+
+    def complete(self, prompt):
+        latency, outcome = self._draw(prompt)
+        time.sleep(latency)
+        return self._text(prompt, outcome)
+
+    async def acomplete(self, prompt):
+        latency, outcome = self._draw(prompt)
+        await asyncio.sleep(latency)
+        return self._text(prompt, outcome)
+
+
+def prompt_fields(prompt):
+    module = re.search(r'Module (\d+): "(.*?)"', prompt)
+    course = re.search(r'(?:course on |of the course |of )"(.*?)"(?: using | \()([^)\n.]+)', prompt)
+    return {
+        "module_number": int(module.group(1)) if module else 1,
+        "module_title": module.group(2) if module else "Module",
+        "topic": course.group(1) if course else "Programming",
+        "language": (course.group(2) if course else "python").strip(),
+    }
+
+
+def fake_payload(prompt):
+    fields = prompt_fields(prompt)
+    topic, language = fields["topic"], fields["language"]
+    title, number = fields["module_title"], fields["module_number"]
+    phase = prompt_phase(prompt)
+
+    if phase == "structure":
+        return {
+            "course_title": f"Complete {topic}",
+            "course_description": f"A generated course on {topic} in {language}.",
+            "modules": [
+                {
+                    "module_number": i,
+                    "title": f"{topic} Topic {i}",
+                    "description": f"Everything about {topic} topic {i}.",
+                    "learning_objectives": [f"Understand topic {i}", f"Apply topic {i}"],
+                    "difficulty": "Beginner" if i < 4 else "Intermediate" if i < 8 else "Advanced",
+                }
+                for i in range(1, 11)
+            ],
+        }
+    if phase == "theory":
+        paragraph = f"{title} is a core part of {topic}. This section explains how it works in {language}, why it matters and the mistakes beginners make. "
+        return {
+            "theory": f"## {title}\n\n" + paragraph * 12,
+            "real_world_examples": [
+                {"title": f"{title} in production", "description": paragraph, "solution": "Apply the pattern.", "learning_outcome": "Confidence."}
+            ],
+        }
+    if phase == "quiz":
+        return {
+            "quizzes": [
+                {
+                    "question": f"Module {number} question {i}: what does {title} do?",
+                    "options": [f"Option {c}" for c in "ABCD"],
+                    "answer": f"Option {'ABCD'[i % 4]}",
+                    "explanation": f"Because of how {title} works.",
+                    "difficulty": ("easy", "medium", "hard")[i % 3],
+                    "type": "code_prediction",
+                }
+                for i in range(1, 11)
+            ]
+        }
+    if phase == "labs":
+        return {
+            "code_examples": [
+                {"title": f"{title} example", "code": f"print('{title} example')", "explanation": "Prints a greeting.", "language": language}
+            ],
+            "mini_labs": [
+                {
+                    "title": f"{title} lab {i}",
+                    "description": f"Practice {title.lower()}.",
+                    "tasks": ["Read the starter code", "Make it print the expected output"],
+                    "expected_outcome": f"lab {i} ok",
+                    "preloaded_code": f"print('lab {i} ok')",
+                    "test_cases": [{"stdin": "", "expected_output": f"lab {i} ok\n"}],
+                }
+                for i in range(1, 4)
+            ],
+        }
+    return {"answer": f"A fake answer about {topic}."}
+
+
+_fake_llm = None
+_fake_llm_lock = threading.Lock()
+
+
+def get_fake_llm():
+    """The process-wide FakeLLM, so seeded draws and stats span orchestrator instances."""
+    global _fake_llm
+    config = (
+        settings.FAKE_LLM_LATENCY_MS, settings.FAKE_LLM_LATENCY_SIGMA, settings.FAKE_LLM_FAILURE_RATE,
+        settings.FAKE_LLM_MALFORMED_RATE, settings.FAKE_LLM_SEED,
+    )
+    with _fake_llm_lock:
+        if _fake_llm is None or _fake_llm.config != config:
+            _fake_llm = FakeLLM.from_settings()
+            _fake_llm.config = config
+        return _fake_llm
+
+
+# -- SDK-shaped wrappers, so AIOrchestrator's call sites stay unchanged --
+
+class FakeGenerativeModel:
+    """Stands in for genai.GenerativeModel."""
+
+    def __init__(self, llm):
+        self.llm = llm
+
+    def generate_content(self, prompt):
+        return SimpleNamespace(text=self.llm.complete(prompt))
+
+    async def generate_content_async(self, prompt):
+        return SimpleNamespace(text=await self.llm.acomplete(prompt))
+
+
+class _Completions:
+    def __init__(self, llm, is_async):
+        self.llm = llm
+        self.is_async = is_async
+
+    def create(self, messages, **kwargs):
+        prompt = messages[-1]["content"]
+        if self.is_async:
+            return self._acreate(prompt)
+        return self._response(self.llm.complete(prompt))
+
+    async def _acreate(self, prompt):
+        return self._response(await self.llm.acomplete(prompt))
+
+    def _response(self, content):
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class FakeChatClient:
+    """Stands in for the Groq / OpenAI (sync or async) clients: `client.chat.completions.create(...)`."""
+
+    def __init__(self, llm, is_async=False):
+        self.chat = SimpleNamespace(completions=_Completions(llm, is_async))
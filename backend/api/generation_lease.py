@@ -0,0 +1,111 @@
+"""
+Cross-process single-flight for course generation.
+
+The request that builds a topic's course first inserts a GenerationLease row for the
+topic; the unique constraint means exactly one request (in any worker or process)
+gets it. Other requests for the topic wait for the row to go away and then answer
+from the stored course. A thread renews the lease every third of
+GENERATION_LEASE_SECONDS while its holder works, so the lease of a killed worker
+expires shortly after and the next request takes it over.
+"""
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connections, transaction
+from django.utils import timezone
+
+from .models import GenerationLease
+
+logger = logging.getLogger('api')
+
+
+def _key(topic):
+    return topic.strip().lower()[:255]
+
+
+def _expiry():
+    return timezone.now() + timedelta(seconds=settings.GENERATION_LEASE_SECONDS)
+
+
+class Lease:
+    """A held lease. Release it (or use it as a context manager) once the course is saved."""
+
+    def __init__(self, topic, owner):
+        self.topic = topic
+        self.owner = owner
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._heartbeat, daemon=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    def renew(self):
+        """Push the expiry out by GENERATION_LEASE_SECONDS. False when the lease was lost."""
+        return bool(
+            GenerationLease.objects.filter(topic=self.topic, owner=self.owner).update(expires_at=_expiry())
+        )
+
+    def release(self):
+        self._stop.set()
+        GenerationLease.objects.filter(topic=self.topic, owner=self.owner).delete()
+
+    def _heartbeat(self):
+        try:
+            while not self._stop.wait(settings.GENERATION_LEASE_SECONDS / 3):
+                try:
+                    if not self.renew():
+                        logger.warning(f"Generation lease for {self.topic!r} was lost to another worker")
+                        return
+                except Exception as e:
+                    logger.warning(f"Generation lease heartbeat failed for {self.topic!r}: {e}")
+        finally:
+            connections.close_all()
+
+
+def acquire(topic):
+    """Take the lease for `topic`, or an expired one over. None while another request holds it."""
+    key = _key(topic)
+    owner = f"{socket.gethostname()[:60]}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    now = timezone.now()
+    try:
+        with transaction.atomic():
+            GenerationLease.objects.create(topic=key, owner=owner, acquired_at=now, expires_at=_expiry())
+    except IntegrityError:
+        # Compare-and-set on expires_at: of several requests taking over, one updates the row
+        taken = GenerationLease.objects.filter(topic=key, expires_at__lte=now).update(
+            owner=owner, acquired_at=now, expires_at=_expiry()
+        )
+        if not taken:
+            return None
+        logger.warning(f"Generation lease for {key!r} expired without a heartbeat; taking it over")
+    lease = Lease(key, owner)
+    lease._thread.start()
+    return lease
+
+
+def is_held(topic, lease=None):
+    """Whether a live lease for `topic` is held by a request other than `lease`'s."""
+    held = GenerationLease.objects.filter(topic=_key(topic), expires_at__gt=timezone.now())
+    if lease is not None:
+        held = held.exclude(owner=lease.owner)
+    return held.exists()
+
+
+def wait_for_release(topic, timeout):
+    """Block until no live lease is held for `topic`. False when `timeout` seconds ran out first."""
+    deadline = time.monotonic() + timeout
+    while is_held(topic):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(settings.GENERATION_LEASE_POLL_SECONDS, remaining))
+    return True
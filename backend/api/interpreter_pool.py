@@ -0,0 +1,174 @@
+"""
+Pool of pre-started, resource-limited Python interpreters for local code runs.
+
+A fresh `python main.py` pays interpreter startup and imports on every run. The pool
+keeps INTERPRETER_POOL_SIZE `interpreter_worker.py` templates warm; a run is handed
+to an idle template over a pipe, which forks a single-use child for it, so no run
+can see or change the interpreter state of another. Templates start inside the
+execution sandbox (api/sandbox.py), which their children inherit. A template is
+replaced only if it dies or stops answering.
+
+The pool is created lazily per process, so gunicorn workers forked after a
+preloaded app each start their own interpreters.
+"""
+import atexit
+import json
+import logging
+import math
+import os
+import queue
+import select
+import shutil
+import signal
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+
+from . import sandbox
+from .execution_scheduler import QueueFull
+
+logger = logging.getLogger('api')
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "interpreter_worker.py")
+# The template enforces the wall limit on its child; the pool gives up on the template after this much more
+KILL_GRACE_SECONDS = 2.0
+
+STATUS_TIME_LIMIT = {"id": 5, "description": "Time Limit Exceeded"}
+STATUS_OTHER = {"id": 12, "description": "Runtime Error (Other)"}
+
+
+class WorkerLost(Exception):
+    pass
+
+
+class PooledInterpreter:
+    """One warm template process and its request/response pipes."""
+
+    def __init__(self):
+        self.workdir = tempfile.mkdtemp(prefix="mentai-pool-")
+        # The sandbox hides the app directory, so the template runs from a copy in its workdir
+        script = shutil.copy(WORKER_SCRIPT, self.workdir)
+        request_r, self.request_w = os.pipe()
+        self.response_r, response_w = os.pipe()
+        try:
+            self.process = subprocess.Popen(
+                sandbox.wrap([
+                    sys.executable, "-I", "-S", script,
+                    str(request_r), str(response_w),
+                    str(settings.LOCAL_EXECUTION_MEMORY_MB * 1024 * 1024),
+                    str(settings.LOCAL_EXECUTION_MAX_PROCESSES),
+                    str(settings.LOCAL_EXECUTION_CPU_SECONDS),
+                    str(settings.LOCAL_EXECUTION_WALL_SECONDS),
+                    str(settings.LOCAL_EXECUTION_OUTPUT_LIMIT_KB * 1024),
+                ], self.workdir),
+                pass_fds=(request_r, response_w),
+                stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                cwd=self.workdir,
+                env={"PATH": os.environ.get("PATH", "/usr/bin:/bin"), "LANG": "C.UTF-8", "HOME": self.workdir},
+                start_new_session=True,
+            )
+        finally:
+            os.close(request_r)
+            os.close(response_w)
+
+    def run(self, payload, timeout):
+        body = json.dumps({"source_code": payload["source_code"], "stdin": payload.get("stdin") or ""}).encode("utf-8")
+        try:
+            os.write(self.request_w, struct.pack(">I", len(body)) + body)
+        except OSError as e:
+            raise WorkerLost(f"worker pipe closed: {e}")
+        deadline = time.monotonic() + timeout
+        (size,) = struct.unpack(">I", self._read(4, deadline))
+        return json.loads(self._read(size, deadline))
+
+    def _read(self, size, deadline):
+        data = b""
+        while len(data) < size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self.response_r], [], [], remaining)[0]:
+                raise TimeoutError
+            chunk = os.read(self.response_r, size - len(data))
+            if not chunk:
+                raise WorkerLost(f"worker exited with {self.process.wait()}")
+            data += chunk
+        return data
+
+    def close(self):
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.process.wait()
+        for fd in (self.request_w, self.response_r):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+class InterpreterPool:
+    def __init__(self, size):
+        self.size = size
+        self._idle = queue.Queue()
+        for _ in range(size):
+            self._idle.put(PooledInterpreter())
+
+    def run(self, payload):
+        """
+        Judge0-shaped output (without compile_output/memory) for a Python payload.
+        Raises QueueFull when no interpreter frees up in time, so the view answers 429.
+        """
+        wall = settings.LOCAL_EXECUTION_WALL_SECONDS
+        try:
+            worker = self._idle.get(timeout=wall * self.size)
+        except queue.Empty:
+            raise QueueFull(max(1, math.ceil(wall)), f"All {self.size} pooled interpreters are busy") from None
+        retire = True
+        try:
+            result = worker.run(payload, settings.LOCAL_EXECUTION_WALL_SECONDS + KILL_GRACE_SECONDS)
+            retire = False
+            return result
+        except TimeoutError:
+            return {"stdout": None, "stderr": None, "status": STATUS_TIME_LIMIT, "time": None}
+        except WorkerLost as e:
+            logger.warning(f"Interpreter pool worker lost: {e}")
+            return {"stdout": None, "stderr": None, "status": STATUS_OTHER, "time": None}
+        finally:
+            if retire:
+                worker.close()
+                worker = PooledInterpreter()
+            self._idle.put(worker)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = InterpreterPool(settings.INTERPRETER_POOL_SIZE)
+                _pool_pid = os.getpid()
+    return _pool
+
+
+@atexit.register
+def _close_pool():
+    if _pool is not None and _pool_pid == os.getpid():
+        _pool.close()
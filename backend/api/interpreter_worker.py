@@ -0,0 +1,240 @@
+"""
+Warm Python template for `interpreter_pool`. Not imported by Django: the pool starts it
+as `python -I -S interpreter_worker.py <request fd> <response fd> <limits...>`.
+
+The template caps its own memory, processes and file size and pre-imports the modules
+beginner labs use, but never runs submitted code itself. For each request it forks a
+child that closes the pool pipes, takes a per-run CPU limit it cannot raise, and runs
+the submission with stdin/stdout/stderr captured. The child exits after that one run,
+so nothing a submission changes (sys.modules, module attributes, signal handlers,
+limits) reaches the next one. The template kills the child's process group if it
+overruns the wall limit. Messages on the pipes are a 4-byte big-endian length
+followed by UTF-8 JSON.
+"""
+import builtins
+import io
+import json
+import os
+import resource
+import select
+import signal
+import struct
+import sys
+import time
+import traceback
+
+# Warm imports, so `import math` in a lab costs a dict lookup
+import bisect, collections, datetime, decimal, fractions, functools, heapq, itertools, math, random, re, statistics, string  # noqa: E401,F401
+
+STATUS_ACCEPTED = {"id": 3, "description": "Accepted"}
+STATUS_TIME_LIMIT = {"id": 5, "description": "Time Limit Exceeded"}
+STATUS_OUTPUT_LIMIT = {"id": 8, "description": "Runtime Error (SIGXFSZ)"}
+STATUS_NZEC = {"id": 11, "description": "Runtime Error (NZEC)"}
+STATUS_OTHER = {"id": 12, "description": "Runtime Error (Other)"}
+
+# The child's own SIGALRM reports a friendly TLE; past this grace the template kills it
+WALL_GRACE_SECONDS = 0.5
+PR_SET_DUMPABLE = 4
+
+
+class TimeLimitExceeded(BaseException):
+    pass
+
+
+class OutputLimitExceeded(BaseException):
+    pass
+
+
+class CappedWriter(io.TextIOBase):
+    """stdout/stderr stand-in that stops the program once the output budget is spent."""
+
+    def __init__(self, budget):
+        self.parts = []
+        self.budget = budget
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        text = str(text)
+        if len(text) > self.budget[0]:
+            self.parts.append(text[:self.budget[0]])
+            self.budget[0] = 0
+            raise OutputLimitExceeded()
+        self.budget[0] -= len(text)
+        self.parts.append(text)
+        return len(text)
+
+    def getvalue(self):
+        return "".join(self.parts)
+
+
+def _read_exact(fd, size):
+    data = b""
+    while len(data) < size:
+        chunk = os.read(fd, size - len(data))
+        if not chunk:
+            raise EOFError
+        data += chunk
+    return data
+
+
+def _send(fd, message):
+    body = json.dumps(message).encode("utf-8")
+    os.write(fd, struct.pack(">I", len(body)) + body)
+
+
+def _on_alarm(signum, frame):
+    raise TimeLimitExceeded()
+
+
+def _user_traceback(exc):
+    # Drop this module's frames so the trace starts at the student's code, like `python main.py`
+    tb = exc.__traceback__
+    while tb is not None and tb.tb_frame.f_code.co_filename == __file__:
+        tb = tb.tb_next
+    return "".join(traceback.format_exception(type(exc), exc, tb))
+
+
+def run(code, stdin, wall_seconds, output_limit):
+    """Execute one submission in this (forked, single-use) process and return its result."""
+    budget = [output_limit]
+    stdout, stderr = CappedWriter(budget), CappedWriter(budget)
+    status = STATUS_ACCEPTED
+
+    signal.setitimer(signal.ITIMER_REAL, wall_seconds)
+    sys.stdin, sys.stdout, sys.stderr = io.StringIO(stdin), stdout, stderr
+    try:
+        exec(compile(code, "main.py", "exec"), {"__name__": "__main__", "__builtins__": builtins})
+    except TimeLimitExceeded:
+        status = STATUS_TIME_LIMIT
+    except OutputLimitExceeded:
+        status = STATUS_OUTPUT_LIMIT
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            status = STATUS_NZEC
+            if not isinstance(e.code, int):
+                budget[0] = output_limit
+                stderr.write(f"{e.code}\n")
+    except BaseException as e:
+        status = STATUS_NZEC
+        budget[0] = output_limit
+        try:
+            stderr.write(_user_traceback(e))
+        except OutputLimitExceeded:
+            pass
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+
+    used = resource.getrusage(resource.RUSAGE_SELF)
+    return {
+        "stdout": stdout.getvalue() or None,
+        "stderr": stderr.getvalue() or None,
+        "status": status,
+        "time": f"{used.ru_utime + used.ru_stime:.3f}",
+    }
+
+
+def _child(request, pool_fds, result_w, cpu_seconds, wall_seconds, output_limit):
+    # Nothing from here on may reach the pool's pipes, other runs or the template
+    for fd in pool_fds:
+        os.close(fd)
+    os.setpgid(0, 0)
+    # A forked child starts with no CPU time used; the hard limit stops it raising the soft one
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+    result = run(request["source_code"], request.get("stdin") or "", wall_seconds, output_limit)
+    body = json.dumps(result).encode("utf-8")
+    view = memoryview(body)
+    while view:
+        view = view[os.write(result_w, view):]
+
+
+def _read_result(fd, deadline, limit):
+    """The child's result bytes, or None when it overran `deadline` or wrote more than `limit`."""
+    data = b""
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            return None
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            return data
+        data += chunk
+        if len(data) > limit:
+            return None
+
+
+def serve(request, pool_fds, cpu_seconds, wall_seconds, output_limit):
+    """Run `request` in a fresh child and return its result; limit kills are reported here."""
+    result_r, result_w = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        code = 70
+        try:
+            os.close(result_r)
+            _child(request, pool_fds, result_w, cpu_seconds, wall_seconds, output_limit)
+            code = 0
+        finally:
+            os._exit(code)
+
+    os.close(result_w)
+    started = time.monotonic()
+    try:
+        data = _read_result(result_r, started + wall_seconds + WALL_GRACE_SECONDS, 8 * output_limit + 65536)
+    finally:
+        os.close(result_r)
+        # Also takes down anything the submission started in its process group
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        _, wait_status = os.waitpid(pid, 0)
+
+    if data:
+        try:
+            result = json.loads(data)
+        except ValueError:
+            result = None
+        if isinstance(result, dict):
+            return result
+    signum = os.WTERMSIG(wait_status) if os.WIFSIGNALED(wait_status) else None
+    if data is None or signum in (signal.SIGXCPU, signal.SIGKILL):
+        status = STATUS_TIME_LIMIT
+    else:
+        status = STATUS_OTHER
+    return {"stdout": None, "stderr": None, "status": status, "time": f"{time.monotonic() - started:.3f}"}
+
+
+def _make_undumpable():
+    # Same-uid children cannot ptrace the template or read its /proc/<pid>/mem
+    try:
+        import ctypes
+
+        ctypes.CDLL(None).prctl(PR_SET_DUMPABLE, 0, 0, 0, 0)
+    except Exception:
+        pass
+
+
+def main():
+    request_fd, response_fd, memory_bytes, max_processes, cpu_seconds = map(int, sys.argv[1:6])
+    wall_seconds, output_limit = float(sys.argv[6]), int(sys.argv[7])
+    if memory_bytes:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+    if max_processes:
+        resource.setrlimit(resource.RLIMIT_NPROC, (max_processes, max_processes))
+    resource.setrlimit(resource.RLIMIT_FSIZE, (output_limit, output_limit))
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+    signal.signal(signal.SIGALRM, _on_alarm)
+    _make_undumpable()
+
+    while True:
+        try:
+            (size,) = struct.unpack(">I", _read_exact(request_fd, 4))
+            request = json.loads(_read_exact(request_fd, size))
+        except EOFError:
+            return
+        _send(response_fd, serve(request, (request_fd, response_fd), cpu_seconds, wall_seconds, output_limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+Judge0 client shared by the code execution views.
+
+JUDGE0_BASE_URL and JUDGE0_AUTH_MODE select the server: RapidAPI's hosted Judge0
+(default), a self-hosted Judge0 using its X-Auth-Token, or an unauthenticated
+stand-in such as `manage.py judge0_stub`.
+
+Submissions go through one pooled `requests.Session` per process (and one
+`httpx.AsyncClient` per event loop for the async views), so runs reuse warm TLS
+connections. Every call has separate connect/read timeouts, so a slow Judge0
+response fails fast instead of holding a worker until gunicorn kills it.
+
+In async execution mode runs are submitted with `wait=false`; result polls from
+concurrent requests are coalesced by `BatchPoller` into `/submissions/batch` GETs.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger('api')
+
+RESULT_FIELDS = "token,stdout,stderr,compile_output,status,time,memory"
+PENDING_STATUS_IDS = (1, 2)  # In Queue, Processing
+
+_session = None
+_session_lock = threading.Lock()
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def judge0_headers():
+    headers = {"content-type": "application/json"}
+    if settings.JUDGE0_AUTH_MODE == "rapidapi":
+        headers["X-RapidAPI-Key"] = os.getenv("RAPIDAPI_KEY")
+        headers["X-RapidAPI-Host"] = urlsplit(settings.JUDGE0_BASE_URL).netloc
+    elif settings.JUDGE0_AUTH_MODE == "token":
+        headers["X-Auth-Token"] = settings.JUDGE0_AUTH_TOKEN
+    return headers
+
+
+def missing_credentials():
+    """Error message when the configured auth mode has no credentials, otherwise None."""
+    if settings.JUDGE0_AUTH_MODE == "rapidapi" and not os.getenv("RAPIDAPI_KEY"):
+        return "Judge0 RapidAPI key not configured on server"
+    if settings.JUDGE0_AUTH_MODE == "token" and not settings.JUDGE0_AUTH_TOKEN:
+        return "Judge0 auth token not configured on server"
+    return None
+
+
+def judge0_output(data):
+    # Compose output
+    return {
+        "stdout": data.get("stdout", ""),
+        "stderr": data.get("stderr", ""),
+        "compile_output": data.get("compile_output", ""),
+        "status": data.get("status", {}),
+        "time": data.get("time"),
+        "memory": data.get("memory")
+    }
+
+
+def submissions_url(wait=True):
+    return f"{settings.JUDGE0_BASE_URL}/submissions?base64_encoded=false&wait={'true' if wait else 'false'}"
+
+
+def is_pending(result):
+    return (result.get("status") or {}).get("id") in PENDING_STATUS_IDS
+
+
+def judge0_timeout():
+    return (settings.JUDGE0_CONNECT_TIMEOUT, settings.JUDGE0_READ_TIMEOUT)
+
+
+def _build_session():
+    # Connection failures never reached Judge0, so they are safe to retry even for
+    # POST; read errors and 502/503/504 are only retried for idempotent GETs.
+    retry = Retry(
+        total=settings.JUDGE0_RETRIES,
+        connect=settings.JUDGE0_RETRIES,
+        read=settings.JUDGE0_RETRIES,
+        status=settings.JUDGE0_RETRIES,
+        allowed_methods=frozenset({"GET"}),
+        status_forcelist=(502, 503, 504),
+        backoff_factor=0.2,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.JUDGE0_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get_async_client():
+    """One pooled client per event loop (uvicorn runs a single loop per worker)."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(
+            timeout=httpx.Timeout(settings.JUDGE0_READ_TIMEOUT, connect=settings.JUDGE0_CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=settings.JUDGE0_POOL_MAXSIZE),
+            transport=httpx.AsyncHTTPTransport(retries=settings.JUDGE0_RETRIES),  # connect errors only
+        )
+    return client
+
+
+def _log_latency(method, url, started, status_code):
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    logger.info(f"Judge0 {method} {url.split('?')[0]} -> {status_code} in {elapsed_ms:.0f}ms")
+
+
+def submit(payload, wait=True):
+    """
+    POST a submission. With `wait` Judge0 answers with the result; without it, with
+    `{"token": ...}` as soon as the run is queued. Raises requests exceptions on
+    timeout/connection errors.
+    """
+    url = submissions_url(wait)
+    started = time.perf_counter()
+    status_code = "error"
+    try:
+        response = get_session().post(url, headers=judge0_headers(), json=payload, timeout=judge0_timeout())
+        status_code = response.status_code
+        return response
+    finally:
+        _log_latency("POST", url, started, status_code)
+
+
+async def asubmit(payload, wait=True):
+    """Async `submit` for the ASGI views. Raises httpx exceptions on timeout/connection errors."""
+    url = submissions_url(wait)
+    started = time.perf_counter()
+    status_code = "error"
+    try:
+        response = await get_async_client().post(url, headers=judge0_headers(), json=payload)
+        status_code = response.status_code
+        return response
+    finally:
+        _log_latency("POST", url, started, status_code)
+
+
+def fetch_batch(tokens):
+    """Results for up to JUDGE0_BATCH_SIZE tokens in one GET, keyed by token (None for unknown tokens)."""
+    url = f"{settings.JUDGE0_BASE_URL}/submissions/batch"
+    started = time.perf_counter()
+    status_code = "error"
+    try:
+        response = get_session().get(
+            url,
+            params={"tokens": ",".join(tokens), "base64_encoded": "false", "fields": RESULT_FIELDS},
+            headers=judge0_headers(),
+            timeout=judge0_timeout(),
+        )
+        status_code = response.status_code
+        response.raise_for_status()
+    finally:
+        _log_latency(f"GET[{len(tokens)}]", url, started, status_code)
+    submissions = response.json().get("submissions") or []
+    results = dict.fromkeys(tokens)
+    for token, result in zip(tokens, submissions):
+        if result:
+            results[result.get("token") or token] = result
+    return results
+
+
+def submit_batch(submissions):
+    """Queue many submissions with one POST to `/submissions/batch`. Returns their tokens in order."""
+    url = f"{settings.JUDGE0_BASE_URL}/submissions/batch?base64_encoded=false"
+    started = time.perf_counter()
+    status_code = "error"
+    try:
+        response = get_session().post(
+            url, headers=judge0_headers(), json={"submissions": submissions}, timeout=judge0_timeout()
+        )
+        status_code = response.status_code
+        response.raise_for_status()
+    finally:
+        _log_latency(f"POST[{len(submissions)}]", url, started, status_code)
+    return [item.get("token") for item in response.json()]
+
+
+def wait_for_batch(tokens, timeout):
+    """
+    Poll `/submissions/batch` until every token has finished (or `timeout` seconds pass).
+    Returns results keyed by token; unfinished runs keep their pending status.
+    """
+    deadline = time.monotonic() + timeout
+    results = {}
+    pending = list(tokens)
+    while pending:
+        for i in range(0, len(pending), settings.JUDGE0_BATCH_SIZE):
+            results.update(fetch_batch(pending[i:i + settings.JUDGE0_BATCH_SIZE]))
+        pending = [t for t in pending if results.get(t) and is_pending(results[t])]
+        if not pending or time.monotonic() >= deadline:
+            break
+        time.sleep(settings.JUDGE0_GRADE_POLL_INTERVAL)
+    return results
+
+
+class BatchPoller:
+    """
+    Coalesces result lookups from concurrent requests into `/submissions/batch` GETs.
+
+    The first lookup starts a flusher that waits `window` seconds, then fetches every
+    token requested in the meantime, `batch_size` tokens per Judge0 call.
+    """
+
+    def __init__(self, window, batch_size):
+        self.window = window
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._flushing = False
+
+    def fetch(self, token, timeout):
+        with self._lock:
+            entry = self._pending.setdefault(token, {"event": threading.Event()})
+            if not self._flushing:
+                self._flushing = True
+                threading.Thread(target=self._flush, daemon=True).start()
+        if not entry["event"].wait(timeout):
+            raise requests.Timeout(f"Judge0 batch lookup for {token} timed out")
+        if "error" in entry:
+            raise entry["error"]
+        return entry["result"]
+
+    def _flush(self):
+        time.sleep(self.window)
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._flushing = False
+        tokens = list(pending)
+        for i in range(0, len(tokens), self.batch_size):
+            chunk = tokens[i:i + self.batch_size]
+            try:
+                results = fetch_batch(chunk)
+                for token in chunk:
+                    pending[token]["result"] = results.get(token)
+            except Exception as e:
+                for token in chunk:
+                    pending[token]["error"] = e
+            finally:
+                for token in chunk:
+                    pending[token]["event"].set()
+
+
+_poller = None
+
+
+def get_poller():
+    global _poller
+    if _poller is None:
+        with _session_lock:
+            if _poller is None:
+                _poller = BatchPoller(settings.JUDGE0_POLL_WINDOW, settings.JUDGE0_BATCH_SIZE)
+    return _poller
+
+
+def poll_result(token):
+    """
+    Current result for a submission token, or None if Judge0 does not know it.
+    Finished results are cached, so repeated polls for a done run skip Judge0.
+    """
+    cache_key = f"judge0-result:{token}"
+    result = cache.get(cache_key)
+    if result is not None:
+        return result
+    result = get_poller().fetch(token, timeout=settings.JUDGE0_CONNECT_TIMEOUT + settings.JUDGE0_READ_TIMEOUT)
+    if result and not is_pending(result):
+        cache.set(cache_key, result, timeout=settings.JUDGE0_RESULT_TTL)
+    return result
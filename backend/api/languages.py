@@ -8,7 +8,8 @@ class LanguageRegistry:
             "judge0_id": 71,  # Python 3.8.1 (Judge0 CE)
             "monaco_id": "python",
             "aliases": ["py", "python3"],
-            "extension": "py"
+            "extension": "py",
+            "local_runtime": {"run": ["{python}", "-I", "-S", "{source}"]}
         },
         "rust": {
             "name": "Rust",
@@ -22,7 +23,9 @@ class LanguageRegistry:
             "judge0_id": 63,  # JavaScript (Node.js 12.14.0)
             "monaco_id": "javascript",
             "aliases": ["js", "node", "nodejs"],
-            "extension": "js"
+            "extension": "js",
+            # V8 reserves a large address space up front, so only the data segment is capped
+            "local_runtime": {"run": ["node", "{source}"], "address_space_limit": False}
         },
         "java": {
             "name": "Java",
@@ -36,14 +39,16 @@ class LanguageRegistry:
             "judge0_id": 54,  # C++ (GCC 9.2.0)
             "monaco_id": "cpp",
             "aliases": ["cplusplus", "c++"],
-            "extension": "cpp"
+            "extension": "cpp",
+            "local_runtime": {"compile": ["g++", "-O1", "-o", "{binary}", "{source}"], "run": ["{binary}"]}
         },
         "c": {
             "name": "C",
             "judge0_id": 50,  # C (GCC 9.2.0)
             "monaco_id": "c",
             "aliases": ["clang"],
-            "extension": "c"
+            "extension": "c",
+            "local_runtime": {"compile": ["gcc", "-O1", "-o", "{binary}", "{source}", "-lm"], "run": ["{binary}"]}
         },
         "go": {
             "name": "Go",
@@ -137,6 +142,14 @@ class LanguageRegistry:
                 
         return None
         
+    @classmethod
+    def get_by_judge0_id(cls, judge0_id):
+        """Return (key, metadata) for a Judge0 language ID, or (None, None)."""
+        for key, data in cls.SUPPORTED_LANGUAGES.items():
+            if judge0_id is not None and data["judge0_id"] == judge0_id:
+                return key, data
+        return None, None
+
     @classmethod
     def is_supported(cls, language_name):
         return cls.get_language_metadata(language_name) is not None
@@ -0,0 +1,208 @@
+"""
+Record and replay LLM provider traffic.
+
+With LLM_CASSETTE_RECORD=True, AIOrchestrator's provider clients are wrapped so every
+call appends {provider, prompt, response or error, elapsed} to the gzip'd JSON-lines
+cassette at LLM_CASSETTE_PATH. With LLM_PROVIDER_BACKEND="replay" the orchestrator gets
+clients that answer from that cassette instead. Each answer waits the recorded time
+multiplied by LLM_CASSETTE_LATENCY_SCALE (0 = no delay), and recorded errors are raised
+again, so the orchestrator's retries, failover, JSON repair, fallback and persistence see
+the same traffic. A prompt that was recorded more than once replays its responses in
+order and then starts again from the first.
+"""
+import asyncio
+import gzip
+import json
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+from django.conf import settings
+
+from .fake_llm import prompt_fields, prompt_phase
+
+
+class CassetteMiss(Exception):
+    pass
+
+
+class ReplayedProviderError(Exception):
+    pass
+
+
+def read_entries(path):
+    # Each recorded call is its own gzip member; gzip.open reads them back as one stream
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class CassetteRecorder:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def record(self, provider, prompt, started, response=None, error=None):
+        entry = {
+            "provider": provider,
+            "prompt": prompt,
+            "response": response,
+            "error": error,
+            "elapsed": round(time.perf_counter() - started, 4),
+            "recorded_at": time.time(),
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock, gzip.open(self.path, "at", encoding="utf-8") as f:
+            f.write(line)
+
+    def wrap_model(self, provider, model):
+        """Recording proxy for a genai.GenerativeModel-like client."""
+        recorder = self
+
+        class RecordingModel:
+            def generate_content(self, prompt):
+                started = time.perf_counter()
+                try:
+                    response = model.generate_content(prompt)
+                except Exception as e:
+                    recorder.record(provider, prompt, started, error=repr(e))
+                    raise
+                recorder.record(provider, prompt, started, response=response.text)
+                return response
+
+            async def generate_content_async(self, prompt):
+                started = time.perf_counter()
+                try:
+                    response = await model.generate_content_async(prompt)
+                except Exception as e:
+                    recorder.record(provider, prompt, started, error=repr(e))
+                    raise
+                recorder.record(provider, prompt, started, response=response.text)
+                return response
+
+        return RecordingModel()
+
+    def wrap_chat_client(self, provider, client, is_async=False):
+        """Recording proxy for a Groq/OpenAI-like client: `client.chat.completions.create(...)`."""
+        recorder = self
+
+        def create(messages, **kwargs):
+            prompt = messages[-1]["content"]
+            started = time.perf_counter()
+            if is_async:
+                return acreate(prompt, started, messages, **kwargs)
+            try:
+                response = client.chat.completions.create(messages=messages, **kwargs)
+            except Exception as e:
+                recorder.record(provider, prompt, started, error=repr(e))
+                raise
+            recorder.record(provider, prompt, started, response=response.choices[0].message.content)
+            return response
+
+        async def acreate(prompt, started, messages, **kwargs):
+            try:
+                response = await client.chat.completions.create(messages=messages, **kwargs)
+            except Exception as e:
+                recorder.record(provider, prompt, started, error=repr(e))
+                raise
+            recorder.record(provider, prompt, started, response=response.choices[0].message.content)
+            return response
+
+        return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+class Cassette:
+    def __init__(self, entries):
+        self.entries = entries
+        self._by_key = {}
+        for entry in entries:
+            self._by_key.setdefault((entry["provider"], entry["prompt"]), []).append(entry)
+        self._next = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @classmethod
+    def load(cls, path):
+        return cls(read_entries(path))
+
+    @property
+    def providers(self):
+        return {entry["provider"] for entry in self.entries}
+
+    def topics(self):
+        """Course topics in the order their structure prompts were recorded, without repeats."""
+        topics = []
+        for entry in self.entries:
+            if prompt_phase(entry["prompt"]) == "structure":
+                topic = prompt_fields(entry["prompt"])["topic"]
+                if topic not in topics:
+                    topics.append(topic)
+        return topics
+
+    def next_entry(self, provider, prompt):
+        key = (provider, prompt)
+        with self._lock:
+            recorded = self._by_key.get(key)
+            if not recorded:
+                self.stats["misses"] += 1
+                raise CassetteMiss(f"{provider}: prompt not in cassette ({prompt_phase(prompt)} phase)")
+            index = self._next.get(key, 0)
+            self._next[key] = (index + 1) % len(recorded)
+            self.stats["hits"] += 1
+            return recorded[index]
+
+    def player(self, provider, latency_scale):
+        return CassettePlayer(self, provider, latency_scale)
+
+
+class CassettePlayer:
+    """Answers one provider's prompts from a cassette; usable wherever fake_llm expects an llm."""
+
+    def __init__(self, cassette, provider, latency_scale):
+        self.cassette = cassette
+        self.provider = provider
+        self.latency_scale = latency_scale
+
+    def _answer(self, entry):
+        if entry["error"] is not None:
+            raise ReplayedProviderError(entry["error"])
+        return entry["response"]
+
+    def complete(self, prompt):
+        entry = self.cassette.next_entry(self.provider, prompt)
+        time.sleep(entry["elapsed"] * self.latency_scale)
+        return self._answer(entry)
+
+    async def acomplete(self, prompt):
+        entry = self.cassette.next_entry(self.provider, prompt)
+        await asyncio.sleep(entry["elapsed"] * self.latency_scale)
+        return self._answer(entry)
+
+
+_cassettes = {}
+_recorders = {}
+_lock = threading.Lock()
+
+
+def cassette_path():
+    # "{pid}" keeps each worker process in its own file
+    return settings.LLM_CASSETTE_PATH.replace("{pid}", str(os.getpid()))
+
+
+def get_cassette(path=None):
+    """The loaded cassette for `path`, reloaded when the file changes."""
+    path = path or cassette_path()
+    mtime = os.path.getmtime(path)
+    with _lock:
+        cached = _cassettes.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = _cassettes[path] = (mtime, Cassette.load(path))
+        return cached[1]
+
+
+def get_recorder():
+    path = cassette_path()
+    with _lock:
+        if path not in _recorders:
+            _recorders[path] = CassetteRecorder(path)
+        return _recorders[path]
@@ -0,0 +1,64 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from api.course_content import get_mini_labs, get_module_quiz, get_prebuilt_code_snippet
+
+LANGUAGES = (
+    "python", "javascript", "react", "html", "css", "java", "go", "typescript", "c", "cpp", "sql", "mongodb", "rust",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Time the offline content library lookups (quizzes, lab snippets, mini labs, concept quizzes) "
+        "and the memory each call allocates, over every language, module and lab."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rounds", type=int, default=20, help="Passes over the full argument matrix.")
+
+    def handle(self, *args, **options):
+        from api.views import GenerateCourseView
+
+        view = GenerateCourseView()
+        modules = range(1, 11)
+        cases = {
+            "get_module_quiz": (
+                get_module_quiz,
+                [(lang, "EXECUTABLE", f"Module {m}", m) for lang in LANGUAGES for m in modules],
+            ),
+            "get_prebuilt_code_snippet": (
+                get_prebuilt_code_snippet,
+                [(lang, "EXECUTABLE", m - 1, lab, f"Module {m}") for lang in LANGUAGES for m in modules for lab in range(3)],
+            ),
+            "get_mini_labs": (
+                get_mini_labs,
+                [(lang, f"Module {m}", m) for lang in LANGUAGES for m in modules],
+            ),
+            "generate_quiz_questions": (
+                view.generate_quiz_questions,
+                [(topic, title, 3) for topic in ("Python", "Java", "Rust") for title in ("Control Flow", "OOP", "Closures")],
+            ),
+        }
+        self.stdout.write(f"{'function':<28} {'calls':>7} {'us/call':>9} {'peak KiB/call':>14}")
+        for name, (func, arg_list) in cases.items():
+            started = time.perf_counter()
+            for _ in range(options["rounds"]):
+                for call_args in arg_list:
+                    func(*call_args)
+            calls = options["rounds"] * len(arg_list)
+            per_call_us = (time.perf_counter() - started) / calls * 1e6
+
+            tracemalloc.start()
+            peaks = []
+            for call_args in arg_list:
+                baseline = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                func(*call_args)
+                peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+            tracemalloc.stop()
+            self.stdout.write(
+                f"{name:<28} {calls:>7} {per_call_us:>9.1f} {sum(peaks) / len(peaks) / 1024:>14.1f}"
+            )
@@ -0,0 +1,107 @@
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.core.management.base import BaseCommand
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive POST /api/execute-code/ at several concurrency levels and report throughput and "
+        "p50/p95/p99 latency. Run the server against `manage.py judge0_stub` to size workers offline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://127.0.0.1:8000/api/execute-code/")
+        parser.add_argument("--concurrency", default="1,5,10,20,40", help="Comma-separated concurrency levels.")
+        parser.add_argument("--requests", type=int, default=100, help="Requests per concurrency level.")
+        parser.add_argument("--topic", default="Python")
+        parser.add_argument("--code", default="print('hello from bench')")
+        parser.add_argument(
+            "--clients", type=int, default=0,
+            help="Distinct client IPs (sent as X-Forwarded-For) to spread requests over (0 = one per request).",
+        )
+        parser.add_argument(
+            "--execution-mode", choices=("sync", "async"), default="sync",
+            help="async polls result_url until the run finishes, like the frontend would.",
+        )
+        parser.add_argument("--timeout", type=float, default=60)
+
+    def handle(self, *args, **options):
+        levels = [int(level) for level in options["concurrency"].split(",") if level.strip()]
+        self.stdout.write(
+            f"{'conc':>5} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'mean ms':>9}  statuses"
+        )
+        for concurrency in levels:
+            latencies, statuses, elapsed = self._run_level(concurrency, options)
+            latencies.sort()
+            self.stdout.write(
+                f"{concurrency:>5} {len(latencies) / elapsed:>8.1f} {percentile(latencies, 50):>9.0f} "
+                f"{percentile(latencies, 95):>9.0f} {percentile(latencies, 99):>9.0f} "
+                f"{statistics.fmean(latencies) if latencies else 0:>9.0f}  "
+                + " ".join(f"{status}x{count}" for status, count in sorted(statuses.items(), key=str))
+            )
+
+    def _run_level(self, concurrency, options):
+        local = threading.local()
+        counter = iter(range(options["requests"]))
+        lock = threading.Lock()
+
+        def session():
+            if not hasattr(local, "session"):
+                local.session = requests.Session()
+            return local.session
+
+        def one(i):
+            client = i % options["clients"] if options["clients"] else i
+            body = {
+                # A unique trailing comment keeps runs out of the execution result cache
+                "code": f"{options['code']}\n# bench {time.time_ns()} {i}",
+                "topic": options["topic"],
+                "execution_mode": options["execution_mode"],
+            }
+            started = time.perf_counter()
+            try:
+                res = session().post(
+                    options["url"], json=body, headers={"X-Forwarded-For": f"198.18.{client // 256 % 256}.{client % 256}"}, timeout=options["timeout"]
+                )
+                if res.status_code == 202 and options["execution_mode"] == "async":
+                    res = self._poll(session(), options["url"], res.json()["result_url"], options["timeout"], started)
+                status = res.status_code
+            except requests.RequestException as e:
+                status = type(e).__name__
+            return (time.perf_counter() - started) * 1000, status
+
+        def worker(results):
+            while True:
+                with lock:
+                    i = next(counter, None)
+                if i is None:
+                    return
+                results.append(one(i))
+
+        results = []
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for _ in range(concurrency):
+                pool.submit(worker, results)
+        elapsed = time.perf_counter() - started
+        return [ms for ms, _ in results], Counter(status for _, status in results), elapsed
+
+    def _poll(self, session, url, result_url, timeout, started):
+        base = url.split("/api/")[0]
+        while True:
+            res = session.get(f"{base}{result_url}", timeout=timeout)
+            if res.status_code != 202 or time.perf_counter() - started > timeout:
+                return res
+            time.sleep(0.1)
@@ -0,0 +1,171 @@
+import statistics
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from api import course_generation, views
+from api.ai_orchestrator import AIOrchestrator
+from api.fake_llm import get_fake_llm
+from api.llm_cassette import get_cassette
+from api.management.commands.bench_execute_code import percentile
+from api.models import Course
+
+PHASES = (
+    ("structure", AIOrchestrator, "generate_course_structure"),
+    ("theory", AIOrchestrator, "generate_theory"),
+    ("quizzes", AIOrchestrator, "generate_quizzes"),
+    ("labs", AIOrchestrator, "generate_labs"),
+    ("fallback", course_generation, "fallback_module_payload"),
+)
+
+
+@contextmanager
+def timed_phases(timings, counts):
+    """Wrap each phase function so its wall time is added to timings[phase]."""
+    originals = [(owner, name, getattr(owner, name)) for _, owner, name in PHASES]
+
+    def timed(phase, func):
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings[phase] += time.perf_counter() - started
+                counts[phase] += 1
+        return wrapper
+
+    for phase, owner, name in PHASES:
+        setattr(owner, name, timed(phase, getattr(owner, name)))
+    try:
+        yield
+    finally:
+        for owner, name, func in originals:
+            setattr(owner, name, func)
+
+
+class Command(BaseCommand):
+    help = (
+        "Build courses end to end through GenerateCourseView.create_course_full against the offline "
+        "fake LLM provider, or a recorded cassette with --cassette, and report total build time, "
+        "DB time and a per-phase breakdown."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--courses", type=int, help="Courses to build (default 3, or every topic in --cassette).")
+        parser.add_argument("--topic", default="Python")
+        parser.add_argument(
+            "--cassette",
+            help="Replay this recorded cassette (LLM_PROVIDER_BACKEND=replay), building the topics it recorded.",
+        )
+        parser.add_argument("--latency-scale", type=float, help="Override LLM_CASSETTE_LATENCY_SCALE (0 = no delay).")
+        parser.add_argument("--mode", choices=("full", "lazy"), default="full")
+        parser.add_argument("--latency-ms", help="Override FAKE_LLM_LATENCY_MS, e.g. '0' or 'theory=2500,quiz=1200'.")
+        parser.add_argument("--failure-rate", type=float, help="Override FAKE_LLM_FAILURE_RATE.")
+        parser.add_argument("--malformed-rate", type=float, help="Override FAKE_LLM_MALFORMED_RATE.")
+        parser.add_argument("--pacing", type=float, help="Override LLM_MODULE_PACING_SECONDS.")
+        parser.add_argument("--seed", type=int, help="Override FAKE_LLM_SEED.")
+        parser.add_argument(
+            "--live", action="store_true",
+            help="Use the configured LLM_PROVIDER_BACKEND instead of forcing the fake provider.",
+        )
+        parser.add_argument("--keep", action="store_true", help="Keep the generated bench courses.")
+
+    def handle(self, *args, **options):
+        if options["cassette"]:
+            overrides = {"LLM_PROVIDER_BACKEND": "replay", "LLM_CASSETTE_PATH": options["cassette"]}
+        else:
+            overrides = {} if options["live"] else {"LLM_PROVIDER_BACKEND": "fake"}
+        # Replaying must not append to the cassette being replayed
+        overrides["LLM_CASSETTE_RECORD"] = False if options["cassette"] else settings.LLM_CASSETTE_RECORD
+        for option, setting in (
+            ("latency_ms", "FAKE_LLM_LATENCY_MS"),
+            ("failure_rate", "FAKE_LLM_FAILURE_RATE"),
+            ("malformed_rate", "FAKE_LLM_MALFORMED_RATE"),
+            ("pacing", "LLM_MODULE_PACING_SECONDS"),
+            ("seed", "FAKE_LLM_SEED"),
+            ("latency_scale", "LLM_CASSETTE_LATENCY_SCALE"),
+        ):
+            if options[option] is not None:
+                overrides[setting] = options[option]
+
+        with override_settings(**overrides):
+            self._run(options)
+
+    def _run(self, options):
+        fake_llm = get_fake_llm() if settings.LLM_PROVIDER_BACKEND == "fake" else None
+        calls_before = dict(fake_llm.stats) if fake_llm else {}
+        cassette = get_cassette() if settings.LLM_PROVIDER_BACKEND == "replay" else None
+        hits_before = dict(cassette.stats) if cassette else {}
+        if cassette:
+            topics = cassette.topics()
+            if not topics:
+                raise CommandError(f"{options['cassette']} has no recorded course structure prompts")
+        else:
+            topics = [options["topic"]]
+        count = options["courses"] or (len(topics) if cassette else 3)
+        view = views.GenerateCourseView()
+        timings, counts = defaultdict(float), defaultdict(int)
+        totals, db_times, query_counts, course_ids = [], [], [], []
+
+        with timed_phases(timings, counts):
+            for i in range(count):
+                topic = topics[i % len(topics)]
+                course = Course.objects.create(
+                    title=topic, topic=f"bench-generation {uuid.uuid4().hex[:8]}", status="generating"
+                )
+                course_ids.append(course.id)
+                started = time.perf_counter()
+                with CaptureQueriesContext(connection) as queries:
+                    try:
+                        view.create_course_full(course, topic, generation_mode=options["mode"])
+                    except ValueError as e:
+                        self.stderr.write(f"course {i + 1}: {e}")
+                totals.append(time.perf_counter() - started)
+                db_times.append(sum(float(q["time"]) for q in queries.captured_queries))
+                query_counts.append(len(queries.captured_queries))
+                self.stdout.write(
+                    f"course {i + 1}/{count} ({topic}): {totals[-1]:.2f}s, "
+                    f"DB {db_times[-1] * 1000:.0f}ms over {query_counts[-1]} queries"
+                )
+
+        if not options["keep"]:
+            Course.objects.filter(id__in=course_ids).delete()
+
+        total = sum(totals)
+        self.stdout.write(
+            f"\n{count} course(s), mode={options['mode']}, provider={settings.LLM_PROVIDER_BACKEND}\n"
+            f"build time  mean {statistics.fmean(totals):.2f}s  min {min(totals):.2f}s  max {max(totals):.2f}s  "
+            f"p95 {percentile(sorted(totals), 95):.2f}s\n"
+            f"throughput  {count / total * 60 if total else 0:.1f} courses/min\n"
+            f"DB time     mean {statistics.fmean(db_times) * 1000:.0f}ms  "
+            f"({statistics.fmean(query_counts):.0f} queries per course)\n"
+        )
+        self.stdout.write(f"{'phase':<10} {'calls':>6} {'total s':>9} {'per call ms':>12} {'share':>7}")
+        accounted = 0.0
+        for phase, _, _ in PHASES:
+            accounted += timings[phase]
+            self._phase_row(phase, counts[phase], timings[phase], total)
+        db_total = sum(db_times)
+        self._phase_row("db", sum(query_counts), db_total, total)
+        # Pacing sleeps, prompt building and serialization are whatever the phases and DB do not cover
+        self._phase_row("other", "", max(0.0, total - accounted - db_total), total)
+
+        if fake_llm:
+            stats = {key: fake_llm.stats[key] - calls_before.get(key, 0) for key in ("calls", "failures", "malformed")}
+            self.stdout.write(
+                f"\nfake provider: {stats['calls']} calls, {stats['failures']} failed, {stats['malformed']} malformed"
+            )
+        if cassette:
+            stats = {key: cassette.stats[key] - hits_before.get(key, 0) for key in ("hits", "misses")}
+            self.stdout.write(f"\ncassette: {stats['hits']} replayed calls, {stats['misses']} prompts not recorded")
+
+    def _phase_row(self, phase, calls, seconds, total):
+        per_call = f"{seconds / calls * 1000:.1f}" if isinstance(calls, int) and calls else ""
+        share = f"{seconds / total:.0%}" if total else ""
+        self.stdout.write(f"{phase:<10} {calls:>6} {seconds:>9.2f} {per_call:>12} {share:>7}")
@@ -0,0 +1,105 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from api.course_content import get_mini_labs, get_module_quiz, get_module_theory, get_module_titles, get_prebuilt_code_examples
+from api.models import Course, Module, Quiz
+from api.persistence import normalize_quiz_list, save_course_outline, save_modules_content
+
+BENCH_TOPIC_PREFIX = "bench-persistence-"
+
+
+class Command(BaseCommand):
+    help = "Compare per-row and bulk persistence of a generated course (write time, statements, lock hold time)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--courses", type=int, default=5, help="Courses written per strategy.")
+        parser.add_argument("--language", default="python", help="Offline curriculum used as the payload.")
+
+    def handle(self, *args, **options):
+        outline, contents = self._payload(options["language"])
+        rows = []
+        for label, write in (("per-row", self._write_per_row), ("bulk", self._write_bulk)):
+            stats = {"elapsed": 0.0, "lock": 0.0, "queries": 0}
+            for i in range(options["courses"]):
+                course = Course.objects.create(topic=f"{BENCH_TOPIC_PREFIX}{label}-{i}", status="generating")
+                with CaptureQueriesContext(connection) as ctx:
+                    started = time.perf_counter()
+                    stats["lock"] += write(course, outline, contents)
+                    stats["elapsed"] += time.perf_counter() - started
+                stats["queries"] += len(ctx.captured_queries)
+            rows.append((label, stats))
+        Course.objects.filter(topic__startswith=BENCH_TOPIC_PREFIX).delete()
+
+        n = options["courses"]
+        self.stdout.write(f"{'strategy':<10} {'write ms/course':>16} {'lock held ms/course':>20} {'statements/course':>18}")
+        for label, stats in rows:
+            self.stdout.write(
+                f"{label:<10} {stats['elapsed'] * 1000 / n:>16.1f} {stats['lock'] * 1000 / n:>20.1f} {stats['queries'] / n:>18.0f}"
+            )
+
+    def _payload(self, language):
+        titles = get_module_titles(language) or [f"Module {i}" for i in range(1, 11)]
+        outline = {"modules": [
+            {"module_number": idx + 1, "title": title, "description": f"About {title}", "difficulty": "Beginner"}
+            for idx, title in enumerate(titles)
+        ]}
+        contents = [
+            {
+                "theory": get_module_theory(language, title, idx + 1),
+                "mini_labs": get_mini_labs(language, title, idx + 1),
+                "code_examples": get_prebuilt_code_examples(language, title, idx + 1),
+                "quizzes": get_module_quiz(language, "EXECUTABLE", title, idx + 1),
+            }
+            for idx, title in enumerate(titles)
+        ]
+        return outline, contents
+
+    def _write_per_row(self, course, outline, contents):
+        """The pre-bulk write path: autocommit INSERT/UPDATE per module and per question."""
+        lock = 0.0
+        modules = []
+        for mod in outline["modules"]:
+            started = time.perf_counter()
+            modules.append(Module.objects.create(
+                course=course,
+                name=f"Module {mod['module_number']}: {mod['title']}",
+                description=mod["description"],
+                difficulty=mod["difficulty"].lower(),
+                order=mod["module_number"],
+                content="",
+            ))
+            lock += time.perf_counter() - started
+        for module, content in zip(modules, contents):
+            started = time.perf_counter()
+            module.content = content["theory"]
+            module.case_scenarios = content["mini_labs"]
+            module.code_examples = content["code_examples"]
+            module.save()
+            for q in normalize_quiz_list(content["quizzes"]):
+                Quiz.objects.create(
+                    module=module,
+                    question=q["question"],
+                    options=q["options"],
+                    correct_answer=q.get("answer") or q.get("correct_answer") or "",
+                    explanation=q.get("explanation", ""),
+                )
+            lock += time.perf_counter() - started
+        started = time.perf_counter()
+        course.status = "generated"
+        course.save()
+        return lock + time.perf_counter() - started
+
+    def _write_bulk(self, course, outline, contents):
+        # Each helper holds the write lock for exactly one transaction
+        started = time.perf_counter()
+        modules = save_course_outline(course, outline)
+        lock = time.perf_counter() - started
+        started = time.perf_counter()
+        with transaction.atomic():
+            save_modules_content(zip(modules, contents), replace_quizzes=False)
+            course.status = "generated"
+            course.save()
+        return lock + time.perf_counter() - started
@@ -0,0 +1,133 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import requests
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Production sits behind a TLS-terminating proxy; without this header every request is a redirect
+HEADERS = {"X-Forwarded-Proto": "https"}
+
+MODES = {
+    "plain": [],
+    "preload": ["-c", "gunicorn_preload.py"],
+}
+
+
+def smaps_rollup(pid):
+    """Rss, Pss and Uss (private pages) of a process in KiB, from /proc/<pid>/smaps_rollup."""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            name, _, rest = line.partition(":")
+            if rest.strip().endswith("kB"):
+                fields[name] = int(rest.split()[0])
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def child_pids(pid):
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name is in parentheses and may contain spaces; ppid follows it
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == pid:
+            children.append(int(entry))
+    return sorted(children)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = (
+        "Start gunicorn without and with gunicorn_preload.py, send some traffic, and report the "
+        "RSS, PSS and USS of the master and every worker. --pid reports an already running master instead."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=3)
+        parser.add_argument("--modes", default="plain,preload", help=f"Comma-separated, from {', '.join(MODES)}.")
+        parser.add_argument("--requests", type=int, default=200, help="Requests to send before measuring.")
+        parser.add_argument("--path", action="append", help="Paths to request (default /api/health/).")
+        parser.add_argument("--pid", type=int, help="Report the gunicorn master with this pid and its workers.")
+        parser.add_argument("--boot-timeout", type=float, default=60)
+
+    def handle(self, *args, **options):
+        if not os.path.exists("/proc/self/smaps_rollup"):
+            raise CommandError("PSS needs /proc/<pid>/smaps_rollup (Linux 4.14+)")
+        if options["pid"]:
+            self._report(options["pid"], f"pid {options['pid']}")
+            return
+        for mode in options["modes"].split(","):
+            if mode not in MODES:
+                raise CommandError(f"unknown mode {mode!r}")
+            self._run(mode, options)
+
+    def _run(self, mode, options):
+        port = free_port()
+        argv = [
+            sys.executable, "-m", "gunicorn", *MODES[mode], "backend.wsgi:application",
+            "--bind", f"127.0.0.1:{port}", "--workers", str(options["workers"]), "--log-level", "warning",
+        ]
+        output = None if options["verbosity"] > 1 else subprocess.DEVNULL  # request logs are noise here
+        server = subprocess.Popen(
+            argv, cwd=settings.BASE_DIR, env={**os.environ, "PYTHONUNBUFFERED": "1"}, stdout=output, stderr=output,
+        )
+        try:
+            self._wait_for_workers(server, port, options)
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            paths = options["path"] or ["/api/health/"]
+            for i in range(options["requests"]):
+                session.get(f"http://127.0.0.1:{port}{paths[i % len(paths)]}", timeout=30)
+            session.close()
+            self._report(server.pid, f"{mode} ({options['workers']} workers)")
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=30)
+
+    def _wait_for_workers(self, server, port, options):
+        deadline = time.monotonic() + options["boot_timeout"]
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise CommandError(f"gunicorn exited with {server.returncode}")
+            if len(child_pids(server.pid)) >= options["workers"]:
+                try:
+                    requests.get(f"http://127.0.0.1:{port}/health", headers=HEADERS, timeout=5)
+                    return
+                except requests.RequestException:
+                    pass
+            time.sleep(0.2)
+        raise CommandError("gunicorn workers did not start in time")
+
+    def _report(self, master_pid, label):
+        workers = child_pids(master_pid)
+        if not workers:
+            raise CommandError(f"no workers found under pid {master_pid}")
+        self.stdout.write(f"\n{label}")
+        self.stdout.write(f"{'process':<16} {'RSS MiB':>9} {'PSS MiB':>9} {'USS MiB':>9}")
+        total_pss = 0
+        for role, pid in [("master", master_pid)] + [("worker", pid) for pid in workers]:
+            mem = smaps_rollup(pid)
+            total_pss += mem["pss"]
+            self.stdout.write(
+                f"{f'{role} {pid}':<16} {mem['rss'] / 1024:>9.1f} {mem['pss'] / 1024:>9.1f} {mem['uss'] / 1024:>9.1f}"
+            )
+        self.stdout.write(f"{'total PSS':<16} {'':>9} {total_pss / 1024:>9.1f}")
@@ -0,0 +1,200 @@
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+
+STATUSES = {
+    3: "Accepted",
+    4: "Wrong Answer",
+    5: "Time Limit Exceeded",
+    6: "Compilation Error",
+    11: "Runtime Error (NZEC)",
+    13: "Internal Error",
+}
+
+
+def parse_status_mix(value):
+    """'3:0.9,6:0.05,11:0.05' -> ([3, 6, 11], [0.9, 0.05, 0.05])"""
+    ids, weights = [], []
+    for part in value.split(","):
+        status_id, _, weight = part.partition(":")
+        if int(status_id) not in STATUSES:
+            raise CommandError(f"Unknown Judge0 status id {status_id}; use one of {sorted(STATUSES)}")
+        ids.append(int(status_id))
+        weights.append(float(weight or 1))
+    return ids, weights
+
+
+class StubJudge0:
+    """In-memory Judge0: every submission finishes `latency` seconds after it was created."""
+
+    def __init__(self, latency_ms, jitter_ms, status_mix, max_concurrent):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.status_ids, self.status_weights = status_mix
+        self.max_concurrent = max_concurrent
+        self.submissions = {}
+        self.lock = threading.Lock()
+        self.active = 0
+        self.counts = {"submissions": 0, "batch_gets": 0, "rejected": 0}
+
+    def create(self, submission):
+        latency = max(0.0, random.gauss(self.latency_ms, self.jitter_ms)) / 1000 if self.jitter_ms else self.latency_ms / 1000
+        status_id = random.choices(self.status_ids, self.status_weights)[0]
+        token = str(uuid.uuid4())
+        result = {
+            "token": token,
+            "stdout": None,
+            "stderr": None,
+            "compile_output": None,
+            "status": {"id": status_id, "description": STATUSES[status_id]},
+            "time": f"{latency:.3f}",
+            "memory": 3000 + random.randint(0, 5000),
+        }
+        if status_id == 3:
+            result["stdout"] = submission.get("expected_output") or "Hello from judge0_stub\n"
+        elif status_id == 6:
+            result["compile_output"] = "main: error: stub compilation error\n"
+        elif status_id == 11:
+            result["stderr"] = "Traceback (most recent call last):\nRuntimeError: stub runtime error\n"
+        with self.lock:
+            self.submissions[token] = (time.monotonic() + latency, result)
+            self.counts["submissions"] += 1
+        return token, latency
+
+    def get(self, token):
+        with self.lock:
+            entry = self.submissions.get(token)
+        if entry is None:
+            return None
+        ready_at, result = entry
+        if time.monotonic() < ready_at:
+            return {"token": token, "status": {"id": 2, "description": "Processing"}}
+        return result
+
+    def admit(self):
+        with self.lock:
+            if self.max_concurrent and self.active >= self.max_concurrent:
+                self.counts["rejected"] += 1
+                return False
+            self.active += 1
+            return True
+
+    def leave(self):
+        with self.lock:
+            self.active -= 1
+
+
+def make_handler(stub, verbose):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            if verbose:
+                super().log_message(format, *args)
+
+        def _send(self, status, body):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _body(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            return json.loads(self.rfile.read(length) or b"{}")
+
+        def _admitted(self):
+            if stub.admit():
+                return True
+            self._send(429, {"message": "You have exceeded the rate limit per second for your plan (judge0_stub)"})
+            return False
+
+        def do_POST(self):
+            url = urlsplit(self.path)
+            if url.path.rstrip("/") == "/submissions/batch":
+                submissions = self._body().get("submissions") or []
+                self._send(201, [{"token": stub.create(s)[0]} for s in submissions])
+                return
+            if url.path.rstrip("/") != "/submissions":
+                self._send(404, {"error": "Not found"})
+                return
+            if not self._admitted():
+                return
+            try:
+                token, latency = stub.create(self._body())
+                if parse_qs(url.query).get("wait", ["false"])[0] == "true":
+                    time.sleep(latency)
+                    self._send(200, stub.get(token))
+                else:
+                    self._send(201, {"token": token})
+            finally:
+                stub.leave()
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            path = url.path.rstrip("/")
+            if path == "/submissions/batch":
+                stub.counts["batch_gets"] += 1
+                tokens = (parse_qs(url.query).get("tokens") or [""])[0].split(",")
+                self._send(200, {"submissions": [stub.get(t) for t in tokens if t]})
+            elif path.startswith("/submissions/"):
+                result = stub.get(path.rsplit("/", 1)[-1])
+                if result:
+                    self._send(200, result)
+                else:
+                    self._send(404, {"error": "Not found"})
+            elif path == "/stats":
+                self._send(200, {**stub.counts, "active": stub.active})
+            else:
+                self._send(404, {"error": "Not found"})
+
+    return Handler
+
+
+class Command(BaseCommand):
+    help = (
+        "Serve a Judge0-compatible stand-in (/submissions, /submissions/batch) with configurable "
+        "latency and status mix, for load-testing execute-code offline. Point the backend at it with "
+        "JUDGE0_BASE_URL=http://127.0.0.1:2358 JUDGE0_AUTH_MODE=none."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=2358)
+        parser.add_argument("--latency-ms", type=float, default=800, help="Mean time for a submission to finish.")
+        parser.add_argument("--jitter-ms", type=float, default=200, help="Standard deviation of the latency.")
+        parser.add_argument(
+            "--status-mix", default="3:0.85,6:0.05,11:0.1",
+            help="Weighted Judge0 status ids for finished runs, e.g. '3:0.9,5:0.02,11:0.08'.",
+        )
+        parser.add_argument(
+            "--max-concurrent", type=int, default=0,
+            help="Answer 429 to single submissions beyond this many in flight, like a RapidAPI plan (0 = unlimited).",
+        )
+        parser.add_argument("--verbose", action="store_true", help="Log every request.")
+
+    def handle(self, *args, **options):
+        stub = StubJudge0(
+            options["latency_ms"], options["jitter_ms"], parse_status_mix(options["status_mix"]), options["max_concurrent"]
+        )
+        server = ThreadingHTTPServer((options["host"], options["port"]), make_handler(stub, options["verbose"]))
+        server.daemon_threads = True
+        self.stdout.write(
+            f"judge0_stub on http://{options['host']}:{options['port']} "
+            f"(latency {options['latency_ms']:.0f}±{options['jitter_ms']:.0f}ms, mix {options['status_mix']}, "
+            f"max concurrent {options['max_concurrent'] or 'unlimited'}). Ctrl+C to stop."
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(f"Served: {stub.counts}")
@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from api import course_generation
+from api.ai_orchestrator import AIOrchestrator
+from api.models import Module
+from api.topic_classifier import TopicClassifier
+
+
+class CallSpacer:
+    """Spaces calls at least `interval` seconds apart across every thread, and counts them."""
+
+    def __init__(self, calls_per_minute):
+        self.interval = 60 / calls_per_minute if calls_per_minute else 0
+        self.calls = 0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+            self.calls += 1
+        time.sleep(slot - now)
+
+
+def find_course(topic):
+    """The stored course a generate-course request for `topic` would be answered from, if any."""
+    display_title = TopicClassifier.classify(topic)["display_title"]
+    for normalized in dict.fromkeys((topic.strip().lower(), display_title.strip().lower())):
+        course = course_generation.get_course_by_topic(normalized)
+        if course:
+            return course
+    return None
+
+
+def course_state(course):
+    """"missing", "complete", or the status of a course that still needs work."""
+    if course is None:
+        return "missing"
+    if course.status == "generated" and not course_generation.course_modules_lack_content(course):
+        return "complete"
+    return course.status
+
+
+def prewarm_topic(topic, orchestrator=None):
+    """
+    Make sure `topic` has a complete stored course. Returns what was done.
+
+    Provider calls go through `orchestrator` (a default AIOrchestrator when None), so the
+    caller decides their pacing.
+    """
+    course = find_course(topic)
+    state = course_state(course)
+    if state == "complete":
+        return "skipped"
+    if state == "outline":
+        for module_id in Module.objects.filter(course=course, content="").values_list("id", flat=True):
+            course_generation.ensure_module_content(module_id, orchestrator)
+        return "filled in"
+
+    answered, job = course_generation.claim_course_generation(
+        topic, {"generation_mode": "full"}, None, record_request=False, wait_seconds=0
+    )
+    if answered:
+        # GENERATING_RESPONSE means another process holds the lease; otherwise the stored course was hydrated
+        return "in progress elsewhere" if answered is course_generation.GENERATING_RESPONSE else "filled in"
+    metadata = job["metadata"]
+    with job["lease"]:
+        course_generation.create_course_full(
+            job["course"],
+            job["topic"],
+            metadata["language"],
+            topic_type=metadata["topic_type"],
+            generation_mode="full",
+            orchestrator=orchestrator,
+        )
+    return "built"
+
+
+class Command(BaseCommand):
+    help = (
+        "Build and store a complete course for every TopicClassifier.REGISTRY topic (plus any extra "
+        "topics given), so the first request for each is answered from the database. Courses that are "
+        "already complete are skipped, outline-only courses are filled in, and failed ones resume from "
+        "their module checkpoints."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("topics", nargs="*", help="Extra topics to build, e.g. 'Data Structures'.")
+        parser.add_argument("--no-registry", action="store_true", help="Only build the topics given.")
+        parser.add_argument("--parallel", type=int, default=3, help="Courses built at the same time.")
+        parser.add_argument(
+            "--calls-per-minute", type=float, default=30,
+            help="Provider calls allowed per minute across all parallel builds (0 = no limit).",
+        )
+        parser.add_argument(
+            "--pacing", type=float, default=0,
+            help="LLM_MODULE_PACING_SECONDS while prewarming (default 0: --calls-per-minute already paces calls).",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Only report what would be built.")
+
+    def handle(self, *args, **options):
+        topics = [] if options["no_registry"] else list(TopicClassifier.REGISTRY)
+        topics += [topic for topic in options["topics"] if topic.strip()]
+        topics = list(dict.fromkeys(topics))
+
+        if options["dry_run"]:
+            for topic in topics:
+                self.stdout.write(f"{topic}: {course_state(find_course(topic))}")
+            return
+
+        started = time.perf_counter()
+        self.spacer = CallSpacer(options["calls_per_minute"])
+        self.pacing = options["pacing"]
+        if options["parallel"] > 1:
+            with ThreadPoolExecutor(max_workers=options["parallel"]) as pool:
+                results = list(pool.map(self._prewarm_in_thread, topics))
+        else:
+            results = [self._prewarm(topic) for topic in topics]
+        summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(Counter(results).items()))
+        self.stdout.write(
+            f"\n{len(topics)} topic(s) in {time.perf_counter() - started:.1f}s: {summary}; {self.spacer.calls} provider calls"
+        )
+
+    def _prewarm(self, topic):
+        started = time.perf_counter()
+        try:
+            orchestrator = AIOrchestrator(pacing_seconds=self.pacing, call_spacer=self.spacer)
+            outcome = prewarm_topic(topic, orchestrator)
+        except Exception as e:
+            self.stderr.write(f"{topic}: {e}")
+            outcome = "failed"
+        self.stdout.write(f"{topic}: {outcome} ({time.perf_counter() - started:.1f}s)")
+        return outcome
+
+    def _prewarm_in_thread(self, topic):
+        try:
+            return self._prewarm(topic)
+        finally:
+            connections.close_all()  # each pool thread has its own connections
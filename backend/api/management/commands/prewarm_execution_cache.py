@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from api import execution_cache, judge0
+from api.models import ExecutionResult
+
+
+class Command(BaseCommand):
+    help = "Run every deterministic prebuilt lab snippet on Judge0 and store its result, so untouched labs skip Judge0."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--language", action="append", help="Limit to a language key (repeatable).")
+        parser.add_argument("--force", action="store_true", help="Re-run snippets that already have a stored result.")
+        parser.add_argument("--dry-run", action="store_true", help="Only count the snippets that would run.")
+
+    def handle(self, *args, **options):
+        stored = set(ExecutionResult.objects.values_list("language_id", "code_sha256", "stdin_sha256"))
+        payloads, seen = [], set()
+        for language, language_id, module_number, lab_index, code in execution_cache.prebuilt_snippets(options["language"]):
+            key = (language_id, execution_cache.sha256(code), execution_cache.sha256(""))
+            if not execution_cache.is_deterministic(code) or key in seen:
+                continue
+            seen.add(key)
+            if key in stored and not options["force"]:
+                continue
+            payloads.append({"language_id": language_id, "source_code": code, "stdin": ""})
+
+        self.stdout.write(f"{len(payloads)} snippet(s) to run, {len(seen) - len(payloads)} already cached.")
+        if options["dry_run"] or not payloads:
+            return
+        if judge0.missing_credentials():
+            raise CommandError(judge0.missing_credentials())
+
+        saved = failed = 0
+        for i in range(0, len(payloads), settings.JUDGE0_BATCH_SIZE):
+            chunk = payloads[i:i + settings.JUDGE0_BATCH_SIZE]
+            tokens = judge0.submit_batch(chunk)
+            results = judge0.wait_for_batch(tokens, settings.JUDGE0_GRADE_TIMEOUT)
+            for payload, token in zip(chunk, tokens):
+                if execution_cache.store(payload, judge0.judge0_output(results.get(token) or {})):
+                    saved += 1
+                else:
+                    failed += 1
+            self.stdout.write(f"  {min(i + len(chunk), len(payloads))}/{len(payloads)} run")
+        self.stdout.write(self.style.SUCCESS(f"Stored {saved} result(s); {failed} not cacheable (runtime error or unfinished)."))
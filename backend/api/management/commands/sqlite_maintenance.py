@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = "Run SQLite maintenance: ANALYZE, PRAGMA optimize, WAL checkpoint and incremental vacuum."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+        parser.add_argument(
+            "--vacuum-pages", type=int, default=0,
+            help="Pages to reclaim with incremental_vacuum (0 = all free pages).",
+        )
+        parser.add_argument(
+            "--enable-incremental-vacuum", action="store_true",
+            help="Switch auto_vacuum to INCREMENTAL. Runs a full VACUUM once, which rewrites the database file.",
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        if connection.vendor != "sqlite":
+            raise CommandError(f"Database '{options['database']}' is {connection.vendor}, not SQLite.")
+
+        with connection.cursor() as cursor:
+            before = self._stats(cursor)
+            if options["enable_incremental_vacuum"] and before["auto_vacuum"] != 2:
+                self.stdout.write("Enabling incremental auto_vacuum (full VACUUM)...")
+                cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                cursor.execute("VACUUM")
+
+            cursor.execute("ANALYZE")
+            cursor.execute("PRAGMA optimize")
+            if self._stats(cursor)["auto_vacuum"] == 2:
+                cursor.execute(f"PRAGMA incremental_vacuum({options['vacuum_pages']})")
+            elif before["freelist_count"]:
+                self.stdout.write("auto_vacuum is not INCREMENTAL; free pages are kept (see --enable-incremental-vacuum).")
+            if before["journal_mode"] == "wal":
+                cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            after = self._stats(cursor)
+
+        for key in ("journal_mode", "page_count", "freelist_count"):
+            self.stdout.write(f"{key}: {before[key]} -> {after[key]}")
+        self.stdout.write(self.style.SUCCESS("SQLite maintenance complete."))
+
+    def _stats(self, cursor):
+        stats = {}
+        for pragma in ("journal_mode", "page_count", "freelist_count", "auto_vacuum"):
+            cursor.execute(f"PRAGMA {pragma}")
+            stats[pragma] = cursor.fetchone()[0]
+        return stats
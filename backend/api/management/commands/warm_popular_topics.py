@@ -0,0 +1,104 @@
+import time
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from api import course_generation, generation_lease, topic_stats
+from api.ai_orchestrator import AIOrchestrator
+from api.management.commands.prewarm_courses import CallSpacer, course_state, find_course, prewarm_topic
+from api.models import TopicRequestCount
+
+# Provider calls for one full course: the outline, then theory, quizzes and labs per module
+COURSE_CALL_ESTIMATE = 1 + 3 * len(course_generation.DEFAULT_MODULE_TITLES)
+
+
+def parse_window(window):
+    """"HH:MM-HH:MM" -> (start, end) times; the window may wrap past midnight."""
+    try:
+        start, end = (datetime.strptime(part.strip(), "%H:%M").time() for part in window.split("-"))
+    except ValueError:
+        raise CommandError(f"TOPIC_WARMING_WINDOW must look like 01:00-06:00, not {window!r}")
+    return start, end
+
+
+def in_window(window, now):
+    start, end = parse_window(window)
+    if start <= end:
+        return start <= now < end
+    return now >= start or now < end
+
+
+class Command(BaseCommand):
+    help = (
+        "Build courses for the most requested topics that have no complete course yet, using the "
+        "request counts in TopicRequestCount. Meant to run from cron: outside TOPIC_WARMING_WINDOW "
+        "it exits without doing anything, and it stops before going over TOPIC_WARMING_CALL_BUDGET "
+        "provider calls."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=settings.TOPIC_WARMING_TOP_N, help="Topics to build at most.")
+        parser.add_argument("--min-requests", type=int, default=settings.TOPIC_WARMING_MIN_REQUESTS)
+        parser.add_argument(
+            "--budget", type=int, default=settings.TOPIC_WARMING_CALL_BUDGET,
+            help="Provider calls this run may make.",
+        )
+        parser.add_argument("--calls-per-minute", type=float, default=settings.TOPIC_WARMING_CALLS_PER_MINUTE)
+        parser.add_argument("--now", action="store_true", help="Run even outside TOPIC_WARMING_WINDOW.")
+        parser.add_argument("--dry-run", action="store_true", help="Only list the topics that would be built.")
+
+    def handle(self, *args, **options):
+        local_now = timezone.localtime().time()
+        if not options["now"] and not in_window(settings.TOPIC_WARMING_WINDOW, local_now):
+            self.stdout.write(f"{local_now:%H:%M} is outside TOPIC_WARMING_WINDOW {settings.TOPIC_WARMING_WINDOW}")
+            return
+
+        topic_stats.flush()
+        candidates = self._candidates(options["top"], options["min_requests"])
+        if not candidates:
+            self.stdout.write("No requested topics need warming.")
+            return
+        if options["dry_run"]:
+            for stats, state in candidates:
+                self.stdout.write(f"{stats.query} ({stats.requests} requests): {state}")
+            return
+
+        started = time.perf_counter()
+        spacer = CallSpacer(options["calls_per_minute"])
+        built = 0
+        # The spacer already paces calls; no extra pause between a module's calls
+        orchestrator = AIOrchestrator(pacing_seconds=0, call_spacer=spacer)
+        for stats, state in candidates:
+            if spacer.calls + COURSE_CALL_ESTIMATE > options["budget"]:
+                self.stdout.write(f"Stopping: {spacer.calls}/{options['budget']} provider calls used")
+                break
+            topic_started = time.perf_counter()
+            try:
+                outcome = prewarm_topic(stats.query, orchestrator)
+                built += 1
+            except Exception as e:
+                outcome = f"failed: {e}"
+            self.stdout.write(
+                f"{stats.query} ({stats.requests} requests, was {state}): {outcome} "
+                f"({time.perf_counter() - topic_started:.1f}s)"
+            )
+        self.stdout.write(
+            f"\n{built} topic(s) warmed in {time.perf_counter() - started:.1f}s, {spacer.calls} provider calls"
+        )
+
+    def _candidates(self, top, min_requests):
+        """[(TopicRequestCount, state)] for the most requested topics without a complete course."""
+        candidates = []
+        for stats in TopicRequestCount.objects.filter(requests__gte=min_requests).order_by(
+            "-requests", "-last_requested_at"
+        ).iterator():
+            course = find_course(stats.query)
+            state = course_state(course)
+            # A "generating" course whose lease is live is being built by a request right now
+            if state != "complete" and not (state == "generating" and generation_lease.is_held(course.topic)):
+                candidates.append((stats, state))
+                if len(candidates) >= top:
+                    break
+        return candidates
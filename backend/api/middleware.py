@@ -1,17 +1,109 @@
 import logging
 
-from django.db import close_old_connections
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from .execution_scheduler import client_id, issue_client_id
 
 logger = logging.getLogger('api')
 
+
 class RequestLoggingMiddleware:
+    # Under ASGI a sync-only middleware runs every request on a thread; this one takes either
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
 
     def __call__(self, request):
-        close_old_connections()
-        logger.info(f"Incoming request: {request.method} {request.path}")
+        if self.is_async:
+            return self.__acall__(request)
+        self.log_request(request)
         response = self.get_response(request)
+        self.log_response(request, response)
+        return response
+
+    async def __acall__(self, request):
+        self.log_request(request)
+        response = await self.get_response(request)
+        self.log_response(request, response)
+        return response
+
+    def log_request(self, request):
+        logger.info(f"Incoming request: {request.method} {request.path}")
+
+    def log_response(self, request, response):
         if response.status_code >= 400:
             logger.error(f"Error on {request.path} (Status {response.status_code})")
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    WhiteNoise that also runs in an async middleware chain. WhiteNoiseMiddleware is
+    sync-only, so under ASGI Django would otherwise adapt it and every request, not just
+    static ones, would go through a thread. Static files are still served the same way.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            # DEBUG only: looks the file up on disk
+            static_file = await sync_to_async(self.find_file)(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
+
+
+class ClientIdMiddleware:
+    """
+    Hands API clients without a valid signed X-Client-Id a new one in the response's
+    X-Client-Id header. The frontend sends it back on every request and code runs are
+    charged to it, so students behind one classroom NAT each get their own share.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        response = self.get_response(request)
+        if self.needs_id(request):
+            self.set_id(response, issue_client_id(request))
         return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if self.needs_id(request):
+            self.set_id(response, await sync_to_async(issue_client_id)(request))
+        return response
+
+    def needs_id(self, request):
+        return request.path.startswith("/api/") and client_id(request) is None
+
+    def set_id(self, response, signed_id):
+        if signed_id:
+            response["X-Client-Id"] = signed_id
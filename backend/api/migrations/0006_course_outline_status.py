@@ -0,0 +1,18 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_course_status'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='course',
+            name='status',
+            field=models.CharField(choices=[('generating', 'Generating'), ('outline', 'Outline'), ('generated', 'Generated'), ('failed', 'Failed')], default='generated', max_length=20),
+        ),
+    ]
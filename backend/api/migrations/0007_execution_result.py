@@ -0,0 +1,27 @@
+# Generated by Django 5.2.3 on 2026-10-19 03:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0006_course_outline_status'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExecutionResult',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_id', models.IntegerField()),
+                ('code_sha256', models.CharField(max_length=64)),
+                ('stdin_sha256', models.CharField(max_length=64)),
+                ('result', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'unique_together': {('language_id', 'code_sha256', 'stdin_sha256')},
+            },
+        ),
+    ]
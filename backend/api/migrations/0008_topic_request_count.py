@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-19 04:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_execution_result'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TopicRequestCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('topic', models.CharField(max_length=255, unique=True)),
+                ('query', models.CharField(max_length=255)),
+                ('requests', models.PositiveIntegerField(default=0)),
+                ('last_requested_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
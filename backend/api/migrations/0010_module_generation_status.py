@@ -0,0 +1,25 @@
+# Generated by Django 5.2.3 on 2026-10-19 04:32
+
+from django.db import migrations, models
+
+
+def mark_modules_with_content_done(apps, schema_editor):
+    # Modules written before checkpoints existed are complete if they have content
+    Module = apps.get_model('api', 'Module')
+    Module.objects.exclude(content='').update(generation_status='done')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_generation_lease'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='module',
+            name='generation_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('generating', 'Generating'), ('done', 'Done'), ('fallback', 'Fallback')], default='pending', max_length=20),
+        ),
+        migrations.RunPython(mark_modules_with_content_done, migrations.RunPython.noop),
+    ]
@@ -6,6 +6,7 @@ from django.contrib.auth.models import User
 class Course(models.Model):
     STATUS_CHOICES = [
         ('generating', 'Generating'),
+        ('outline', 'Outline'),
         ('generated', 'Generated'),
         ('failed', 'Failed'),
     ]
@@ -25,6 +26,15 @@ class Module(models.Model):
         ('intermediate', 'Intermediate'),
         ('advanced', 'Advanced'),
     ]
+    # Per-module checkpoint of course generation: "pending" and "generating" modules are
+    # (re)generated when a stalled, failed or forced generation resumes; "fallback" ones
+    # got offline content after a provider failure and are retried on `force`.
+    GENERATION_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('generating', 'Generating'),
+        ('done', 'Done'),
+        ('fallback', 'Fallback'),
+    ]
     
     course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name='modules')
     name = models.CharField(max_length=255)
@@ -34,6 +44,7 @@ class Module(models.Model):
     order = models.IntegerField(default=0)
     code_examples = models.JSONField(default=list, blank=True)  # For technical topics
     case_scenarios = models.JSONField(default=list, blank=True)  # For non-technical topics
+    generation_status = models.CharField(max_length=20, choices=GENERATION_STATUS_CHOICES, default='pending')
     
     class Meta:
         ordering = ['order']
@@ -96,3 +107,47 @@ class UserProgress(models.Model):
 
     def __str__(self):
         return f"{self.user.username} - {self.display_title}"
+
+class ExecutionResult(models.Model):
+    """
+    Judge0 output of an unmodified, deterministic prebuilt lab snippet, keyed by
+    (language_id, sha256(code), sha256(stdin)). See api/execution_cache.py.
+    """
+    language_id = models.IntegerField()
+    code_sha256 = models.CharField(max_length=64)
+    stdin_sha256 = models.CharField(max_length=64)
+    result = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ('language_id', 'code_sha256', 'stdin_sha256')
+
+    def __str__(self):
+        return f"{self.language_id}:{self.code_sha256[:12]}"
+
+class TopicRequestCount(models.Model):
+    """
+    How often generate-course was asked for a topic, keyed like Course.topic.
+    Counted in memory and flushed in batches; see api/topic_stats.py.
+    """
+    topic = models.CharField(max_length=255, unique=True)  # normalized, e.g. "introduction to data structures"
+    query = models.CharField(max_length=255)  # latest raw topic that maps to it, e.g. "Data Structures"
+    requests = models.PositiveIntegerField(default=0)
+    last_requested_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.topic} ({self.requests})"
+
+class GenerationLease(models.Model):
+    """
+    Held by the request generating the course for a topic, keyed like Course.topic.
+    Other requests for the topic wait for it to go away; the holder renews expires_at
+    while it works, so a lease left by a killed worker expires. See api/generation_lease.py.
+    """
+    topic = models.CharField(max_length=255, unique=True)
+    owner = models.CharField(max_length=100)  # host:pid:random, e.g. "web-1:4312:9f2c61aa"
+    acquired_at = models.DateTimeField()
+    expires_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.topic} ({self.owner})"
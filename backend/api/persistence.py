@@ -0,0 +1,102 @@
+"""
+Bulk persistence for generated course content.
+
+Each helper writes its rows in a single transaction with bulk_create/bulk_update,
+so a whole course costs a handful of statements and one commit instead of one
+INSERT/UPDATE (and one SQLite fsync) per module and per quiz question.
+"""
+from django.db import transaction
+
+from .models import Module, Quiz
+
+MODULE_CONTENT_FIELDS = ["content", "case_scenarios", "code_examples", "generation_status"]
+
+
+def normalize_quiz_list(quizzes):
+    if isinstance(quizzes, dict):
+        if "questions" in quizzes:
+            return quizzes["questions"]
+        if "quizzes" in quizzes:
+            return quizzes["quizzes"]
+        return []
+    return quizzes if isinstance(quizzes, list) else []
+
+
+def build_quiz_rows(module, quizzes):
+    """Unsaved Quiz rows for the valid questions in a provider or fallback quiz payload."""
+    rows = []
+    for q in normalize_quiz_list(quizzes):
+        if isinstance(q, dict) and "question" in q:
+            rows.append(Quiz(
+                module=module,
+                question=q.get("question", "Invalid Question"),
+                options=q.get("options", []),
+                correct_answer=q.get("answer") or q.get("correct_answer") or "",
+                explanation=q.get("explanation", ""),
+            ))
+    return rows
+
+
+def apply_module_content(module, content):
+    """Copy a generated content payload onto a Module instance without saving it."""
+    module.content = content.get("theory", "")
+    module.case_scenarios = content.get("mini_labs", [])
+    module.code_examples = content.get("code_examples", [])
+    # Offline library payloads carry "fallback": True
+    module.generation_status = "fallback" if content.get("fallback") else "done"
+
+
+def save_course_outline(course, outline):
+    """Persist the course title/description and its outline modules. Returns the new modules."""
+    modules = [
+        Module(
+            course=course,
+            name=f"Module {mod.get('module_number', 0)}: {mod['title']}",
+            description=mod.get("description", ""),
+            difficulty=mod.get("difficulty", "beginner").lower(),
+            order=mod.get("module_number", 0),
+            content="",
+        )
+        for mod in outline["modules"]
+    ]
+    with transaction.atomic():
+        course.save()
+        return Module.objects.bulk_create(modules)
+
+
+def save_modules_content(results, replace_quizzes=True):
+    """
+    Write generated content for many modules at once.
+
+    `results` is an iterable of (module, content) pairs. Existing quizzes of those
+    modules are replaced when the payload carries questions.
+    """
+    modules, quiz_rows, refreshed = [], [], []
+    for module, content in results:
+        apply_module_content(module, content)
+        modules.append(module)
+        rows = build_quiz_rows(module, content.get("quizzes", []))
+        if rows:
+            refreshed.append(module.pk)
+            quiz_rows.extend(rows)
+    if not modules:
+        return
+    with transaction.atomic():
+        Module.objects.bulk_update(modules, MODULE_CONTENT_FIELDS)
+        if replace_quizzes and refreshed:
+            Quiz.objects.filter(module_id__in=refreshed).delete()
+        Quiz.objects.bulk_create(quiz_rows)
+
+
+def save_module_content(module, content):
+    save_modules_content([(module, content)])
+
+
+def save_module_quizzes(module, quizzes):
+    """Replace a module's quizzes in one transaction; no-op when the payload is empty."""
+    rows = build_quiz_rows(module, quizzes)
+    if not rows:
+        return
+    with transaction.atomic():
+        module.quizzes.all().delete()
+        Quiz.objects.bulk_create(rows)
@@ -0,0 +1,51 @@
+"""
+Local pre-flight checks run before code is sent to an execution backend.
+
+Many beginner submissions do not even parse. A checker registered for a language
+gets the source code and returns a Judge0-shaped result when the code is certain
+to fail, so the request is answered without a Judge0 round trip; it returns None
+to let the run proceed. Python is checked with `compile()`; other languages with
+a cheap local checker can be added with `@register("<language key>")`.
+"""
+import traceback
+
+from .languages import LanguageRegistry
+
+# What Judge0 reports for a Python file that fails to parse
+STATUS_NZEC = {"id": 11, "description": "Runtime Error (NZEC)"}
+
+PREFLIGHT_CHECKS = {}
+
+
+def register(language):
+    def decorator(check):
+        PREFLIGHT_CHECKS[language] = check
+        return check
+    return decorator
+
+
+def check(payload):
+    """Judge0-shaped result if the payload's code is rejected locally, otherwise None."""
+    language, _ = LanguageRegistry.get_by_judge0_id(payload.get("language_id"))
+    checker = PREFLIGHT_CHECKS.get(language)
+    return checker(payload.get("source_code") or "") if checker else None
+
+
+@register("python")
+def check_python(code):
+    try:
+        compile(code, "main.py", "exec", dont_inherit=True)
+    except (SyntaxError, ValueError) as e:  # ValueError: source contains null bytes
+        stderr = "".join(traceback.format_exception_only(type(e), e))
+        line = getattr(e, "lineno", None)
+        return {
+            "stdout": None,
+            "stderr": stderr,
+            "compile_output": None,
+            "status": STATUS_NZEC,
+            "time": "0.000",
+            "memory": None,
+            "line": line,
+            "column": getattr(e, "offset", None) if line else None,
+        }
+    return None
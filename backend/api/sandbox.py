@@ -0,0 +1,93 @@
+"""
+Isolation for local code runs (LocalSubprocessBackend and the interpreter pool).
+
+rlimits only cap resources; a submission still runs on this host. With
+LOCAL_EXECUTION_SANDBOX="namespaces" (the default) each command is started through
+`unshare` and `sandbox_init.py`, so it:
+
+- sees only its own processes (the server's /proc/<pid>/environ is not there),
+- has no network,
+- finds LOCAL_EXECUTION_HIDDEN_PATHS (the app with its .env and SQLite file, /data)
+  covered by empty mounts, and a private /tmp holding only its own workdir,
+- runs as LOCAL_EXECUTION_USER when the server runs as root (otherwise it is mapped
+  to the server's uid through a user namespace).
+
+If the sandbox cannot start on this host, the local backends report every language as
+unsupported and runs go to Judge0. "none" skips the sandbox and is refused unless DEBUG.
+"""
+import logging
+import os
+import pwd
+import shutil
+import subprocess
+import sys
+import tempfile
+from functools import lru_cache
+
+from django.conf import settings
+
+logger = logging.getLogger('api')
+
+SANDBOX_INIT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sandbox_init.py")
+
+
+def _run_as():
+    """(uid, gid) to drop to, or None when the server is not root and cannot switch users."""
+    if os.geteuid() != 0:
+        return None
+    user = pwd.getpwnam(settings.LOCAL_EXECUTION_USER)
+    return user.pw_uid, user.pw_gid
+
+
+def wrap(argv, workdir):
+    """
+    The argv that runs `argv` in the sandbox with `workdir` as its working directory,
+    handing `workdir` to the run user. `argv` as is when the sandbox is off.
+    """
+    if settings.LOCAL_EXECUTION_SANDBOX == "none":
+        return argv
+    run_as = _run_as()
+    prefix = [shutil.which("unshare") or "unshare", "--fork", "--pid", "--mount-proc", "--net", "--ipc", "--uts", "--mount"]
+    if run_as:
+        os.chown(workdir, *run_as)
+    else:
+        prefix += ["--user", "--map-root-user"]
+    uid, gid = run_as or (-1, -1)
+    return [
+        *prefix, sys.executable, "-I", "-S", SANDBOX_INIT,
+        str(uid), str(gid), workdir, ",".join(settings.LOCAL_EXECUTION_HIDDEN_PATHS), "--", *argv,
+    ]
+
+
+def available():
+    """Whether local runs may execute on this host with the configured sandbox."""
+    return _probe(settings.LOCAL_EXECUTION_SANDBOX, settings.LOCAL_EXECUTION_USER, settings.DEBUG)
+
+
+@lru_cache(maxsize=None)
+def _probe(mode, user, debug):
+    if mode == "none":
+        if not debug:
+            logger.warning("LOCAL_EXECUTION_SANDBOX=none is only allowed with DEBUG; local runs go to Judge0")
+        return debug
+    if mode != "namespaces":
+        logger.warning(f"Unknown LOCAL_EXECUTION_SANDBOX {mode!r}; local runs go to Judge0")
+        return False
+    workdir = tempfile.mkdtemp(prefix="mentai-run-")
+    try:
+        probe = subprocess.run(
+            wrap([sys.executable, "-I", "-S", "-c", "pass"], workdir),
+            cwd=workdir, capture_output=True, timeout=10, env={"PATH": os.environ.get("PATH", "/usr/bin:/bin")},
+        )
+    except (OSError, KeyError, subprocess.SubprocessError) as e:
+        logger.warning(f"Execution sandbox unavailable ({e}); local runs go to Judge0")
+        return False
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    if probe.returncode != 0:
+        logger.warning(
+            f"Execution sandbox unavailable (exit {probe.returncode}: "
+            f"{probe.stderr.decode(errors='replace').strip()[-300:]}); local runs go to Judge0"
+        )
+        return False
+    return True
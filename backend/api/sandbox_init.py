@@ -0,0 +1,65 @@
+"""
+Sandbox entry point for local code runs. Not imported by Django: `sandbox.wrap` starts it
+as namespace root inside fresh PID, mount, network, IPC and UTS namespaces as
+
+    python -I -S sandbox_init.py <uid> <gid> <workdir> <hidden,paths> -- <command...>
+
+It covers the hidden paths with empty mounts, replaces the directory holding the run's
+workdir and /dev/shm with private tmpfs mounts (mounting the workdir back), drops to
+<uid>/<gid> when they are not -1, forbids regaining privileges and execs the command.
+"""
+import ctypes
+import os
+import sys
+
+MS_RDONLY = 1
+MS_NOSUID = 2
+MS_NODEV = 4
+MS_BIND = 4096
+PR_SET_NO_NEW_PRIVS = 38
+
+libc = ctypes.CDLL(None, use_errno=True)
+
+
+def mount(source, target, fstype, flags, data=None):
+    if libc.mount(
+        source.encode(), target.encode(), fstype.encode() if fstype else None, flags, data.encode() if data else None,
+    ) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno), target)
+
+
+def hide(path):
+    if os.path.isdir(path):
+        mount("tmpfs", path, "tmpfs", MS_NOSUID | MS_NODEV | MS_RDONLY, "size=4k,mode=755")
+    elif os.path.exists(path):
+        mount("/dev/null", path, None, MS_BIND)
+
+
+def main():
+    uid, gid, workdir, hidden = int(sys.argv[1]), int(sys.argv[2]), sys.argv[3], sys.argv[4]
+    command = sys.argv[sys.argv.index("--") + 1:]
+
+    # Other runs' workdirs sit next to this one; keep a handle to ours and mount it back
+    workdir_fd = os.open(workdir, os.O_RDONLY | os.O_DIRECTORY)
+    for path in filter(None, hidden.split(",")):
+        hide(path)
+    for path in dict.fromkeys((os.path.dirname(workdir), "/dev/shm")):
+        if os.path.isdir(path):
+            mount("tmpfs", path, "tmpfs", MS_NOSUID | MS_NODEV, "size=16m,mode=1777")
+    os.mkdir(workdir)
+    mount(f"/proc/self/fd/{workdir_fd}", workdir, None, MS_BIND)
+    os.close(workdir_fd)
+    os.chdir(workdir)
+
+    if uid >= 0:
+        os.setgroups([])
+        os.setgid(gid)
+        os.setuid(uid)
+    if libc.prctl(PR_SET_NO_NEW_PRIVS, 1, 0, 0, 0) != 0:
+        raise OSError(ctypes.get_errno(), "prctl(PR_SET_NO_NEW_PRIVS) failed")
+    os.execv(command[0], command)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,76 @@ def _module_title_from_name(name: str) -> str:
     return name
 
 
+def parse_fieldset(value):
+    """Turn "id,title,modules.name" into {"id": {}, "title": {}, "modules": {"name": {}}}."""
+    tree = {}
+    for path in (value or "").split(","):
+        path = path.strip()
+        if not path:
+            continue
+        node = tree
+        for part in path.split("."):
+            node = node.setdefault(part, {})
+    return tree
+
+
+def projection_from_request(request):
+    """Serializer kwargs for the `?fields=` / `?include=` query parameters."""
+    if request is None:
+        return {}
+    return {
+        "fields": parse_fieldset(request.GET.get("fields")),
+        "include": parse_fieldset(request.GET.get("include")),
+    }
+
+
+def is_compact_schema(request):
+    """`?schema=v2` selects the compact representation without duplicated fields."""
+    return request is not None and request.GET.get("schema") == "v2"
+
+
+def prefetch_lookups(serializer, prefix=""):
+    """Related lookups a (projected) serializer will actually render."""
+    lookups = []
+    for name, field in serializer.fields.items():
+        child = getattr(field, "child", field)
+        if isinstance(child, serializers.BaseSerializer):
+            lookups.append(prefix + name)
+            lookups.extend(prefetch_lookups(child, f"{prefix}{name}__"))
+    return lookups
+
+
+class SparseFieldsetMixin:
+    """
+    Projects a serializer down to the requested fields.
+
+    `fields` keeps only the named fields; nested serializers receive their own
+    subtree. Fields listed in Meta.optional_fields are dropped unless named in
+    `fields` or opted into with `include`.
+    """
+    def __init__(self, *args, fields=None, include=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fieldset = (fields, include)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        requested, include = self.fieldset
+        include = include or {}
+        optional = getattr(self.Meta, "optional_fields", ())
+        for name in list(fields):
+            if requested:
+                keep = name in requested
+            else:
+                keep = name not in optional or name in include
+            if not keep:
+                fields.pop(name)
+                continue
+            child = getattr(fields[name], "child", fields[name])
+            if isinstance(child, SparseFieldsetMixin):
+                child.fieldset = ((requested or {}).get(name), include.get(name))
+        return fields
+
+
 class VideoSerializer(serializers.ModelSerializer):
     class Meta:
         model = Video
@@ -20,11 +90,24 @@ class QuizSerializer(serializers.ModelSerializer):
         model = Quiz
         fields = ['id', 'question', 'options', 'correct_answer', 'question_type', 'explanation']
 
-class ModuleSerializer(serializers.ModelSerializer):
+class PublicLabsField(serializers.JSONField):
+    """Lab list without the hidden grading cases; exposes only how many a lab has."""
+    def to_representation(self, value):
+        labs = super().to_representation(value)
+        if not isinstance(labs, list):
+            return labs
+        return [
+            {**{k: v for k, v in lab.items() if k != 'test_cases'}, 'test_case_count': len(lab['test_cases'])}
+            if isinstance(lab, dict) and lab.get('test_cases') else lab
+            for lab in labs
+        ]
+
+class ModuleSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     videos = VideoSerializer(many=True, read_only=True)
     quizzes = QuizSerializer(many=True, read_only=True)
     theory = serializers.CharField(source='content', read_only=True)
-    mini_labs = serializers.JSONField(source='case_scenarios', read_only=True)
+    case_scenarios = PublicLabsField(read_only=True)
+    mini_labs = PublicLabsField(source='case_scenarios', read_only=True)
     preloaded_code = serializers.SerializerMethodField()
     practice_problems = serializers.SerializerMethodField()
     mini_project = serializers.SerializerMethodField()
@@ -39,8 +122,11 @@ class ModuleSerializer(serializers.ModelSerializer):
 
     def _topic_context(self, obj):
         topic_label = obj.course.topic or obj.course.title or "general"
-        classification = TopicClassifier.classify(topic_label)
-        return classification["language"], topic_label
+        # One child serializer renders every module of a course; classify each topic once
+        languages = self.__dict__.setdefault("_topic_languages", {})
+        if topic_label not in languages:
+            languages[topic_label] = TopicClassifier.classify(topic_label)["language"]
+        return languages[topic_label], topic_label
 
     def get_preloaded_code(self, obj):
         if obj.case_scenarios and len(obj.case_scenarios) > 0:
@@ -62,13 +148,30 @@ class ModuleSerializer(serializers.ModelSerializer):
         language, _ = self._topic_context(obj)
         return get_mini_project(language, _module_title_from_name(obj.name), obj.order or 1)
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     modules = ModuleSerializer(many=True, read_only=True)
     videos = VideoSerializer(many=True, read_only=True)
     
     class Meta:
         model = Course
-        fields = ['id', 'title', 'content', 'topic', 'created_at', 'modules', 'videos']
+        fields = ['id', 'title', 'content', 'topic', 'status', 'created_at', 'modules', 'videos']
+        optional_fields = ['status']
+
+class CompactModuleSerializer(ModuleSerializer):
+    """v2 module schema: `theory`/`mini_labs` only, heavy extras behind `?include=`."""
+    class Meta(ModuleSerializer.Meta):
+        fields = [
+            'id', 'name', 'description', 'difficulty', 'order',
+            'theory', 'mini_labs', 'code_examples', 'preloaded_code', 'videos',
+            'quizzes', 'practice_problems', 'mini_project',
+        ]
+        optional_fields = ['quizzes', 'practice_problems', 'mini_project']
+
+class CompactCourseSerializer(CourseSerializer):
+    modules = CompactModuleSerializer(many=True, read_only=True)
+
+    class Meta(CourseSerializer.Meta):
+        pass
 
 class ProgressSerializer(serializers.ModelSerializer):
     class Meta:
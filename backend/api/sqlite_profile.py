@@ -0,0 +1,27 @@
+"""
+Opt-in SQLite tuning for the Render `/data` disk.
+
+With SQLITE_PRODUCTION_PROFILE enabled every new SQLite connection switches to
+WAL (readers no longer block on generation writes), waits on busy locks instead
+of failing with "database is locked", and uses a larger page cache and mmap.
+"""
+import logging
+
+from django.conf import settings
+
+logger = logging.getLogger('api')
+
+
+def apply_sqlite_pragmas(cursor, pragmas):
+    """Apply `PRAGMA name = value` for each entry. Works with Django and sqlite3 cursors."""
+    for name, value in pragmas.items():
+        cursor.execute(f"PRAGMA {name} = {value}")
+
+
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """`connection_created` receiver; a no-op for other backends or when the profile is off."""
+    if connection.vendor != "sqlite" or not settings.SQLITE_PRODUCTION_PROFILE:
+        return
+    with connection.cursor() as cursor:
+        apply_sqlite_pragmas(cursor, settings.SQLITE_PRAGMAS)
+    logger.debug("Applied SQLite production profile to %s", connection.alias)
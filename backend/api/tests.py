@@ -1,3 +1,1292 @@
-from django.test import TestCase
+import asyncio
+import datetime
+import glob
+import io
+import json
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from http.server import ThreadingHTTPServer
+from unittest import mock
 
-# Create your tests here.
+import httpx
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import (
+    AsyncClient, AsyncRequestFactory, Client, RequestFactory, SimpleTestCase, TestCase, TransactionTestCase,
+    override_settings,
+)
+from django.urls import path
+from django.utils import timezone
+
+from django.core.management import call_command
+
+from . import content_library, course_generation, execution_backends, execution_cache, generation_lease, judge0, sandbox, topic_stats, views
+from .ai_orchestrator import AIOrchestrator
+from .content_library import ContentLibrary
+from .db import refresh_stale_connections
+from .course_content import get_mini_labs, get_module_quiz, get_module_theory, get_prebuilt_code_snippet
+from .models import Course, ExecutionResult, GenerationLease, Module, Quiz, TopicRequestCount
+from .execution_scheduler import ExecutionScheduler, QueueFull, client_key, issue_client_id
+from .interpreter_pool import InterpreterPool
+from .management.commands.judge0_stub import StubJudge0, make_handler
+from .management.commands.prewarm_courses import CallSpacer
+from .management.commands.warm_popular_topics import in_window
+from .persistence import save_course_outline, save_modules_content
+from .sqlite_profile import apply_sqlite_pragmas
+from .warmup import warm_process
+from .views_async import AsyncCodeExecutionView, AsyncGenerateCourseView, AsyncMentAIAskView, AsyncModuleContentView
+
+
+# Total `python -X importtime` self time for a cold django.setup() plus URLconf load
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1500"))
+# Provider and PDF SDKs that must only be imported on first use
+DEFERRED_IMPORTS = ("google.generativeai", "groq", "openai", "grpc", "reportlab")
+
+# URLconf for tests that need the async views behind the full middleware chain
+urlpatterns = [path("api/v1/ask", AsyncMentAIAskView.as_view())]
+
+# Offline path: no provider keys, so every phase falls back to the prebuilt library.
+OFFLINE_PROVIDERS = [
+    mock.patch("api.ai_orchestrator.AIOrchestrator.generate_course_structure", return_value={}),
+    mock.patch("api.ai_orchestrator.AIOrchestrator.generate_complete_module", return_value={}),
+    mock.patch("api.ai_orchestrator.AIOrchestrator.agenerate_course_structure", new_callable=mock.AsyncMock, return_value={}),
+    mock.patch("api.ai_orchestrator.AIOrchestrator.agenerate_complete_module", new_callable=mock.AsyncMock, return_value={}),
+]
+
+
+class OfflineProvidersMixin:
+    def setUp(self):
+        super().setUp()
+        for patcher in OFFLINE_PROVIDERS:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+@override_settings(LAZY_PREFETCH_NEXT_MODULE=False)
+class LazyGenerationTests(OfflineProvidersMixin, TestCase):
+    def test_lazy_mode_persists_outline_only(self):
+        res = self.client.post(
+            "/api/generate-course/",
+            {"topic": "Python", "generation_mode": "lazy"},
+            content_type="application/json",
+            secure=True,
+        )
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.json()["metadata"]["generation_mode"], "lazy")
+        course = Course.objects.get()
+        self.assertEqual(course.status, "outline")
+        self.assertEqual(course.modules.count(), 10)
+        self.assertFalse(course.modules.exclude(content="").exists())
+
+    def test_module_is_hydrated_on_first_open(self):
+        self.client.post(
+            "/api/generate-course/",
+            {"topic": "Python", "generation_mode": "lazy"},
+            content_type="application/json",
+            secure=True,
+        )
+        module = Module.objects.order_by("order").first()
+        res = self.client.get(f"/api/modules/{module.id}/content", secure=True)
+        self.assertEqual(res.status_code, 200)
+        module.refresh_from_db()
+        self.assertTrue(module.content)
+        self.assertEqual(module.quizzes.count(), 10)
+        # Other modules stay outline-only until opened
+        self.assertEqual(Module.objects.filter(content="").count(), 9)
+
+    @override_settings(COURSE_GENERATION_MODE="lazy")
+    def test_cached_outline_is_not_backfilled(self):
+        self.client.post("/api/generate-course/", {"topic": "Python"}, content_type="application/json", secure=True)
+        res = self.client.post("/api/generate-course/", {"topic": "Python"}, content_type="application/json", secure=True)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(Module.objects.filter(content="").count(), 10)
+
+    def _outline_module(self):
+        self.client.post(
+            "/api/generate-course/",
+            {"topic": "Python", "generation_mode": "lazy"},
+            content_type="application/json",
+            secure=True,
+        )
+        return Module.objects.order_by("order").first()
+
+    def test_provider_call_runs_outside_a_transaction(self):
+        module = self._outline_module()
+        # TestCase wraps each test in atomic blocks of its own; hydration must not add one
+        outer_blocks = len(connection.atomic_blocks)
+        blocks_during_call = []
+
+        def generate(*args, **kwargs):
+            blocks_during_call.append(len(connection.atomic_blocks))
+            return {}
+
+        with mock.patch("api.ai_orchestrator.AIOrchestrator.generate_complete_module", side_effect=generate):
+            course_generation.ensure_module_content(module.id)
+        self.assertEqual(blocks_during_call, [outer_blocks])
+        module.refresh_from_db()
+        self.assertTrue(module.content)
+
+    def test_content_stored_during_generation_wins(self):
+        module = self._outline_module()
+
+        def generate(*args, **kwargs):
+            Module.objects.filter(id=module.id).update(content="written by another worker")
+            return {}
+
+        with mock.patch("api.ai_orchestrator.AIOrchestrator.generate_complete_module", side_effect=generate):
+            hydrated = course_generation.ensure_module_content(module.id)
+        self.assertEqual(hydrated.content, "written by another worker")
+        self.assertEqual(module.quizzes.count(), 0)
+
+
+@override_settings(LAZY_PREFETCH_NEXT_MODULE=False)
+class SparseFieldsetTests(OfflineProvidersMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.post("/api/generate-course/", {"topic": "Python"}, content_type="application/json", secure=True)
+        self.course = Course.objects.get()
+
+    def test_course_list_defaults_to_a_light_projection(self):
+        res = self.client.get("/api/courses/", secure=True)
+        self.assertEqual(res.json()["courses"], [
+            {"id": self.course.id, "title": self.course.title, "topic": self.course.topic, "status": "generated"},
+        ])
+        self.assertNotIn(b"correct_answer", res.content)
+
+        res = self.client.get("/api/courses/?include=status", secure=True)
+        course = res.json()["courses"][0]
+        self.assertEqual(course["status"], "generated")
+        self.assertEqual(len(course["modules"]), 10)
+
+    @override_settings(COURSE_LIST_PAGE_SIZE=1, COURSE_LIST_MAX_PAGE_SIZE=2)
+    def test_course_list_is_paginated(self):
+        for topic in ("Java", "Go"):
+            self.client.post("/api/generate-course/", {"topic": topic}, content_type="application/json", secure=True)
+        newest_first = list(Course.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+
+        page = self.client.get("/api/courses/", secure=True).json()
+        self.assertEqual(page["count"], 3)
+        self.assertEqual([course["id"] for course in page["courses"]], newest_first[:1])
+        self.assertIsNone(page["previous"])
+
+        page = self.client.get(page["next"], secure=True).json()
+        self.assertEqual([course["id"] for course in page["courses"]], newest_first[1:2])
+
+        page = self.client.get("/api/courses/?limit=50&offset=1", secure=True).json()
+        self.assertEqual([course["id"] for course in page["courses"]], newest_first[1:])
+        self.assertIsNone(page["next"])
+
+    def test_course_list_fields_projection(self):
+        res = self.client.get("/api/courses/?fields=id,title", secure=True)
+        self.assertEqual(res.json()["courses"], [{"id": self.course.id, "title": self.course.title}])
+
+    def test_nested_fields_projection(self):
+        res = self.client.get("/api/courses/?fields=id,modules.name", secure=True)
+        course = res.json()["courses"][0]
+        self.assertEqual(set(course), {"id", "modules"})
+        self.assertEqual(set(course["modules"][0]), {"name"})
+
+    def test_compact_schema_drops_duplicates_and_quizzes(self):
+        module = self.course.modules.first()
+        full = self.client.get(f"/api/modules/{module.id}/content", secure=True).json()
+        compact = self.client.get(f"/api/modules/{module.id}/content?schema=v2", secure=True).json()
+        for field in ("content", "case_scenarios", "quizzes", "practice_problems", "mini_project"):
+            self.assertIn(field, full)
+            self.assertNotIn(field, compact)
+        self.assertEqual(compact["theory"], full["theory"])
+        self.assertEqual(compact["mini_labs"], full["mini_labs"])
+
+    def test_compact_schema_include(self):
+        res = self.client.post(
+            "/api/generate-course/?schema=v2&include=modules.quizzes",
+            {"topic": "Python"},
+            content_type="application/json",
+            secure=True,
+        )
+        module = res.json()["modules"][0]
+        self.assertEqual(len(module["quizzes"]), 10)
+        self.assertNotIn("practice_problems", module)
+
+
+@override_settings(LAZY_PREFETCH_NEXT_MODULE=False)
+class AsyncViewTests(OfflineProvidersMixin, TestCase):
+    factory = AsyncRequestFactory()
+
+    async def test_generate_course_and_hydrate_module(self):
+        request = self.factory.post(
+            "/api/generate-course/", {"topic": "Python", "generation_mode": "lazy"}, content_type="application/json"
+        )
+        res = await AsyncGenerateCourseView.as_view()(request)
+        self.assertEqual(res.status_code, 201)
+        module = await Module.objects.order_by("order").afirst()
+        self.assertEqual(module.content, "")
+
+        res = await AsyncModuleContentView.as_view()(self.factory.get("/"), module_id=module.id)
+        self.assertEqual(res.status_code, 200)
+        await module.arefresh_from_db()
+        self.assertTrue(module.content)
+        self.assertEqual(await module.quizzes.acount(), 10)
+
+    @mock.patch.dict(os.environ, {"RAPIDAPI_KEY": "test"})
+    async def test_code_execution_awaits_judge0(self):
+        def judge0(request):
+            self.assertEqual(request.headers["X-RapidAPI-Key"], "test")
+            return httpx.Response(200, json={"stdout": "hi\n", "status": {"id": 3, "description": "Accepted"}})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(judge0))
+        request = self.factory.post(
+            "/api/execute-code/", {"code": "print('hi')", "topic": "Python"}, content_type="application/json"
+        )
+        with mock.patch("api.judge0.get_async_client", return_value=client):
+            res = await AsyncCodeExecutionView.as_view()(request)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(json.loads(res.content)["stdout"], "hi\n")
+
+
+
+@override_settings(ROOT_URLCONF="api.tests")
+class AsyncMiddlewareChainTests(SimpleTestCase):
+    async def test_in_flight_requests_are_not_bound_to_threads(self):
+        # More requests than the default executor has threads (and far more than the one
+        # thread-sensitive thread): a sync-only middleware would run each request on a
+        # thread and they could never all be waiting on the provider at once
+        in_flight = 40
+        arrived = []
+        all_arrived = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 5
+
+        async def aask_mentai(query):
+            arrived.append(query)
+            if len(arrived) == in_flight:
+                all_arrived.set()
+            await asyncio.wait_for(all_arrived.wait(), max(deadline - loop.time(), 0))
+            return "answer"
+
+        service = mock.Mock(client=True, aask_mentai=aask_mentai)
+        client = AsyncClient()
+        with mock.patch.dict(os.environ, {"GEMINI_API_KEY": "test"}), \
+                mock.patch("api.views_async.GeminiService", return_value=service):
+            responses = await asyncio.gather(*(
+                client.post("/api/v1/ask", {"query": f"q{i}"}, content_type="application/json", secure=True)
+                for i in range(in_flight)
+            ))
+        self.assertEqual([json.loads(res.content)["answer"] for res in responses], ["answer"] * in_flight)
+
+
+@override_settings(
+    LLM_PROVIDER_BACKEND="fake", FAKE_LLM_LATENCY_MS="0", LLM_MODULE_PACING_SECONDS=0, LAZY_PREFETCH_NEXT_MODULE=False
+)
+class FakeLLMProviderTests(TestCase):
+    def test_full_course_is_built_from_fake_provider(self):
+        res = self.client.post(
+            "/api/generate-course/", {"topic": "Python", "generation_mode": "full"},
+            content_type="application/json", secure=True,
+        )
+        self.assertEqual(res.status_code, 201)
+        course = Course.objects.get()
+        self.assertEqual(course.modules.count(), 10)
+        module = course.modules.order_by("order").first()
+        self.assertIn("is a core part of Python", module.content)
+        self.assertEqual(module.quizzes.count(), 10)
+
+    @override_settings(FAKE_LLM_FAILURE_RATE=1)
+    def test_failing_provider_falls_back_to_offline_library(self):
+        with mock.patch("time.sleep"):
+            res = self.client.post(
+                "/api/generate-course/", {"topic": "Python", "generation_mode": "full"},
+                content_type="application/json", secure=True,
+            )
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(Course.objects.get().modules.exclude(content="").count(), 10)
+
+    def test_draws_are_seeded(self):
+        from .fake_llm import FakeLLM
+
+        prompt = AIOrchestrator()._quiz_prompt("Python", "python", "Loops", 3)
+        runs = [
+            [FakeLLM({"default": 0.001}, failure_rate=0.2, malformed_rate=0.3, seed=7)._draw(prompt) for _ in range(20)]
+            for _ in range(2)
+        ]
+        self.assertEqual(runs[0], runs[1])
+        malformed = FakeLLM({"default": 0}, malformed_rate=1, sigma=0)
+        with self.assertRaises(json.JSONDecodeError):
+            json.loads(malformed.complete(prompt))
+
+    @override_settings(LLM_MODULE_PACING_SECONDS=5)
+    def test_pacing_and_call_spacer_are_per_orchestrator(self):
+        spacer = CallSpacer(0)
+        orchestrator = AIOrchestrator(pacing_seconds=0, call_spacer=spacer)
+        with mock.patch("time.sleep") as sleep:
+            orchestrator.generate_complete_module("Python", "python", "Loops", 2)
+        # Theory, quizzes and labs: one spaced provider call each, no pause between them
+        self.assertEqual(spacer.calls, 3)
+        self.assertNotIn(mock.call(5), sleep.call_args_list)
+        # Other orchestrators keep the deployment's pacing and are not spaced
+        self.assertEqual(AIOrchestrator().pacing_seconds, 5)
+        AIOrchestrator().generate_theory("Python", "python", "Loops", 2)
+        self.assertEqual(spacer.calls, 3)
+
+
+@override_settings(FAKE_LLM_LATENCY_MS="0", LLM_MODULE_PACING_SECONDS=0, LLM_CASSETTE_LATENCY_SCALE=0)
+class LLMCassetteTests(SimpleTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "cassette.jsonl.gz")
+
+    def test_recorded_calls_replay_in_order(self):
+        from .llm_cassette import Cassette
+
+        with override_settings(LLM_PROVIDER_BACKEND="fake", LLM_CASSETTE_RECORD=True, LLM_CASSETTE_PATH=self.path):
+            recorded = AIOrchestrator().generate_complete_module("Python", "python", "Loops", 2)
+            AIOrchestrator().generate_course_structure("Python", "python")
+        cassette = Cassette.load(self.path)
+        self.assertEqual(len(cassette.entries), 4)
+        self.assertEqual(cassette.topics(), ["Python"])
+        self.assertTrue(all(entry["elapsed"] >= 0 for entry in cassette.entries))
+
+        with override_settings(LLM_PROVIDER_BACKEND="replay", LLM_CASSETTE_PATH=self.path):
+            replayed = AIOrchestrator().generate_complete_module("Python", "python", "Loops", 2)
+        self.assertEqual(replayed, recorded)
+
+    @mock.patch("time.sleep")
+    def test_recorded_errors_are_raised_again(self, sleep):
+        from .llm_cassette import CassetteRecorder, get_cassette
+
+        prompt = AIOrchestrator()._theory_prompt("Python", "python", "Loops", 2)
+        recorder = CassetteRecorder(self.path)
+        recorder.record("gemini", prompt, 0, error="ResourceExhausted('429')")
+        recorder.record("gemini", prompt, 0, response='{"theory": "ok"}')
+        with override_settings(LLM_PROVIDER_BACKEND="replay", LLM_CASSETTE_PATH=self.path):
+            orchestrator = AIOrchestrator()
+            self.assertIsNone(orchestrator.groq_client)  # not in the cassette
+            self.assertEqual(orchestrator._call_gemini(prompt), '{"theory": "ok"}')
+            self.assertIsNone(orchestrator._call_gemini("a prompt that was never recorded"))
+        self.assertEqual(get_cassette(self.path).stats, {"hits": 2, "misses": 2})
+
+
+@mock.patch.dict(os.environ, {"RAPIDAPI_KEY": "test"})
+class Judge0ClientTests(TestCase):
+    def _execute(self):
+        return self.client.post(
+            "/api/execute-code/", {"code": "print('hi')", "topic": "Python"}, content_type="application/json", secure=True
+        )
+
+    def test_runs_share_one_session_with_timeouts(self):
+        response = mock.Mock(status_code=200, text="{}", json=lambda: {"stdout": "hi\n"})
+        with mock.patch("requests.Session.post", return_value=response) as post:
+            self.assertEqual(self._execute().json()["stdout"], "hi\n")
+            self._execute()
+        self.assertEqual(post.call_count, 2)
+        self.assertEqual(post.call_args.kwargs["timeout"], (settings.JUDGE0_CONNECT_TIMEOUT, settings.JUDGE0_READ_TIMEOUT))
+        self.assertIs(judge0.get_session(), judge0.get_session())
+
+    def test_syntax_errors_are_answered_locally(self):
+        with mock.patch("requests.Session.post") as post:
+            res = self.client.post(
+                "/api/execute-code/", {"code": "x = 1\nif x\n    print(x)", "topic": "Python"},
+                content_type="application/json", secure=True,
+            )
+        self.assertFalse(post.called)
+        self.assertEqual(res["X-Execution-Preflight"], "rejected")
+        self.assertEqual((res.json()["status"]["id"], res.json()["line"]), (11, 2))
+        self.assertIn("SyntaxError", res.json()["stderr"])
+
+    def test_slow_judge0_returns_504(self):
+        with mock.patch("requests.Session.post", side_effect=requests.ReadTimeout("read timed out")):
+            self.assertEqual(self._execute().status_code, 504)
+
+
+@mock.patch.dict(os.environ, {"RAPIDAPI_KEY": "test"})
+@override_settings(JUDGE0_POLL_WINDOW=0.1)
+class Judge0AsyncModeTests(TestCase):
+    TOKENS = [str(uuid.uuid4()) for _ in range(3)]
+
+    def setUp(self):
+        judge0._poller = None
+        cache.clear()
+
+    def _batch_response(self, status_id):
+        submissions = [{"token": t, "stdout": "hi\n", "status": {"id": status_id}} for t in self.TOKENS]
+        return mock.Mock(status_code=200, json=lambda: {"submissions": submissions})
+
+    def test_async_mode_returns_token(self):
+        response = mock.Mock(status_code=201, text="", json=lambda: {"token": self.TOKENS[0]})
+        with mock.patch("requests.Session.post", return_value=response) as post:
+            res = self.client.post(
+                "/api/execute-code/",
+                {"code": "print('hi')", "topic": "Python", "execution_mode": "async"},
+                content_type="application/json",
+                secure=True,
+            )
+        self.assertEqual(res.status_code, 202)
+        self.assertEqual(res.json()["result_url"], f"/api/execute-code/{self.TOKENS[0]}/")
+        self.assertIn("wait=false", post.call_args.args[0])
+
+    def test_concurrent_polls_share_one_batch_request(self):
+        with mock.patch("requests.Session.get", return_value=self._batch_response(3)) as get:
+            threads = [threading.Thread(target=judge0.poll_result, args=(t,)) for t in self.TOKENS]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            # Finished results are cached
+            res = self.client.get(f"/api/execute-code/{self.TOKENS[0]}/", secure=True)
+        self.assertEqual(get.call_count, 1)
+        self.assertEqual(set(get.call_args.kwargs["params"]["tokens"].split(",")), set(self.TOKENS))
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["stdout"], "hi\n")
+
+    def test_pending_run_returns_202(self):
+        with mock.patch("requests.Session.get", return_value=self._batch_response(2)):
+            res = self.client.get(f"/api/execute-code/{self.TOKENS[0]}/", secure=True)
+        self.assertEqual(res.status_code, 202)
+        self.assertEqual(res.json()["status"], {"id": 2})
+
+
+@mock.patch.dict(os.environ, {"RAPIDAPI_KEY": ""})
+class Judge0StubTests(TestCase):
+    def setUp(self):
+        stub = StubJudge0(latency_ms=0, jitter_ms=0, status_mix=([3], [1]), max_concurrent=0)
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(stub, verbose=False))
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    def test_execute_code_against_the_stub_without_credentials(self):
+        with override_settings(JUDGE0_BASE_URL=f"http://127.0.0.1:{self.server.server_port}", JUDGE0_AUTH_MODE="none"):
+            res = self.client.post(
+                "/api/execute-code/", {"code": "print(1)", "topic": "Python"}, content_type="application/json", secure=True
+            )
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["stdout"], "Hello from judge0_stub\n")
+
+    def test_auth_modes(self):
+        with override_settings(JUDGE0_AUTH_MODE="token", JUDGE0_AUTH_TOKEN="secret"):
+            self.assertEqual(judge0.judge0_headers()["X-Auth-Token"], "secret")
+            self.assertIsNone(judge0.missing_credentials())
+        with override_settings(JUDGE0_AUTH_MODE="rapidapi"):
+            self.assertEqual(judge0.missing_credentials(), "Judge0 RapidAPI key not configured on server")
+
+
+@mock.patch.dict(os.environ, {"RAPIDAPI_KEY": "test"})
+@override_settings(LAZY_PREFETCH_NEXT_MODULE=False, JUDGE0_GRADE_POLL_INTERVAL=0)
+class LabGradingTests(OfflineProvidersMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.post("/api/generate-course/", {"topic": "Python"}, content_type="application/json", secure=True)
+        self.module = Module.objects.get(order=1)
+
+    def _grade(self, stdout_by_poll):
+        post = mock.Mock(status_code=201, json=lambda: [{"token": "t1"}])
+        polls = [
+            mock.Mock(status_code=200, json=lambda out=out: {"submissions": [out]}) for out in stdout_by_poll
+        ]
+        with mock.patch("requests.Session.post", return_value=post) as batch_post, \
+                mock.patch("requests.Session.get", side_effect=polls):
+            res = self.client.post(
+                f"/api/labs/{self.module.id}/0/grade", {"code": "print('hi')"}, content_type="application/json", secure=True
+            )
+        self.assertEqual(batch_post.call_count, 1)
+        self.assertEqual(len(batch_post.call_args.kwargs["json"]["submissions"]), 1)
+        return res.json()
+
+    def test_hidden_cases_are_not_serialized(self):
+        lab = self.client.get(f"/api/modules/{self.module.id}/content", secure=True).json()["mini_labs"][0]
+        self.assertNotIn("test_cases", lab)
+        self.assertEqual(lab["test_case_count"], 1)
+
+    def test_grading_waits_for_the_batch_and_compares_output(self):
+        done = {"token": "t1", "stdout": "Hello Student, Welcome to Python 3.10+  \n", "status": {"id": 3}}
+        result = self._grade([{"token": "t1", "status": {"id": 2}}, done])
+        self.assertEqual((result["passed"], result["total"], result["all_passed"]), (1, 1, True))
+
+    def test_syntax_error_fails_every_case_without_judge0(self):
+        with mock.patch("requests.Session.post") as post:
+            res = self.client.post(
+                f"/api/labs/{self.module.id}/0/grade", {"code": "print('hi'"}, content_type="application/json", secure=True
+            )
+        self.assertFalse(post.called)
+        self.assertEqual((res.json()["passed"], res.json()["results"][0]["status"]["id"]), (0, 11))
+
+    def test_wrong_output_fails(self):
+        result = self._grade([{"token": "t1", "stdout": "Hello\n", "status": {"id": 4}}])
+        self.assertFalse(result["all_passed"])
+        self.assertFalse(result["results"][0]["passed"])
+
+    def test_grading_goes_through_the_execution_scheduler(self):
+        scheduler = ExecutionScheduler(max_in_flight=1, per_user=1, max_queue=0, per_user_queue=0, queue_timeout=1)
+        scheduler.acquire("someone-else")
+        with mock.patch("api.views.get_scheduler", return_value=scheduler), \
+                mock.patch("requests.Session.post") as post:
+            res = self.client.post(
+                f"/api/labs/{self.module.id}/0/grade", {"code": "print('hi')"}, content_type="application/json", secure=True
+            )
+        self.assertEqual(res.status_code, 429)
+        self.assertEqual(res["Retry-After"], str(res.json()["retry_after"]))
+        self.assertFalse(post.called)
+        scheduler.release("someone-else")
+        self.assertEqual(scheduler.stats()["in_flight"], 0)
+
+
+@mock.patch.dict(os.environ, {"RAPIDAPI_KEY": "test"})
+class ExecutionCacheTests(TestCase):
+    SNIPPET = get_prebuilt_code_snippet("python", "EXECUTABLE", 0, 0)
+
+    def setUp(self):
+        cache.clear()
+
+    def _execute(self, code):
+        return self.client.post(
+            "/api/execute-code/", {"code": code, "topic": "Python"}, content_type="application/json", secure=True
+        )
+
+    def _run_twice(self, code):
+        response = mock.Mock(status_code=200, text="{}", json=lambda: {"stdout": "out\n", "status": {"id": 3}})
+        with mock.patch("requests.Session.post", return_value=response) as post:
+            self._execute(code)
+            second = self._execute(code)
+        return post.call_count, second
+
+    def test_unmodified_snippet_is_served_from_cache(self):
+        calls, second = self._run_twice(self.SNIPPET)
+        self.assertEqual(calls, 1)
+        self.assertEqual(second["X-Execution-Cache"], "hit")
+        self.assertEqual(second.json()["stdout"], "out\n")
+
+    def test_edited_code_always_runs(self):
+        calls, second = self._run_twice(self.SNIPPET + "\nprint(1)")
+        self.assertEqual(calls, 2)
+        self.assertFalse(second.has_header("X-Execution-Cache"))
+
+    def test_nondeterministic_code_is_not_cacheable(self):
+        self.assertFalse(execution_cache.is_deterministic("import random\nprint(random.random())"))
+        for code in ("from datetime import datetime\nprint(datetime.now())", "import time\nprint(time.time())",
+                     "console.log(new Date())", "print(id(object()))"):
+            self.assertFalse(execution_cache.is_deterministic(code), code)
+
+    def test_words_containing_call_names_are_deterministic(self):
+        for code in ("def update(settings):\n    return settings", "print('candidate', 'validated')", "offset(1)"):
+            self.assertTrue(execution_cache.is_deterministic(code), code)
+
+    def test_cacheable_snippets_follow_content_library_reloads(self):
+        root = tempfile.mkdtemp()
+        os.mkdir(os.path.join(root, "python"))
+        path = os.path.join(root, "python", "labs.json")
+
+        def write(code, mtime):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"snippets": {"1": [code]}}, f)
+            os.utime(path, (mtime, mtime))
+
+        def cacheable(code):
+            return execution_cache.is_cacheable({"language_id": 71, "source_code": code})
+
+        write("print('first')", 1_000_000_000)
+        with override_settings(CONTENT_LIBRARY_DIR=root, CONTENT_LIBRARY_RELOAD_SECONDS=0.01):
+            self.assertTrue(cacheable("print('first')"))
+            write("print('second')", 2_000_000_000)
+            with mock.patch("api.content_library.time.monotonic", return_value=10**9):
+                self.assertEqual(get_prebuilt_code_snippet("python", "EXECUTABLE", 0, 0), "print('second')")
+            self.assertTrue(cacheable("print('second')"))
+            self.assertFalse(cacheable("print('first')"))
+
+    def test_prewarm_command_stores_results(self):
+        tokens = [{"token": str(i)} for i in range(3)]
+        submissions = [{"token": str(i), "stdout": "ok\n", "status": {"id": 3}} for i in range(3)]
+        with mock.patch("requests.Session.post", return_value=mock.Mock(status_code=201, json=lambda: tokens)), \
+                mock.patch("requests.Session.get", return_value=mock.Mock(status_code=200, json=lambda: {"submissions": submissions})):
+            call_command("prewarm_execution_cache", language=["python"], stdout=mock.Mock())
+        self.assertTrue(ExecutionResult.objects.exists())
+        self.assertIsNotNone(execution_cache.lookup({"language_id": 71, "source_code": self.SNIPPET, "stdin": ""}))
+
+
+@mock.patch.dict(os.environ, {"RAPIDAPI_KEY": ""})
+@override_settings(CODE_EXECUTION_BACKEND="local", LOCAL_EXECUTION_WALL_SECONDS=1)
+class LocalExecutionBackendTests(TestCase):
+    def _execute(self, code, **extra):
+        with mock.patch("requests.Session.post") as post:
+            res = self.client.post(
+                "/api/execute-code/", {"code": code, "topic": "Python", **extra}, content_type="application/json", secure=True
+            )
+        self.assertFalse(post.called)
+        return res
+
+    def test_python_runs_locally_without_judge0(self):
+        res = self._execute("print(input() * 2)", stdin="ab", execution_mode="async")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual((res.json()["stdout"], res.json()["status"]["id"]), ("abab\n", 3))
+
+    def test_runaway_code_is_stopped(self):
+        self.assertEqual(self._execute("while True: pass").json()["status"]["id"], 5)
+        self.assertEqual(self._execute("raise SystemExit(3)").json()["status"]["id"], 11)
+
+    def test_languages_without_local_runtime_use_judge0(self):
+        self.assertIsInstance(execution_backends.get_backend(73), execution_backends.Judge0Backend)
+
+
+class ExecutionSandboxTests(SimpleTestCase):
+    PROBE = (
+        "import os, socket\n"
+        "print(os.getuid(), os.path.exists('/proc/{pid}'), os.path.exists({manage!r}))\n"
+        "try:\n"
+        "    socket.create_connection(('1.1.1.1', 80), timeout=1)\n"
+        "    print('online')\n"
+        "except OSError:\n"
+        "    print('offline')"
+    )
+
+    def setUp(self):
+        if not sandbox.available():
+            self.skipTest("the execution sandbox cannot start on this host")
+        self.code = self.PROBE.format(pid=os.getpid(), manage=str(settings.BASE_DIR / "manage.py"))
+
+    def assertIsolated(self, stdout):
+        uid, server_visible, app_visible, network = stdout.split()
+        if os.geteuid() == 0:
+            self.assertNotEqual(uid, "0")
+        self.assertEqual((server_visible, app_visible, network), ("False", "False", "offline"))
+
+    def test_local_runs_cannot_see_the_server_app_or_network(self):
+        body, _ = execution_backends.LocalSubprocessBackend().execute({"language_id": 71, "source_code": self.code})
+        self.assertIsolated(body["stdout"])
+
+    def test_pooled_runs_cannot_see_the_server_app_or_network(self):
+        pool = InterpreterPool(size=1)
+        self.addCleanup(pool.close)
+        self.assertIsolated(pool.run({"source_code": self.code})["stdout"])
+
+    @override_settings(CODE_EXECUTION_BACKEND="local", LOCAL_EXECUTION_SANDBOX="none")
+    def test_unsandboxed_runs_need_debug(self):
+        self.assertIsInstance(execution_backends.get_backend(71), execution_backends.Judge0Backend)
+        with override_settings(DEBUG=True):
+            self.assertIsInstance(execution_backends.get_backend(71), execution_backends.LocalSubprocessBackend)
+
+
+@override_settings(LOCAL_EXECUTION_WALL_SECONDS=1)
+class InterpreterPoolTests(SimpleTestCase):
+    def setUp(self):
+        self.pool = InterpreterPool(size=1)
+        self.addCleanup(self.pool.close)
+
+    def _worker_pid(self):
+        worker = self.pool._idle.get()
+        self.pool._idle.put(worker)
+        return worker.process.pid
+
+    def test_runs_in_a_fresh_namespace(self):
+        self.assertEqual(self.pool.run({"source_code": "x = input()\nprint(x * 2)", "stdin": "ab"})["stdout"], "abab\n")
+        result = self.pool.run({"source_code": "print(x)"})
+        self.assertEqual(result["status"]["id"], 11)
+        self.assertIn("NameError", result["stderr"])
+
+    def test_runs_cannot_change_the_interpreter_of_later_runs(self):
+        template = self._worker_pid()
+        tamper = (
+            "import json, math, resource, signal, sys\n"
+            "json.loads = lambda *a, **k: 'hijacked'\n"
+            "math.pi = 3\n"
+            "sys.modules['statistics'] = None\n"
+            "signal.signal(signal.SIGALRM, signal.SIG_IGN)\n"
+            "print(resource.getrlimit(resource.RLIMIT_CPU))"
+        )
+        limits = self.pool.run({"source_code": tamper})["stdout"]
+        soft, hard = eval(limits)
+        self.assertLessEqual(hard, settings.LOCAL_EXECUTION_CPU_SECONDS + 1)
+
+        result = self.pool.run({"source_code": "import json, math, statistics\nprint(json.loads('1'), math.pi > 3.1)"})
+        self.assertEqual(result["stdout"], "1 True\n")
+        self.assertEqual(self._worker_pid(), template)
+
+    def test_limits_hold_against_submissions_that_fight_them(self):
+        raise_cpu = (
+            "import resource, signal\n"
+            "signal.signal(signal.SIGALRM, signal.SIG_IGN)\n"
+            "signal.signal(signal.SIGXCPU, signal.SIG_IGN)\n"
+            "try:\n"
+            "    resource.setrlimit(resource.RLIMIT_CPU, (100, resource.RLIM_INFINITY))\n"
+            "except ValueError:\n"
+            "    pass\n"
+            "while True: pass"
+        )
+        template = self._worker_pid()
+        self.assertEqual(self.pool.run({"source_code": raise_cpu})["status"]["id"], 5)
+        self.assertEqual(self.pool.run({"source_code": "import time\ntime.sleep(30)"})["status"]["id"], 5)
+        # The template only forks; a run hitting a limit does not cost a new interpreter
+        self.assertEqual(self._worker_pid(), template)
+        self.assertEqual(self.pool.run({"source_code": "print('ok')"})["stdout"], "ok\n")
+
+    @override_settings(CODE_EXECUTION_BACKEND="pool")
+    def test_execute_code_uses_the_pool(self):
+        with mock.patch("api.interpreter_pool.get_pool", return_value=self.pool):
+            res = self.client.post(
+                "/api/execute-code/", {"code": "print('warm')", "topic": "Python"}, content_type="application/json", secure=True
+            )
+        self.assertEqual(res.json()["stdout"], "warm\n")
+
+    @override_settings(CODE_EXECUTION_BACKEND="pool", LOCAL_EXECUTION_WALL_SECONDS=0.2)
+    def test_exhausted_pool_answers_429(self):
+        busy = self.pool._idle.get()
+        self.addCleanup(self.pool._idle.put, busy)
+        with mock.patch("api.interpreter_pool.get_pool", return_value=self.pool):
+            res = self.client.post(
+                "/api/execute-code/", {"code": "print('warm')", "topic": "Python"}, content_type="application/json", secure=True
+            )
+        self.assertEqual(res.status_code, 429)
+        self.assertEqual(res["Retry-After"], "1")
+
+
+class ExecutionSchedulerTests(SimpleTestCase):
+    def _scheduler(self, **overrides):
+        options = {"max_in_flight": 1, "per_user": 1, "max_queue": 10, "per_user_queue": 5, "queue_timeout": 5}
+        return ExecutionScheduler(**{**options, **overrides})
+
+    def test_waiting_users_are_served_round_robin(self):
+        scheduler = self._scheduler()
+        scheduler.acquire("busy")
+        order, threads = [], []
+
+        def run(user, label):
+            with scheduler.slot(user):
+                order.append(label)
+
+        for user, label in (("a", "a1"), ("a", "a2"), ("b", "b1")):
+            threads.append(threading.Thread(target=run, args=(user, label)))
+            threads[-1].start()
+            while scheduler.stats()["queued"] < len(threads):
+                threading.Event().wait(0.005)
+        scheduler.release("busy")
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(order, ["a1", "b1", "a2"])
+
+    def test_full_queue_is_rejected_immediately(self):
+        scheduler = self._scheduler(max_queue=0)
+        scheduler.acquire("a")
+        with self.assertRaises(QueueFull) as raised:
+            scheduler.acquire("b")
+        self.assertGreaterEqual(raised.exception.retry_after, 1)
+        self.assertEqual(scheduler.stats()["rejected"], 1)
+
+    def setUp(self):
+        cache.clear()
+
+    def test_runs_are_charged_to_signed_client_ids(self):
+        factory = RequestFactory()
+        signed_id = issue_client_id(factory.post("/"))
+        self.assertTrue(client_key(factory.post("/", HTTP_X_CLIENT_ID=signed_id)).startswith("client:"))
+        # Ids the backend did not sign count as none
+        self.assertEqual(client_key(factory.post("/", HTTP_X_CLIENT_ID=signed_id + "x")), "ip:127.0.0.1")
+
+        # Any API response hands a browser without one its id
+        res = self.client.post("/api/execute-code/", {}, content_type="application/json", secure=True)
+        self.assertTrue(client_key(factory.post("/", HTTP_X_CLIENT_ID=res["X-Client-Id"])).startswith("client:"))
+        res = self.client.post(
+            "/api/execute-code/", {}, content_type="application/json", secure=True, HTTP_X_CLIENT_ID=res["X-Client-Id"]
+        )
+        self.assertNotIn("X-Client-Id", res)
+
+    @override_settings(EXECUTION_CLIENT_IDS_PER_IP=2)
+    def test_client_ids_per_ip_are_limited(self):
+        request = RequestFactory().post("/", HTTP_X_FORWARDED_FOR="203.0.113.7")
+        self.assertIsNotNone(issue_client_id(request))
+        self.assertIsNotNone(issue_client_id(request))
+        self.assertIsNone(issue_client_id(request))
+        self.assertIsNotNone(issue_client_id(RequestFactory().post("/", HTTP_X_FORWARDED_FOR="198.51.100.1")))
+
+    def test_ip_keyed_clients_get_the_per_ip_caps(self):
+        scheduler = self._scheduler(max_in_flight=10, per_user_queue=0, per_ip=3, per_ip_queue=0)
+        for _ in range(3):
+            scheduler.acquire("ip:203.0.113.7")
+        with self.assertRaises(QueueFull):
+            scheduler.acquire("ip:203.0.113.7")
+        scheduler.acquire("client:a")
+        with self.assertRaises(QueueFull):
+            scheduler.acquire("client:a")
+
+    @mock.patch.dict(os.environ, {"RAPIDAPI_KEY": "test"})
+    def test_students_behind_one_nat_each_get_their_own_share(self):
+        scheduler = self._scheduler(max_in_flight=4, per_user_queue=2, max_queue=100, queue_timeout=10)
+        nat = {"HTTP_X_FORWARDED_FOR": "203.0.113.7"}
+        signed_ids = [issue_client_id(RequestFactory().post("/", **nat)) for _ in range(40)]
+        statuses = []
+
+        class Judge0:
+            local = False
+
+            def execute(self, payload, wait):
+                time.sleep(0.02)
+                return {"stdout": "ok"}, 200
+
+        def run_code(signed_id):
+            res = Client().post(
+                "/api/execute-code/", {"code": "print(input())", "topic": "Python"},
+                content_type="application/json", secure=True, HTTP_X_CLIENT_ID=signed_id, **nat,
+            )
+            statuses.append(res.status_code)
+
+        with mock.patch("api.views.get_scheduler", return_value=scheduler), \
+                mock.patch("api.views.execution_backends.get_backend", return_value=Judge0()):
+            threads = [threading.Thread(target=run_code, args=(signed_id,)) for signed_id in signed_ids]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(30)
+        self.assertEqual(statuses, [200] * 40)
+
+    def test_anonymous_runs_are_charged_to_the_proxy_appended_ip(self):
+        factory = RequestFactory()
+        spoofed = factory.post("/", HTTP_X_FORWARDED_FOR="1.1.1.1, 203.0.113.7", HTTP_X_CLIENT_ID="fresh-every-time")
+        self.assertEqual(client_key(spoofed), "ip:203.0.113.7")
+        with override_settings(EXECUTION_TRUSTED_PROXIES=2):
+            self.assertEqual(client_key(factory.post("/", HTTP_X_FORWARDED_FOR="9.9.9.9, 203.0.113.7, 10.0.0.2")), "ip:203.0.113.7")
+        with override_settings(EXECUTION_TRUSTED_PROXIES=0):
+            self.assertEqual(client_key(spoofed), "ip:127.0.0.1")
+        self.assertEqual(client_key(factory.post("/")), "ip:127.0.0.1")
+
+    @mock.patch.dict(os.environ, {"RAPIDAPI_KEY": "test"})
+    def test_execute_code_answers_429_with_retry_after(self):
+        scheduler = self._scheduler(max_queue=0)
+        scheduler.acquire("someone-else")
+        with mock.patch("api.views.get_scheduler", return_value=scheduler), \
+                mock.patch("requests.Session.post") as post:
+            res = self.client.post(
+                "/api/execute-code/", {"code": "print(1)", "topic": "Python"}, content_type="application/json", secure=True
+            )
+        self.assertEqual(res.status_code, 429)
+        self.assertEqual(res["Retry-After"], str(res.json()["retry_after"]))
+        self.assertFalse(post.called)
+
+
+class CourseContentTablesTests(SimpleTestCase):
+    def test_returned_content_can_be_mutated_without_touching_the_tables(self):
+        quiz = get_module_quiz("Python", "EXECUTABLE", "Basics", 1)
+        quiz["questions"][0]["options"].append("Perl")
+        quiz["questions"].clear()
+        labs = get_mini_labs("go", "Basics", 1)
+        labs[0]["tasks"].append("Extra task")
+        labs[0]["test_cases"][0]["expected_output"] = "changed"
+
+        quiz = get_module_quiz("Python", "EXECUTABLE", "Basics", 1)
+        self.assertEqual(quiz["questions"][0]["options"], ["Guido van Rossum", "Gosling", "Stroustrup", "Ritchie"])
+        labs = get_mini_labs("go", "Basics", 1)
+        self.assertEqual(len(labs[0]["tasks"]), 3)
+        self.assertEqual(labs[0]["test_cases"][0]["expected_output"], "Hello, Go!\n")
+        with self.assertRaises(TypeError):
+            content_library.section("python", "quizzes")[1][0]["answer"] = "Ritchie"
+
+    def test_snippets_are_indexed_by_language_module_and_lab(self):
+        snippets = content_library.section("go", "labs")["snippets"]
+        self.assertEqual(get_prebuilt_code_snippet("Golang", "EXECUTABLE", 0, 0), snippets[1][0])
+        self.assertTrue(get_prebuilt_code_snippet("Java", "EXECUTABLE", 0, 0).startswith("public class Main {"))
+        self.assertEqual(get_prebuilt_code_snippet("python", "EXECUTABLE", 0, 5), "# Python Advanced Lab 6")
+        self.assertEqual(get_prebuilt_code_snippet("rust", "EXECUTABLE", 0, 0, "Ownership"), "// Code for Ownership")
+
+    def test_generic_quiz_names_the_module(self):
+        quiz = get_module_quiz("Rust", "EXECUTABLE", "Ownership", 1)
+        self.assertEqual(len(quiz["questions"]), 10)
+        self.assertIn("Key concept of Ownership?", [q["question"] for q in quiz["questions"]])
+
+    def test_theory_is_served_from_the_library(self):
+        self.assertEqual(get_module_theory("js", "Basics", 1), content_library.section("javascript", "theory")[1])
+        self.assertIn("Rust", get_module_theory("Rust", "Ownership", 1))
+
+
+class ContentLibraryTests(SimpleTestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.root, "python"))
+        os.mkdir(os.path.join(self.root, "go"))
+        self.write("python", "theory", {"1": "# Basics"})
+        self.write("go", "theory", {"1": "# Go"})
+
+    def write(self, language, section, data, mtime=None):
+        path = os.path.join(self.root, language, f"{section}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(data if isinstance(data, str) else json.dumps(data))
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+
+    def test_sections_load_on_first_use(self):
+        library = ContentLibrary(self.root)
+        self.assertEqual(library.loaded(), [])
+        self.assertEqual(library.section("python", "theory")[1], "# Basics")
+        self.assertEqual(library.loaded(), [("python", "theory")])
+        self.assertEqual(library.languages(), ["go", "python"])
+
+    def test_changed_file_is_reloaded(self):
+        library = ContentLibrary(self.root, reload_seconds=0.01)
+        self.assertEqual(library.section("python", "theory")[1], "# Basics")
+        self.write("python", "theory", {"1": "# Basics, revised"}, mtime=2_000_000_000)
+        with mock.patch("api.content_library.time.monotonic", return_value=10**9):
+            self.assertEqual(library.section("python", "theory")[1], "# Basics, revised")
+
+    def test_broken_file_keeps_the_loaded_content(self):
+        library = ContentLibrary(self.root, reload_seconds=0.01)
+        library.section("python", "theory")
+        self.write("python", "theory", "{not json", mtime=2_000_000_000)
+        with mock.patch("api.content_library.time.monotonic", return_value=10**9), self.assertLogs("api", "ERROR"):
+            self.assertEqual(library.section("python", "theory")[1], "# Basics")
+
+    def test_unknown_languages_and_sections_are_empty(self):
+        library = ContentLibrary(self.root)
+        self.assertEqual(library.section("rust", "theory"), {})
+        self.assertEqual(library.section("../python", "theory"), {})
+        self.assertEqual(library.section("python", "secrets"), {})
+        self.assertEqual(library.loaded(), [])
+
+    def test_library_follows_settings(self):
+        with override_settings(CONTENT_LIBRARY_DIR=self.root):
+            self.assertEqual(get_module_theory("golang", "Basics", 1), "# Go")
+        self.assertNotEqual(get_module_theory("golang", "Basics", 1), "# Go")
+
+
+class WarmupTests(SimpleTestCase):
+    def test_every_content_file_is_loaded(self):
+        summary = warm_process(provider_sdks=False)
+        files = glob.glob(os.path.join(settings.CONTENT_LIBRARY_DIR, "*", "*.json"))
+        self.assertEqual(summary["content_sections"], len(files))
+        self.assertGreater(summary["cacheable_snippets"], 0)
+        self.assertEqual(summary["provider_sdks"], [])
+
+
+@override_settings(LAZY_PREFETCH_NEXT_MODULE=False)
+class PrewarmCoursesTests(OfflineProvidersMixin, TestCase):
+    def prewarm(self, *topics):
+        out = io.StringIO()
+        call_command("prewarm_courses", "--no-registry", *topics, "--parallel", "1", stdout=out)
+        return out.getvalue()
+
+    def test_builds_missing_courses_and_skips_complete_ones(self):
+        self.assertIn("python: built", self.prewarm("python", "Data Structures"))
+        course = Course.objects.get(topic="python programming")
+        self.assertEqual(course.status, "generated")
+        self.assertFalse(course.modules.filter(content="").exists())
+
+        output = self.prewarm("python", "py", "Data Structures")
+        self.assertIn("3 skipped", output)
+        self.assertEqual(Course.objects.count(), 2)
+
+        res = self.client.post("/api/generate-course/", {"topic": "Python"}, content_type="application/json", secure=True)
+        self.assertEqual(res.status_code, 200)
+
+    def test_outline_courses_are_filled_in(self):
+        self.client.post(
+            "/api/generate-course/", {"topic": "Go", "generation_mode": "lazy"}, content_type="application/json", secure=True,
+        )
+        self.assertIn("go: filled in", self.prewarm("go"))
+        self.assertEqual(Course.objects.get().status, "generated")
+        self.assertFalse(Module.objects.filter(content="").exists())
+
+
+@override_settings(LAZY_PREFETCH_NEXT_MODULE=False)
+class DemandWarmingTests(OfflineProvidersMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        # Start from no counts: drop whatever earlier tests left pending
+        topic_stats.flush()
+        TopicRequestCount.objects.all().delete()
+
+    @override_settings(TOPIC_STATS_FLUSH_SECONDS=3600)
+    def test_requests_are_counted_in_memory_and_flushed_in_one_batch(self):
+        for topic in ("Data Structures", "data structures ", "Python"):
+            self.client.post("/api/generate-course/", {"topic": topic}, content_type="application/json", secure=True)
+        self.assertFalse(TopicRequestCount.objects.exists())
+        self.assertEqual(topic_stats.pending(), {"introduction to data structures": 2, "python programming": 1})
+
+        self.assertEqual(topic_stats.flush(), 2)
+        stats = TopicRequestCount.objects.get(topic="introduction to data structures")
+        self.assertEqual((stats.requests, stats.query), (2, "data structures"))
+        self.assertEqual(topic_stats.pending(), {})
+
+    def test_most_requested_topics_without_a_course_are_built(self):
+        TopicRequestCount.objects.create(topic="introduction to data structures", query="Data Structures", requests=5)
+        TopicRequestCount.objects.create(topic="python programming", query="Python", requests=3)
+        TopicRequestCount.objects.create(topic="introduction to cobol", query="COBOL", requests=1)
+
+        out = io.StringIO()
+        call_command("warm_popular_topics", "--now", stdout=out)
+        self.assertIn("2 topic(s) warmed", out.getvalue())
+        self.assertEqual(
+            sorted(Course.objects.filter(status="generated").values_list("topic", flat=True)),
+            ["introduction to data structures", "python programming"],
+        )
+        # Prewarming does not count as demand
+        self.assertEqual(topic_stats.pending(), {})
+
+        out = io.StringIO()
+        call_command("warm_popular_topics", "--now", stdout=out)
+        self.assertIn("No requested topics need warming.", out.getvalue())
+
+    def test_budget_and_window_are_respected(self):
+        TopicRequestCount.objects.create(topic="python programming", query="Python", requests=3)
+        out = io.StringIO()
+        call_command("warm_popular_topics", "--now", "--budget", "10", stdout=out)
+        self.assertIn("Stopping: 0/10 provider calls used", out.getvalue())
+        self.assertFalse(Course.objects.exists())
+
+        self.assertTrue(in_window("23:00-02:00", datetime.time(1, 30)))
+        self.assertFalse(in_window("23:00-02:00", datetime.time(12, 0)))
+        self.assertTrue(in_window("01:00-06:00", datetime.time(1, 0)))
+
+
+@override_settings(LAZY_PREFETCH_NEXT_MODULE=False, LLM_MODULE_PACING_SECONDS=0)
+class GenerationSingleFlightTests(OfflineProvidersMixin, TestCase):
+    def generate(self, topic="Python"):
+        return self.client.post("/api/generate-course/", {"topic": topic}, content_type="application/json", secure=True)
+
+    def test_lease_is_exclusive_until_released(self):
+        lease = generation_lease.acquire("Python Programming")
+        self.assertIsNone(generation_lease.acquire("python programming"))
+        self.assertTrue(generation_lease.is_held("python programming"))
+        self.assertFalse(generation_lease.is_held("python programming", lease))
+        self.assertTrue(lease.renew())
+        lease.release()
+        self.assertFalse(generation_lease.is_held("python programming"))
+        generation_lease.acquire("python programming").release()
+
+    def test_followers_wait_for_the_leader_and_get_its_course(self):
+        leader = generation_lease.acquire("python programming")
+        course = Course.objects.create(topic="python programming", title="Python Programming", status="generating")
+
+        def leader_finishes(topic, timeout):
+            self.assertEqual(topic, "python programming")
+            with leader:
+                views.GenerateCourseView().create_course_full(course, "Python Programming", language="python")
+            return True
+
+        with mock.patch("api.course_generation.generation_lease.wait_for_release", side_effect=leader_finishes) as wait:
+            res = self.generate()
+        self.assertEqual(wait.call_count, 1)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["id"], course.id)
+        self.assertEqual(Course.objects.count(), 1)
+        self.assertFalse(GenerationLease.objects.exists())
+
+    @override_settings(GENERATION_WAIT_SECONDS=0)
+    def test_followers_get_202_when_the_wait_runs_out(self):
+        generation_lease.acquire("python programming")
+        Course.objects.create(topic="python programming", status="generating")
+        res = self.generate()
+        self.assertEqual(res.status_code, 202)
+        self.assertEqual(res.json()["status"], "generating")
+
+    @override_settings(GENERATION_WAIT_SECONDS=0, GENERATION_ASYNC_WAIT_SECONDS=10, GENERATION_LEASE_POLL_SECONDS=0.01)
+    async def test_only_the_async_view_waits_long(self):
+        leader = await sync_to_async(generation_lease.acquire)("python programming")
+        course = await Course.objects.acreate(topic="python programming", title="Python Programming", status="generating")
+        request = AsyncRequestFactory().post("/api/generate-course/", {"topic": "Python"}, content_type="application/json")
+        follower = asyncio.ensure_future(AsyncGenerateCourseView.as_view()(request))
+
+        res = await sync_to_async(self.generate)()
+        self.assertEqual(res.status_code, 202)
+        await asyncio.sleep(0.1)
+        self.assertFalse(follower.done())
+
+        def leader_finishes():
+            with leader:
+                views.GenerateCourseView().create_course_full(course, "Python Programming", language="python")
+
+        await sync_to_async(leader_finishes)()
+        res = await asyncio.wait_for(follower, 5)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(json.loads(res.content)["id"], course.id)
+
+    def test_expired_lease_of_a_killed_worker_is_taken_over(self):
+        Course.objects.create(topic="python programming", status="generating")
+        GenerationLease.objects.create(
+            topic="python programming", owner="dead:1:0", acquired_at=timezone.now(), expires_at=timezone.now(),
+        )
+        res = self.generate()
+        self.assertEqual(res.status_code, 201)
+        course = Course.objects.get()
+        self.assertEqual(course.status, "generated")
+        self.assertEqual(course.modules.count(), 10)
+        self.assertFalse(GenerationLease.objects.exists())
+
+
+@override_settings(LAZY_PREFETCH_NEXT_MODULE=False, LLM_MODULE_PACING_SECONDS=0)
+class CheckpointedGenerationTests(OfflineProvidersMixin, TestCase):
+    MODULE = {"theory": "Provider theory. " * 10, "quizzes": [{"question": "Q?", "options": ["a"], "answer": "a"}]}
+
+    def generate(self, **data):
+        return self.client.post(
+            "/api/generate-course/", {"topic": "Python", **data}, content_type="application/json", secure=True,
+        )
+
+    def statuses(self):
+        return list(Module.objects.order_by("order").values_list("generation_status", flat=True))
+
+    def test_killed_generation_resumes_from_its_checkpoints(self):
+        course = Course.objects.create(topic="python programming", status="generating")
+        provider = mock.patch(
+            "api.ai_orchestrator.AIOrchestrator.generate_complete_module",
+            side_effect=[dict(self.MODULE)] * 3 + [SystemExit("worker killed")],
+        )
+        with provider, self.assertRaises(SystemExit):
+            views.GenerateCourseView().create_course_full(course, "Python Programming", language="python")
+        # Finished modules were committed one by one; the one in flight is marked
+        self.assertEqual(self.statuses(), ["done"] * 3 + ["generating"] + ["pending"] * 6)
+        first = Module.objects.get(order=1)
+        self.assertTrue(first.content.startswith("Provider theory."))
+
+        with mock.patch(
+            "api.ai_orchestrator.AIOrchestrator.generate_complete_module", side_effect=lambda **_: dict(self.MODULE),
+        ) as provider:
+            res = self.generate()
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(provider.call_count, 7)
+        self.assertEqual(self.statuses(), ["done"] * 10)
+        self.assertEqual(Module.objects.count(), 10)
+        self.assertEqual(Course.objects.get().status, "generated")
+        self.assertEqual(Module.objects.get(order=1).quizzes.count(), 1)
+
+    def test_force_retries_only_fallback_modules(self):
+        self.generate()
+        self.assertEqual(self.statuses(), ["fallback"] * 10)
+        course = Course.objects.get()
+        Module.objects.filter(order__lte=4).update(generation_status="done")
+
+        with mock.patch(
+            "api.ai_orchestrator.AIOrchestrator.generate_complete_module", side_effect=lambda **_: dict(self.MODULE),
+        ) as provider:
+            res = self.generate(force=True)
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(provider.call_count, 6)
+        self.assertEqual(res.json()["id"], course.id)
+        self.assertEqual(self.statuses(), ["done"] * 10)
+        # Retried modules had their fallback quizzes replaced
+        self.assertEqual(Module.objects.get(order=10).quizzes.count(), 1)
+
+
+class BulkPersistenceTests(TestCase):
+    def test_course_is_written_in_a_few_statements(self):
+        course = Course.objects.create(topic="bulk", status="generating")
+        outline = {"modules": [{"module_number": i, "title": f"Topic {i}"} for i in range(1, 11)]}
+        quiz = {"questions": [{"question": f"Q{i}?", "options": ["a", "b"], "answer": "a"} for i in range(10)]}
+        with self.assertNumQueries(8):  # 4 writes plus savepoints around the two transactions
+            modules = save_course_outline(course, outline)
+            save_modules_content(((m, {"theory": "T", "quizzes": quiz}) for m in modules), replace_quizzes=False)
+        self.assertEqual(Quiz.objects.filter(module__course=course).count(), 100)
+        self.assertEqual(Module.objects.filter(course=course, content="T").count(), 10)
+
+    def test_quizzes_are_replaced(self):
+        course = Course.objects.create(topic="bulk")
+        module = save_course_outline(course, {"modules": [{"module_number": 1, "title": "A"}]})[0]
+        for answer in ("a", "b"):
+            save_modules_content([(module, {"theory": "T", "quizzes": [{"question": "Q?", "options": [], "answer": answer}]})])
+        self.assertEqual(list(module.quizzes.values_list("correct_answer", flat=True)), ["b"])
+
+
+class StaleConnectionTests(TransactionTestCase):
+    """refresh_stale_connections between provider calls, outside TestCase's wrapping transaction."""
+
+    def setUp(self):
+        connection.ensure_connection()
+        self.addCleanup(setattr, connection, "close_at", None)
+        self.addCleanup(setattr, connection, "errors_occurred", False)
+
+    def test_healthy_connection_is_kept(self):
+        with mock.patch.object(connection, "close") as close:
+            refresh_stale_connections()
+        close.assert_not_called()
+
+    def test_obsolete_connection_is_closed(self):
+        connection.close_at = time.monotonic() - 1
+        with mock.patch.object(connection, "close") as close:
+            refresh_stale_connections()
+        close.assert_called_once()
+
+    def test_unusable_connection_is_closed(self):
+        connection.errors_occurred = True
+        with mock.patch.object(connection, "is_usable", return_value=False), \
+                mock.patch.object(connection, "close") as close:
+            refresh_stale_connections()
+        close.assert_called_once()
+
+    def test_connection_inside_an_atomic_block_is_left_alone(self):
+        with transaction.atomic():
+            connection.close_at = time.monotonic() - 1
+            connection.errors_occurred = True
+            with mock.patch.object(connection, "is_usable", return_value=False), \
+                    mock.patch.object(connection, "close") as close:
+                refresh_stale_connections()
+            close.assert_not_called()
+            connection.errors_occurred = False
+
+
+class ConnectionSettingsTests(SimpleTestCase):
+    def _conn_max_age(self, **env):
+        env = {key: value for key, value in os.environ.items() if key not in ("ASYNC_VIEWS", "DB_CONN_MAX_AGE")} | env
+        result = subprocess.run(
+            [sys.executable, "-c", "from backend import settings; print(settings.DATABASES['default']['CONN_MAX_AGE'])"],
+            cwd=settings.BASE_DIR, env={**env, "PYTHONPATH": str(settings.BASE_DIR)},
+            capture_output=True, text=True, timeout=60,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        return int(result.stdout.strip().splitlines()[-1])
+
+    def test_persistent_connections_are_off_under_async_views(self):
+        self.assertEqual(self._conn_max_age(), 600)
+        self.assertEqual(self._conn_max_age(ASYNC_VIEWS="True"), 0)
+        self.assertEqual(self._conn_max_age(ASYNC_VIEWS="True", DB_CONN_MAX_AGE="60"), 60)
+
+
+class SQLiteProfileConcurrencyTests(SimpleTestCase):
+    """A reader must not be blocked while a generation write transaction holds the write lock."""
+
+    def _connect(self, path, profile):
+        conn = sqlite3.connect(path, timeout=0, isolation_level=None)
+        if profile:
+            apply_sqlite_pragmas(conn.cursor(), {**settings.SQLITE_PRAGMAS, "busy_timeout": 0})
+        return conn
+
+    def _read_during_write(self, profile):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "db.sqlite3")
+            writer, reader = self._connect(path, profile), self._connect(path, profile)
+            try:
+                writer.execute("CREATE TABLE module (id INTEGER PRIMARY KEY, content TEXT)")
+                writer.execute("INSERT INTO module (content) VALUES ('theory')")
+                writer.execute("BEGIN EXCLUSIVE")
+                writer.executemany("INSERT INTO module (content) VALUES (?)", [("x" * 1000,)] * 100)
+                return reader.execute("SELECT count(*) FROM module").fetchone()[0]
+            finally:
+                writer.close()
+                reader.close()
+
+    def test_reads_proceed_during_writes_with_profile(self):
+        self.assertEqual(self._read_during_write(profile=True), 1)
+
+    def test_rollback_journal_blocks_reads(self):
+        with self.assertRaises(sqlite3.OperationalError):
+            self._read_during_write(profile=False)
+
+
+class ImportBudgetTests(SimpleTestCase):
+    """A worker must not pay for provider SDKs before it serves its first request."""
+
+    def test_cold_boot_stays_within_budget(self):
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": "backend.settings", "PYTHONPATH": str(settings.BASE_DIR)}
+        boot = "import django; django.setup(); from django.urls import get_resolver; get_resolver().url_patterns"
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", boot],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, timeout=60,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        imports = re.findall(r"^import time:\s+(\d+) \|\s+\d+ \|\s+(\S+)$", result.stderr, re.M)
+        modules = {name for _, name in imports}
+        self.assertEqual([m for m in DEFERRED_IMPORTS if m in modules], [])
+        total_ms = sum(int(us) for us, _ in imports) / 1000
+        self.assertLess(total_ms, IMPORT_TIME_BUDGET_MS, f"cold boot imports took {total_ms:.0f}ms")
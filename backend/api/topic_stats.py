@@ -0,0 +1,88 @@
+"""
+Per-topic generate-course request counts, for demand-driven warming.
+
+record() only bumps an in-process counter. Pending counts are written to
+TopicRequestCount in one transaction once TOPIC_STATS_FLUSH_SECONDS have passed
+since the last flush (and when the process exits), so a request adds no write
+of its own. Counts that fail to flush are kept for the next attempt.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import TopicRequestCount
+
+logger = logging.getLogger('api')
+
+_pending = Counter()
+_queries = {}  # topic -> latest raw query
+_last_request = {}  # topic -> datetime
+_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+def record(topic, query):
+    """Count one request for the normalized `topic`, asked for as `query`."""
+    if not settings.TOPIC_STATS_ENABLED:
+        return
+    with _lock:
+        _pending[topic] += 1
+        _queries[topic] = query[:255]
+        _last_request[topic] = timezone.now()
+        due = time.monotonic() - _last_flush >= settings.TOPIC_STATS_FLUSH_SECONDS
+    if due:
+        flush()
+
+
+def pending():
+    with _lock:
+        return dict(_pending)
+
+
+def flush():
+    """Write pending counts to the database. Returns the number of topics written."""
+    global _last_flush
+    with _lock:
+        counts, queries, last_request = dict(_pending), dict(_queries), dict(_last_request)
+        _pending.clear()
+        _queries.clear()
+        _last_request.clear()
+        _last_flush = time.monotonic()
+    if not counts:
+        return 0
+    try:
+        with transaction.atomic():
+            TopicRequestCount.objects.bulk_create(
+                [TopicRequestCount(topic=topic[:255], query=queries[topic]) for topic in counts],
+                ignore_conflicts=True,
+            )
+            for topic, count in counts.items():
+                TopicRequestCount.objects.filter(topic=topic[:255]).update(
+                    requests=F("requests") + count,
+                    query=queries[topic],
+                    last_requested_at=last_request[topic],
+                )
+    except Exception as e:
+        logger.warning(f"Topic stats: flush of {len(counts)} topic(s) failed, keeping them for the next one: {e}")
+        with _lock:
+            for topic, count in counts.items():
+                _pending[topic] += count
+                _queries.setdefault(topic, queries[topic])
+                _last_request.setdefault(topic, last_request[topic])
+        return 0
+    return len(counts)
+
+
+@atexit.register
+def _flush_at_exit():
+    try:
+        flush()
+    except Exception:
+        pass
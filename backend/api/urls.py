@@ -1,15 +1,29 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 from .views_health import HealthCheckView
 
+if settings.ASYNC_VIEWS:
+    from . import views_async
+    generate_course_view = views_async.AsyncGenerateCourseView.as_view()
+    module_content_view = views_async.AsyncModuleContentView.as_view()
+    execute_code_view = views_async.AsyncCodeExecutionView.as_view()
+else:
+    generate_course_view = views.GenerateCourseView.as_view()
+    module_content_view = views.ModuleContentView.as_view()
+    execute_code_view = views.CodeExecutionView.as_view()
+
 urlpatterns = [
     path('health/', HealthCheckView.as_view(), name='health'),
-    path('generate-course/', views.GenerateCourseView.as_view(), name='generate-course'),
-    path('modules/<int:module_id>/content', views.ModuleContentView.as_view(), name='module-content'),
+    path('generate-course/', generate_course_view, name='generate-course'),
+    path('courses/', views.CourseListView.as_view(), name='course-list'),
+    path('modules/<int:module_id>/content', module_content_view, name='module-content'),
     path('quiz/<int:module_id>/', views.QuizView.as_view(), name='quiz'),
     path('quiz/<int:module_id>/submit/', views.SubmitQuizView.as_view(), name='submit-quiz'),
     path('validate-video/', views.ValidateVideoView.as_view(), name='validate-video'),
-    path('execute-code/', views.CodeExecutionView.as_view(), name='execute-code'),
+    path('execute-code/', execute_code_view, name='execute-code'),
+    path('execute-code/<uuid:token>/', views.CodeExecutionResultView.as_view(), name='execute-code-result'),
+    path('labs/<int:module_id>/<int:lab_index>/grade', views.LabGradeView.as_view(), name='lab-grade'),
     # Platform API
     path('auth/sync/', views.AuthSyncView.as_view(), name='auth-sync'),
     path('dashboard/', views.DashboardView.as_view(), name='dashboard'),
@@ -1,6 +1,10 @@
+from django.conf import settings
 from django.urls import path
 from .views_v1 import MentAIAskView
 
+if settings.ASYNC_VIEWS:
+    from .views_async import AsyncMentAIAskView as MentAIAskView
+
 urlpatterns = [
     path('ask', MentAIAskView.as_view(), name='ask-v1'),
 ]
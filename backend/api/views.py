@@ -5,117 +5,35 @@ import re
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.pagination import LimitOffsetPagination
 from django.http import HttpResponse
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from io import BytesIO
 from datetime import datetime
 from django.contrib.auth.models import User
-from .models import Course, Module, Video, Quiz, Progress
-from .serializers import CourseSerializer, ModuleSerializer
+from .models import Course, Module, Video, Progress
+from .serializers import (
+    CourseSerializer, CompactCourseSerializer,
+    parse_fieldset, projection_from_request, is_compact_schema, prefetch_lookups,
+)
 
 from django.shortcuts import get_object_or_404
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
 
 import threading
-from django.core.cache import cache
-from django.db import connection
-from django.db.utils import OperationalError
-
-
-def _get_course_by_topic(topic: str):
-    """Lookup course; reconnect once if Postgres dropped an idle SSL connection."""
-    try:
-        return Course.objects.filter(topic__iexact=topic).first()
-    except OperationalError:
-        connection.close()
-        return Course.objects.filter(topic__iexact=topic).first()
-
-
-MIN_MODULE_CONTENT_LEN = 100
-
-
-def _module_title_from_name(name: str) -> str:
-    if ": " in name:
-        return name.split(": ", 1)[1]
-    return name
-
-
-def _course_modules_lack_content(course) -> bool:
-    modules = list(course.modules.all())
-    if not modules:
-        return True
-    return any(
-        not mod.content or len(mod.content.strip()) < MIN_MODULE_CONTENT_LEN
-        for mod in modules
-    )
-
-
-def _normalize_quiz_list(quizzes):
-    if isinstance(quizzes, dict):
-        if "questions" in quizzes:
-            return quizzes["questions"]
-        if "quizzes" in quizzes:
-            return quizzes["quizzes"]
-        return []
-    return quizzes if isinstance(quizzes, list) else []
-
-
-def _save_module_quizzes(mod_obj, quizzes):
-    quizzes = _normalize_quiz_list(quizzes)
-    if not quizzes:
-        return
-    mod_obj.quizzes.all().delete()
-    for q in quizzes:
-        if isinstance(q, dict) and "question" in q:
-            correct_ans = q.get("answer") or q.get("correct_answer") or ""
-            Quiz.objects.create(
-                module=mod_obj,
-                question=q.get("question", "Invalid Question"),
-                options=q.get("options", []),
-                correct_answer=correct_ans,
-                explanation=q.get("explanation", ""),
-            )
-
-
-def _hydrate_course_modules(course, language, topic_type, topic_display):
-    """Backfill module theory/labs/quizzes when DB has outline-only rows (common on Render cache hits)."""
-    print(f"Hydrating empty module content for course id={course.id} topic={course.topic!r}")
-    for mod in course.modules.all():
-        if mod.content and len(mod.content.strip()) >= MIN_MODULE_CONTENT_LEN:
-            continue
-        title = _module_title_from_name(mod.name)
-        mod_num = mod.order or 1
-        mod.content = get_module_theory(language, title, mod_num)
-        mod.case_scenarios = get_mini_labs(language, title, mod_num, topic_type=topic_type)
-        mod.code_examples = get_prebuilt_code_examples(language, title, mod_num)
-        mod.save()
-        if not mod.quizzes.exists():
-            _save_module_quizzes(mod, get_module_quiz(language, topic_type, title, mod_num))
-
-
-def _build_course_response(course, metadata):
-    if _course_modules_lack_content(course):
-        _hydrate_course_modules(
-            course,
-            metadata["language"],
-            metadata["topic_type"],
-            course.title or course.topic,
-        )
-        course.status = "generated"
-        course.save(update_fields=["status"])
-    response_data = CourseSerializer(course).data
-    response_data["metadata"] = metadata
-    return response_data
+from contextlib import nullcontext
+from django.conf import settings
+from django.db.models import prefetch_related_objects
 
 
 # Module-level fallback cache for dev/local
 _course_cache = {}
 _cache_lock = threading.Lock()
 
+from . import content_library, execution_backends, execution_cache, judge0, preflight
+from .course_generation import (
+    claim_course_generation, create_course_full, ensure_module_content, prefetch_next_module, serialize_module,
+)
+from .execution_scheduler import QueueFull, client_key, get_scheduler
 from .languages import LanguageRegistry
 from .course_content import get_module_titles, get_prebuilt_code_examples, get_practice_problems, get_mini_labs, get_module_quiz, get_prebuilt_code_snippet, get_module_theory, get_mini_project, get_module_objectives
 from .topic_classifier import TopicClassifier
@@ -132,108 +50,23 @@ class GenerateCourseView(APIView):
                     "example": {"topic": "Java Programming"}
                 }, status=status.HTTP_400_BAD_REQUEST)
             
-            # 1. Fast normalized DB check
-            normalized_topic = raw_topic.strip().lower()
-
-            existing_course = _get_course_by_topic(normalized_topic)
-            if existing_course:
-                if request.data.get("force"):
-                    print(f"Force generation requested. Deleting existing course: {existing_course.id}")
-                    existing_course.delete()
-                    existing_course = None
-                elif existing_course.status == "generating":
-                    classification = TopicClassifier.classify(raw_topic)
-                    metadata = {
-                        "language": classification["language"],
-                        "execution_enabled": classification["execution_enabled"],
-                        "topic_type": classification["type"],
-                    }
-                    if existing_course.modules.exists() and _course_modules_lack_content(existing_course):
-                        print(f"Recovering stalled generation for course id={existing_course.id}")
-                        response_data = _build_course_response(existing_course, metadata)
-                        return Response(response_data, status=status.HTTP_200_OK)
-                    return Response({
-                        "message": "Course is currently being generated. Please wait.",
-                        "status": "generating"
-                    }, status=status.HTTP_202_ACCEPTED)
-                elif existing_course.status == "generated":
-                    print(f"Course {normalized_topic} found in DB. Returning existing structure.")
-                    classification = TopicClassifier.classify(raw_topic)
-                    metadata = {
-                        "language": classification["language"],
-                        "execution_enabled": classification["execution_enabled"],
-                        "topic_type": classification["type"],
-                    }
-                    response_data = _build_course_response(existing_course, metadata)
-                    return Response(response_data, status=status.HTTP_200_OK)
-
-            # 2. Input Intelligence & Standardization for new topic
-            classification = TopicClassifier.classify(raw_topic)
-            display_title = classification.get("display_title", raw_topic.title())
-            canonical_slug = classification["language"]
-            execution_enabled = classification["execution_enabled"]
-            topic_type = classification["type"]
-            
-            # Double check with classifier's display_title just in case it maps to an existing course
-            classifier_normalized = display_title.strip().lower()
-            existing_course = _get_course_by_topic(classifier_normalized)
-            if existing_course:
-                if request.data.get("force"):
-                    print(f"Force generation requested. Deleting existing course: {existing_course.id}")
-                    existing_course.delete()
-                    existing_course = None
-                elif existing_course.status == "generating":
-                    metadata = {
-                        "language": canonical_slug,
-                        "execution_enabled": execution_enabled,
-                        "topic_type": topic_type,
-                    }
-                    if existing_course.modules.exists() and _course_modules_lack_content(existing_course):
-                        print(f"Recovering stalled generation for course id={existing_course.id}")
-                        response_data = _build_course_response(existing_course, metadata)
-                        return Response(response_data, status=status.HTTP_200_OK)
-                    return Response({"message": "Course is currently being generated. Please wait.", "status": "generating"}, status=status.HTTP_202_ACCEPTED)
-                elif existing_course.status == "generated":
-                    metadata = {
-                        "language": canonical_slug,
-                        "execution_enabled": execution_enabled,
-                        "topic_type": topic_type,
-                    }
-                    response_data = _build_course_response(existing_course, metadata)
-                    return Response(response_data, status=status.HTTP_200_OK)
-
-            print(f"Generating new course for: {display_title} (Lang: {canonical_slug}, Exec: {execution_enabled})")
-
-            # 3. Lock course record to prevent concurrent generations
-            course_obj, created = Course.objects.get_or_create(
-                topic=classifier_normalized,
-                defaults={
-                    "title": display_title,
-                    "status": "generating"
-                }
-            )
-            
-            if not created and course_obj.status == "generating":
-                 return Response({"message": "Course is currently being generated. Please wait.", "status": "generating"}, status=status.HTTP_202_ACCEPTED)
-
-            course_obj.status = "generating"
-            course_obj.save()
-
-            # 4. Generate Course Structure and Full Content
-            course_data = self.create_course_full(
-                course_obj,
-                display_title,
-                language=canonical_slug, 
-                execution_enabled=execution_enabled,
-                topic_type=topic_type
-            )
-            
-            course_data["metadata"] = {
-                "language": canonical_slug,
-                "execution_enabled": execution_enabled,
-                "topic_type": topic_type
-            }
-            
+            answered, job = claim_course_generation(raw_topic, request.data, request)
+            if answered:
+                body, status_code = answered
+                return Response(body, status=status_code)
+
+            # 3. Generate Course Structure and Full Content (or just the outline in lazy mode)
+            metadata = job["metadata"]
+            with job["lease"]:
+                course_data = self.create_course_full(
+                    job["course"],
+                    job["topic"],
+                    language=metadata["language"],
+                    execution_enabled=metadata["execution_enabled"],
+                    topic_type=metadata["topic_type"],
+                    generation_mode=metadata["generation_mode"]
+                )
+            course_data["metadata"] = metadata
             return Response(course_data, status=status.HTTP_201_CREATED)
 
         except ValueError as ve:
@@ -250,196 +83,21 @@ class GenerateCourseView(APIView):
                 "details": "An unexpected error occurred while generating the course"
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    def create_course_full(self, course_obj, topic, language=None, execution_enabled=True, topic_type="EXECUTABLE"):
-        """Dynamic course generation using Hybrid Multi-LLM Orchestrator and Full Content Pre-population"""
+    def create_course_full(self, course_obj, topic, language=None, execution_enabled=True, topic_type="EXECUTABLE", generation_mode="full", orchestrator=None):
+        """Dynamic course generation using Hybrid Multi-LLM Orchestrator and Full Content Pre-population.
+
+        In "lazy" mode only the outline is persisted; module content is hydrated on demand.
+        See `course_generation.create_course_full`.
+        """
         if not language:
             language = self.detect_programming_language(topic)
-            
-        try:
-            from .ai_orchestrator import AIOrchestrator
-            import concurrent.futures
-            orchestrator = AIOrchestrator()
-            
-            course_outline = None
-            try:
-                print(f"Attempting valid Multi-LLM AI structure generation for: {topic}")
-                course_outline = orchestrator.generate_course_structure(topic, language)
-            except Exception as ex_struct:
-                print(f"[Offline Fallback] AI structure generation failed: {ex_struct}")
-
-            # If AI structure generation failed, was empty, or had 0 modules, use offline fallback curriculum
-            if not course_outline or "modules" not in course_outline or len(course_outline["modules"]) == 0:
-                print(f"[Offline Fallback] Generating prebuilt curriculum outline for {topic} ({language})")
-                titles = get_module_titles(language)
-                if not titles:
-                    # If we don't have a syllabus for this language, try matching a standard language or create generic titles
-                    titles = [
-                        "Introduction and Development Environment",
-                        "Language Fundamentals: Variables and Data Types",
-                        "Control Flow: Conditionals and Loops",
-                        "Functions and Scope",
-                        "Data Structures and Collections",
-                        "Object-Oriented Programming and Core Concepts",
-                        "Advanced Language Features",
-                        "Exception Handling and File I/O",
-                        "Testing and Debugging",
-                        "Projects and Best Practices"
-                    ]
-                
-                course_outline = {
-                    "course_title": f"Complete {topic} Programming",
-                    "course_description": f"A comprehensive course covering {topic} from fundamentals to advanced applications with hands-on labs and interactive quizzes.",
-                    "modules": [
-                        {
-                            "module_number": idx + 1,
-                            "title": title,
-                            "description": f"Master the concepts of {title.lower()} with detailed theory, exercises, and assessments.",
-                            "learning_objectives": [f"Understand {title.lower()}", f"Apply {title.lower()} in real-world scenarios"],
-                            "difficulty": "Beginner" if idx < 3 else "Intermediate" if idx < 7 else "Advanced"
-                        }
-                        for idx, title in enumerate(titles)
-                    ]
-                }
-
-            if course_outline and "modules" in course_outline and len(course_outline["modules"]) > 0:
-                # Update Course details
-                course_obj.title = course_outline.get("course_title", f"Course on {topic}")
-                course_obj.content = course_outline.get("course_description", f"A comprehensive course covering {topic}.")
-                course_obj.save()
-                
-                # Save Modules structure immediately
-                modules_to_create = []
-                for mod in course_outline["modules"]:
-                    mod_num = mod.get("module_number", 0)
-                    module = Module.objects.create(
-                        course=course_obj,
-                        name=f"Module {mod_num}: {mod['title']}",
-                        description=mod.get("description", ""),
-                        difficulty=mod.get("difficulty", "beginner").lower(),
-                        order=mod_num,
-                        content=""
-                    )
-                    modules_to_create.append({"obj": module, "title": mod["title"], "num": mod_num})
-
-                # Parallel Generate Full Content
-                def generate_module_content(mod_data):
-                    mod_obj = mod_data["obj"]
-                    print(f"START generating module: {mod_data['title']}")
-                    try:
-                        # Generate theory, labs, quizzes
-                        module_content = orchestrator.generate_complete_module(
-                            topic=topic,
-                            language=language,
-                            module_title=mod_data["title"],
-                            module_number=mod_data["num"]
-                        )
-                        
-                        # Validate generated content. If it lacks theory, quizzes, or labs, use fallback
-                        if not module_content or not module_content.get("theory") or len(module_content.get("theory")) < 100:
-                            print(f"[Offline Fallback] AI theory too short or missing for module: {mod_data['title']}")
-                            raise ValueError("Invalid theory content")
-                            
-                        # Field-by-field robust fallback for other parts if AI returned empty collections due to rate limits
-                        quizzes = module_content.get("quizzes", [])
-                        quizzes_list = []
-                        if isinstance(quizzes, dict):
-                            if "questions" in quizzes:
-                                quizzes_list = quizzes["questions"]
-                            elif "quizzes" in quizzes:
-                                quizzes_list = quizzes["quizzes"]
-                        elif isinstance(quizzes, list):
-                            quizzes_list = quizzes
-                            
-                        if not quizzes_list:
-                            print(f"[Offline Fallback] AI quizzes empty/missing for module: {mod_data['title']}. Using prebuilt fallback quizzes.")
-                            module_content["quizzes"] = get_module_quiz(language, topic_type, mod_data["title"], mod_data["num"])
-                            
-                        if not module_content.get("mini_labs"):
-                            print(f"[Offline Fallback] AI mini_labs empty/missing for module: {mod_data['title']}. Using prebuilt fallback mini labs.")
-                            module_content["mini_labs"] = get_mini_labs(language, mod_data["title"], mod_data["num"], topic_type=topic_type)
-                            
-                        if not module_content.get("code_examples"):
-                            print(f"[Offline Fallback] AI code_examples empty/missing for module: {mod_data['title']}. Using prebuilt fallback code examples.")
-                            module_content["code_examples"] = get_prebuilt_code_examples(language, mod_data["title"], mod_data["num"])
-                            
-                        print(f"Generated content keys: {module_content.keys()}")
-                        print(f"Theory length: {len(module_content.get('theory', ''))}")
-                        print(f"Quiz count: {len(module_content.get('quizzes', []))}")
-                        return {"mod_obj": mod_obj, "content": module_content}
-                    except Exception as e:
-                        print(f"Module generation failed or was empty: {e}")
-                        print(f"[Offline Fallback] Populating offline fallback for module: {mod_data['title']}")
-                        
-                        # Generate fallback content from our prebuilt course_content library
-                        fallback_theory = get_module_theory(language, mod_data["title"], mod_data["num"])
-                        fallback_labs = get_mini_labs(language, mod_data["title"], mod_data["num"], topic_type=topic_type)
-                        fallback_quiz = get_module_quiz(language, topic_type, mod_data["title"], mod_data["num"])
-                        fallback_code_examples = get_prebuilt_code_examples(language, mod_data["title"], mod_data["num"])
-                        
-                        module_content = {
-                            "theory": fallback_theory,
-                            "mini_labs": fallback_labs,
-                            "code_examples": fallback_code_examples,
-                            "quizzes": fallback_quiz
-                        }
-                        
-                        print(f"[Offline Fallback] Completed fallback population. Quiz count: {len(fallback_quiz)}")
-                        return {"mod_obj": mod_obj, "content": module_content}
-
-                print(f"Starting paced content generation for {len(modules_to_create)} modules...")
-                results = []
-                for mod in modules_to_create:
-                    results.append(generate_module_content(mod))
-
-                # Safely execute all database writes synchronously to avoid "database is locked" in SQLite
-                print("Parallel generation complete. Saving to database...")
-                for res in results:
-                    mod_obj = res["mod_obj"]
-                    module_content = res["content"]
-                    
-                    # Update Module
-                    mod_obj.content = module_content.get("theory", "")
-                    mod_obj.case_scenarios = module_content.get("mini_labs", [])
-                    mod_obj.code_examples = module_content.get("code_examples", [])
-                    mod_obj.save()
-                    
-                    # Create Quizzes
-                    quizzes = module_content.get("quizzes", [])
-                    if isinstance(quizzes, dict):
-                        if "questions" in quizzes:
-                            quizzes = quizzes["questions"]
-                        elif "quizzes" in quizzes:
-                            quizzes = quizzes["quizzes"]
-                        else:
-                            quizzes = []
-                    
-                    if isinstance(quizzes, list):
-                        for q in quizzes:
-                            if isinstance(q, dict) and "question" in q:
-                                correct_ans = q.get("answer") or q.get("correct_answer") or ""
-                                Quiz.objects.create(
-                                    module=mod_obj,
-                                    question=q.get("question", "Invalid Question"),
-                                    options=q.get("options", []),
-                                    correct_answer=correct_ans,
-                                    explanation=q.get("explanation", "")
-                                )
-
-                # Mark as Generated
-                course_obj.status = "generated"
-                course_obj.save()
-
-                serializer = CourseSerializer(course_obj)
-                return serializer.data
-            else:
-                raise ValueError("Failed to generate course structure. AI returned empty or invalid response.")
-        except Exception as e:
-            import traceback
-            tb = traceback.format_exc()
-            print(f"[Backend Error] Exception in create_course_full: {tb}")
-            course_obj.status = "failed"
-            course_obj.save()
-            raise ValueError(f"AI Content Generation Failed: {e}")
+        return create_course_full(
+            course_obj, topic, language,
+            topic_type=topic_type,
+            generation_mode=generation_mode,
+            orchestrator=orchestrator,
+            request=getattr(self, "request", None),
+        )
 
     def generate_unique_module_content(self, language, module_title, module_number, difficulty, module_index, topic="", topic_type="EXECUTABLE"):
         """Generate unique, context-specific content for each module"""
@@ -2027,77 +1685,19 @@ class GenerateCourseView(APIView):
             raise ValueError("Module title is required for quiz generation.")
         module_lower = module_title.lower()
 
-        # Define key concepts for common module types (expandable)
-        concept_map = {
-            'python': {
-                'control flow': [
-                    ("Which keyword is used for a conditional statement in Python?", ["if", "when", "cond", "switch"], "if", "'if' is used for conditionals in Python."),
-                    ("Which statement is used to exit a loop early?", ["break", "stop", "exit", "return"], "break", "'break' exits a loop early in Python."),
-                    ("What is the output of: for i in range(3): print(i)?", ["0 1 2", "1 2 3", "0 1 2 3", "1 2"], "0 1 2", "range(3) produces 0, 1, 2."),
-                    ("Which loop is best for iterating over a list?", ["for", "while", "do-while", "loop"], "for", "'for' is used to iterate over lists in Python."),
-                    ("Which keyword is used for an else-if condition in Python?", ["elif", "elseif", "else if", "elseif()"], "elif", "'elif' is the correct syntax for else-if in Python."),
-                    ("What does the 'continue' statement do in a loop?", ["Skip to next iteration", "Exit the loop", "Skip the entire loop", "Restart the loop"], "Skip to next iteration", "'continue' skips the current iteration and continues with the next."),
-                    ("Which operator is used for exponentiation in Python?", ["**", "^", "pow", "exp"], "**", "** is the exponentiation operator in Python."),
-                    ("What is the result of 5 // 2 in Python?", ["2", "2.5", "2.0", "3"], "2", "// performs integer division in Python."),
-                    ("Which function is used to get the length of a list?", ["len()", "length()", "size()", "count()"], "len()", "len() returns the number of items in a list."),
-                    ("What is the correct way to check if a key exists in a dictionary?", ["if key in dict", "if dict.has_key(key)", "if dict.contains(key)", "if dict[key]"], "if key in dict", "Use 'in' operator to check if a key exists in a dictionary.")
-                ],
-                'oop': [
-                    ("Which keyword is used to define a class in Python?", ["class", "object", "struct", "type"], "class", "'class' is used to define classes in Python."),
-                    ("What is the first parameter of instance methods in Python?", ["self", "this", "cls", "obj"], "self", "'self' refers to the instance in Python methods."),
-                    ("How do you create an object from a class?", ["obj = MyClass()", "obj = new MyClass()", "obj = MyClass.create()", "obj = class MyClass()"], "obj = MyClass()", "Use MyClass() to instantiate an object."),
-                    ("Which method is called when an object is created?", ["__init__", "__new__", "__create__", "__start__"], "__init__", "__init__ is the constructor method."),
-                    ("Which decorator is used for static methods?", ["@staticmethod", "@classmethod", "@property", "@static"], "@staticmethod", "@staticmethod defines a static method in a class."),
-                    ("What is inheritance in Python?", ["A class can inherit from another class", "A function can inherit from another function", "A variable can inherit from another variable", "A module can inherit from another module"], "A class can inherit from another class", "Inheritance allows a class to inherit attributes and methods from another class."),
-                    ("Which method is used to represent an object as a string?", ["__str__", "__repr__", "__string__", "__format__"], "__str__", "__str__ returns a string representation of the object."),
-                    ("What is encapsulation in OOP?", ["Bundling data and methods that operate on that data", "Creating multiple objects", "Inheriting from multiple classes", "Creating abstract classes"], "Bundling data and methods that operate on that data", "Encapsulation bundles data and methods together in a class."),
-                    ("Which keyword is used for method overriding?", ["No special keyword needed", "override", "overwrite", "redefine"], "No special keyword needed", "Python automatically overrides methods when you define them in a subclass."),
-                    ("What is polymorphism in Python?", ["The ability to use different classes through a common interface", "Creating multiple objects", "Inheriting from multiple classes", "Creating abstract classes"], "The ability to use different classes through a common interface", "Polymorphism allows different classes to be used through a common interface.")
-                ],
-                # Add more mappings for other module types as needed
-            },
-            'java': {
-                'control flow': [
-                    ("Which keyword is used for a conditional statement in Java?", ["if", "when", "cond", "switch"], "if", "'if' is used for conditionals in Java."),
-                    ("Which statement is used to exit a loop early in Java?", ["break", "stop", "exit", "return"], "break", "'break' exits a loop early in Java."),
-                    ("What is the output of: for(int i=0;i<3;i++) System.out.print(i);?", ["012", "123", "0123", "01 2"], "012", "The loop prints 0, 1, 2."),
-                    ("Which loop is best for iterating over an array?", ["for", "while", "do-while", "loop"], "for", "'for' is used to iterate over arrays in Java."),
-                    ("Which keyword is used for an else-if condition in Java?", ["else if", "elif", "elseif", "elseif()"], "else if", "'else if' is the correct syntax in Java."),
-                    ("What does the 'continue' statement do in a Java loop?", ["Skip to next iteration", "Exit the loop", "Skip the entire loop", "Restart the loop"], "Skip to next iteration", "'continue' skips the current iteration and continues with the next."),
-                    ("Which loop executes at least once?", ["do-while", "while", "for", "foreach"], "do-while", "do-while loop executes the body at least once before checking the condition."),
-                    ("What is the result of 5 / 2 in Java?", ["2", "2.5", "2.0", "3"], "2", "Integer division in Java truncates the decimal part."),
-                    ("Which operator is used for logical AND in Java?", ["&&", "&", "and", "AND"], "&&", "&& is the logical AND operator in Java."),
-                    ("What is the purpose of the 'switch' statement?", ["Execute different code based on a value", "Create a loop", "Define a method", "Create an object"], "Execute different code based on a value", "Switch statement executes different code blocks based on a variable's value.")
-                ],
-                'oop': [
-                    ("Which keyword is used to define a class in Java?", ["class", "object", "struct", "type"], "class", "'class' is used to define classes in Java."),
-                    ("What is the first parameter of instance methods in Java?", ["this", "self", "cls", "obj"], "this", "'this' refers to the instance in Java methods."),
-                    ("How do you create an object from a class?", ["MyClass obj = new MyClass();", "obj = MyClass()", "MyClass.create()", "class MyClass()"], "MyClass obj = new MyClass();", "Use new MyClass() to instantiate an object in Java."),
-                    ("Which method is called when an object is created?", ["constructor", "__init__", "init", "start"], "constructor", "The constructor is called when an object is created in Java."),
-                    ("Which annotation is used for overriding methods?", ["@Override", "@Overload", "@Overriding", "@Method"], "@Override", "@Override is used to indicate a method override in Java."),
-                    ("What is inheritance in Java?", ["A class can inherit from another class", "A method can inherit from another method", "A variable can inherit from another variable", "A package can inherit from another package"], "A class can inherit from another class", "Inheritance allows a class to inherit attributes and methods from another class."),
-                    ("Which keyword is used to prevent inheritance?", ["final", "static", "private", "protected"], "final", "final keyword prevents a class from being inherited."),
-                    ("What is encapsulation in Java?", ["Bundling data and methods that operate on that data", "Creating multiple objects", "Inheriting from multiple classes", "Creating abstract classes"], "Bundling data and methods that operate on that data", "Encapsulation bundles data and methods together in a class."),
-                    ("Which access modifier allows access within the same package?", ["default", "public", "private", "protected"], "default", "Default access modifier allows access within the same package."),
-                    ("What is polymorphism in Java?", ["The ability to use different classes through a common interface", "Creating multiple objects", "Inheriting from multiple classes", "Creating abstract classes"], "The ability to use different classes through a common interface", "Polymorphism allows different classes to be used through a common interface.")
-                ],
-                # Add more mappings for other module types as needed
-            }
-            # Add more languages as needed
-        }
-
         lang_key = language.lower()
         # Try to match module type from title
         module_type = None
-        for key in concept_map.get(lang_key, {}):
+        concepts = content_library.section(lang_key, "concepts")
+        for key in concepts:
             if key in module_lower:
                 module_type = key
                 break
         # If no mapping, generate generic but language-specific questions
         questions = []
         if module_type:
-            for q, opts, correct, expl in concept_map[lang_key][module_type]:
-                opts_shuffled = opts[:]
+            for q, opts, correct, expl in concepts[module_type]:
+                opts_shuffled = list(opts)
                 random.shuffle(opts_shuffled)
                 correct_label = ['a)', 'b)', 'c)', 'd)'][opts_shuffled.index(correct)]
                 labeled_options = [f"{label} {opt}" for label, opt in zip(['a)', 'b)', 'c)', 'd)'], opts_shuffled)]
@@ -2277,92 +1877,127 @@ class ValidateVideoView(APIView):
             return Response({"valid": False, "error": str(e)}, status=200)
 
 
+def _prepare_code_execution(data, allow_local=False):
+    """
+    Validate an execute-code request and build its Judge0 submission.
+    With `allow_local`, languages served by a local execution backend do not need a Judge0 key.
+
+    Returns (judge0_payload, None), or (None, (error_body, status_code)).
+    """
+    code = data.get('code')
+    topic = data.get('topic') # New: Get topic from request
+
+    print(f"[CodeExecutionView] Incoming request: code={code}, topic={topic}")
+
+    if not code:
+        print("[CodeExecutionView] Error: Code is required")
+        return None, ({"error": "Code is required"}, 400)
+
+    if not topic:
+        print("[CodeExecutionView] Error: Topic is required for language classification")
+        return None, ({"error": "Topic is required"}, 400)
+
+    # Classify the topic to determine the language for execution
+    try:
+        classification = TopicClassifier.classify(topic)
+        language = classification["language"] # This is the "syntax highlighting" language
+        execution_enabled = classification["execution_enabled"]
+        topic_type = classification["type"]
+
+        print(f"[CodeExecutionView] Topic Classified: {classification}")
+
+        if not execution_enabled:
+            return None, ({"error": f"Code execution is not enabled for topic type: {topic_type}"}, 400)
+
+    except Exception as e:
+        print(f"[CodeExecutionView] Error classifying topic: {str(e)}")
+        return None, ({"error": "Error classifying topic", "details": str(e)}, 500)
+
+    # Map language to Judge0 language_id using Registry and Topic
+    # Ideally 'language' variable holds the normalized language key (e.g. 'python', 'rust')
+    language_id = LanguageRegistry.get_language_id(language)
+    if not language_id:
+        return None, ({"error": f"Unsupported language: {language}"}, 400)
+
+    # --- Judge0 API via RapidAPI ---
+    runs_locally = allow_local and execution_backends.get_backend(language_id).local
+    missing_credentials = None if runs_locally else judge0.missing_credentials()
+    if missing_credentials:
+        return None, ({"error": missing_credentials}, 500)
+
+    stdin = data.get('stdin', '')
+    return {
+        "language_id": language_id,
+        "source_code": code,
+        "stdin": stdin or ""
+    }, None
+
+
+EXECUTION_MODES = ("sync", "async")
+
+
+def _resolve_execution_mode(data):
+    """Per-request `execution_mode` wins over the deployment default."""
+    mode = str(data.get("execution_mode") or settings.CODE_EXECUTION_MODE).strip().lower()
+    return mode if mode in EXECUTION_MODES else "sync"
+
+
+def _execution_slot(backend, request):
+    """Judge0 runs wait for a fair slot from the execution scheduler; local runs go straight through."""
+    if backend.local:
+        return nullcontext()
+    return get_scheduler().slot(client_key(request))
+
+
+def _queue_full_response(error):
+    print(f"[CodeExecutionView] Rejected: {error} (retry after {error.retry_after}s)")
+    return {
+        "error": "Too many code runs right now, please try again shortly",
+        "details": str(error),
+        "retry_after": error.retry_after,
+    }, 429, {"Retry-After": str(error.retry_after)}
+
+
 @method_decorator(csrf_exempt, name='dispatch')
 class CodeExecutionView(APIView):
+    """
+    Runs code on the execution backend picked for its language (Judge0 unless
+    CODE_EXECUTION_BACKEND routes it to a local runtime). In "async" execution mode
+    (`"execution_mode": "async"` or CODE_EXECUTION_MODE) a Judge0 run is queued and its
+    token returned immediately; poll `GET /api/execute-code/<token>/` for the result
+    instead of holding this worker. Local runs always answer directly. Code that fails
+    a local pre-flight check (`preflight`, e.g. a Python syntax error) never leaves
+    the server.
+    """
     def post(self, request):
-        code = request.data.get('code')
-        topic = request.data.get('topic') # New: Get topic from request
-        
-        print(f"[CodeExecutionView] Incoming request: code={code}, topic={topic}")
-        
-        if not code:
-            print("[CodeExecutionView] Error: Code is required")
-            return Response({"error": "Code is required"}, status=400)
-        
-        if not topic:
-            print("[CodeExecutionView] Error: Topic is required for language classification")
-            return Response({"error": "Topic is required"}, status=400)
-
-        # Classify the topic to determine the language for execution
         try:
-            classification = TopicClassifier.classify(topic)
-            language = classification["language"] # This is the "syntax highlighting" language
-            execution_enabled = classification["execution_enabled"]
-            topic_type = classification["type"]
-            
-            print(f"[CodeExecutionView] Topic Classified: {classification}")
-
-            if not execution_enabled:
-                return Response({"error": f"Code execution is not enabled for topic type: {topic_type}"}, status=400)
+            judge0_payload, error = _prepare_code_execution(request.data, allow_local=True)
+            if error:
+                body, status_code = error
+                return Response(body, status=status_code)
 
-        except Exception as e:
-            print(f"[CodeExecutionView] Error classifying topic: {str(e)}")
-            return Response({"error": "Error classifying topic", "details": str(e)}, status=500)
-        
-        try:
-            # --- Judge0 API via RapidAPI ---
-            print('RAPIDAPI_KEY from env:', os.getenv('RAPIDAPI_KEY'))
-            RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")
-            RAPIDAPI_HOST = "judge0-ce.p.rapidapi.com"
-            if not RAPIDAPI_KEY:
-                return Response({"error": "Judge0 RapidAPI key not configured on server"}, status=500)
-
-            # Map language to Judge0 language_id using Registry and Topic
-            # Determine effective language from registry based on the topic classification result
-            # Ideally 'language' variable holds the normalized language key (e.g. 'python', 'rust')
-            language_id = LanguageRegistry.get_language_id(language)
-            
-            if not language_id:
-                # Try to fuzzy match if exact match failed
-                if not language_id:
-                    # Very simple fuzzy match fallback specific for this view if needed
-                    # But ideally frontend sends correct key
-                    pass
-                
-            if not language_id:
-                return Response({"error": f"Unsupported language: {language}"}, status=400)
-
-            stdin = request.data.get('stdin', '')
-            judge0_payload = {
-                "language_id": language_id,
-                "source_code": code,
-                "stdin": stdin or ""
-            }
+            rejected = preflight.check(judge0_payload)
+            if rejected is not None:
+                return Response(rejected, status=200, headers={"X-Execution-Preflight": "rejected"})
 
             try:
-                judge0_res = requests.post(
-                    f"https://{RAPIDAPI_HOST}/submissions?base64_encoded=false&wait=true",
-                    headers={
-                        "content-type": "application/json",
-                        "X-RapidAPI-Key": RAPIDAPI_KEY,
-                        "X-RapidAPI-Host": RAPIDAPI_HOST
-                    },
-                    json=judge0_payload
-                )
-                print(f"[CodeExecutionView] Judge0 status: {judge0_res.status_code}, response: {judge0_res.text}")
-                if judge0_res.status_code != 200:
-                    return Response({"error": "Judge0 error", "details": judge0_res.text}, status=judge0_res.status_code)
-                data = judge0_res.json()
-                # Compose output
-                output = {
-                    "stdout": data.get("stdout", ""),
-                    "stderr": data.get("stderr", ""),
-                    "compile_output": data.get("compile_output", ""),
-                    "status": data.get("status", {}),
-                    "time": data.get("time"),
-                    "memory": data.get("memory")
-                }
-                return Response(output, status=200)
+                backend = execution_backends.get_backend(judge0_payload["language_id"])
+                wait = backend.local or _resolve_execution_mode(request.data) == "sync"
+                if wait and not backend.local:
+                    cached = execution_cache.lookup(judge0_payload)
+                    if cached is not None:
+                        return Response(cached, status=200, headers={"X-Execution-Cache": "hit"})
+                with _execution_slot(backend, request):
+                    body, status_code = backend.execute(judge0_payload, wait=wait)
+                if wait and not backend.local and status_code == 200:
+                    execution_cache.store(judge0_payload, body)
+                return Response(body, status=status_code)
+            except QueueFull as e:
+                body, status_code, headers = _queue_full_response(e)
+                return Response(body, status=status_code, headers=headers)
+            except requests.Timeout as e:
+                print(f"[CodeExecutionView] Judge0 timeout: {str(e)}")
+                return Response({"error": "Judge0 timed out", "details": str(e)}, status=504)
             except Exception as e:
                 print(f"[CodeExecutionView] Judge0 exception: {str(e)}")
                 return Response({"error": "Error connecting to Judge0", "details": str(e)}, status=500)
@@ -2372,6 +2007,139 @@ class CodeExecutionView(APIView):
             return Response({"error": "Error executing code", "details": str(e)}, status=500)
 
 
+def _normalize_output(text):
+    """Compare program output ignoring trailing whitespace on each line and at the end."""
+    return "\n".join(line.rstrip() for line in (text or "").rstrip().splitlines())
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class LabGradeView(APIView):
+    """
+    Grades `code` against a lab's hidden test cases. Every case is queued with a single
+    Judge0 `/submissions/batch` call and outputs are compared here, so expected outputs
+    never reach the client. The batch waits for an execution slot like a run does
+    and answers 429 with Retry-After when the queue is full.
+    """
+    def post(self, request, module_id, lab_index):
+        module = get_object_or_404(Module.objects.select_related("course"), id=module_id)
+        labs = module.case_scenarios or []
+        if lab_index >= len(labs) or not isinstance(labs[lab_index], dict):
+            return Response({"error": "Lab not found"}, status=404)
+        test_cases = labs[lab_index].get("test_cases") or []
+        if not test_cases:
+            return Response({"error": "This lab has no test cases to grade against"}, status=400)
+
+        course = module.course
+        judge0_payload, error = _prepare_code_execution({
+            "code": request.data.get("code"),
+            "topic": course.topic or course.title or "general",
+        })
+        if error:
+            body, status_code = error
+            return Response(body, status=status_code)
+
+        rejected = preflight.check(judge0_payload)
+        if rejected is not None:
+            # Code that cannot compile fails every case the same way; no need to ask Judge0
+            outputs = [rejected] * len(test_cases)
+        else:
+            submissions = [
+                {**judge0_payload, "stdin": case.get("stdin", ""), "expected_output": case.get("expected_output", "")}
+                for case in test_cases
+            ]
+            try:
+                # The whole batch takes one slot from the same admission control as execute-code
+                with get_scheduler().slot(client_key(request)):
+                    tokens = judge0.submit_batch(submissions)
+                    results = judge0.wait_for_batch(tokens, settings.JUDGE0_GRADE_TIMEOUT)
+            except QueueFull as e:
+                body, status_code, headers = _queue_full_response(e)
+                return Response(body, status=status_code, headers=headers)
+            except requests.Timeout as e:
+                print(f"[LabGradeView] Judge0 timeout: {str(e)}")
+                return Response({"error": "Judge0 timed out", "details": str(e)}, status=504)
+            except Exception as e:
+                print(f"[LabGradeView] Judge0 exception: {str(e)}")
+                return Response({"error": "Error connecting to Judge0", "details": str(e)}, status=500)
+            outputs = [results.get(token) or {} for token in tokens]
+
+        cases = []
+        for number, (case, result) in enumerate(zip(test_cases, outputs), start=1):
+            finished = bool(result) and not judge0.is_pending(result)
+            cases.append({
+                "case": number,
+                "passed": finished and _normalize_output(result.get("stdout")) == _normalize_output(case.get("expected_output")),
+                **judge0.judge0_output(result),
+            })
+        passed = sum(case["passed"] for case in cases)
+        return Response({
+            "module_id": module.id,
+            "lab_index": lab_index,
+            "passed": passed,
+            "total": len(cases),
+            "all_passed": passed == len(cases),
+            "results": cases,
+        }, status=200)
+
+
+class CodeExecutionResultView(APIView):
+    """Result of a queued run: 202 while Judge0 is still queueing/running it, 200 once done."""
+    def get(self, request, token):
+        token = str(token)
+        try:
+            data = judge0.poll_result(token)
+        except requests.Timeout as e:
+            print(f"[CodeExecutionResultView] Judge0 timeout: {str(e)}")
+            return Response({"error": "Judge0 timed out", "details": str(e)}, status=504)
+        except Exception as e:
+            print(f"[CodeExecutionResultView] Judge0 exception: {str(e)}")
+            return Response({"error": "Error connecting to Judge0", "details": str(e)}, status=500)
+        if data is None:
+            return Response({"error": "Unknown submission token"}, status=404)
+        output = {"token": token, **judge0.judge0_output(data)}
+        return Response(output, status=202 if judge0.is_pending(data) else 200)
+
+
+# Course list fields when the request asks for no projection of its own
+COURSE_LIST_DEFAULT_FIELDS = "id,title,topic,status"
+
+
+class CoursePagination(LimitOffsetPagination):
+    """`?limit=`/`?offset=` pages of the course list, kept under the `courses` key."""
+
+    def __init__(self):
+        self.default_limit = settings.COURSE_LIST_PAGE_SIZE
+        self.max_limit = settings.COURSE_LIST_MAX_PAGE_SIZE
+
+    def get_paginated_response(self, data):
+        return Response({
+            "count": self.count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "courses": data,
+        }, status=status.HTTP_200_OK)
+
+
+class CourseListView(APIView):
+    """
+    Lists persisted courses, newest first, a page at a time (`?limit=`, `?offset=`).
+
+    Without `?fields=` or `?include=` each course is only its id, title, topic and
+    status; the same projections as the course endpoints ask for more, e.g.
+    `?fields=id,title,modules.name` or `?include=status` for whole courses.
+    """
+    def get(self, request):
+        projection = projection_from_request(request)
+        if not projection["fields"] and not projection["include"]:
+            projection["fields"] = parse_fieldset(COURSE_LIST_DEFAULT_FIELDS)
+        serializer_class = CompactCourseSerializer if is_compact_schema(request) else CourseSerializer
+        paginator = CoursePagination()
+        page = paginator.paginate_queryset(Course.objects.order_by("-created_at", "-id"), request, view=self)
+        serializer = serializer_class(page, many=True, **projection)
+        prefetch_related_objects(page, *prefetch_lookups(serializer.child))
+        return paginator.get_paginated_response(serializer.data)
+
+
 class QuizView(APIView):
     def get(self, request, module_id):
         try:
@@ -2548,77 +2316,20 @@ class UpdateProgressView(APIView):
         
         return Response({"status": "updated"}, status=200)
 
-from django.db import transaction
-
 class ModuleContentView(APIView):
     def get(self, request, module_id):
         module = get_object_or_404(Module, id=module_id)
         
         # If content already exists, return
         if module.content:
-            serializer = ModuleSerializer(module)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            prefetch_next_module(module)
+            return Response(serialize_module(module, request), status=status.HTTP_200_OK)
 
-        # Content does not exist, trigger AI Generation with lock
+        # Content does not exist (outline-first course), trigger AI Generation with lock
         try:
-            with transaction.atomic():
-                # Lock the module row to prevent concurrent generations
-                module = Module.objects.select_for_update().get(id=module_id)
-                if module.content:
-                    serializer = ModuleSerializer(module)
-                    return Response(serializer.data, status=status.HTTP_200_OK)
-
-                from .ai_orchestrator import AIOrchestrator
-                orchestrator = AIOrchestrator()
-                
-                # Fetch topic language for generation
-                course = module.course
-                classification = TopicClassifier.classify(course.topic)
-                language = classification.get("language", "general")
-                
-                print(f"Generating content for Module ID {module_id}: {module.name}")
-                module_content = orchestrator.generate_complete_module(
-                    course.topic, 
-                    language, 
-                    module.name, 
-                    module.order
-                )
-
-                if module_content:
-                    module.content = module_content.get('theory', '') # Theory content mapped from AI
-                    
-                    # Store Code Labs
-                    if module_content.get('mini_labs'):
-                        module.case_scenarios = module_content.get('mini_labs')
-                    elif module_content.get('code_examples'):
-                        module.code_examples = module_content.get('code_examples')
-                        
-                    module.save()
-                    
-                    # Store Quizzes
-                    quizzes = module_content.get('quizzes', [])
-                    if isinstance(quizzes, dict):
-                        if 'questions' in quizzes:
-                            quizzes = quizzes['questions']
-                        elif 'quizzes' in quizzes:
-                            quizzes = quizzes['quizzes']
-                        else:
-                            quizzes = []
-                            
-                    if isinstance(quizzes, list):
-                        for q in quizzes:
-                            if isinstance(q, dict) and 'question' in q:
-                                correct_ans = q.get('answer') or q.get('correct_answer') or ''
-                                Quiz.objects.create(
-                                    module=module,
-                                    question=q.get('question', ''),
-                                    options=q.get('options', []),
-                                    correct_answer=correct_ans,
-                                    explanation=q.get('explanation', '')
-                                )
-                
-                serializer = ModuleSerializer(module)
-                return Response(serializer.data, status=status.HTTP_200_OK)
+            module = ensure_module_content(module_id)
+            prefetch_next_module(module)
+            return Response(serialize_module(module, request), status=status.HTTP_200_OK)
 
         except Exception as e:
             import traceback
@@ -2628,4 +2339,3 @@ class ModuleContentView(APIView):
                 "error": "Failed to generate module content",
                 "details": str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
@@ -0,0 +1,316 @@
+"""
+Async variants of the I/O-bound endpoints, routed in place of the DRF views when
+ASYNC_VIEWS is enabled and the app is served over ASGI.
+
+Provider and Judge0 calls are awaited on the event loop, so a worker holds no
+thread while a course, module or code submission is in flight. ORM work and
+serialization reuse the sync helpers in `course_generation` through `sync_to_async`.
+"""
+import asyncio
+import json
+import logging
+import os
+from contextlib import nullcontext
+
+import httpx
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, JsonResponse
+from django.utils import timezone
+from django.views import View
+
+from . import execution_backends, execution_cache, preflight
+from .execution_scheduler import QueueFull, client_key, get_scheduler
+from .ai_orchestrator import AIOrchestrator
+from .ai_service import GeminiService
+from .models import Module
+from .course_generation import (
+    GENERATING_RESPONSE,
+    checkpointed_modules,
+    claim_course_generation,
+    complete_module_payload,
+    fallback_course_outline,
+    fallback_module_payload,
+    is_valid_outline,
+    mark_course_failed,
+    mark_course_outline_only,
+    mark_module_generating,
+    module_generation_args,
+    persist_course_outline,
+    prefetch_next_module,
+    save_generated_course,
+    save_module_checkpoint,
+    serialize_course,
+    serialize_module,
+    store_module_content,
+)
+from .views import _prepare_code_execution, _queue_full_response, _resolve_execution_mode
+
+logger = logging.getLogger('api')
+
+
+class AsyncAPIView(View):
+    """Minimal async counterpart of APIView: JSON in and out, CSRF exempt like the DRF views."""
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+    def parse_json(self, request):
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
+
+
+async def _agenerate_module_payload(orchestrator, topic, language, topic_type, module_title, module_number):
+    """Async `generate_module_payload`."""
+    print(f"START generating module: {module_title}")
+    try:
+        module_content = await orchestrator.agenerate_complete_module(
+            topic=topic,
+            language=language,
+            module_title=module_title,
+            module_number=module_number
+        )
+        return complete_module_payload(module_content, language, topic_type, module_title, module_number)
+    except Exception as e:
+        print(f"Module generation failed or was empty: {e}")
+        return fallback_module_payload(language, topic_type, module_title, module_number)
+
+
+async def _acreate_course_full(course_obj, topic, language, topic_type, generation_mode, request):
+    """Async `course_generation.create_course_full`."""
+    try:
+        orchestrator = AIOrchestrator()
+
+        modules_to_create = await sync_to_async(checkpointed_modules)(course_obj)
+        if modules_to_create:
+            print(f"Resuming generation of {topic} from its saved outline")
+        else:
+            course_outline = None
+            try:
+                print(f"Attempting valid Multi-LLM AI structure generation for: {topic}")
+                course_outline = await orchestrator.agenerate_course_structure(topic, language)
+            except Exception as ex_struct:
+                print(f"[Offline Fallback] AI structure generation failed: {ex_struct}")
+
+            if not is_valid_outline(course_outline):
+                course_outline = fallback_course_outline(topic, language)
+
+            modules_to_create = await sync_to_async(persist_course_outline)(course_obj, course_outline, topic)
+
+        if generation_mode == "lazy":
+            await sync_to_async(mark_course_outline_only)(course_obj, len(modules_to_create), topic)
+            return await sync_to_async(serialize_course)(course_obj, request)
+
+        pending = [entry for entry in modules_to_create if entry[0].generation_status in ("pending", "generating")]
+        print(f"Starting paced content generation for {len(pending)} of {len(modules_to_create)} modules...")
+        for module, title, num in pending:
+            await sync_to_async(mark_module_generating)(module)
+            module_content = await _agenerate_module_payload(orchestrator, topic, language, topic_type, title, num)
+            await sync_to_async(save_module_checkpoint)(module, module_content)
+        await sync_to_async(save_generated_course)(course_obj)
+        return await sync_to_async(serialize_course)(course_obj, request)
+    except Exception as e:
+        import traceback
+        print(f"[Backend Error] Exception in create_course_full: {traceback.format_exc()}")
+        await sync_to_async(mark_course_failed)(course_obj)
+        raise ValueError(f"AI Content Generation Failed: {e}")
+
+
+async def _aensure_module_content(module_id):
+    """Async `ensure_module_content`: the prefetch cache key is the generation lock and the save re-checks the row."""
+    lock_key = f"module-prefetch:{module_id}"
+    if not await cache.aadd(lock_key, True, timeout=settings.LAZY_PREFETCH_LOCK_TIMEOUT):
+        await _await_prefetch(module_id)
+    else:
+        try:
+            module = await Module.objects.select_related("course").aget(id=module_id)
+            if not module.content:
+                print(f"Generating content for Module ID {module_id}: {module.name}")
+                generation_args = await sync_to_async(module_generation_args)(module)
+                module_content = await _agenerate_module_payload(AIOrchestrator(), *generation_args)
+                return await sync_to_async(store_module_content)(module_id, module_content)
+        finally:
+            await cache.adelete(lock_key)
+
+    module = await Module.objects.select_related("course").aget(id=module_id)
+    if not module.content:
+        # Lock expired without a result; generate without it, the save still keeps the first writer
+        generation_args = await sync_to_async(module_generation_args)(module)
+        module_content = await _agenerate_module_payload(AIOrchestrator(), *generation_args)
+        module = await sync_to_async(store_module_content)(module_id, module_content)
+    return module
+
+
+async def _await_prefetch(module_id):
+    """Async `wait_for_prefetch`."""
+    deadline = asyncio.get_running_loop().time() + settings.LAZY_PREFETCH_LOCK_TIMEOUT
+    while await cache.aget(f"module-prefetch:{module_id}") and asyncio.get_running_loop().time() < deadline:
+        await asyncio.sleep(0.25)
+
+
+async def _aclaim_course_generation(raw_topic, data, request):
+    """
+    `claim_course_generation`, but the wait for a generation held by another request
+    polls from the event loop, for up to GENERATION_ASYNC_WAIT_SECONDS, instead of
+    blocking a thread.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + settings.GENERATION_ASYNC_WAIT_SECONDS
+    answered, job = await sync_to_async(claim_course_generation)(raw_topic, data, request, wait_seconds=0)
+    while answered is GENERATING_RESPONSE and loop.time() < deadline:
+        await asyncio.sleep(settings.GENERATION_LEASE_POLL_SECONDS)
+        data = {key: value for key, value in data.items() if key != "force"}
+        answered, job = await sync_to_async(claim_course_generation)(
+            raw_topic, data, request, record_request=False, wait_seconds=0
+        )
+    return answered, job
+
+
+class AsyncGenerateCourseView(AsyncAPIView):
+    async def post(self, request):
+        data = self.parse_json(request) or {}
+        try:
+            # Validate request data
+            raw_topic = data.get("topic")
+            if not raw_topic or not isinstance(raw_topic, str) or len(raw_topic.strip()) == 0:
+                return JsonResponse({
+                    "error": "Topic is required",
+                    "details": "Please provide a valid 'topic' field",
+                    "example": {"topic": "Java Programming"}
+                }, status=400)
+
+            answered, job = await _aclaim_course_generation(raw_topic, data, request)
+            if answered:
+                body, status_code = answered
+                return JsonResponse(body, status=status_code)
+
+            metadata = job["metadata"]
+            try:
+                course_data = await _acreate_course_full(
+                    job["course"],
+                    job["topic"],
+                    metadata["language"],
+                    metadata["topic_type"],
+                    metadata["generation_mode"],
+                    request,
+                )
+            finally:
+                await sync_to_async(job["lease"].release)()
+            course_data["metadata"] = metadata
+            return JsonResponse(course_data, status=201)
+
+        except ValueError as ve:
+            return JsonResponse({
+                "error": "Validation error",
+                "details": str(ve)
+            }, status=400)
+        except Exception:
+            import traceback
+            print("[Backend Error] Exception in AsyncGenerateCourseView:", traceback.format_exc())
+            return JsonResponse({
+                "error": "Internal server error",
+                "details": "An unexpected error occurred while generating the course"
+            }, status=500)
+
+
+class AsyncModuleContentView(AsyncAPIView):
+    async def get(self, request, module_id):
+        try:
+            module = await Module.objects.aget(id=module_id)
+        except Module.DoesNotExist:
+            raise Http404("No Module matches the given query.")
+
+        # If content already exists, return
+        if module.content:
+            await sync_to_async(prefetch_next_module)(module)
+            return JsonResponse(await sync_to_async(serialize_module)(module, request))
+
+        # Content does not exist (outline-first course), trigger AI Generation with lock
+        try:
+            module = await _aensure_module_content(module_id)
+            await sync_to_async(prefetch_next_module)(module)
+            return JsonResponse(await sync_to_async(serialize_module)(module, request))
+        except Exception as e:
+            import traceback
+            print(f"[Backend Error] Exception in AsyncModuleContentView (Gen): {traceback.format_exc()}")
+            return JsonResponse({
+                "error": "Failed to generate module content",
+                "details": str(e)
+            }, status=500)
+
+
+class AsyncCodeExecutionView(AsyncAPIView):
+    async def post(self, request):
+        try:
+            data = self.parse_json(request) or {}
+            judge0_payload, error = await sync_to_async(_prepare_code_execution)(data, allow_local=True)
+            if error:
+                body, status_code = error
+                return JsonResponse(body, status=status_code)
+
+            rejected = preflight.check(judge0_payload)
+            if rejected is not None:
+                return JsonResponse(rejected, status=200, headers={"X-Execution-Preflight": "rejected"})
+
+            try:
+                backend = execution_backends.get_backend(judge0_payload["language_id"])
+                wait = backend.local or _resolve_execution_mode(data) == "sync"
+                if wait and not backend.local:
+                    cached = await sync_to_async(execution_cache.lookup)(judge0_payload)
+                    if cached is not None:
+                        return JsonResponse(cached, status=200, headers={"X-Execution-Cache": "hit"})
+                if backend.local:
+                    slot = nullcontext()
+                else:
+                    slot = get_scheduler().aslot(await sync_to_async(client_key)(request))
+                async with slot:
+                    body, status_code = await backend.aexecute(judge0_payload, wait=wait)
+                if wait and not backend.local and status_code == 200:
+                    await sync_to_async(execution_cache.store)(judge0_payload, body)
+                return JsonResponse(body, status=status_code)
+            except QueueFull as e:
+                body, status_code, headers = _queue_full_response(e)
+                return JsonResponse(body, status=status_code, headers=headers)
+            except httpx.TimeoutException as e:
+                print(f"[CodeExecutionView] Judge0 timeout: {str(e)}")
+                return JsonResponse({"error": "Judge0 timed out", "details": str(e)}, status=504)
+            except Exception as e:
+                print(f"[CodeExecutionView] Judge0 exception: {str(e)}")
+                return JsonResponse({"error": "Error connecting to Judge0", "details": str(e)}, status=500)
+
+        except Exception as e:
+            print(f"[CodeExecutionView] Exception: {str(e)}")
+            return JsonResponse({"error": "Error executing code", "details": str(e)}, status=500)
+
+
+class AsyncMentAIAskView(AsyncAPIView):
+    async def post(self, request):
+        query = (self.parse_json(request) or {}).get('query')
+
+        # Validation: query must exist and be a non-empty string
+        if not query or not isinstance(query, str) or not query.strip():
+            return JsonResponse({"error": "Invalid request: 'query' must be a non-empty string."}, status=400)
+
+        if not os.getenv("GEMINI_API_KEY"):
+            logger.error("GEMINI_API_KEY is missing from environment.")
+            return JsonResponse({"error": "AI service configuration error."}, status=500)
+
+        ai_service = GeminiService()
+        if not ai_service.client:
+            return JsonResponse({"error": "AI service configuration error."}, status=500)
+
+        try:
+            answer = await ai_service.aask_mentai(query)
+            if not answer:
+                raise ValueError("Empty response from AI service")
+        except Exception as e:
+            logger.error(f"MentAI chat failure: {str(e)}")
+            answer = "I'm sorry, I'm having trouble processing your request right now. Please try again later."
+        return JsonResponse({"answer": answer, "timestamp": timezone.now().isoformat()}, status=200)
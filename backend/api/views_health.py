@@ -2,13 +2,16 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 import os
 
+from .execution_scheduler import get_scheduler
+
 class HealthCheckView(APIView):
     def get(self, request):
         return Response({
             "status": "ok",
             "service": "MentAI Backend",
             "environment": "production",
-            "gemini_api_configured": bool(os.getenv("GEMINI_API_KEY"))
+            "gemini_api_configured": bool(os.getenv("GEMINI_API_KEY")),
+            "execution_queue": get_scheduler().stats(),
         }, status=200)
 
 def root_status(request):
@@ -1,6 +1,5 @@
 import os
 import logging
-import google.generativeai as genai
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
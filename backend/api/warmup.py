@@ -0,0 +1,61 @@
+"""
+Load everything a worker would otherwise build on its first requests.
+
+Called by gunicorn_preload.py in the gunicorn master after the app is preloaded and
+before workers are forked, so the loaded content, caches and modules sit in pages the
+workers share copy-on-write instead of each worker building its own copy.
+"""
+import importlib
+import logging
+import time
+
+from django.conf import settings
+
+from . import content_library, execution_backends, execution_cache
+from .languages import LanguageRegistry
+from .topic_classifier import TopicClassifier
+
+logger = logging.getLogger('api')
+
+# Imported (never configured) so workers share their modules; clients are still built per worker
+PROVIDER_SDKS = ("google.generativeai", "groq", "openai")
+
+
+def warm_process(provider_sdks=None):
+    """Warm this process's shared state and return what was loaded, for logging."""
+    if provider_sdks is None:
+        provider_sdks = settings.PRELOAD_PROVIDER_SDKS
+    started = time.perf_counter()
+    library = content_library.get_library()
+    for language in library.languages():
+        for section in content_library.SECTIONS:
+            library.section(language, section)
+
+    for topic in (*TopicClassifier.REGISTRY, *TopicClassifier.ALIASES, "python programming", "pythn"):
+        TopicClassifier.classify(topic)
+
+    runtimes = [
+        execution_backends.local_runtime(meta["judge0_id"])
+        for meta in LanguageRegistry.SUPPORTED_LANGUAGES.values()
+    ]
+    snippets = execution_cache.cacheable_snippets()
+
+    sdks = []
+    if provider_sdks:
+        for name in PROVIDER_SDKS:
+            try:
+                importlib.import_module(name)
+            except ImportError as e:
+                logger.warning(f"Warmup: could not import {name}: {e}")
+            else:
+                sdks.append(name)
+
+    summary = {
+        "content_sections": len(library.loaded()),
+        "local_runtimes": sum(1 for runtime in runtimes if runtime),
+        "cacheable_snippets": len(snippets),
+        "provider_sdks": sdks,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+    logger.info(f"Warmup: {summary}")
+    return summary
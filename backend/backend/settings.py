@@ -33,7 +33,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',  # ✅ Add Whitenoise for static files
+    'api.middleware.StaticFilesMiddleware',  # ✅ Whitenoise for static files (async-capable)
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -42,6 +42,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'api.middleware.RequestLoggingMiddleware',  # ✅ Log requests and errors
+    'api.middleware.ClientIdMiddleware',  # ✅ Signed per-browser id for fair code-run capacity
 ]
 
 ROOT_URLCONF = 'backend.urls'
@@ -63,6 +64,13 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'backend.wsgi.application'
+ASGI_APPLICATION = 'backend.asgi.application'
+
+# ASGI deployment: route course generation, module content, code execution and MentAI
+# to the async views in api/views_async.py, which await provider/Judge0 I/O instead of
+# holding a worker thread. Serve with the uvicorn worker:
+#   gunicorn backend.asgi:application -k uvicorn.workers.UvicornWorker
+ASYNC_VIEWS = os.getenv("ASYNC_VIEWS", "False").lower() == "true"
 
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
@@ -74,14 +82,48 @@ if RENDER_DATA_DIR.exists():
 else:
     default_db_url = f'sqlite:////{BASE_DIR / "db.sqlite3"}'
 
+# Persistent connections: reuse each connection for DB_CONN_MAX_AGE seconds (0 = reconnect per
+# request). Django health-checks a reused connection once per request and replaces it if it was
+# dropped, so views don't need their own reconnect logic. Under ASGI connections are
+# per-thread and not reused across requests, so persistence is off by default there.
+DB_CONN_MAX_AGE = int(os.getenv("DB_CONN_MAX_AGE", "0" if ASYNC_VIEWS else "600"))
+
 DATABASES = {
     'default': dj_database_url.config(
         default=default_db_url,
-        conn_max_age=0,
+        conn_max_age=DB_CONN_MAX_AGE,
         conn_health_checks=True,
     )
 }
 
+if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    # Behind a server-side pooler (PgBouncer in transaction mode) a cursor can't outlive its transaction
+    if os.getenv("DB_SERVER_SIDE_POOLER", "False").lower() == "true":
+        DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+    # In-process connection pool; requires psycopg 3 with the pool extra (`psycopg[binary,pool]`)
+    if os.getenv("DB_POOL", "False").lower() == "true":
+        DATABASES['default']['CONN_MAX_AGE'] = 0  # the pool owns connection lifetime
+        DATABASES['default'].setdefault('OPTIONS', {})['pool'] = {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            "timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+        }
+
+# Opt-in SQLite production profile, applied on connection_created (see api/sqlite_profile.py).
+# WAL lets course reads proceed while generation writes; busy_timeout waits for locks instead of failing.
+SQLITE_PRODUCTION_PROFILE = os.getenv("SQLITE_PRODUCTION_PROFILE", "False").lower() == "true"
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+    "synchronous": "NORMAL",
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(128 * 1024 * 1024))),
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", "-32000")),  # negative = KiB
+    "temp_store": "MEMORY",
+}
+if SQLITE_PRODUCTION_PROFILE and DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    # Take the write lock when a transaction starts so it cannot fail to upgrade mid-transaction
+    DATABASES['default'].setdefault('OPTIONS', {})['transaction_mode'] = 'IMMEDIATE'
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -110,6 +152,139 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")
 
+# ✅ Course generation
+# "full" generates every module up front; "lazy" persists only the outline and
+# generates each module the first time it is opened. Clients may override per request.
+COURSE_GENERATION_MODE = os.getenv("COURSE_GENERATION_MODE", "full").lower()
+LAZY_PREFETCH_NEXT_MODULE = os.getenv("LAZY_PREFETCH_NEXT_MODULE", "True").lower() == "true"
+LAZY_PREFETCH_LOCK_TIMEOUT = int(os.getenv("LAZY_PREFETCH_LOCK_TIMEOUT", "120"))
+# Pause between a module's theory, quiz and lab calls, to stay under provider rate limits
+LLM_MODULE_PACING_SECONDS = float(os.getenv("LLM_MODULE_PACING_SECONDS", "0.5"))
+# GET /api/courses/ page size (?limit=) by default and at most
+COURSE_LIST_PAGE_SIZE = int(os.getenv("COURSE_LIST_PAGE_SIZE", "20"))
+COURSE_LIST_MAX_PAGE_SIZE = int(os.getenv("COURSE_LIST_MAX_PAGE_SIZE", "100"))
+
+# ✅ Generation single-flight
+# One request per topic builds the course while holding a GenerationLease row; concurrent
+# requests for the topic wait up to GENERATION_WAIT_SECONDS for it and get the finished
+# course, or 202 to poll once the wait runs out (0 = at once). A waiting sync view holds a
+# worker thread, so it only waits briefly; the async view (ASYNC_VIEWS) waits on the event
+# loop for up to GENERATION_ASYNC_WAIT_SECONDS. The holder renews the lease while it works,
+# so a killed worker's lease expires after GENERATION_LEASE_SECONDS and is taken over.
+GENERATION_LEASE_SECONDS = float(os.getenv("GENERATION_LEASE_SECONDS", "30"))
+GENERATION_WAIT_SECONDS = float(os.getenv("GENERATION_WAIT_SECONDS", "3"))
+GENERATION_ASYNC_WAIT_SECONDS = float(os.getenv("GENERATION_ASYNC_WAIT_SECONDS", "90"))
+GENERATION_LEASE_POLL_SECONDS = float(os.getenv("GENERATION_LEASE_POLL_SECONDS", "0.5"))
+
+# ✅ Demand-driven warming
+# generate-course requests are counted per normalized topic in memory and written to
+# TopicRequestCount at most every TOPIC_STATS_FLUSH_SECONDS. `manage.py warm_popular_topics`
+# (run from cron) then builds the most requested topics that lack a complete course, but only
+# inside TOPIC_WARMING_WINDOW (local TIME_ZONE) and within TOPIC_WARMING_CALL_BUDGET provider calls.
+TOPIC_STATS_ENABLED = os.getenv("TOPIC_STATS_ENABLED", "True").lower() == "true"
+TOPIC_STATS_FLUSH_SECONDS = float(os.getenv("TOPIC_STATS_FLUSH_SECONDS", "60"))
+TOPIC_WARMING_WINDOW = os.getenv("TOPIC_WARMING_WINDOW", "01:00-06:00")
+TOPIC_WARMING_TOP_N = int(os.getenv("TOPIC_WARMING_TOP_N", "10"))
+TOPIC_WARMING_MIN_REQUESTS = int(os.getenv("TOPIC_WARMING_MIN_REQUESTS", "2"))
+TOPIC_WARMING_CALL_BUDGET = int(os.getenv("TOPIC_WARMING_CALL_BUDGET", "300"))
+TOPIC_WARMING_CALLS_PER_MINUTE = float(os.getenv("TOPIC_WARMING_CALLS_PER_MINUTE", "20"))
+
+# ✅ Worker preloading
+# Used by gunicorn_preload.py: also import the provider SDK modules in the gunicorn master
+# so workers share them instead of each importing them on first generation.
+PRELOAD_PROVIDER_SDKS = os.getenv("PRELOAD_PROVIDER_SDKS", "True").lower() == "true"
+
+# ✅ Offline content library
+# Prebuilt theory, quizzes and labs are read from CONTENT_LIBRARY_DIR/<language>/<section>.json
+# on first use. Files are re-checked every CONTENT_LIBRARY_RELOAD_SECONDS (0 = never) and
+# reloaded when they change, so curriculum edits apply without a deploy.
+CONTENT_LIBRARY_DIR = os.getenv("CONTENT_LIBRARY_DIR", str(BASE_DIR / "api" / "content"))
+CONTENT_LIBRARY_RELOAD_SECONDS = float(os.getenv("CONTENT_LIBRARY_RELOAD_SECONDS", "30"))
+
+# ✅ LLM providers
+# "live" uses the Gemini/Groq/OpenAI keys above; "fake" swaps in api/fake_llm.py, an
+# offline provider that returns schema-valid JSON after a log-normal delay around
+# FAKE_LLM_LATENCY_MS (a number, or per phase: "structure=800,theory=2500,quiz=1200,labs=1800"),
+# failing or truncating a seeded fraction of calls. Used by `manage.py bench_generation`.
+LLM_PROVIDER_BACKEND = os.getenv("LLM_PROVIDER_BACKEND", "live").lower()
+FAKE_LLM_LATENCY_MS = os.getenv("FAKE_LLM_LATENCY_MS", "structure=800,theory=2500,quiz=1200,labs=1800")
+FAKE_LLM_LATENCY_SIGMA = float(os.getenv("FAKE_LLM_LATENCY_SIGMA", "0.35"))
+FAKE_LLM_FAILURE_RATE = float(os.getenv("FAKE_LLM_FAILURE_RATE", "0"))
+FAKE_LLM_MALFORMED_RATE = float(os.getenv("FAKE_LLM_MALFORMED_RATE", "0"))
+FAKE_LLM_SEED = int(os.getenv("FAKE_LLM_SEED", "0"))
+# LLM_CASSETTE_RECORD appends every provider call (prompt, raw response or error, timing)
+# to the gzip'd cassette at LLM_CASSETTE_PATH ("{pid}" is replaced by the process id).
+# LLM_PROVIDER_BACKEND="replay" answers from that cassette, waiting the recorded time
+# multiplied by LLM_CASSETTE_LATENCY_SCALE.
+LLM_CASSETTE_RECORD = os.getenv("LLM_CASSETTE_RECORD", "False").lower() == "true"
+LLM_CASSETTE_PATH = os.getenv("LLM_CASSETTE_PATH", str(BASE_DIR / "llm_cassette.jsonl.gz"))
+LLM_CASSETTE_LATENCY_SCALE = float(os.getenv("LLM_CASSETTE_LATENCY_SCALE", "1.0"))
+
+# ✅ Judge0 code execution
+# JUDGE0_BASE_URL points at RapidAPI's Judge0 by default, or at a self-hosted Judge0 or
+# `manage.py judge0_stub`. JUDGE0_AUTH_MODE: "rapidapi" (RAPIDAPI_KEY), "token"
+# (X-Auth-Token from JUDGE0_AUTH_TOKEN, for self-hosted Judge0) or "none".
+JUDGE0_BASE_URL = os.getenv("JUDGE0_BASE_URL", "https://judge0-ce.p.rapidapi.com").rstrip("/")
+JUDGE0_AUTH_MODE = os.getenv("JUDGE0_AUTH_MODE", "rapidapi").lower()
+JUDGE0_AUTH_TOKEN = os.getenv("JUDGE0_AUTH_TOKEN")
+# Connect/read timeouts (seconds) bound how long a run can hold a worker; keep the read
+# timeout below gunicorn's --timeout. Retries cover connection failures, plus read errors
+# and 502/503/504 on idempotent GETs.
+JUDGE0_CONNECT_TIMEOUT = float(os.getenv("JUDGE0_CONNECT_TIMEOUT", "3.05"))
+JUDGE0_READ_TIMEOUT = float(os.getenv("JUDGE0_READ_TIMEOUT", "30"))
+JUDGE0_RETRIES = int(os.getenv("JUDGE0_RETRIES", "2"))
+JUDGE0_POOL_MAXSIZE = int(os.getenv("JUDGE0_POOL_MAXSIZE", "10"))
+# "sync" waits for the run (wait=true); "async" queues it and returns the Judge0 token,
+# whose result is polled through batched /submissions/batch lookups. Clients may override.
+CODE_EXECUTION_MODE = os.getenv("CODE_EXECUTION_MODE", "sync").lower()
+JUDGE0_POLL_WINDOW = float(os.getenv("JUDGE0_POLL_WINDOW", "0.05"))
+JUDGE0_BATCH_SIZE = int(os.getenv("JUDGE0_BATCH_SIZE", "20"))
+JUDGE0_RESULT_TTL = int(os.getenv("JUDGE0_RESULT_TTL", "600"))
+# Lab grading submits every hidden case in one batch, then polls the batch until done
+JUDGE0_GRADE_POLL_INTERVAL = float(os.getenv("JUDGE0_GRADE_POLL_INTERVAL", "0.5"))
+JUDGE0_GRADE_TIMEOUT = float(os.getenv("JUDGE0_GRADE_TIMEOUT", "30"))
+# Admission control in front of Judge0, per worker process: a global in-flight cap
+# (the RapidAPI plan's concurrency divided by the number of workers), a per-user cap,
+# and a bounded round-robin queue. Over capacity answers 429 with Retry-After. Only
+# engages with gthread workers or ASGI; a sync worker serves one request at a time.
+EXECUTION_MAX_IN_FLIGHT = int(os.getenv("EXECUTION_MAX_IN_FLIGHT", "10"))
+EXECUTION_PER_USER_IN_FLIGHT = int(os.getenv("EXECUTION_PER_USER_IN_FLIGHT", "1"))
+EXECUTION_MAX_QUEUE = int(os.getenv("EXECUTION_MAX_QUEUE", "100"))
+EXECUTION_PER_USER_QUEUE = int(os.getenv("EXECUTION_PER_USER_QUEUE", "2"))
+EXECUTION_QUEUE_TIMEOUT = float(os.getenv("EXECUTION_QUEUE_TIMEOUT", "15"))
+# Without a login, runs are charged to the signed id ClientIdMiddleware gives each browser
+# (X-Client-Id); at most EXECUTION_CLIENT_IDS_PER_IP are issued per client IP and hour.
+# Requests without one are charged to the client IP, which may be a classroom behind one
+# NAT, under the larger per-IP caps. The IP is the X-Forwarded-For entry the outermost of
+# EXECUTION_TRUSTED_PROXIES reverse proxies appended (Render and Railway: 1; 0 = socket peer).
+EXECUTION_CLIENT_IDS_PER_IP = int(os.getenv("EXECUTION_CLIENT_IDS_PER_IP", "200"))
+EXECUTION_PER_IP_IN_FLIGHT = int(os.getenv("EXECUTION_PER_IP_IN_FLIGHT", "5"))
+EXECUTION_PER_IP_QUEUE = int(os.getenv("EXECUTION_PER_IP_QUEUE", "40"))
+EXECUTION_TRUSTED_PROXIES = int(os.getenv("EXECUTION_TRUSTED_PROXIES", "1"))
+
+# ✅ Code execution backends
+# "judge0" sends every run to Judge0; "local" runs languages that declare a
+# `local_runtime` in LanguageRegistry (and whose toolchain is installed) in a
+# resource-limited subprocess on this host, and everything else on Judge0.
+# "pool" runs Python on warm pooled interpreters, and everything else on Judge0.
+CODE_EXECUTION_BACKEND = os.getenv("CODE_EXECUTION_BACKEND", "judge0").lower()
+LOCAL_EXECUTION_CPU_SECONDS = int(os.getenv("LOCAL_EXECUTION_CPU_SECONDS", "2"))
+LOCAL_EXECUTION_WALL_SECONDS = float(os.getenv("LOCAL_EXECUTION_WALL_SECONDS", "5"))
+LOCAL_EXECUTION_MEMORY_MB = int(os.getenv("LOCAL_EXECUTION_MEMORY_MB", "256"))
+LOCAL_EXECUTION_MAX_PROCESSES = int(os.getenv("LOCAL_EXECUTION_MAX_PROCESSES", "64"))
+LOCAL_EXECUTION_OUTPUT_LIMIT_KB = int(os.getenv("LOCAL_EXECUTION_OUTPUT_LIMIT_KB", "64"))
+# Local runs start in fresh PID/network/mount namespaces (see api/sandbox.py) with these
+# paths hidden, as LOCAL_EXECUTION_USER when the server is root. If the sandbox cannot
+# start, local runs go to Judge0. "none" disables it and is only honoured with DEBUG.
+LOCAL_EXECUTION_SANDBOX = os.getenv("LOCAL_EXECUTION_SANDBOX", "namespaces").lower()
+LOCAL_EXECUTION_USER = os.getenv("LOCAL_EXECUTION_USER", "nobody")
+LOCAL_EXECUTION_HIDDEN_PATHS = [
+    path for path in os.getenv("LOCAL_EXECUTION_HIDDEN_PATHS", f"{BASE_DIR},{RENDER_DATA_DIR}").split(",") if path
+]
+# "pool" keeps this many warm Python templates per worker process; each run executes in a
+# single-use child forked from one of them.
+INTERPRETER_POOL_SIZE = int(os.getenv("INTERPRETER_POOL_SIZE", "2"))
+
 # ✅ CORS settings
 CORS_ALLOW_ALL_ORIGINS = True  # Allowed for all origins as per requirements
 CORS_ALLOW_CREDENTIALS = True
@@ -129,7 +304,10 @@ CORS_ALLOW_HEADERS = list(default_headers) + [
     'origin',
     'authorization',
     'x-requested-with',
+    'x-client-id',
 ]
+# The frontend stores the signed id ClientIdMiddleware sends back
+CORS_EXPOSE_HEADERS = ['x-client-id']
 
 # Security Settings
 if not DEBUG:
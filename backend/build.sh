@@ -7,3 +7,8 @@ pip install -r requirements.txt
 
 python manage.py collectstatic --no-input
 python manage.py migrate
+
+# Opt-in: on hosts whose build can reach the runtime database (not Render, whose /data disk is mounted only at runtime)
+if [ "$(echo "${PREWARM_COURSES_ON_BUILD:-False}" | tr '[:upper:]' '[:lower:]')" = "true" ]; then
+    python manage.py prewarm_courses || echo "prewarm_courses failed; run it by hand once the service is live"
+fi
@@ -0,0 +1,32 @@
+"""
+Gunicorn config for copy-on-write friendly workers:
+
+    gunicorn -c gunicorn_preload.py backend.wsgi:application
+
+The master imports the app once (preload_app), warms the content library, classifier,
+execution registries and provider SDK modules (api/warmup.py), then moves every object
+it holds into the GC's permanent generation with gc.freeze() before forking. Workers
+start with those pages shared, and their garbage collections no longer walk (and so
+no longer write to and copy) the inherited objects. Worker count still comes from
+WEB_CONCURRENCY and other options can be passed on the command line as usual.
+
+Code is only reloaded by restarting the master: HUP re-forks workers from the same
+preloaded image.
+"""
+import gc
+
+preload_app = True
+
+
+def when_ready(server):
+    # Runs in the master after the preloaded app is imported and before workers are forked
+    from django.db import connections
+
+    from api.warmup import warm_process
+
+    summary = warm_process()
+    # A connection opened here would be shared by every forked worker
+    connections.close_all()
+    gc.collect()
+    gc.freeze()
+    server.log.info(f"Preloaded and froze {gc.get_freeze_count()} objects: {summary}")
@@ -2,8 +2,21 @@ import axios from 'axios';
 
 export const API = axios.create();
 
+// Per-browser ID signed and issued by the backend (X-Client-Id response header). Code runs
+// are charged to it, so students behind the same classroom NAT each get their own share of
+// run capacity; the backend ignores IDs it did not sign.
+const CLIENT_ID_KEY = 'mentai-client-id';
+
+const storeClientId = (headers?: { [key: string]: unknown }) => {
+  const issued = headers?.['x-client-id'];
+  if (typeof window !== 'undefined' && typeof issued === 'string' && issued) {
+    window.localStorage.setItem(CLIENT_ID_KEY, issued);
+  }
+};
+
 API.interceptors.response.use(
   (response) => {
+    storeClientId(response.headers);
     const url = response.config.url || '';
     if (typeof window !== 'undefined' && url.includes('generate-course')) {
       const data = response.data as {
@@ -32,12 +45,19 @@ API.interceptors.response.use(
     }
     return response;
   },
-  (error) => Promise.reject(error)
+  (error) => {
+    storeClientId(error?.response?.headers);
+    return Promise.reject(error);
+  }
 );
 
 API.interceptors.request.use((config) => {
   const isDev = process.env.NODE_ENV === 'development';
   if (typeof window !== 'undefined') {
+    const clientId = window.localStorage.getItem(CLIENT_ID_KEY);
+    if (clientId) {
+      config.headers.set('X-Client-Id', clientId);
+    }
     const hostname = window.location.hostname;
     const isLocalHost = hostname === 'localhost' || hostname === '127.0.0.1' || hostname.startsWith('192.168.') || hostname.startsWith('10.') || hostname.endsWith('.local');
     if (isDev || isLocalHost) {